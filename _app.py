@@ -1,6 +1,16 @@
 """ 
 Código para gerenciar a execução de um aplicativo com interface gráfica utilizando o customtkinter.
 A ideia é que não permita abrir mais de uma vez o app, mesmo que o usuário tente.
+Se o app já estiver aberto, o pedido é enviado para a instância aberta (canal de controle local) e este processo termina.
+Linha de comando (com o app aberto):
+    python _app.py                  -> traz a janela para frente
+    python _app.py status           -> lista as execuções
+    python _app.py run <program_id> -> executa um programa cadastrado
+    python _app.py cancel <run_id>  -> cancela uma execução em andamento
+    python _app.py reload           -> recarrega os programas e as configurações e verifica o schedule
+    python _app.py ping             -> confirma que o app está aberto
+    python _app.py agents           -> lista os agentes de execução conectados e as execuções em cada um
+    python _app.py queue            -> lista os pedidos da fila de execuções que ainda não terminaram
 Code by: Marco Antônio Samuelsson
 Data: 18/09/2025
 Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
@@ -11,67 +21,194 @@ Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
 #       os: para manipulação de arquivos e diretórios
 #       sys: para manipulação de parâmetros e funções do sistema
 #       tempfile: para criação de arquivos temporários
-#       psutil: para verificação de processos em execução
+#       json: para exibir a resposta da instância aberta e gravar o carimbo (PID + horário de criação) no arquivo de lock
+#       errno: para diferenciar "lock de outro processo" de "sistema de arquivos sem suporte a lock"
+#       psutil: para verificação de processos em execução (somente o processo do carimbo, sem listar os processos)
+#       msvcrt (Windows) / fcntl (demais sistemas): para o lock exclusivo do arquivo pelo sistema operacional
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Bibliotecas internas:
-#       App: chamada do app
+#       StartupTimer: mede o tempo de abertura (importado primeiro: o tempo começa a contar aqui)
+#       send_command: envia os comandos para a instância aberta (não importa nada da interface)
+#       App: chamada do app (importado somente depois de confirmar que não há outra instância aberta)
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+from app.adm_files.startup_timer import StartupTimer
 import os
 import sys
 import tempfile
+import json
+import errno
 import psutil  # pip install psutil
-from app.interfaces.main import App
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+from app.executer.control_client import send_command
 
 # Criação do arquivo de lock
+# O arquivo fica aberto e travado pelo sistema operacional enquanto o app estiver aberto;
+# se o processo terminar (mesmo travando), o sistema libera o lock sozinho
 lockfile = os.path.join(tempfile.gettempdir(), 'my_app.lock')
+lock_handle = None
+# No Windows o lock é de um byte bem depois do carimbo, para que o carimbo continue legível pelos outros processos
+LOCK_OFFSET = 0x7FFFFFFF
+# Erros que significam "o arquivo já está travado por outro processo"
+LOCK_BUSY_ERRORS = (errno.EACCES, errno.EAGAIN, errno.EDEADLK)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+# Função que monta o carimbo do processo: PID + horário de criação
+# O PID sozinho pode ser reaproveitado pelo sistema depois de um travamento; PID + horário de criação identifica o processo
+#   Parametros:
+#       pid: PID do processo (padrão: processo atual)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def process_stamp(pid=None):
+    process = psutil.Process(pid or os.getpid())
+    return {"pid": process.pid, "create_time": process.create_time()}
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+# Função que verifica se o processo do carimbo ainda existe (mesmo PID e mesmo horário de criação)
+#   Parametros:
+#       stamp: carimbo lido do arquivo de lock
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def stamp_alive(stamp):
+    try:
+        return process_stamp(stamp["pid"]) == stamp
+    except (psutil.Error, KeyError, TypeError, ValueError):
+        return False
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+# Função que lê o carimbo gravado no arquivo de lock (None se o arquivo estiver vazio ou em outro formato)
+#   Parametros:
+#       handle: arquivo de lock aberto
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def read_stamp(handle):
+    try:
+        handle.seek(0)
+        return json.loads(handle.read() or "null")
+    except (OSError, ValueError):
+        return None
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+# Função que tenta travar o arquivo de lock sem esperar
+#   Parametros:
+#       handle: arquivo de lock aberto
+#   Retorna True se o lock foi obtido e False se outro processo já tem o lock
+#   Gera OSError se o sistema de arquivos não suportar lock
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def acquire_lock(handle):
+    try:
+        if os.name == "nt":
+            handle.seek(LOCK_OFFSET)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError as e:
+        if e.errno in LOCK_BUSY_ERRORS:
+            return False
+        raise
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 # Função para verificar se o app já está em execução
+# O lock é do sistema operacional (atômico: duas aberturas ao mesmo tempo nunca conseguem o lock juntas)
+# e fica com o processo até ele terminar. O carimbo (PID + horário de criação) só decide quando o sistema
+# de arquivos não suporta lock
 #   Parametros:
 #       Nenhum
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 def is_already_running():
-    # Verifica se o arquivo de lock existe
-    if os.path.exists(lockfile):
-        # Se existir, tenta ler o PID do processo
-        try:
-            with open(lockfile, 'r') as f:
-                pid = int(f.read())
-            # Verifica se o processo ainda está ativo
-            if psutil.pid_exists(pid):
-                return True
-            else:
-                # Processo não existe mais, remove o lock
-                os.remove(lockfile)
-        except Exception:
-            # Se houver erro ao ler o arquivo, remove o lock
-            os.remove(lockfile)
+    global lock_handle
+    handle = os.fdopen(os.open(lockfile, os.O_RDWR | os.O_CREAT, 0o600), "r+")
+    try:
+        locked = acquire_lock(handle)
+    except OSError:
+        # Sem suporte a lock: considera aberto somente se o processo do carimbo ainda existir
+        locked = not stamp_alive(read_stamp(handle))
+
+    if not locked:
+        handle.close()
+        return True
 
-    # Cria o arquivo de lock com o PID atual
-    with open(lockfile, 'w') as f:
-        f.write(str(os.getpid()))
+    # Lock obtido: grava o carimbo deste processo e mantém o arquivo aberto até o app fechar
+    handle.seek(0)
+    handle.truncate()
+    json.dump(process_stamp(), handle)
+    handle.flush()
+    lock_handle = handle
     return False
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-#   Função para limpar o arquivo de lock
+#   Função para liberar o lock
+#   O arquivo não é apagado: apagar um arquivo travado deixaria outra abertura travar um arquivo que não existe mais
 #   Parametros:
 #       Nenhum
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 def cleanup_lock():
-    # Verifica se o arquivo de lock existe
-    if os.path.exists(lockfile):
-        # Se existir, tenta ler o PID do processo
-        try:
-            os.remove(lockfile)
-        except Exception:
-            pass
-#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-# Verifica se o app já está em execução
+    global lock_handle
+    if lock_handle is None:
+        return
+    try:
+        # Apaga o carimbo e libera o lock (o sistema também libera ao fechar o arquivo)
+        lock_handle.seek(0)
+        lock_handle.truncate()
+        lock_handle.flush()
+        if os.name == "nt":
+            lock_handle.seek(LOCK_OFFSET)
+            msvcrt.locking(lock_handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(lock_handle.fileno(), fcntl.LOCK_UN)
+    except OSError:
+        pass
+    finally:
+        lock_handle.close()
+        lock_handle = None
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função para enviar o pedido desta abertura para a instância já aberta
+#   Parametros:
+#       arguments: argumentos da linha de comando (sem argumentos = trazer a janela para frente)
+#   Retorna o código de saída do processo (0 = comando aceito)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def forward_command(arguments):
+    command, *values = arguments or ["show"]
+    command_arguments = {}
+    if command == "run":
+        command_arguments["program_id"] = values[0] if values else ""
+    elif command == "cancel":
+        command_arguments["exec_id"] = values[0] if values else ""
+
+    try:
+        response = send_command(command, **command_arguments)
+    except ConnectionError as e:
+        print(f"Error: {e}")
+        return 1
+    # Abertura sem argumentos: a janela aberta vem para frente, nada é exibido
+    if arguments:
+        print(json.dumps(response, indent=4))
+    return 0 if response.get("ok") else 1
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+# Verifica se o app já está em execução: o pedido vai para a instância aberta
+arguments = sys.argv[1:]
 if is_already_running():
-    sys.exit(0)
+    sys.exit(forward_command(arguments))
+
+# Comando da linha de comando sem o app aberto: não abre a janela
+if arguments:
+    cleanup_lock()
+    print("Error: Terminator is not running. Open the APP before sending commands.")
+    sys.exit(1)
+
+# Importa o App somente agora: uma segunda abertura termina sem carregar a interface
+from app.interfaces.main import App
+StartupTimer.mark("imports")
 
 # Tenta iniciar o App
 try:
     app = App()
     app.mainloop()
+    # O canal de controle, o executor e o Runner só existem se a janela chegou a iniciar o _deferred_start
+    if app.control_server:
+        app.control_server.stop()
+    if app.job_executor:
+        app.job_executor.stop()
+    if app.folder_cleaner:
+        app.folder_cleaner.stop()
+    if app.runner and app.runner.python_pool:
+        app.runner.python_pool.stop()
+    if app.runner and app.runner.agent_dispatcher:
+        app.runner.agent_dispatcher.stop()
 
 # Finaliza o App
 finally:
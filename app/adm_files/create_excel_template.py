@@ -12,12 +12,18 @@ Qualquer alteração ou cópia deste código deve ser aprovada pela criador!
 #           Alignment: permite definir o alinhamento do texto dentro das células (centralizado, à esquerda, quebra de linha, etc.).
 #       openpyxl.utils: fornece utilitários para manipulação de planilhas, como conversão de índices de coluna para letras (get_column_letter), validação de referências de célula, etc.
 #       platform: fornece informações sobre o sistema operacional em execução, útil para abrir o arquivo Excel de forma compatível com Windows, macOS ou Linux.
+#       NamedStyle: estilo registrado uma única vez no arquivo e compartilhado por todas as células (usado no export em streaming).
+#       WriteOnlyCell: célula com estilo para planilhas write-only (gravadas em streaming).
+#       csv, os: para a gravação alternativa em CSV (sem estilos), uma aba por arquivo.
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
+from openpyxl.cell import WriteOnlyCell
 import openpyxl.utils
 import subprocess
 import platform
+import csv
+import os
 
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Classe para criação de templates Excel
@@ -129,4 +135,124 @@ class Create_Excel():
             else:  # Linux
                 subprocess.run(["xdg-open", self.file_name])
         except Exception as e:
-            return e
\ No newline at end of file
+            return e
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe para exportações grandes em streaming (memória constante)
+#   Usa o workbook write-only do openpyxl: as linhas são gravadas direto no arquivo e não ficam em memória.
+#   Os estilos são NamedStyle registrados uma única vez e compartilhados por todas as células.
+#   Como as linhas não ficam em memória, a largura das colunas precisa ser informada antes (precomputada).
+#   Se o arquivo terminar em ".csv", grava em CSV simples (sem estilos): a primeira aba no próprio arquivo
+#   e as demais em "<arquivo> - <aba>.csv".
+#   Principais Métodos:
+#       - add_sheet: Adiciona uma nova planilha com cabeçalho e larguras das colunas.
+#       - add_lines: Grava as linhas (qualquer iterável, inclusive geradores) na planilha.
+#       - column_widths: Calcula as larguras das colunas a partir do cabeçalho e das linhas.
+#       - save: Salva/fecha o arquivo.
+#       - open_excel_file: Abre o arquivo depois de criado.
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class Stream_Excel(Create_Excel):
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Inicializa a classe e cria o arquivo (Excel write-only ou CSV)
+#   Parâmetros:
+#       - file_name: Nome do arquivo a ser criado (.xlsx ou .csv).
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def __init__(self, file_name: str):
+        self.file_name = file_name
+        self.is_csv = file_name.lower().endswith(".csv")
+        self.sheets = {}
+        self.csv_files = {}
+        self.max_col_widths = {}
+        if self.is_csv:
+            self.workbook = None
+            return
+        self.workbook = openpyxl.Workbook(write_only=True)
+        # Estilos compartilhados: registrados uma vez, as células só guardam o nome do estilo
+        self.header_style = NamedStyle(name="terminator_header")
+        self.header_style.font = Font(bold=True, color="FFFFFF")
+        self.header_style.fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
+        self.header_style.alignment = Alignment(wrap_text=True)
+        self.line_style = NamedStyle(name="terminator_line")
+        self.line_style.alignment = Alignment(wrap_text=True)
+        self.workbook.add_named_style(self.header_style)
+        self.workbook.add_named_style(self.line_style)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método 'column_widths': Calcula a largura de cada coluna (mesma regra do Create_Excel: maior texto + 5, no máximo 50)
+#   Parâmetros:
+#       - headers: Lista com os cabeçalhos.
+#       - rows: Lista de linhas já em memória (opcional).
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @staticmethod
+    def column_widths(headers: list, rows: list = ()):
+        widths = [len(str(header)) for header in headers]
+        for row in rows:
+            for col, value in enumerate(row):
+                if col < len(widths) and len(str(value)) > widths[col]:
+                    widths[col] = len(str(value))
+        return [min(50, width + 5) for width in widths]
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método 'add_sheet': Adiciona uma nova planilha com o cabeçalho e as larguras das colunas
+#   Parâmetros:
+#       - sheet_name: Nome da planilha a ser adicionada.
+#       - headers: Lista de strings representando os cabeçalhos das colunas.
+#       - widths: Lista com a largura de cada coluna (se não informado, usa a largura dos cabeçalhos).
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def add_sheet(self, sheet_name: str, headers: list = None, widths: list = None):
+        # Verifica se a planilha já existe
+        if sheet_name in self.sheets:
+            raise ValueError(f"The sheet '{sheet_name}' already exists.")
+        headers = headers or []
+
+        if self.is_csv:
+            # A primeira aba usa o próprio arquivo, as demais um arquivo por aba
+            path = self.file_name if not self.csv_files else f"{os.path.splitext(self.file_name)[0]} - {sheet_name}.csv"
+            file = open(path, "w", newline="", encoding="utf-8-sig")
+            self.csv_files[sheet_name] = file
+            self.sheets[sheet_name] = csv.writer(file, delimiter=";")
+            if headers:
+                self.sheets[sheet_name].writerow(headers)
+            return
+
+        sheet = self.workbook.create_sheet(title=sheet_name)
+        # No modo write-only a largura precisa ser definida antes da primeira linha
+        for col, width in enumerate(widths or self.column_widths(headers), start=1):
+            sheet.column_dimensions[openpyxl.utils.get_column_letter(col)].width = width
+        self.sheets[sheet_name] = sheet
+        if headers:
+            sheet.append([self._cell(sheet, value, self.header_style.name) for value in headers])
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método '_cell': Cria uma célula write-only com o estilo compartilhado
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _cell(self, sheet, value, style_name):
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.style = style_name
+        return cell
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método 'add_lines': Grava as linhas na planilha especificada, uma a uma, sem guardar em memória
+#   Parâmetros:
+#       - sheet_name: Nome da planilha onde as linhas serão adicionadas.
+#       - rows: Iterável de listas/tuplas de valores (pode ser um gerador).
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def add_lines(self, sheet_name: str, rows):
+        sheet = self.sheets[sheet_name]
+        if self.is_csv:
+            sheet.writerows(rows)
+            return
+        style_name = self.line_style.name
+        for row in rows:
+            sheet.append([self._cell(sheet, value, style_name) for value in row])
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método 'add_line': Grava uma linha na planilha especificada (mesma assinatura do Create_Excel)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def add_line(self, sheet_name: str, datas: list):
+        self.add_lines(sheet_name, [datas])
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método 'save': Salva o Excel ou fecha os arquivos CSV.
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def save(self):
+        if self.is_csv:
+            for file in self.csv_files.values():
+                file.close()
+            return
+        self.workbook.save(self.file_name)
\ No newline at end of file
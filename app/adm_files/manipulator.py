@@ -12,14 +12,13 @@ Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
 #   json: para manipulação de arquivos JSON
 #   pathlib.Path: para manipulação de caminhos de arquivos e pastas
 #   shutil: para operações de alto nível em arquivos e pastas
-#   Hash: para hash e verificação de senhas
+#   Hash: para restaurar as senhas das conexões do PREP (importado sob demanda, no connection_data)
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 import os
 import sys
 import json
 from pathlib import Path
 import shutil
-from app.security.password_hash import Hash
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Classe para manipulação de arquivos e pastas do sistema operacional
 #   Métodos:
@@ -30,6 +29,7 @@ from app.security.password_hash import Hash
 #       clean_folder: limpa o conteúdo de uma pasta
 #       create_txt: cria um arquivo .txt
 #       write_txt: escreve em um arquivo .txt
+#       connection_data: monta o conteúdo do arquivo de conexão JSON
 #       create_connection_file: cria um arquivo de conexão JSON
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 class manipulador:
@@ -45,6 +45,14 @@ class manipulador:
 #   programs_txt: arquivo .txt para armazenar os programas registrados
 #   users_txt: arquivo .txt para armazenar os usuários registrados
 #   settings_txt: arquivo .txt para armazenar as configurações registradas
+#   cleaner_txt: arquivo .txt com o resumo de cada passada do limpador de pastas
+#   cleaner_report_json: relatório completo (JSON) da última passada do limpador de pastas
+#   logs_index_db: banco auxiliar com o índice de busca do executed_txt
+#   job_queue_db: fila durável de execuções (JobQueueDB), dividida entre o APP e os executores sem interface
+#   cleaner_policies_json: políticas de limpeza de cada pasta (idade, filtros, profundidade, janela, limite de itens por segundo)
+#   startup_json: relatório do tempo de abertura do APP (StartupTimer)
+#   python_pool_json: configuração do pool de processos Python pré-aquecidos (opcional, desativado se o arquivo não existir)
+#   agents_json: configuração do despachante de execuções para os agentes (opcional, desativado se o arquivo não existir)
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#    
     def __init__(self):
         if getattr(sys, 'frozen', False):
@@ -66,6 +74,24 @@ class manipulador:
         self.programs_txt = os.path.join(self.logs_folder, "programs.txt")
         self.users_txt = os.path.join(self.logs_folder, "users.txt")
         self.settings_txt = os.path.join(self.logs_folder, "settings.txt")
+        self.cleaner_txt = os.path.join(self.logs_folder, "cleaner.txt")
+        self.cleaner_report_json = os.path.join(self.logs_folder, "cleaner_report.json")
+        self.startup_json = os.path.join(self.logs_folder, "startup.json")
+
+        # Banco auxiliar com o índice de busca do histórico de execuções
+        self.logs_index_db = os.path.join(self.database_folder, "logsIndex.db")
+
+        # Fila durável de execuções (agendadas, manuais e da linha de comando)
+        self.job_queue_db = os.path.join(self.database_folder, "jobQueue.db")
+
+        # Políticas de limpeza de cada pasta do limpador de pastas
+        self.cleaner_policies_json = os.path.join(self.database_folder, "cleaner_policies.json")
+
+        # Configuração do pool de processos Python pré-aquecidos
+        self.python_pool_json = os.path.join(self.database_folder, "python_pool.json")
+
+        # Configuração do despachante de execuções para os agentes (worker_agent)
+        self.agents_json = os.path.join(self.database_folder, "agents.json")
 
         # Caminho ícone imagem
         self.icon_terminator = os.path.join(self.image_folder, "icon_terminator.ico")
@@ -145,12 +171,15 @@ class manipulador:
         with open(path_txt, 'a', encoding='utf-8') as file:
             file.write(f"\n{new_content}")
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-#   Método para criar um arquivo de conexão JSON para usar no PREP
-#   Parâmetros: 1. nome do arquivo JSON
-#               2. output_list - lista de conexões de saída
-#               3. input_list - lista de conexões de entrada
+#   Método para montar o conteúdo do arquivo de conexão JSON do PREP (também enviado aos agentes, que criam o arquivo na máquina deles)
+#   Parâmetros: 1. output_list - lista de conexões de saída
+#               2. input_list - lista de conexões de entrada
+#               3. restore_password - função que restaura as senhas (padrão: uma única instância de Hash para todas as conexões)
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-    def create_connection_file(self, file_name, output_list, input_list):
+    def connection_data(self, output_list, input_list, restore_password=None):
+        from app.security.password_hash import Hash
+        # Cria o Hash uma única vez (a derivação da chave é cara)
+        restore_password = restore_password or Hash().restore_password
         # Dados a serem escritos no arquivo JSON
         out_data = []
         for data_out in output_list:
@@ -158,7 +187,7 @@ class manipulador:
                 "serverUrl": data_out["ServerURLOut"],
                 "contentUrl": data_out["ContentURLOut"],
                 "username": data_out["UsernameOut"],
-                "password": Hash().restore_password(data_out["PasswordOut"])
+                "password": restore_password(data_out["PasswordOut"])
             })
         in_data = []
         for data_in in input_list:
@@ -166,7 +195,7 @@ class manipulador:
                 "username": data_in["UsernameIn"],
                 "hostname": data_in["HostnameIn"],
                 "contentUrl": data_in["ContentURLIn"],
-                "password": Hash().restore_password(data_in["PasswordIn"])
+                "password": restore_password(data_in["PasswordIn"])
             })
 
         data = {
@@ -176,6 +205,16 @@ class manipulador:
             "inputConnections": 
                 in_data
         }
+        return data
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método para criar um arquivo de conexão JSON para usar no PREP
+#   Parâmetros: 1. nome do arquivo JSON
+#               2. output_list - lista de conexões de saída
+#               3. input_list - lista de conexões de entrada
+#               4. restore_password - função que restaura as senhas (padrão: uma única instância de Hash para todas as conexões)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def create_connection_file(self, file_name, output_list, input_list, restore_password=None):
+        data = self.connection_data(output_list, input_list, restore_password)
         # Escreve os dados no arquivo JSON
         with open(file_name, "w") as file:
             json.dump(data, file, indent=4)
\ No newline at end of file
@@ -0,0 +1,67 @@
+""" 
+Código para medir o tempo de abertura do APP (importações, janela pronta, primeiro frame e inicialização adiada).
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   time: para medir o tempo desde o início do processo
+#   json: para gravar o relatório da abertura
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import time
+import json
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe StartupTimer
+#   Deve ser o primeiro módulo importado pelo _app.py: o tempo começa a contar na importação deste arquivo.
+#   Cada etapa da abertura chama mark com o seu nome e, depois do primeiro frame, o relatório é gravado em JSON
+#   (manipulador.startup_json) com o tempo de cada etapa e se a janela apareceu dentro do orçamento (BUDGET_SECONDS).
+#   Métodos principais da classe:
+#       mark: registra o tempo (segundos desde o início) de uma etapa
+#       report: devolve o relatório das etapas
+#       save: grava o relatório em JSON e avisa no console se o orçamento foi ultrapassado
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class StartupTimer:
+    BUDGET_SECONDS = 1.0
+    started = time.perf_counter()
+    marks = {}
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que registra o tempo de uma etapa da abertura
+#   Parâmetros:
+#       name: nome da etapa (ex: "imports", "window", "first_frame")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def mark(cls, name):
+        cls.marks[name] = round(time.perf_counter() - cls.started, 4)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve o relatório das etapas
+#   Parâmetros:
+#       window_mark: etapa que representa a janela na tela (comparada com o orçamento)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def report(cls, window_mark="first_frame"):
+        time_to_window = cls.marks.get(window_mark)
+        return {
+            "date": time.strftime("%d/%m/%Y - %H:%M:%S"),
+            "marks": dict(cls.marks),
+            "budget_seconds": cls.BUDGET_SECONDS,
+            "time_to_window": time_to_window,
+            "within_budget": time_to_window is not None and time_to_window <= cls.BUDGET_SECONDS,
+        }
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que grava o relatório em JSON
+#   Parâmetros:
+#       path: caminho do arquivo JSON
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def save(cls, path):
+        report = cls.report()
+        try:
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(report, file, indent=4)
+        except OSError as e:
+            print(f"Error saving the startup report: {e}")
+        if not report["within_budget"]:
+            print(f"Startup took {report['time_to_window']}s (budget {cls.BUDGET_SECONDS}s): {report['marks']}")
+        return report
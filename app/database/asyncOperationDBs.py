@@ -0,0 +1,86 @@
+""" 
+Código para acesso assíncrono ao banco de dados (GenericDBOperations executado em uma thread dedicada ao banco).
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   asyncio: para aguardar (await) o resultado da thread do banco sem travar o loop de eventos
+#   functools: para montar a chamada (partial) enviada para a thread do banco
+#   inspect: para identificar quais atributos do GenericDBOperations são métodos
+#   ThreadPoolExecutor: thread única dedicada ao banco de dados
+#   GenericDBOperations: operações síncronas executadas na thread do banco
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from app.database.operationDBs import GenericDBOperations
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe AsyncDBOperations
+#   Versão assíncrona do GenericDBOperations para ser usada dentro do loop de eventos (Runner, agendador).
+#   O SQLAlchemy continua síncrono, mas cada chamada roda em uma thread dedicada ao banco: uma espera de disco ou de lock
+#   no executerDB.db não trava mais a leitura das saídas (pipes) das tarefas em execução.
+#   A thread é única e compartilhada por todas as instâncias (atributo da classe), então as operações assíncronas no banco
+#   acontecem uma de cada vez, na ordem em que foram pedidas (o SQLite só aceita uma escrita por vez).
+#   Cada instância tem o seu próprio GenericDBOperations (engine e sessão próprios), usado somente pela thread do banco.
+#   Qualquer método do GenericDBOperations pode ser aguardado diretamente: await async_db.select(["id"]), await async_db.update(1, ...)
+#   Métodos principais da classe:
+#       submit: executa qualquer função na thread do banco e aguarda o resultado (ex: atualização do catálogo de programas)
+#       run: o mesmo que submit, a partir de uma instância
+#       __getattr__: devolve a versão assíncrona dos métodos do GenericDBOperations
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class AsyncDBOperations:
+    _executor = None
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Construtor da classe
+#   Parâmetros:
+#       model_class: Classe do modelo do banco de dados (ex: SettingsDB, ProgramsDB)
+#       database_url: URL de conexão com o banco de dados
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def __init__(self, model_class, database_url):
+        self.db = GenericDBOperations(model_class, database_url)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve a thread dedicada ao banco (criada somente no primeiro uso)
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def executor(cls):
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="terminator-db")
+        return cls._executor
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que executa uma função na thread do banco e aguarda o resultado sem bloquear o loop de eventos
+#   Parâmetros:
+#       function: função síncrona que acessa o banco
+#       *args, **kwargs: argumentos da função
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    async def submit(cls, function, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls.executor(), functools.partial(function, *args, **kwargs))
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que executa uma função na thread do banco a partir de uma instância
+#   Parâmetros:
+#       function: função síncrona que acessa o banco
+#       *args, **kwargs: argumentos da função
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def run(self, function, *args, **kwargs):
+        return await self.submit(function, *args, **kwargs)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve a versão assíncrona de um método do GenericDBOperations (chamado somente para atributos que não existem nesta classe)
+#   Parâmetros:
+#       name: nome do método (ex: "select", "update", "get_by_column")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def __getattr__(self, name):
+        attribute = getattr(self.db, name)
+        # Atributos que não são métodos (engine, model_class...) são devolvidos sem alteração
+        if not inspect.ismethod(attribute):
+            return attribute
+
+        async def method(*args, **kwargs):
+            return await self.submit(attribute, *args, **kwargs)
+        return method
@@ -0,0 +1,269 @@
+""" 
+Código da fila durável de execuções (SQLite): os pedidos de execução sobrevivem ao fechamento ou travamento do APP.
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   sqlite3: para o banco da fila (arquivo próprio, fora do executerDB.db)
+#   time: para as datas (epoch) dos pedidos e o vencimento das reservas
+#   uuid: para a chave dos pedidos sem chave própria (execuções manuais)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import sqlite3
+import time
+import uuid
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe JobQueueDB
+#   Fila de execuções gravada em um banco SQLite próprio. Cada pedido passa pelos estados:
+#       queued: aguardando um executor
+#       leased: reservado por um executor (owner) até lease_until
+#       running: programa em execução (a reserva é renovada pelo executor enquanto ele estiver vivo)
+#       done: terminou com sucesso
+#       failed: terminou com erro, foi cancelado ou a reserva venceu sem tentativas restantes
+#   Pedido idempotente: a chave (job_key) é única; pedir de novo a mesma chave (ex: o mesmo horário do schedule depois de reabrir o APP)
+#   devolve o pedido que já existe em vez de criar outro.
+#   Retirada idempotente: a reserva é feita dentro de uma transação BEGIN IMMEDIATE (um único processo escreve por vez),
+#   então dois executores (mesmo em processos diferentes) nunca recebem o mesmo pedido; terminar um pedido que já terminou
+#   ou que foi reservado por outro executor não altera nada.
+#   Reserva vencida (executor fechado ou travado): o pedido volta para a fila se ainda tiver tentativas, senão fica como failed.
+#   Métodos:
+#       __init__: define o caminho e cria as tabelas da fila
+#       enqueue: acrescenta um pedido (ou devolve o que já existe com a mesma chave)
+#       has_queued: verifica se há pedidos aguardando (leitura rápida, sem travar a fila)
+#       dequeue: reserva os próximos pedidos para um executor
+#       start: marca um pedido reservado como em execução
+#       heartbeat: renova as reservas de um executor
+#       finish: grava o resultado de um pedido
+#       release: devolve para a fila os pedidos reservados e ainda não iniciados de um executor
+#       jobs: lista os pedidos (mais recentes primeiro)
+#       purge: apaga os pedidos terminados há mais de alguns dias
+#       _expire: devolve para a fila (ou encerra) os pedidos com reserva vencida
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class JobQueueDB:
+    STATES = ("queued", "leased", "running", "done", "failed")
+    # Colunas devolvidas pelas consultas (dicionários)
+    COLUMNS = ("id", "job_key", "program_id", "program_name", "type_run", "state", "status", "owner", "lease_until",
+               "attempts", "max_attempts", "exec_id", "enqueued_at", "started_at", "finished_at")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Construtor da classe
+#   Parâmetros:
+#       queue_path: caminho do banco da fila (ex: C:/Terminator/Database/jobQueue.db)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def __init__(self, queue_path):
+        self.queue_path = queue_path
+        self._create_tables()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que abre uma conexão nova com o banco da fila
+#   Cada chamada abre a sua conexão para que a fila possa ser usada por threads e processos diferentes
+#   As transações são abertas explicitamente (isolation_level=None): BEGIN IMMEDIATE nas reservas
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _connect(self):
+        return sqlite3.connect(self.queue_path, timeout=30, isolation_level=None)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que cria as tabelas da fila caso ainda não existam
+#   O modo WAL permite que os executores leiam a fila enquanto outro processo grava
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _create_tables(self):
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id INTEGER PRIMARY KEY, job_key TEXT NOT NULL UNIQUE, program_id INTEGER, program_name TEXT, type_run TEXT, "
+                "state TEXT NOT NULL DEFAULT 'queued', status TEXT, owner TEXT, lease_until REAL, "
+                "attempts INTEGER NOT NULL DEFAULT 0, max_attempts INTEGER NOT NULL DEFAULT 1, exec_id TEXT, "
+                "enqueued_at REAL, started_at REAL, finished_at REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_jobs_state ON jobs (state, id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_jobs_owner ON jobs (owner)")
+        finally:
+            conn.close()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que acrescenta um pedido na fila
+#   Parâmetros:
+#       program_id: ID do programa (os dados do programa são lidos do catálogo somente na hora de executar)
+#       program_name: nome do programa (exibido no histórico)
+#       type_run: tipo da execução (Automatic, On Demand, Remote...)
+#       job_key: chave única do pedido (padrão: uma chave nova, ou seja, sempre um pedido novo)
+#       max_attempts: tentativas quando a reserva vence (ex: 2 = executa de novo uma vez se o APP fechar no meio da execução)
+#   Retorna o ID do pedido (o novo ou o que já existia com a mesma chave)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def enqueue(self, program_id, program_name, type_run, job_key=None, max_attempts=1):
+        job_key = job_key or uuid.uuid4().hex
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR IGNORE INTO jobs (job_key, program_id, program_name, type_run, max_attempts, enqueued_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_key, program_id, program_name, type_run, max(1, int(max_attempts)), time.time())
+            )
+            return conn.execute("SELECT id FROM jobs WHERE job_key = ?", (job_key,)).fetchone()[0]
+        finally:
+            conn.close()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que verifica se há pedidos aguardando ou com reserva vencida (somente leitura: não disputa a escrita com os outros executores)
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def has_queued(self):
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "SELECT 1 FROM jobs WHERE state = 'queued' OR (state IN ('leased', 'running') AND lease_until < ?) LIMIT 1", (time.time(),)
+            ).fetchone() is not None
+        finally:
+            conn.close()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve para a fila (ou encerra como failed) os pedidos cuja reserva venceu
+#   Deve ser chamado dentro de uma transação
+#   Parâmetros:
+#       conn: conexão com a transação aberta
+#       now: horário atual (epoch)
+#   Retorna a quantidade de pedidos alterados
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _expire(self, conn, now):
+        requeued = conn.execute(
+            "UPDATE jobs SET state = 'queued', owner = NULL, lease_until = NULL "
+            "WHERE state IN ('leased', 'running') AND lease_until < ? AND attempts < max_attempts", (now,)
+        ).rowcount
+        failed = conn.execute(
+            "UPDATE jobs SET state = 'failed', status = 'Lease Expired', finished_at = ? "
+            "WHERE state IN ('leased', 'running') AND lease_until < ?", (now, now)
+        ).rowcount
+        return requeued + failed
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que reserva os próximos pedidos da fila para um executor (os mais antigos primeiro)
+#   Antes da reserva, os pedidos com reserva vencida voltam para a fila (ou são encerrados)
+#   Parâmetros:
+#       owner: identificação do executor (ex: "MAQUINA:1234")
+#       lease_seconds: duração da reserva; o executor renova com heartbeat enquanto estiver vivo
+#       limit: quantidade máxima de pedidos reservados (None = todos os que estiverem aguardando)
+#   Retorna a lista de pedidos reservados (dicionários)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def dequeue(self, owner, lease_seconds=120, limit=None):
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._expire(conn, now)
+                ids = [row[0] for row in conn.execute("SELECT id FROM jobs WHERE state = 'queued' ORDER BY id LIMIT ?", (-1 if limit is None else limit,))]
+                for job_id in ids:
+                    conn.execute(
+                        "UPDATE jobs SET state = 'leased', owner = ?, lease_until = ?, attempts = attempts + 1 WHERE id = ? AND state = 'queued'",
+                        (owner, now + lease_seconds, job_id)
+                    )
+                rows = conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM jobs WHERE id IN ({', '.join('?' * len(ids))}) ORDER BY id", ids).fetchall() if ids else []
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            return [dict(zip(self.COLUMNS, row)) for row in rows]
+        finally:
+            conn.close()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que marca um pedido reservado como em execução
+#   Parâmetros:
+#       job_id: ID do pedido
+#       owner: executor que reservou o pedido
+#       exec_id: ID da execução no APP (usado para cancelar e no histórico)
+#       lease_seconds: nova duração da reserva
+#   Retorna True se o pedido ainda era deste executor (False se a reserva venceu e o pedido foi para outro)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def start(self, job_id, owner, exec_id, lease_seconds=120):
+        now = time.time()
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "UPDATE jobs SET state = 'running', exec_id = ?, started_at = ?, lease_until = ? WHERE id = ? AND owner = ? AND state = 'leased'",
+                (str(exec_id), now, now + lease_seconds, job_id, owner)
+            ).rowcount == 1
+        finally:
+            conn.close()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que renova as reservas de todos os pedidos de um executor
+#   Parâmetros:
+#       owner: identificação do executor
+#       lease_seconds: nova duração da reserva
+#   Retorna a quantidade de reservas renovadas
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def heartbeat(self, owner, lease_seconds=120):
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "UPDATE jobs SET lease_until = ? WHERE owner = ? AND state IN ('leased', 'running')",
+                (time.time() + lease_seconds, owner)
+            ).rowcount
+        finally:
+            conn.close()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que grava o resultado de um pedido (done para "Success", failed para os demais status)
+#   Idempotente: só altera pedidos reservados ou em execução pelo mesmo executor
+#   Parâmetros:
+#       job_id: ID do pedido
+#       owner: executor que reservou o pedido
+#       status: status final da execução (Success, Error, Path Not Found, Error Run...)
+#   Retorna True se o resultado foi gravado
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def finish(self, job_id, owner, status):
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "UPDATE jobs SET state = ?, status = ?, finished_at = ?, lease_until = NULL WHERE id = ? AND owner = ? AND state IN ('leased', 'running')",
+                ("done" if status == "Success" else "failed", status, time.time(), job_id, owner)
+            ).rowcount == 1
+        finally:
+            conn.close()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve para a fila os pedidos reservados e ainda não iniciados de um executor (ex: ao fechar o APP)
+#   A tentativa não é contada, pois o programa não chegou a rodar
+#   Parâmetros:
+#       owner: identificação do executor
+#   Retorna a quantidade de pedidos devolvidos
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def release(self, owner):
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "UPDATE jobs SET state = 'queued', owner = NULL, lease_until = NULL, attempts = attempts - 1 WHERE owner = ? AND state = 'leased'",
+                (owner,)
+            ).rowcount
+        finally:
+            conn.close()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que lista os pedidos da fila (mais recentes primeiro)
+#   Parâmetros:
+#       states: estados desejados (padrão: todos)
+#       since: somente pedidos criados a partir deste horário (epoch)
+#       limit: quantidade máxima de pedidos
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def jobs(self, states=None, since=None, limit=200):
+        conditions, values = [], []
+        if states:
+            conditions.append(f"state IN ({', '.join('?' * len(states))})")
+            values.extend(states)
+        if since is not None:
+            conditions.append("enqueued_at >= ?")
+            values.append(since)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        conn = self._connect()
+        try:
+            rows = conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM jobs {where} ORDER BY id DESC LIMIT ?", (*values, limit)).fetchall()
+            return [dict(zip(self.COLUMNS, row)) for row in rows]
+        finally:
+            conn.close()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que apaga os pedidos terminados (done/failed) há mais de 'days' dias
+#   Parâmetros:
+#       days: idade mínima (dias) dos pedidos apagados
+#   Retorna a quantidade de pedidos apagados
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def purge(self, days=30):
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "DELETE FROM jobs WHERE state IN ('done', 'failed') AND finished_at < ?", (time.time() - days * 86400,)
+            ).rowcount
+        finally:
+            conn.close()
@@ -0,0 +1,266 @@
+"""
+Código para indexação e busca textual (SQLite FTS5) do histórico de execuções gravado no executed.txt.
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   os: para verificar o tamanho e a existência do arquivo de log
+#   re: para extrair os campos de cada registro do log
+#   sqlite3: para o banco auxiliar com o índice invertido (FTS5)
+#   threading: para atualizar o índice em segundo plano sem travar a interface
+#   datetime: para converter as datas do log para o formato ISO (ordenável)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Separador e expressões regulares para identificar os registros e os campos gravados pelo Runner e pelo stop_execution do App
+#   Um registro começa no separador (exatamente 115 traços) seguido da linha de cabeçalho ("Program ID: ..." ou "Program '...' Canceled.")
+#   e termina no próximo separador: linhas de traços impressas pelos programas (tabelas, print("-"*40)) não abrem nem fecham registros
+#   INDEX_VERSION: versão da leitura dos registros; índices gravados por outra versão são reconstruídos
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+SEPARATOR = "-" * 115
+HEADER_LINE = re.compile(r"^(?:Program ID: |Program '.*' Canceled\.$)")
+INDEX_VERSION = "2"
+FIELD_NAME = re.compile(r"^Program Name: (.*?)\.?$")
+FIELD_CANCELED = re.compile(r"^Program '(.*)' Canceled\.$")
+FIELD_FINISH = re.compile(r"^(?:Finish Hour|Canceled Hour): (\d{2}/\d{2}/\d{4} - \d{2}:\d{2}:\d{2})")
+FIELD_TYPE_RUN = re.compile(r"^Type Run: (.*?)\.?$")
+FIELD_OUTPUT = re.compile(r"^Output: (\w+)")
+PROGRAM_ID = re.compile(r"^(\d+) - ")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe LogsIndexDB
+#   Mantém um banco auxiliar (sidecar) com um índice invertido FTS5 sobre os registros do log de execuções.
+#   O índice é incremental: guarda o offset (bytes) e a linha já lidos do arquivo e só processa o que foi acrescentado.
+#   Se o arquivo for truncado ou substituído (ou o índice tiver sido gravado por outra versão), o índice é reconstruído do zero.
+#   Métodos:
+#       __init__: define os caminhos e cria as tabelas do índice
+#       update: lê os novos registros do log e adiciona no índice
+#       start_background_update: chama o update em uma thread separada
+#       search: busca registros por texto, programa, status e intervalo de datas
+#       iter_records: percorre todos os registros indexados (do mais antigo ao mais recente) sem carregar tudo em memória
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class LogsIndexDB:
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Construtor da classe
+#   Parâmetros:
+#       log_path: caminho do arquivo de log indexado (ex: executed.txt)
+#       index_path: caminho do banco auxiliar onde o índice será gravado
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def __init__(self, log_path, index_path):
+        self.log_path = log_path
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        self._thread = None
+        self._create_tables()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que abre uma conexão nova com o banco do índice
+#   Cada chamada abre a sua conexão para que o índice possa ser usado por threads diferentes
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _connect(self):
+        return sqlite3.connect(self.index_path, timeout=10)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que cria as tabelas do índice caso ainda não existam
+#       meta: offset, linha e assinatura do arquivo já indexado
+#       records: campos filtráveis de cada registro (com índices) e a linha onde o registro começa
+#       records_fts: índice invertido (sem conteúdo) sobre o texto completo de cada registro
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _create_tables(self):
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                "id INTEGER PRIMARY KEY, program_id TEXT, program_name TEXT, status TEXT, "
+                "finish TEXT, type_run TEXT, line INTEGER)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_records_program_id ON records (program_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_records_status ON records (status)")
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_records_finish ON records (finish)")
+            conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS records_fts USING fts5(body, content='')")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que lê o estado salvo na tabela meta
+#   Retorna: (offset, linha, assinatura, versão)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _read_meta(self, conn):
+        meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+        return int(meta.get("offset", 0)), int(meta.get("line", 1)), meta.get("head", ""), meta.get("version", "")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que apaga todo o índice (usado quando o arquivo de log é truncado ou substituído)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _reset(self, conn):
+        conn.execute("DELETE FROM records")
+        conn.execute("INSERT INTO records_fts(records_fts) VALUES ('delete-all')")
+        conn.execute("DELETE FROM meta")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que transforma as linhas de um bloco do log em um registro do índice
+#   Parâmetros:
+#       lines: linhas do bloco (sem as linhas de traços)
+#       line_number: linha do arquivo onde o bloco começa
+#   Retorna uma tupla com os campos da tabela records e o texto completo do bloco
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _parse_block(self, lines, line_number):
+        program_name, status, finish, type_run = "", "", "", ""
+        for line in lines:
+            line = line.strip()
+            if (match := FIELD_NAME.match(line)) and not program_name:
+                program_name = match.group(1)
+            elif match := FIELD_CANCELED.match(line):
+                program_name, status = match.group(1), "Canceled"
+            elif (match := FIELD_FINISH.match(line)) and not finish:
+                finish = datetime.strptime(match.group(1), "%d/%m/%Y - %H:%M:%S").strftime("%Y-%m-%d %H:%M:%S")
+            elif (match := FIELD_TYPE_RUN.match(line)) and not type_run:
+                type_run = match.group(1)
+            elif (match := FIELD_OUTPUT.match(line)) and not status:
+                # "Output: Canceled by Error Run Process." também é tratado como cancelamento
+                status = "Canceled" if match.group(1) == "Canceled" else match.group(1)
+        program_id = PROGRAM_ID.match(program_name)
+        program_id = program_id.group(1) if program_id else ""
+        return (program_id, program_name, status, finish, type_run, line_number), "\n".join(lines)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que atualiza o índice com os registros acrescentados no log desde a última leitura
+#   Apenas blocos completos (separador e cabeçalho no início, separador no fim) são indexados; um bloco incompleto será lido na próxima chamada
+#   Parâmetros:
+#       Nenhum
+#   Retorna a quantidade de registros adicionados
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def update(self):
+        if not os.path.exists(self.log_path):
+            return 0
+        # Garante que apenas uma atualização rode por vez
+        with self._lock, self._connect() as conn:
+            offset, line_number, head, version = self._read_meta(conn)
+            size = os.path.getsize(self.log_path)
+
+            with open(self.log_path, "rb") as file:
+                current_head = file.read(64).decode("utf-8", errors="replace")
+                # Arquivo truncado ou substituído (ou índice gravado por outra versão): reconstrói o índice
+                if size < offset or (head and current_head != head) or (offset and version != INDEX_VERSION):
+                    self._reset(conn)
+                    offset, line_number = 0, 1
+                if size == offset:
+                    return 0
+                file.seek(offset)
+                data = file.read(size - offset)
+
+            new_records = []
+            # separator_line: linha do separador que ainda espera o cabeçalho (None = nenhum)
+            block, block_line, separator_line = None, 0, None
+            position, last_offset, last_line = offset, offset, line_number
+            for raw_line in data.splitlines(keepends=True):
+                # Linha final sem quebra de linha ainda está sendo escrita
+                if not raw_line.endswith(b"\n"):
+                    break
+                line = raw_line.decode("utf-8", errors="replace").rstrip("\r\n")
+                position += len(raw_line)
+                if block is not None:
+                    # Dentro do registro, somente o separador exato fecha o bloco
+                    if line.strip() == SEPARATOR:
+                        new_records.append(self._parse_block(block, block_line))
+                        block = None
+                    else:
+                        block.append(line)
+                elif separator_line is not None and HEADER_LINE.match(line.strip()):
+                    # Separador seguido do cabeçalho: começo de um registro
+                    block, block_line, separator_line = [line], separator_line, None
+                else:
+                    # Linhas fora de um registro (ex: "Start Program - ...") são ignoradas
+                    separator_line = line_number if line.strip() == SEPARATOR else None
+                line_number += 1
+                # Só avança o ponto salvo quando não há bloco aberto nem separador esperando o cabeçalho
+                if block is None and separator_line is None:
+                    last_offset, last_line = position, line_number
+
+            for fields, body in new_records:
+                cursor = conn.execute(
+                    "INSERT INTO records (program_id, program_name, status, finish, type_run, line) VALUES (?, ?, ?, ?, ?, ?)",
+                    fields
+                )
+                conn.execute("INSERT INTO records_fts (rowid, body) VALUES (?, ?)", (cursor.lastrowid, body))
+
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [("offset", str(last_offset)), ("line", str(last_line)), ("head", current_head), ("version", INDEX_VERSION)]
+            )
+            return len(new_records)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que atualiza o índice em segundo plano (thread daemon)
+#   Se uma atualização já estiver rodando, não inicia outra
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def start_background_update(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._safe_update, daemon=True)
+            self._thread.start()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que executa o update tratando os erros (usado pela thread em segundo plano)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _safe_update(self):
+        try:
+            self.update()
+        except Exception as e:
+            print(f"Error to update the log index {self.index_path}:\n{e}")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que busca registros no índice
+#   Parâmetros:
+#       text: termos livres procurados no texto do registro (todos devem aparecer)
+#       program: ID do programa (somente números) ou parte do nome do programa
+#       status: "Success", "Error" ou "Canceled" (vazio para todos)
+#       date_from / date_to: datas no formato dd/mm/YYYY (inclusivas)
+#       limit: quantidade máxima de resultados
+#   Retorna uma lista de dicionários ordenada do registro mais recente para o mais antigo
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def search(self, text="", program="", status="", date_from="", date_to="", limit=500):
+        conditions, values = [], []
+        if text.strip():
+            # Cada termo vira uma frase entre aspas para não ser interpretado como sintaxe do FTS5
+            terms = " ".join('"' + term.replace('"', '""') + '"' for term in text.split())
+            conditions.append("id IN (SELECT rowid FROM records_fts WHERE records_fts MATCH ?)")
+            values.append(terms)
+        if program.strip():
+            if program.strip().isdigit():
+                conditions.append("program_id = ?")
+                values.append(program.strip())
+            else:
+                conditions.append("program_name LIKE ?")
+                values.append(f"%{program.strip()}%")
+        if status:
+            conditions.append("status = ?")
+            values.append(status)
+        if date_from:
+            conditions.append("finish >= ?")
+            values.append(datetime.strptime(date_from, "%d/%m/%Y").strftime("%Y-%m-%d 00:00:00"))
+        if date_to:
+            conditions.append("finish <= ?")
+            values.append(datetime.strptime(date_to, "%d/%m/%Y").strftime("%Y-%m-%d 23:59:59"))
+
+        query = "SELECT program_id, program_name, status, finish, type_run, line FROM records"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY id DESC LIMIT ?"
+        values.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(query, values).fetchall()
+        columns = ("program_id", "program_name", "status", "finish", "type_run", "line")
+        return [dict(zip(columns, row)) for row in rows]
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que percorre todos os registros indexados, do mais antigo ao mais recente (usado na exportação do histórico)
+#   Os registros são lidos do cursor aos poucos, sem carregar o índice inteiro em memória
+#   Parâmetros:
+#       Nenhum
+#   Retorna um gerador de tuplas (program_id, program_name, status, finish, type_run)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def iter_records(self):
+        conn = self._connect()
+        try:
+            cursor = conn.execute("SELECT program_id, program_name, status, finish, type_run FROM records ORDER BY id")
+            for row in cursor:
+                yield row
+        finally:
+            conn.close()
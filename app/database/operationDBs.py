@@ -11,27 +11,100 @@ Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
 #   create_engine: Função para criar uma conexão com o banco de dados.
 #   sessionmaker: Função para criar uma fábrica de sessões.
 #   Base: Classe base para definir modelos de banco de dados.
+#   insert, update, delete, select, bindparam: Construtores do SQLAlchemy core usados nas operações em lote (executemany).
+#   inspect: Função para ler as colunas que já existem nas tabelas do banco (migração leve).
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#    
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert, update, delete, select, bindparam, exists, inspect
 from sqlalchemy.orm import sessionmaker
 from app.database.base import Base
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Classe para operações genéricas em bancos de dados.
 #   model_class: Classe do modelo do banco de dados (ex: UsersDB, ProgramsDB, SettingsDB).
 #   database_url: URL de conexão com o banco de dados (ex: "sqlite:///C:/Terminator/Database/executerDB.db").
+#   As operações em lote (bulk_register, bulk_update, bulk_delete) usam o SQLAlchemy core dentro de uma única transação,
+#   divididas em lotes de 'batch_size' linhas para entradas muito grandes. Se algum lote falhar, nada é gravado (rollback).
+#   As consultas select e exists leem somente as colunas pedidas e devolvem tuplas leves (Row), sem criar objetos do ORM.
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 class GenericDBOperations:
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Construtor que inicializa a classe com a classe do modelo e a URL do banco de dados.
 #   Cria a engine e a sessão para interagir com o banco de dados.
+#   Também cria as colunas e os índices que ainda não existem em bancos antigos (migração leve).
+#   A criação das tabelas e a migração só rodam na primeira instância de cada banco (URL) no processo:
+#   o APP abre várias instâncias para o mesmo executerDB.db e não precisa conferir o esquema em todas (abertura mais rápida).
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    _prepared_urls = set()
+
     def __init__(self, model_class, database_url):
         self.model_class = model_class
         self.engine = create_engine(database_url)
-        Base.metadata.create_all(self.engine)
+        self.created_columns = []
+        self.created_indexes = []
+        if database_url not in GenericDBOperations._prepared_urls:
+            Base.metadata.create_all(self.engine)
+            self.created_columns = self.migrate_columns()
+            self.created_indexes = self.migrate_indexes()
+            GenericDBOperations._prepared_urls.add(database_url)
         self.Session = sessionmaker(bind=self.engine)
         self.session = self.Session()
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método de migração leve do esquema: acrescenta (ALTER TABLE ADD COLUMN) as colunas declaradas nos modelos
+#   que ainda não existem nas tabelas de bancos antigos (ex: programs.revision).
+#   Se a coluna tiver um valor padrão simples, ele é usado como DEFAULT para preencher os registros existentes.
+#   Parâmetros:
+#       Nenhum
+#   Retorna a lista com as colunas criadas ("tabela.coluna")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def migrate_columns(self):
+        created = []
+        for table in Base.metadata.sorted_tables:
+            try:
+                existing = {column["name"] for column in inspect(self.engine).get_columns(table.name)}
+                for column in table.columns:
+                    if column.name in existing:
+                        continue
+                    column_type = column.type.compile(dialect=self.engine.dialect)
+                    default = column.default.arg if column.default is not None and column.default.is_scalar else None
+                    default_sql = f" DEFAULT {default!r}" if default is not None else ""
+                    with self.engine.begin() as connection:
+                        connection.exec_driver_sql(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}{default_sql}')
+                    created.append(f"{table.name}.{column.name}")
+            except Exception as e:
+                print(f"Error adding the new columns of table '{table.name}': {e}")
+        return created
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método de migração leve do esquema: o create_all só cria as tabelas que não existem,
+#   então os índices declarados depois (ex: programs.owner_id, programs.program_name) não chegam aos executerDB.db já existentes.
+#   Cria somente os índices que faltam (checkfirst); os dados das tabelas não são alterados.
+#   Parâmetros:
+#       Nenhum
+#   Retorna a lista com os nomes dos índices criados
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def migrate_indexes(self):
+        created = []
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                try:
+                    with self.engine.begin() as connection:
+                        if not self.engine.dialect.has_index(connection, table.name, index.name):
+                            index.create(connection)
+                            created.append(index.name)
+                except Exception as e:
+                    print(f"Error creating index '{index.name}': {e}")
+        return created
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve o plano de execução (EXPLAIN QUERY PLAN do SQLite) de uma consulta
+#   Usado para conferir se as consultas mais usadas usam índice em vez de percorrer a tabela inteira (SCAN)
+#   Parâmetros:
+#       statement: consulta do SQLAlchemy (select, update, delete...)
+#   Retorna a lista com as linhas de detalhe do plano (ex: "SEARCH programs USING INDEX ix_programs_owner_id (owner_id=?)")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def query_plan(self, statement):
+        compiled = statement.compile(self.engine)
+        with self.engine.connect() as connection:
+            rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", tuple(compiled.params[name] for name in compiled.positiontup)).all()
+        return [row[-1] for row in rows]
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método para registrar um novo registro no banco de dados.
 #   Parâmetros:
 #       **kwargs: Argumentos nomeados correspondentes aos campos do modelo.
@@ -82,6 +155,52 @@ class GenericDBOperations:
             result.append({column.name: getattr(record, column.name) for column in self.model_class.__table__.columns})
         return result
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que monta as condições (WHERE) das consultas select/exists
+#   Parâmetros:
+#       where: dicionário {coluna: valor}; se o valor for lista/tupla/set, vira "coluna IN (...)"
+#       where_not: dicionário {coluna: valor} com os valores que NÃO devem aparecer (None = coluna não nula)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _conditions(self, where=None, where_not=None):
+        table = self.model_class.__table__
+        conditions = []
+        for column_name, value in (where or {}).items():
+            column = table.c[column_name]
+            conditions.append(column.in_(list(value)) if isinstance(value, (list, tuple, set)) else column == value)
+        for column_name, value in (where_not or {}).items():
+            column = table.c[column_name]
+            conditions.append(column.is_not(None) if value is None else (column != value) | column.is_(None))
+        return conditions
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que busca somente as colunas pedidas, com filtros e limite, sem criar objetos do ORM
+#   Parâmetros:
+#       columns: lista com os nomes das colunas (padrão: todas)
+#       where: dicionário {coluna: valor} (valor lista/tupla/set = IN)
+#       where_not: dicionário {coluna: valor} dos valores que devem ser excluídos
+#       limit: quantidade máxima de registros
+#       order_by: nome da coluna usada na ordenação
+#   Retorna uma lista de tuplas (Row), que também permitem acesso por nome (row.program_name)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def select(self, columns=None, where=None, where_not=None, limit=None, order_by=None):
+        table = self.model_class.__table__
+        statement = select(*[table.c[column] for column in columns]) if columns else select(table)
+        conditions = self._conditions(where, where_not)
+        if conditions:
+            statement = statement.where(*conditions)
+        if order_by:
+            statement = statement.order_by(table.c[order_by])
+        if limit:
+            statement = statement.limit(limit)
+        return self.session.execute(statement).all()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que verifica se existe algum registro (com os filtros informados) sem ler os registros
+#   Parâmetros:
+#       **where: filtros {coluna: valor} (valor lista/tupla/set = IN)
+#   Retorna True ou False
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def exists(self, **where):
+        statement = select(exists().where(*self._conditions(where)) if where else exists(self.model_class.__table__.select()))
+        return bool(self.session.execute(statement).scalar())
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método que pega um registro do banco de dados com base em um valor específico de uma coluna.
 #   Parâmetros:
 #       column_name: Nome da coluna a ser filtrada.
@@ -124,4 +243,90 @@ class GenericDBOperations:
                 manipulador.write_txt(manipulador.programs_txt, content_name)
         else:
             content_id = f"Program with ID '{program_id}' not found!\n"
-            manipulador.write_txt(manipulador.programs_txt, content_id)
\ No newline at end of file
+            manipulador.write_txt(manipulador.programs_txt, content_id)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que executa uma operação em lotes dentro de uma única transação (commit único ou rollback de tudo)
+#   Parâmetros:
+#       items: lista de itens a serem gravados
+#       batch_size: quantidade de itens por lote
+#       execute_batch: função que recebe a conexão e um lote de itens e retorna a quantidade de linhas afetadas
+#       before: função opcional que recebe a conexão e roda antes dos lotes, na mesma transação
+#   Retorna a quantidade total de linhas afetadas
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _run_in_batches(self, items, batch_size, execute_batch, before=None):
+        affected = 0
+        try:
+            connection = self.session.connection()
+            if before:
+                before(connection)
+            for start in range(0, len(items), batch_size):
+                affected += execute_batch(connection, items[start:start + batch_size])
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        finally:
+            # Os objetos já carregados na sessão precisam ser relidos depois da alteração em lote
+            self.session.expire_all()
+        return affected
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método para registrar vários registros de uma vez (INSERT com executemany)
+#   Parâmetros:
+#       records: lista de dicionários com os campos do modelo
+#       batch_size: quantidade de registros por lote (padrão: 500)
+#   Retorna a quantidade de registros inseridos
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def bulk_register(self, records, batch_size=500):
+        table = self.model_class.__table__
+        records = list(records)
+        if not records:
+            return 0
+        def execute_batch(connection, batch):
+            connection.execute(insert(table), batch)
+            return len(batch)
+        return self._run_in_batches(records, batch_size, execute_batch)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método para atualizar vários registros de uma vez (UPDATE com executemany)
+#   Registros com os mesmos campos são agrupados no mesmo comando.
+#   Parâmetros:
+#       records: lista de dicionários com o campo 'id' e os campos a serem atualizados
+#       batch_size: quantidade de registros por lote (padrão: 500)
+#       reset: dicionário {coluna: valor} gravado em todos os registros antes da atualização, na mesma transação
+#              (ex: limpar um campo e gravar os novos valores; se algo falhar, os valores antigos continuam no banco)
+#   Retorna a quantidade de registros atualizados
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def bulk_update(self, records, batch_size=500, reset=None):
+        table = self.model_class.__table__
+        # Agrupa os registros pelos campos alterados (cada grupo vira um único UPDATE com executemany)
+        groups = {}
+        for record in records:
+            fields = tuple(sorted(key for key in record if key != "id"))
+            if fields:
+                groups.setdefault(fields, []).append({f"b_{key}": value for key, value in record.items()})
+        if not groups and not reset:
+            return 0
+        items = [(fields, row) for fields, rows in groups.items() for row in rows]
+        def execute_batch(connection, batch):
+            affected = 0
+            for fields in dict.fromkeys(fields for fields, _ in batch):
+                statement = update(table).where(table.c.id == bindparam("b_id")).values({field: bindparam(f"b_{field}") for field in fields})
+                result = connection.execute(statement, [row for row_fields, row in batch if row_fields == fields])
+                affected += max(result.rowcount, 0)
+            return affected
+        before = (lambda connection: connection.execute(update(table).values(reset))) if reset else None
+        return self._run_in_batches(items, batch_size, execute_batch, before)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método para deletar vários registros de uma vez pelo ID (DELETE ... WHERE id IN (...))
+#   Parâmetros:
+#       record_ids: lista de IDs a serem deletados
+#       batch_size: quantidade de IDs por lote (padrão: 500)
+#   Retorna a quantidade de registros deletados
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def bulk_delete(self, record_ids, batch_size=500):
+        table = self.model_class.__table__
+        record_ids = list(record_ids)
+        if not record_ids:
+            return 0
+        def execute_batch(connection, batch):
+            return max(connection.execute(delete(table).where(table.c.id.in_(batch))).rowcount, 0)
+        return self._run_in_batches(record_ids, batch_size, execute_batch)
\ No newline at end of file
@@ -0,0 +1,133 @@
+""" 
+Código para o catálogo em memória dos programas cadastrados (ProgramsDB), com atualização por versão de cada registro.
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   threading: para proteger o catálogo quando for lido por mais de uma thread
+#   Path: para montar o caminho parcial exibido nas tabelas
+#   ProgramParameters: para ler os parâmetros já convertidos (JSON) de cada programa
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import threading
+from pathlib import Path
+from app.executer.program_parameters import ProgramParameters
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe ProgramCatalog
+#   Mantém em memória os programas cadastrados já decodificados: schedule separado em (hora, dia), parâmetros convertidos e caminho parcial para exibição.
+#   As telas (Programs, Schedule, Export, execução manual, alteração e exclusão) e o agendador leem daqui em vez de consultar
+#   e decodificar a tabela inteira a cada troca de aba.
+#   Atualização por versão: a cada leitura o catálogo consulta somente (id, revision, date_modified) de todos os programas
+#   e busca no banco apenas os registros novos ou cuja versão mudou; os programas que não existem mais são removidos.
+#   A coluna revision é incrementada pelo próprio banco a cada UPDATE (ver ProgramsDB), então nenhuma alteração se perde,
+#   mesmo as feitas por outras instâncias de GenericDBOperations (janelas de cadastro, importação do schedule...).
+#   Métodos principais da classe:
+#       refresh: atualiza somente os registros que mudaram
+#       invalidate: descarta o catálogo (a próxima leitura busca tudo de novo)
+#       programs: devolve todos os programas (ordenados pelo ID)
+#       scheduled: devolve somente os programas com schedule
+#       get: devolve um programa pelo ID
+#       _decode: monta o registro decodificado a partir da linha do banco
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class ProgramCatalog:
+    FETCH_BATCH = 500
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Construtor da classe
+#   Parâmetros:
+#       db_programs: instância de GenericDBOperations(ProgramsDB) usada nas leituras
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def __init__(self, db_programs):
+        self.db_programs = db_programs
+        self.records = {}
+        self.versions = {}
+        # Incrementado sempre que algum programa entra, muda ou sai do catálogo
+        self.version = 0
+        self._lock = threading.Lock()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que monta o registro decodificado a partir da linha do banco
+#   Parâmetros:
+#       row: linha (Row) com todas as colunas da tabela de programas
+#   Retorna um dicionário com as colunas do banco e os campos decodificados:
+#       schedule_entries: lista de tuplas (hora "HH:MM", dia) do schedule_list (entradas inválidas são ignoradas)
+#       partial_path: pasta + nome do arquivo do programa, exibido nas tabelas
+#       parameter_items: lista de itens dos parâmetros (JSON gravado no cadastro ou texto convertido, para programas antigos)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @staticmethod
+    def _decode(row):
+        record = row._asdict()
+        record["schedule_list"] = record["schedule_list"] or ""
+        record["parameters"] = record["parameters"] or ""
+        entries = []
+        for entry in record["schedule_list"].split(","):
+            time_part, separator, day_part = entry.strip().partition("-")
+            if separator and time_part.strip() and day_part.strip():
+                entries.append((time_part.strip(), day_part.strip()))
+        record["schedule_entries"] = entries
+        record["parameter_items"] = ProgramParameters.loads(record.get("parameters_json"), record["parameters"])
+        full_path = Path(record["program_path"] or "")
+        record["partial_path"] = Path("") / full_path.parts[-2] / full_path.name if len(full_path.parts) > 1 else full_path
+        return record
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que atualiza o catálogo buscando no banco somente os registros novos ou alterados
+#   Parâmetros:
+#       Nenhum
+#   Retorna True se algum programa entrou, mudou ou saiu do catálogo
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def refresh(self):
+        with self._lock:
+            current = {program_id: (revision, date_modified) for program_id, revision, date_modified in self.db_programs.select(["id", "revision", "date_modified"])}
+            changed = [program_id for program_id, version in current.items() if self.versions.get(program_id) != version]
+            removed = [program_id for program_id in self.records if program_id not in current]
+            for program_id in removed:
+                self.records.pop(program_id, None)
+                self.versions.pop(program_id, None)
+            # Busca os registros alterados em lotes (limite de variáveis do SQLite no IN)
+            for start in range(0, len(changed), self.FETCH_BATCH):
+                for row in self.db_programs.select(where={"id": changed[start:start + self.FETCH_BATCH]}):
+                    self.records[row.id] = self._decode(row)
+                    self.versions[row.id] = (row.revision, row.date_modified)
+            if changed or removed:
+                self.version += 1
+            return bool(changed or removed)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que descarta o catálogo; a próxima leitura busca todos os programas de novo
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def invalidate(self):
+        with self._lock:
+            self.records = {}
+            self.versions = {}
+            self.version += 1
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve todos os programas do catálogo, ordenados pelo ID
+#   Parâmetros:
+#       Nenhum
+#   Retorna uma lista de dicionários (não altere os registros; use get para ter uma cópia)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def programs(self):
+        self.refresh()
+        return [self.records[program_id] for program_id in sorted(self.records)]
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve somente os programas que têm schedule
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def scheduled(self):
+        return [record for record in self.programs() if record["schedule_entries"]]
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve uma cópia do programa pelo ID
+#   Parâmetros:
+#       program_id: ID do programa (int ou texto vindo da tabela da interface)
+#   Retorna o dicionário do programa ou None se não encontrado
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def get(self, program_id):
+        try:
+            program_id = int(program_id)
+        except (TypeError, ValueError):
+            return None
+        self.refresh()
+        record = self.records.get(program_id)
+        return dict(record) if record else None
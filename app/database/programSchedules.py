@@ -0,0 +1,58 @@
+""" 
+Código para a gravação em lote dos schedules dos programas cadastrados (ProgramsDB), usada na importação do schedule.
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   time: para medir o tempo gasto no banco pela importação
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import time
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe ProgramSchedules
+#   Regras da tabela de programas para a importação do schedule: confere os IDs e nomes da planilha com o banco,
+#   registra no log de programas as entradas ignoradas e grava tudo com o bulk_update do GenericDBOperations
+#   (o schedule de todos os programas é limpo e os novos são gravados na mesma transação).
+#   Métodos principais da classe:
+#       replace: substitui todos os schedules dos programas
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class ProgramSchedules:
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método para substituir todos os schedules dos programas em uma única transação (importação do schedule)
+#   Se qualquer etapa falhar, a transação é desfeita (rollback) e os schedules antigos continuam no banco.
+#   Programas não encontrados ou com nome diferente do ID são ignorados e registrados no log, como no update_schedule_by_program.
+#   Parâmetros:
+#       db_programs: instância de GenericDBOperations(ProgramsDB) usada na gravação
+#       schedules: dicionário {(program_id, program_name): schedule_final}
+#       modified_date: data de modificação do banco de dados
+#       manipulador: instância do manipulador para gravar o log de programas
+#   Retorna:
+#       Dicionário com a quantidade de programas atualizados, ignorados e o tempo gasto no banco (segundos)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @staticmethod
+    def replace(db_programs, schedules, modified_date, manipulador):
+        started = time.perf_counter()
+        messages = []
+        rows = []
+        # Lê os nomes de todos os programas de uma vez para validar os IDs da importação
+        names = dict(db_programs.select(["id", "program_name"]))
+        for (program_id, program_name), schedule_final in schedules.items():
+            try:
+                record_id = int(program_id)
+            except (TypeError, ValueError):
+                record_id = None
+            if record_id not in names:
+                messages.append(f"Program with ID '{program_id}' not found!\n")
+            elif names[record_id] != program_name:
+                messages.append(f"Program name '{program_name}' does not match the record with ID '{program_id}'.\n")
+            else:
+                rows.append({"id": record_id, "schedule_list": schedule_final, "date_modified": modified_date})
+
+        # Limpa o campo schedule de todos os programas e grava os novos schedules (executemany), com um único commit
+        db_programs.bulk_update(rows, reset={"schedule_list": ""})
+
+        if messages:
+            manipulador.write_txt(manipulador.programs_txt, "".join(messages))
+        return {"updated": len(rows), "ignored": len(messages), "seconds": time.perf_counter() - started}
@@ -9,9 +9,10 @@ Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
 #   Importa as bibliotecas necessárias
 #   sqlalchemy: Biblioteca para mapeamento objeto-relacional (ORM) em Python.
 #   Column, Integer, String: Tipos de dados e construtores de colunas do SQLAlchemy.
+#   literal_column: Expressão SQL usada para incrementar a revisão a cada UPDATE.
 #   Base: Classe base para a definição de modelos de banco de dados.
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, literal_column
 from app.database.base import Base
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Define o URL do banco
@@ -23,20 +24,26 @@ from app.database.base import Base
 #   Cada atributo da classe corresponde a uma coluna na tabela do banco de dados:   
 #       id: Coluna inteira que serve como chave primária.
 #       program_path: Coluna string que armazena o caminho do programa.
-#       program_name: Coluna string que armazena o nome do programa.
+#       program_name: Coluna string que armazena o nome do programa (indexada, usada na validação do schedule).
 #       program_type: Coluna string que indica o tipo do programa (e.g., Executable, Python).
-#       owner_id: Coluna inteira que referencia o ID do proprietário do programa.
+#       owner_id: Coluna inteira que referencia o ID do proprietário do programa (indexada, usada ao remover um usuário).
 #       schedule_list: Coluna string que armazena a lista de agendamentos do programa.
 #       parameters: Coluna string que armazena os parâmetros do programa.
+#       parameters_json: Coluna string com os parâmetros já convertidos no cadastro (lista de itens em JSON, ver ProgramParameters).
+#       interpreter: Coluna string com o interpretador ou virtualenv do programa Python (vazio = Python do sistema).
 #       date_modified: Coluna string que registra a data da última modificação.
+#       revision: Coluna inteira incrementada pelo banco a cada UPDATE (usada pelo catálogo de programas para saber o que mudou).
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 class ProgramsDB(Base):
     __tablename__ = 'programs'
     id = Column(Integer, primary_key=True)
     program_path = Column(String)
-    program_name = Column(String)
+    program_name = Column(String, index=True)
     program_type = Column(String)
-    owner_id = Column(Integer)
+    owner_id = Column(Integer, index=True)
     schedule_list = Column(String)
     parameters = Column(String)
-    date_modified = Column(String)
\ No newline at end of file
+    parameters_json = Column(String)
+    interpreter = Column(String)
+    date_modified = Column(String)
+    revision = Column(Integer, default=0, onupdate=literal_column("revision + 1"))
\ No newline at end of file
@@ -0,0 +1,53 @@
+""" 
+Código para o cache de leitura (read-through) do registro de configurações (SettingsDB).
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   threading: para proteger o cache quando for lido por mais de uma thread
+#   MappingProxyType: para devolver uma cópia somente leitura (congelada) do registro
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import threading
+from types import MappingProxyType
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe SettingsCache
+#   Guarda em memória o registro de configurações (id = 1), que quase nunca muda, e evita uma consulta ao banco
+#   a cada execução de Prep (tableau_bat), a cada verificação da senha de administrador e a cada passada do limpador.
+#   O cache é compartilhado por todas as instâncias de GenericDBOperations(SettingsDB) do APP (atributos da classe)
+#   e só é invalidado quando a janela de configurações (Inter_Settings.register_data) grava o registro.
+#   O registro é devolvido congelado (MappingProxyType): quem lê não consegue alterar o cache por engano.
+#   Métodos principais da classe:
+#       get: devolve o registro de configurações (lê do banco somente se o cache estiver vazio)
+#       invalidate: limpa o cache para que a próxima leitura venha do banco
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class SettingsCache:
+    _snapshot = None
+    _lock = threading.Lock()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve o registro de configurações, lendo do banco somente na primeira vez (ou após invalidate)
+#   Parâmetros:
+#       db_settings: instância de GenericDBOperations(SettingsDB) usada na leitura
+#       settings_id: ID do registro de configurações (padrão: 1)
+#   Retorna o registro como um dicionário somente leitura ou None se as configurações ainda não foram cadastradas
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def get(cls, db_settings, settings_id=1):
+        with cls._lock:
+            if cls._snapshot is None:
+                rows = db_settings.select(where={"id": settings_id}, limit=1)
+                # Sem registro: não guarda nada, para que o cadastro seja lido assim que existir
+                if rows:
+                    cls._snapshot = MappingProxyType(rows[0]._asdict())
+            return cls._snapshot
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que limpa o cache; deve ser chamado sempre que o registro de configurações for gravado
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def invalidate(cls):
+        with cls._lock:
+            cls._snapshot = None
@@ -0,0 +1,372 @@
+""" 
+Código do despachante de execuções para agentes (worker_agent) em outras máquinas: os agentes se registram por TCP e recebem os programas para rodar.
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   asyncio: para o servidor TCP rodar no mesmo loop de eventos das execuções (sem threads extras)
+#   json: para ler a configuração e trocar as mensagens (uma linha JSON por mensagem) com os agentes
+#   base64: para receber a saída (bytes) dos programas dentro das mensagens JSON
+#   secrets: para comparar o token dos agentes
+#   ssl: para o canal criptografado (TLS) com os agentes, quando houver certificado na configuração
+#   ipaddress: para reconhecer os agentes conectados na própria máquina (loopback)
+#   itertools: para numerar as execuções enviadas aos agentes
+#   datetime: para registrar o início de cada execução remota
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import asyncio
+import json
+import base64
+import secrets
+import ssl
+import ipaddress
+import itertools
+from datetime import datetime
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe RemoteAgent
+#   Representa um agente conectado: nome, capacidade (execuções ao mesmo tempo), tipos de programa aceitos e execuções em andamento.
+#   Métodos:
+#       __init__: Guarda os dados do registro e a conexão do agente.
+#       free: Devolve quantas execuções o agente ainda aceita.
+#       is_local: Verifica se o agente está conectado na própria máquina (loopback).
+#       send: Envia uma mensagem para o agente.
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class RemoteAgent:
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método construtor
+#   Parâmetros:
+#       name: nome do agente (ex: nome da máquina)
+#       capacity: quantidade de execuções ao mesmo tempo
+#       program_types: tipos de programa aceitos (ex: ["Python", "Executable", "Prep"])
+#       writer: stream de escrita da conexão (asyncio)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def __init__(self, name, capacity, program_types, writer):
+        self.name = name
+        self.capacity = capacity
+        self.program_types = program_types
+        self.writer = writer
+        self.address = writer.get_extra_info("peername")
+        self.jobs = {}
+        self._lock = asyncio.Lock()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve quantas execuções o agente ainda aceita
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def free(self):
+        return self.capacity - len(self.jobs)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que verifica se o agente está conectado na própria máquina (endereço loopback, ex: 127.0.0.1)
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def is_local(self):
+        try:
+            return bool(self.address) and ipaddress.ip_address(self.address[0]).is_loopback
+        except ValueError:
+            return False
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que envia uma mensagem para o agente (uma linha JSON)
+#   Parâmetros:
+#       message: dicionário da mensagem
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def send(self, message):
+        async with self._lock:
+            self.writer.write((json.dumps(message) + "\n").encode("utf-8"))
+            await self.writer.drain()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe AgentDispatcher
+#   Servidor TCP onde os agentes (worker_agent) se registram, informando capacidade e tipos de programa aceitos.
+#   O Runner chama run antes de executar um programa na própria máquina: se houver um agente livre para o tipo do programa,
+#   a execução vai para ele e o status e a saída voltam por mensagens enquanto o programa roda; senão o Runner executa localmente.
+#   Opcional: só é criado se a configuração (agents.json) estiver com "enabled": true e com um token.
+#   Com "certfile" (e "keyfile") na configuração, o canal usa TLS. Sem TLS, as execuções com senhas restauradas
+#   (parâmetros com senha e conexões do Prep) só vão para agentes na própria máquina; as demais rodam aqui.
+#   Protocolo (uma linha JSON por mensagem):
+#       agente -> APP: register (token, name, capacity, program_types), status (job_id, status), output (job_id, stream, data), done (job_id, returncode)
+#       APP -> agente: registered / error (resposta do registro), run (job_id, program_type, path, args, interpreter, connections), cancel (job_id)
+#   Métodos:
+#       __init__: Inicializa o despachante (sem abrir o servidor).
+#       from_config: Cria o despachante a partir do arquivo de configuração (None se desativado).
+#       start: Inicia o servidor no loop de eventos.
+#       stop: Fecha o servidor e as conexões dos agentes.
+#       available: Verifica se há um agente livre para o tipo do programa.
+#       run: Envia um programa para um agente livre e espera o resultado.
+#       status: Devolve os agentes conectados e as execuções em andamento em cada um.
+#       _pick: Escolhe o agente livre menos ocupado para o tipo do programa (somente agentes locais para execuções com senha sem TLS).
+#       _serve: Abre o servidor.
+#       _handle: Registra um agente e lê as mensagens dele até a conexão fechar.
+#       _receive: Trata uma mensagem de status, saída ou fim de execução.
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class AgentDispatcher:
+    # Configuração usada quando o arquivo não existe ou não informa algum valor
+    #   enabled: ativa o despachante (padrão: desativado, tudo roda nesta máquina)
+    #   host: endereço em que os agentes se conectam ("0.0.0.0" para aceitar outras máquinas)
+    #   port: porta do servidor
+    #   token: senha compartilhada com os agentes (obrigatória)
+    #   certfile, keyfile: certificado e chave privada (PEM) do canal TLS (vazio = canal sem criptografia)
+    DEFAULT_CONFIG = {
+        "enabled": False,
+        "host": "127.0.0.1",
+        "port": 8766,
+        "token": "",
+        "certfile": "",
+        "keyfile": "",
+    }
+    # Tamanho máximo de uma mensagem (a saída chega em pedaços bem menores)
+    LINE_LIMIT = 16 * 1024 * 1024
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método construtor
+#   Parâmetros:
+#       host: endereço do servidor
+#       port: porta do servidor (0 = porta escolhida pelo sistema)
+#       token: senha compartilhada com os agentes
+#       ssl_context: contexto TLS do servidor (None = canal sem criptografia)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def __init__(self, host, port, token, ssl_context=None):
+        self.host = host
+        self.port = port
+        self.token = token
+        self.ssl_context = ssl_context
+        self.agents = {}
+        self._job_ids = itertools.count(1)
+        self._server = None
+        self._task = None
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que cria o despachante a partir do arquivo de configuração
+#   Parâmetros:
+#       config_path: caminho do agents.json
+#   Retorna o despachante ou None se estiver desativado (ou sem token, ou com um certificado que não pôde ser carregado)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def from_config(cls, config_path):
+        config = dict(cls.DEFAULT_CONFIG)
+        try:
+            with open(config_path, "r", encoding="utf-8") as file:
+                config.update(json.load(file))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Error to read the agents settings {config_path}. Check the error:\n{e}")
+            return None
+
+        if not config["enabled"]:
+            return None
+        if not config["token"]:
+            print(f"Error to start the agent dispatcher: set a 'token' in {config_path}.")
+            return None
+
+        ssl_context = None
+        if config["certfile"]:
+            try:
+                ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+                ssl_context.load_cert_chain(config["certfile"], config["keyfile"] or None)
+            except (OSError, ssl.SSLError) as e:
+                print(f"Error to load the agents TLS certificate {config['certfile']}. Check the error:\n{e}")
+                return None
+        return cls(config["host"], int(config["port"]), str(config["token"]), ssl_context)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que inicia o servidor no loop de eventos
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def start(self):
+        if self._task is None or self._task.done():
+            loop = asyncio.get_event_loop()
+            self._task = loop.create_task(self._serve())
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que fecha o servidor e as conexões dos agentes
+#   As execuções em andamento nos agentes são encerradas por eles quando a conexão cai
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def stop(self):
+        if self._server:
+            self._server.close()
+            self._server = None
+        for agent in list(self.agents.values()):
+            agent.writer.close()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que abre o servidor
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def _serve(self):
+        try:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port, limit=self.LINE_LIMIT, ssl=self.ssl_context)
+            self.port = self._server.sockets[0].getsockname()[1]
+        except Exception as e:
+            print(f"Error to start the agent dispatcher: {e}")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que escolhe o agente livre menos ocupado que aceita o tipo do programa
+#   Parâmetros:
+#       program_type: tipo do programa (Executable, Python, Prep)
+#       secret: a execução leva senhas restauradas (sem TLS, somente agentes na própria máquina)
+#   Retorna o agente ou None se nenhum estiver livre
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _pick(self, program_type, secret=False):
+        candidates = [
+            agent for agent in self.agents.values()
+            if program_type in agent.program_types and agent.free() > 0 and (not secret or self.ssl_context or agent.is_local())
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda agent: len(agent.jobs) / agent.capacity)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que verifica se há um agente livre que aceita o tipo do programa
+#   Parâmetros:
+#       program_type: tipo do programa (Executable, Python, Prep)
+#       secret: a execução leva senhas restauradas (sem TLS, somente agentes na própria máquina)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def available(self, program_type, secret=False):
+        return self._pick(program_type, secret) is not None
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que envia um programa para um agente livre e espera o fim da execução
+#   Se a tarefa for cancelada, o agente recebe o pedido de cancelamento (e encerra o processo)
+#   Parâmetros:
+#       program_type: tipo do programa (Executable, Python, Prep)
+#       path: caminho do programa (o mesmo caminho precisa existir na máquina do agente, ex: pasta de rede)
+#       args: argumentos do programa (já convertidos, com as senhas restauradas)
+#       interpreter: interpretador ou virtualenv do programa Python (resolvido na máquina do agente)
+#       connections: conteúdo do arquivo de conexões do Prep (somente Prep com parâmetros)
+#       secret: a execução leva senhas restauradas (sem TLS, somente agentes na própria máquina)
+#   Retorna a tupla (código de saída, stdout em bytes, stderr em bytes) ou None se nenhum agente estiver livre
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def run(self, program_type, path, args, interpreter=None, connections=None, secret=False):
+        agent = self._pick(program_type, secret)
+        if agent is None:
+            return None
+
+        job_id = next(self._job_ids)
+        job = {
+            "path": path,
+            "status": "sent",
+            "start": datetime.now().strftime("%d/%m/%Y - %H:%M:%S"),
+            "output": {"stdout": bytearray(), "stderr": bytearray()},
+            "future": asyncio.get_running_loop().create_future(),
+        }
+        agent.jobs[job_id] = job
+        try:
+            await agent.send({
+                "type": "run",
+                "job_id": job_id,
+                "program_type": program_type,
+                "path": path,
+                "args": [str(arg) for arg in args],
+                "interpreter": interpreter or "",
+                "connections": connections,
+            })
+            return await job["future"]
+        except asyncio.CancelledError:
+            try:
+                await agent.send({"type": "cancel", "job_id": job_id})
+            except (ConnectionError, OSError):
+                pass
+            raise
+        except (ConnectionError, OSError) as e:
+            return 1, bytes(job["output"]["stdout"]), f"The connection with the agent '{agent.name}' was lost: {e}".encode("utf-8")
+        finally:
+            agent.jobs.pop(job_id, None)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve os agentes conectados e as execuções em andamento em cada um
+#   Parâmetros:
+#       Nenhum
+#   Retorna uma lista de dicionários (nome, endereço, capacidade, tipos e execuções com status e última linha da saída)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def status(self):
+        agents = []
+        for agent in self.agents.values():
+            jobs = []
+            for job_id, job in agent.jobs.items():
+                last_line = bytes(job["output"]["stdout"]).decode("utf-8", errors="replace").strip().rsplit("\n", 1)[-1]
+                jobs.append({"job_id": job_id, "path": job["path"], "status": job["status"], "start": job["start"], "last_output": last_line})
+            agents.append({
+                "name": agent.name,
+                "address": f"{agent.address[0]}:{agent.address[1]}" if agent.address else "",
+                "capacity": agent.capacity,
+                "program_types": agent.program_types,
+                "jobs": jobs,
+            })
+        return agents
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que atende a conexão de um agente: confere o registro e lê as mensagens até a conexão fechar
+#   Se a conexão cair ou o agente enviar uma mensagem inválida, a conexão é fechada e as execuções em andamento no agente terminam com erro
+#   Parâmetros:
+#       reader, writer: streams da conexão (asyncio)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def _handle(self, reader, writer):
+        agent = None
+        try:
+            line = await asyncio.wait_for(reader.readline(), timeout=10)
+            message = json.loads(line)
+            if not isinstance(message, dict) or message.get("type") != "register" or not secrets.compare_digest(str(message.get("token", "")), self.token):
+                writer.write((json.dumps({"type": "error", "error": "Invalid token."}) + "\n").encode("utf-8"))
+                await writer.drain()
+                return
+            capacity, program_types = message.get("capacity", 1), message.get("program_types", [])
+            # Campos do registro com o tipo errado: recusa o agente
+            if (not isinstance(capacity, int) or isinstance(capacity, bool) or not isinstance(program_types, list)
+                    or not all(isinstance(program_type, str) for program_type in program_types)):
+                writer.write((json.dumps({"type": "error", "error": "Invalid register message."}) + "\n").encode("utf-8"))
+                await writer.drain()
+                return
+            name = str(message.get("name") or "agent")
+            # Nome repetido (ex: duas instâncias na mesma máquina): recebe um sufixo
+            base_name, suffix = name, 2
+            while name in self.agents:
+                name, suffix = f"{base_name}-{suffix}", suffix + 1
+            agent = RemoteAgent(name, max(1, capacity), program_types, writer)
+            self.agents[name] = agent
+            await agent.send({"type": "registered", "name": name})
+
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                self._receive(agent, json.loads(line))
+        except (asyncio.TimeoutError, ConnectionError, OSError, ValueError, TypeError, AttributeError) as e:
+            print(f"Error in the connection with the agent {agent.name if agent else writer.get_extra_info('peername')}: {e}")
+        finally:
+            if agent:
+                self.agents.pop(agent.name, None)
+                for job in agent.jobs.values():
+                    if not job["future"].done():
+                        job["future"].set_result((1, bytes(job["output"]["stdout"]), bytes(job["output"]["stderr"]) + f"\nThe agent '{agent.name}' disconnected while running the program.".encode("utf-8")))
+            writer.close()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que trata uma mensagem de um agente
+#   Mensagem que não é um objeto JSON ou com campos do tipo errado gera ValueError (o _handle fecha a conexão com o agente)
+#   Parâmetros:
+#       agent: agente que enviou a mensagem
+#       message: dicionário da mensagem (status, output ou done)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _receive(self, agent, message):
+        if not isinstance(message, dict):
+            raise ValueError(f"Invalid message: {message!r}")
+        job_id = message.get("job_id")
+        if not isinstance(job_id, int) or isinstance(job_id, bool):
+            raise ValueError(f"Invalid job_id: {job_id!r}")
+        job = agent.jobs.get(job_id)
+        # Execução já cancelada ou terminada: a mensagem é descartada
+        if job is None:
+            return
+        kind = message.get("type")
+        if kind == "status":
+            status = message.get("status", "")
+            if not isinstance(status, str):
+                raise ValueError(f"Invalid status: {status!r}")
+            job["status"] = status
+        elif kind == "output":
+            data = message.get("data", "")
+            if not isinstance(data, str):
+                raise ValueError(f"Invalid output data: {data!r}")
+            stream = "stderr" if message.get("stream") == "stderr" else "stdout"
+            job["output"][stream] += base64.b64decode(data)
+        elif kind == "done" and not job["future"].done():
+            returncode = message.get("returncode", 1)
+            if not isinstance(returncode, int) or isinstance(returncode, bool):
+                raise ValueError(f"Invalid returncode: {returncode!r}")
+            job["status"] = "done"
+            job["future"].set_result((returncode, bytes(job["output"]["stdout"]), bytes(job["output"]["stderr"])))
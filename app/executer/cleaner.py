@@ -9,96 +9,527 @@ Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
 #   Importação de bibliotecas necessárias
 #   asyncio: Biblioteca para programação assíncrona.
 #   os: Biblioteca para interações com o sistema operacional.
-#   datetime, timedelta: Bibliotecas para manipulação de datas e tempos.
-#   GenericDBOperations, SettingsDB: Classes para operações de banco de dados.
+#   shutil: Biblioteca para remoção de pastas com todo o conteúdo.
+#   time: Biblioteca para pegar o horário atual em segundos (comparado com o st_ctime/st_mtime) e medir a duração.
+#   json: Biblioteca para gravar o relatório de cada passada e ler/gravar as políticas de cada pasta.
+#   fnmatch: Biblioteca para comparar os nomes dos itens com os filtros (glob) de inclusão/exclusão.
+#   heapq: Biblioteca de heap (fila de prioridade) para apagar primeiro os itens mais antigos no modo de cota.
+#   datetime, timedelta: Bibliotecas para registrar a data da passada e calcular as janelas de execução.
+#   ThreadPoolExecutor: Pool de threads para varrer e apagar fora do loop de eventos.
+#   AsyncDBOperations, SettingsDB: Classes para operações de banco de dados sem travar o loop de eventos.
+#   SettingsCache: Cache do registro de configurações (evita ler o banco a cada verificação).
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 import asyncio
 import os
+import shutil
+import time
+import json
+import fnmatch
+import heapq
 from datetime import datetime, timedelta
-from app.database.operationDBs import GenericDBOperations
+from concurrent.futures import ThreadPoolExecutor
+from app.database.asyncOperationDBs import AsyncDBOperations
 from app.database.settingsDB import SettingsDB
+from app.database.settingsCache import SettingsCache
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Classe FolderCleaner
-#   Responsável por limpar pastas automaticamente com base em um limite de dias.
+#   Responsável por limpar pastas automaticamente com base em uma política por pasta.
 #   A classe utiliza uma instância de manipulador para realizar operações de exclusão.
-#   A limpeza é realizada diariamente em um loop assíncrono.
+#   Cada pasta tem a sua política (idade, filtros glob de inclusão/exclusão, profundidade, ctime ou mtime,
+#   janela de execução, limite de itens por segundo e cota de tamanho), gravada em um arquivo JSON na pasta do banco de dados.
+#   No modo de cota (max_size_gb > 0), depois da limpeza por idade, os itens mais antigos são apagados até a pasta caber na cota.
+#   A mesma leitura (uma única varredura) monta o heap de idade/tamanho usado para escolher os itens, sem ler o disco de novo.
+#   Pastas sem política usam a política padrão (DEFAULT_POLICY).
+#   O loop assíncrono verifica a cada minuto quais pastas estão dentro da sua janela e ainda não foram limpas nela.
+#   A varredura (os.scandir) e as exclusões rodam em um pool de threads limitado, em lotes, para não travar o loop de eventos.
+#   Cada passada gera um relatório (itens lidos, arquivos apagados, bytes liberados, tempo por pasta e subpastas mais lentas)
+#   gravado na pasta de logs. No modo dry_run nada é apagado, apenas contabilizado.
 #   Métodos:
 #       __init__: Inicializa a classe com o manipulador e o limite de dias.
-#       _daily_loop: Loop assíncrono que executa a limpeza diariamente.
-#       clean_if_old: Verifica e limpa arquivos/pastas mais antigos que o limite de dias.
+#       load_policies: Lê as políticas gravadas para cada pasta.
+#       save_policies: Grava as políticas de cada pasta.
+#       get_policy: Retorna a política completa de uma pasta (política gravada + valores padrão).
+#       _is_due: Verifica se a pasta está dentro da sua janela e ainda não foi limpa nela.
+#       _daily_loop: Loop assíncrono que executa a limpeza de cada pasta na sua janela.
+#       run_pass: Executa uma passada completa nas pastas informadas e grava o relatório.
+#       clean_if_old: Verifica e limpa arquivos/pastas mais antigos que o limite de dias da política.
+#       _scan_batch: Lê o próximo lote de itens da pasta reaproveitando o stat do DirEntry.
+#       _quota_evictions: Escolhe no heap os itens mais antigos que precisam ser apagados para a pasta caber na cota.
+#       _delete_items: Apaga (ou só contabiliza, no dry_run) uma lista de arquivos/pastas.
+#       _pool: Retorna o pool de threads da varredura e das exclusões (recriado depois do stop).
+#       _tree_size: Soma a quantidade de arquivos e bytes de uma pasta.
+#       _write_report: Grava o relatório da passada na pasta de logs.
 #       start: Inicia o loop de limpeza.
-#       stop: Para o loop de limpeza.
+#       stop: Para o loop de limpeza e encerra o pool de threads.
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 class FolderCleaner:
+    # Política usada nas pastas que não têm política própria
+    #   days: idade (em dias) a partir da qual o item é apagado
+    #   time_field: data usada para calcular a idade ("ctime" = criação, "mtime" = última modificação)
+    #   include: filtros glob dos nomes que podem ser apagados
+    #   exclude: filtros glob dos nomes que nunca são apagados (nem lidos, no caso de pastas)
+    #   depth: quantos níveis de subpastas são lidos (0 = apenas os itens da pasta, pastas antigas são apagadas inteiras)
+    #   window_start/window_end: janela (HH:MM) em que a limpeza pode rodar. Vazio = qualquer hora, a cada 24 horas
+    #   max_items_per_second: limite de itens lidos por segundo (0 = sem limite)
+    #   max_size_gb: cota de tamanho da pasta em GB; os itens mais antigos são apagados até caber (0 = sem cota)
+    DEFAULT_POLICY = {
+        "days": 30,
+        "time_field": "ctime",
+        "include": ["*"],
+        "exclude": [],
+        "depth": 0,
+        "window_start": "",
+        "window_end": "",
+        "max_items_per_second": 0,
+        "max_size_gb": 0,
+    }
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método construtor que inicializa a classe FolderCleaner.
 #   Parâmetros:
 #       manipulador_instance: Instância do manipulador para operações de arquivo.
-#       days_threshold: Limite de dias para considerar arquivos/pastas como antigos (padrão: 30).
+#       days_threshold: Limite de dias padrão para considerar arquivos/pastas como antigos (padrão: 30).
+#       max_workers: Quantidade máxima de threads usadas para varrer e apagar (padrão: 4).
+#       batch_size: Quantidade de itens lidos por lote antes de devolver o controle ao loop (padrão: 500).
+#       dry_run: Se True, apenas contabiliza o que seria apagado, sem apagar nada (padrão: False).
+#       check_interval: Intervalo (segundos) entre as verificações das janelas de execução (padrão: 60).
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-    def __init__(self, manipulador_instance, days_threshold=30):
+    def __init__(self, manipulador_instance, days_threshold=30, max_workers=4, batch_size=500, dry_run=False, check_interval=60):
         self.days_threshold = days_threshold
         self.manipulador = manipulador_instance
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.check_interval = check_interval
+        # Quantidade de subpastas/arquivos mais lentos listados no relatório de cada pasta
+        self.slowest_limit = 10
+        # Faixas de idade (dias) usadas no relatório para ajudar a definir o limite de dias
+        self.age_buckets = [7, 15, 30, 60, 90, 180, 365]
+        # Horário da última limpeza de cada pasta
+        self.last_runs = {}
+        # Pool de threads criado no primeiro uso e encerrado no stop
+        self._executor = None
         self._running = False
         self._task = None
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que lê as políticas gravadas para cada pasta
+#   Parâmetros:
+#       Nenhum.
+#   Retorna:
+#       Dicionário {pasta: política} (somente os valores gravados, sem os valores padrão)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def load_policies(self):
+        if not os.path.exists(self.manipulador.cleaner_policies_json):
+            return {}
+        try:
+            with open(self.manipulador.cleaner_policies_json, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except Exception as e:
+            print(f"Error to read the cleaner policies:\n{e}")
+            return {}
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que grava as políticas de cada pasta
+#   Parâmetros:
+#       policies: Dicionário {pasta: política}
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def save_policies(self, policies):
+        with open(self.manipulador.cleaner_policies_json, "w", encoding="utf-8") as file:
+            json.dump(policies, file, indent=4)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que retorna a política completa de uma pasta
+#   Parâmetros:
+#       path_folder: Caminho da pasta.
+#       policies: Políticas já lidas (opcional, se não informado lê o arquivo).
+#   Retorna:
+#       Dicionário com todos os campos da política
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def get_policy(self, path_folder, policies=None):
+        policies = self.load_policies() if policies is None else policies
+        policy = dict(self.DEFAULT_POLICY, days=self.days_threshold)
+        policy.update(policies.get(path_folder, {}))
+        return policy
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que verifica se a pasta deve ser limpa agora
+#   Sem janela: a pasta é limpa se nunca foi limpa ou se a última limpeza foi há 24 horas ou mais.
+#   Com janela: a pasta é limpa se o horário atual está dentro da janela e ela ainda não foi limpa nesta janela.
+#   A janela pode passar da meia-noite (ex: 22:00 até 05:00).
+#   Parâmetros:
+#       path_folder: Caminho da pasta.
+#       policy: Política da pasta.
+#       now: Data e hora atual.
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _is_due(self, path_folder, policy, now):
+        last_run = self.last_runs.get(path_folder)
+        if not policy["window_start"] or not policy["window_end"]:
+            return last_run is None or (now - last_run).total_seconds() >= 86400
+
+        start = datetime.strptime(policy["window_start"], "%H:%M").time()
+        end = datetime.strptime(policy["window_end"], "%H:%M").time()
+        current = now.time()
+        if start <= end:
+            inside = start <= current <= end
+            window_opened = datetime.combine(now.date(), start)
+        else:
+            inside = current >= start or current <= end
+            # Depois da meia-noite a janela começou no dia anterior
+            window_opened = datetime.combine(now.date() if current >= start else now.date() - timedelta(days=1), start)
+        return inside and (last_run is None or last_run < window_opened)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método _daily_loop
-#   Loop assíncrono que executa a limpeza diariamente.
-#   Lê as pastas a serem limpas do banco de dados e chama o método clean_if_old para cada pasta.
-#   Aguarda 24 horas entre cada execução.
-#   Utiliza asyncio.gather para executar a limpeza de múltiplas pastas simultaneamente.
+#   Loop assíncrono que executa a limpeza de cada pasta dentro da sua janela de execução.
+#   Lê as pastas a serem limpas do banco de dados e as políticas do arquivo JSON a cada verificação.
+#   As pastas que estiverem na janela são limpas juntas em uma passada (asyncio.gather).
 #   Parâmetros:
 #       Nenhum.
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
     async def _daily_loop(self):
         # Inicializa a conexão com o banco de dados
-        self.db_settings = GenericDBOperations(SettingsDB, "sqlite:///C:/Terminator/Database/executerDB.db")
+        self.db_settings = AsyncDBOperations(SettingsDB, "sqlite:///C:/Terminator/Database/executerDB.db")
 
         # Loop principal que roda enquanto a limpeza estiver ativa
         while self._running:
             # Lê as pastas a serem limpas do banco de dados
             self.list_folders_delete = []
 
-            # Lê as configurações do banco de dados
-            for setting in self.db_settings.get_all():
+            # Lê as configurações (cache, o banco só é lido de novo depois que as configurações forem gravadas)
+            settings = await self.db_settings.run(SettingsCache.get, self.db_settings.db)
+            if settings:
                 # Extrai a lista de pastas do campo paths_delete
-                raw_string = setting['paths_delete'].strip("[]").replace("'", "")
+                raw_string = (settings["paths_delete"] or "").strip("[]").replace("'", "")
                 # Divide a string em uma lista de caminhos, removendo virgulas e espaços extras
-                self.list_folders_delete = [path.strip() for path in raw_string.split(",")]
+                self.list_folders_delete = [path.strip() for path in raw_string.split(",") if path.strip()]
+
+            # Seleciona as pastas que estão dentro da janela de execução
+            policies = self.load_policies()
+            now = datetime.now()
+            due_folders = []
+            for folder in self.list_folders_delete:
+                try:
+                    if self._is_due(folder, self.get_policy(folder, policies), now):
+                        due_folders.append(folder)
+                except ValueError as e:
+                    print(f"Invalid cleaner window for {folder}:\n{e}")
 
-            # Executa a limpeza para cada pasta na lista
-            # Cria uma lista de tarefas para limpar cada pasta
-            tasks = [self.clean_if_old(folder) for folder in self.list_folders_delete]
-            # Executa todas as tarefas simultaneamente
-            await asyncio.gather(*tasks)
-            # Aguarda 24 horas antes da próxima execução
-            await asyncio.sleep(86400) 
+            # Executa a limpeza para as pastas selecionadas e grava o relatório da passada
+            if due_folders:
+                for folder in due_folders:
+                    self.last_runs[folder] = now
+                await self.run_pass(due_folders, policies=policies)
+            # Aguarda a próxima verificação
+            await asyncio.sleep(self.check_interval)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que executa uma passada de limpeza em todas as pastas informadas (em paralelo) e grava o relatório
+#   Parâmetros:
+#       folders: Lista de caminhos das pastas a serem limpas.
+#       dry_run: Se informado, sobrescreve o self.dry_run apenas nesta passada.
+#       policies: Políticas já lidas (opcional, se não informado lê o arquivo).
+#   Retorna:
+#       Dicionário com o relatório da passada.
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def run_pass(self, folders, dry_run=None, policies=None):
+        dry_run = self.dry_run if dry_run is None else dry_run
+        policies = self.load_policies() if policies is None else policies
+        started = time.perf_counter()
+        report = {
+            "date": datetime.now().strftime("%d/%m/%Y - %H:%M:%S"),
+            "dry_run": dry_run,
+        }
+        # Cria uma lista de tarefas para limpar cada pasta e executa todas simultaneamente
+        roots = await asyncio.gather(*[self.clean_if_old(folder, dry_run=dry_run, policy=self.get_policy(folder, policies)) for folder in folders if folder])
+        report["roots"] = list(roots)
+        report["files_scanned"] = sum(root["files_scanned"] for root in roots)
+        report["files_deleted"] = sum(root["files_deleted"] for root in roots)
+        report["bytes_reclaimed"] = sum(root["bytes_reclaimed"] for root in roots)
+        report["seconds"] = round(time.perf_counter() - started, 3)
+        self._write_report(report)
+        return report
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-#   Método que verifica e limpa arquivos/pastas mais antigos que o limite de dias.
+#   Método que verifica e limpa arquivos/pastas mais antigos que o limite de dias da política.
+#   A pasta é lida com os.scandir em lotes de 'batch_size' itens dentro do pool de threads.
+#   Subpastas são lidas até a profundidade da política; no último nível as pastas antigas são apagadas inteiras.
+#   Os itens antigos de cada lote são divididos entre as threads do pool para exclusão.
+#   Entre um lote e outro o controle volta para o loop de eventos (agendador e runner continuam rodando),
+#   respeitando o limite de itens por segundo da política.
 #   Parâmetros:
 #       path_folder: Caminho da pasta a ser limpa.
+#       dry_run: Se True, apenas contabiliza o que seria apagado (padrão: self.dry_run).
+#       policy: Política da pasta (padrão: política gravada para a pasta).
+#   Retorna:
+#       Dicionário com as estatísticas da pasta (usado no relatório da passada).
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def clean_if_old(self, path_folder, dry_run=None, policy=None):
+        dry_run = self.dry_run if dry_run is None else dry_run
+        policy = self.get_policy(path_folder) if policy is None else policy
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        now = time.time()
+        # Itens com data (ctime/mtime) anterior a esse horário (em segundos) são considerados antigos
+        limit_time = now - float(policy["days"]) * 86400
+        # Com limite de itens por segundo, os lotes não passam do limite
+        rate = int(policy["max_items_per_second"] or 0)
+        batch_size = min(self.batch_size, rate) if rate > 0 else self.batch_size
+        # Cota de tamanho (bytes). Com cota, os itens mantidos pela idade entram no heap para o despejo por cota
+        quota = float(policy.get("max_size_gb") or 0) * 1024 ** 3
+        quota_items = [] if quota > 0 else None
+        stats = {
+            "root": path_folder,
+            "policy": policy,
+            "files_scanned": 0,
+            "files_deleted": 0,
+            "bytes_reclaimed": 0,
+            "bytes_total": 0,
+            "quota_evicted": 0,
+            "errors": 0,
+            "seconds": 0.0,
+            "items_by_age": {f">{days}d": 0 for days in self.age_buckets},
+            "slowest_subtrees": [],
+        }
+        deleted = []
+        # Pastas pendentes de leitura: (caminho, nível)
+        pending = [(path_folder, 0)]
+
+        while pending:
+            current_folder, level = pending.pop()
+            # Abre a pasta fora do loop de eventos (pastas de rede podem demorar a responder)
+            try:
+                entries = await loop.run_in_executor(self._pool(), os.scandir, current_folder)
+            # Se a pasta não existir, não há nada para limpar
+            except (FileNotFoundError, NotADirectoryError):
+                if level == 0:
+                    stats["error"] = "Folder not found"
+                    return stats
+                continue
+            except OSError as e:
+                print(f"Error checking folder {current_folder}:\n {e}")
+                stats["errors"] += 1
+                if level == 0:
+                    stats["error"] = str(e)
+                    return stats
+                continue
+
+            try:
+                while True:
+                    # Lê o próximo lote de itens antigos fora do loop de eventos
+                    old_items, subfolders, finished = await loop.run_in_executor(
+                        self._pool(), self._scan_batch, entries, batch_size, level, policy, limit_time, now, stats, quota_items
+                    )
+                    pending.extend((subfolder, level + 1) for subfolder in subfolders)
+                    if old_items:
+                        # Divide as exclusões do lote entre as threads do pool
+                        chunks = [old_items[i::self.max_workers] for i in range(self.max_workers)]
+                        results = await asyncio.gather(*[loop.run_in_executor(self._pool(), self._delete_items, chunk, dry_run) for chunk in chunks if chunk])
+                        for result in results:
+                            deleted.extend(result)
+                    # Limita a taxa de leitura: espera até que os itens lidos caibam no limite por segundo
+                    if rate > 0:
+                        wait = stats["files_scanned"] / rate - (time.perf_counter() - started)
+                        if wait > 0:
+                            await asyncio.sleep(wait)
+                    if finished:
+                        break
+                    # Devolve o controle ao loop de eventos entre os lotes
+                    await asyncio.sleep(0)
+            finally:
+                entries.close()
+
+        # Modo de cota: apaga os itens mais antigos até a pasta caber na cota
+        if quota_items is not None:
+            remaining = stats["bytes_total"] - sum(item["bytes"] for item in deleted if not item.get("error"))
+            evictions = self._quota_evictions(quota_items, remaining, quota)
+            stats["quota_evicted"] = len(evictions)
+            if evictions:
+                chunks = [evictions[i::self.max_workers] for i in range(self.max_workers)]
+                results = await asyncio.gather(*[loop.run_in_executor(self._pool(), self._delete_items, chunk, dry_run) for chunk in chunks if chunk])
+                for result in results:
+                    deleted.extend(result)
+
+        # Consolida as estatísticas da pasta
+        for item in deleted:
+            stats["files_deleted"] += item["files"]
+            stats["bytes_reclaimed"] += item["bytes"]
+            stats["errors"] += 1 if item.get("error") else 0
+        stats["slowest_subtrees"] = sorted(deleted, key=lambda item: item["seconds"], reverse=True)[:self.slowest_limit]
+        stats["seconds"] = round(time.perf_counter() - started, 3)
+        return stats
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que lê o próximo lote de itens da pasta (executado no pool de threads)
+#   Usa o stat guardado no DirEntry (no Windows vem junto com a listagem, sem chamada extra ao disco)
+#   Itens que batem com algum filtro de exclusão são ignorados; os demais precisam bater com algum filtro de inclusão.
+#   Parâmetros:
+#       entries: iterador retornado pelo os.scandir
+#       batch_size: quantidade máxima de itens lidos neste lote
+#       level: nível da pasta que está sendo lida (0 = pasta da lista)
+#       policy: política da pasta
+#       limit_time: horário limite (em segundos); itens com data anterior a ele são antigos
+#       now: horário atual (em segundos), usado para as faixas de idade do relatório
+#       stats: estatísticas da pasta (itens lidos, faixas de idade e tamanho total são somados aqui)
+#       quota_items: lista (heap) dos itens mantidos pela idade, preenchida somente no modo de cota (None = sem cota)
+#   Retorna:
+#       (lista de (caminho, é_pasta, tamanho, arquivos) dos itens antigos, subpastas a serem lidas, True se a pasta terminou de ser lida)
+#       arquivos é None quando a pasta ainda não foi medida (é medida na exclusão)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _scan_batch(self, entries, batch_size, level, policy, limit_time, now, stats, quota_items=None):
+        old_items = []
+        subfolders = []
+        time_field = "st_mtime" if policy["time_field"] == "mtime" else "st_ctime"
+        for _ in range(batch_size):
+            entry = next(entries, None)
+            if entry is None:
+                return old_items, subfolders, True
+            stats["files_scanned"] += 1
+            try:
+                # Links simbólicos são tratados como arquivo, nunca como pasta
+                is_dir = entry.is_dir(follow_symlinks=False)
+                # Enquanto não chegar na profundidade da política, as subpastas são lidas em vez de apagadas
+                if is_dir and level < int(policy["depth"]) and not any(fnmatch.fnmatch(entry.name, pattern) for pattern in policy["exclude"]):
+                    subfolders.append(entry.path)
+                    continue
+                # Obtém a data (criação ou modificação) e o tamanho do item sem seguir links simbólicos
+                item_stat = entry.stat(follow_symlinks=False)
+                files, size = None, item_stat.st_size
+                # No modo de cota todo item ocupa espaço na pasta, inclusive os que não podem ser apagados
+                if quota_items is not None:
+                    files, size = self._tree_size(entry.path) if is_dir else (1, item_stat.st_size)
+                    stats["bytes_total"] += size
+                if any(fnmatch.fnmatch(entry.name, pattern) for pattern in policy["exclude"]):
+                    continue
+                if not any(fnmatch.fnmatch(entry.name, pattern) for pattern in policy["include"]):
+                    continue
+                item_time = getattr(item_stat, time_field)
+                age_days = (now - item_time) / 86400
+                for days in self.age_buckets:
+                    if age_days > days:
+                        stats["items_by_age"][f">{days}d"] += 1
+                if item_time < limit_time:
+                    old_items.append((entry.path, is_dir, size, files))
+                elif quota_items is not None:
+                    quota_items.append((item_time, entry.path, is_dir, size, files))
+            except OSError as e:
+                print(f"Error checking item {entry.path}:\n {e}")
+                stats["errors"] += 1
+        return old_items, subfolders, False
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-    async def clean_if_old(self, path_folder):
-        # Verifica se a pasta existe
-        if not os.path.exists(path_folder):
-            return
-        
-        # Itera sobre os itens na pasta
-        for item in os.listdir(path_folder):
-            # Constrói o caminho completo do item
-            item_path = os.path.join(path_folder, item)
+#   Método que escolhe os itens que precisam ser apagados para a pasta caber na cota
+#   O heap é montado uma única vez (heapify) com os itens da varredura; os mais antigos saem primeiro.
+#   Parâmetros:
+#       quota_items: lista de (data, caminho, é_pasta, tamanho, arquivos) montada na varredura
+#       remaining: tamanho (bytes) da pasta depois da limpeza por idade
+#       quota: cota (bytes) da pasta
+#   Retorna:
+#       Lista de (caminho, é_pasta, tamanho, arquivos) dos itens a serem apagados
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _quota_evictions(self, quota_items, remaining, quota):
+        evictions = []
+        heapq.heapify(quota_items)
+        while remaining > quota and quota_items:
+            _, item_path, is_dir, size, files = heapq.heappop(quota_items)
+            evictions.append((item_path, is_dir, size, files))
+            remaining -= size
+        return evictions
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que apaga uma lista de arquivos/pastas (executado no pool de threads)
+#   Os bytes de cada pasta são somados antes da exclusão para o relatório.
+#   Parâmetros:
+#       items: lista de (caminho, é_pasta, tamanho, arquivos); arquivos None = pasta ainda não medida
+#       dry_run: Se True, apenas contabiliza sem apagar
+#   Retorna:
+#       Lista de dicionários com caminho, arquivos, bytes e segundos gastos em cada item
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _delete_items(self, items, dry_run=False):
+        results = []
+        for item_path, is_dir, size, files in items:
+            started = time.perf_counter()
+            result = {"path": item_path, "files": 1 if files is None else files, "bytes": size}
             try:
-                # Obtém a data de criação do item
-                item_time = datetime.fromtimestamp(os.path.getctime(item_path))
-                # Verifica se o item é mais antigo que o limite de dias
-                if datetime.now() - item_time > timedelta(days=self.days_threshold):
-                    # Remove o item (arquivo ou link simbólico ou pasta)
-                    if os.path.isfile(item_path) or os.path.islink(item_path):
-                        self.manipulador.dell_item(item_path)
-                    elif os.path.isdir(item_path):
-                        self.manipulador.dell_folder(item_path)
+                # Remove o item (pasta com todo o conteúdo, ou arquivo/link simbólico)
+                if is_dir:
+                    if files is None:
+                        result["files"], result["bytes"] = self._tree_size(item_path)
+                    if not dry_run:
+                        shutil.rmtree(item_path)
+                elif not dry_run:
+                    os.remove(item_path)
             except Exception as e:
-                print(f"Error checking item {item_path}:\n {e}")
+                print(f"Error to delete {item_path}. Check the error:\n{e}")
+                result.update(files=0, bytes=0, error=str(e))
+            result["seconds"] = round(time.perf_counter() - started, 4)
+            results.append(result)
+        return results
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que soma a quantidade de arquivos e bytes de uma pasta (sem seguir links simbólicos)
+#   Parâmetros:
+#       path_folder: caminho da pasta
+#   Retorna:
+#       (quantidade de arquivos, total de bytes)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _tree_size(self, path_folder):
+        files, total = 0, 0
+        pending = [path_folder]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        else:
+                            files += 1
+                            total += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+        return files, total
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que grava o relatório da passada na pasta de logs
+#   O último relatório completo fica em cleaner_report.json e um resumo é acrescentado em cleaner.txt
+#   Parâmetros:
+#       report: dicionário com o relatório da passada
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _write_report(self, report):
+        try:
+            with open(self.manipulador.cleaner_report_json, "w", encoding="utf-8") as file:
+                json.dump(report, file, indent=4)
+
+            mode = "DRY RUN (nothing deleted)" if report["dry_run"] else "Cleanup"
+            content = (
+                f"-------------------------------------------------------------------------------------------------------------------\n"
+                f"Folder Cleaner {mode} - {report['date']}.\n"
+                f"Items Scanned: {report['files_scanned']}. Files Deleted: {report['files_deleted']}. "
+                f"Bytes Reclaimed: {report['bytes_reclaimed']} ({report['bytes_reclaimed'] / 1024 ** 2:.2f} MB). "
+                f"Time: {report['seconds']}s.\n"
+            )
+            for root in report["roots"]:
+                policy = root["policy"]
+                window = f"{policy['window_start']}-{policy['window_end']}" if policy["window_start"] and policy["window_end"] else "Any time"
+                quota = f"{policy['max_size_gb']} GB" if policy.get("max_size_gb") else "No quota"
+                content += (
+                    f"\nFolder: {root['root']}\n"
+                    f"    Policy: {policy['days']} days ({policy['time_field']}) | Include: {', '.join(policy['include'])} | "
+                    f"Exclude: {', '.join(policy['exclude']) or '-'} | Depth: {policy['depth']} | Window: {window} | "
+                    f"Max items/s: {policy['max_items_per_second'] or 'No limit'} | Quota: {quota}\n"
+                    f"    Scanned: {root['files_scanned']} | Deleted: {root['files_deleted']} | "
+                    f"Bytes: {root['bytes_reclaimed']} | Errors: {root['errors']} | Time: {root['seconds']}s\n"
+                )
+                if policy.get("max_size_gb"):
+                    content += f"    Folder size: {root['bytes_total']} bytes | Evicted by quota: {root['quota_evicted']}\n"
+                content += (
+                    f"    Items by age: {', '.join(f'{age}: {count}' for age, count in root['items_by_age'].items())}\n"
+                )
+                if root.get("error"):
+                    content += f"    Error: {root['error']}\n"
+                for item in root["slowest_subtrees"]:
+                    content += f"    Slowest: {item['path']} - {item['seconds']}s - {item['files']} files - {item['bytes']} bytes\n"
+            content += "-------------------------------------------------------------------------------------------------------------------\n"
+            self.manipulador.write_txt(self.manipulador.cleaner_txt, content)
+        except Exception as e:
+            print(f"Error to write the cleaner report:\n{e}")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que retorna o pool de threads usado na varredura e nas exclusões
+#   O pool é criado no primeiro uso e de novo depois do stop (ex: dry run ou start depois de parar o limpador)
+#   Parâmetros:
+#       Nenhum.
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="FolderCleaner")
+        return self._executor
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método que inicia o loop de limpeza diária.
 #   Parâmetros:
@@ -113,7 +544,7 @@ class FolderCleaner:
             # Inicia a tarefa de limpeza diária
             self._task = loop.create_task(self._daily_loop())
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-#   Método que para o loop de limpeza diária.
+#   Método que para o loop de limpeza diária e encerra o pool de threads (as threads não continuam vivas depois do limpador)
 #   Parâmetros:
 #       Nenhum.
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
@@ -123,4 +554,8 @@ class FolderCleaner:
             self._running = False
             if self._task:
                 # Cancela a tarefa assíncrona
-                self._task.cancel()
\ No newline at end of file
+                self._task.cancel()
+        # Encerra o pool sem esperar; os lotes ainda na fila são descartados
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
\ No newline at end of file
@@ -0,0 +1,58 @@
+""" 
+Código do cliente do canal de controle local: envia comandos (run, status, cancel, reload, show) para a instância do APP já aberta.
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   os: para verificar se o arquivo de endereço existe
+#   json: para ler o arquivo de endereço e trocar as mensagens com a instância aberta
+#   socket: para conectar na instância aberta (somente 127.0.0.1)
+#   tempfile: para montar o caminho do arquivo de endereço (mesma pasta do arquivo de lock do _app.py)
+#   Este módulo não importa nada da interface: é usado pela linha de comando antes (ou no lugar) de abrir a janela
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import os
+import json
+import socket
+import tempfile
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Arquivo com o endereço (porta) e o token da instância aberta, gravado pelo ControlServer
+#   Somente quem consegue ler este arquivo (usuário que abriu o APP) consegue enviar comandos
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+ENDPOINT_FILE = os.path.join(tempfile.gettempdir(), "my_app.endpoint.json")
+HOST = "127.0.0.1"
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que envia um comando para a instância aberta e devolve a resposta
+#   Cada comando usa uma conexão: uma linha JSON de ida ({"token", "command", ...argumentos}) e uma linha JSON de volta
+#   Parâmetros:
+#       command: comando ("ping", "show", "status", "run", "cancel", "reload")
+#       timeout: tempo máximo (segundos) de espera pela resposta
+#       arguments: argumentos do comando (ex: program_id=12, exec_id="3")
+#   Retorna o dicionário da resposta ({"ok": True/False, ...})
+#   Gera ConnectionError se não houver instância aberta ou se ela não responder
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def send_command(command, timeout=5, **arguments):
+    try:
+        with open(ENDPOINT_FILE, "r", encoding="utf-8") as file:
+            endpoint = json.load(file)
+    except (OSError, ValueError):
+        raise ConnectionError("No running instance was found.")
+
+    request = {**arguments, "token": endpoint["token"], "command": command}
+    try:
+        with socket.create_connection((HOST, endpoint["port"]), timeout=timeout) as connection:
+            connection.sendall((json.dumps(request) + "\n").encode("utf-8"))
+            response = b""
+            while not response.endswith(b"\n"):
+                chunk = connection.recv(65536)
+                if not chunk:
+                    break
+                response += chunk
+    except OSError as e:
+        raise ConnectionError(f"The running instance did not answer: {e}")
+
+    if not response:
+        raise ConnectionError("The running instance closed the connection without answering.")
+    return json.loads(response)
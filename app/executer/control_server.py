@@ -0,0 +1,176 @@
+""" 
+Código do canal de controle local da instância aberta do APP: recebe comandos da linha de comando (ou de uma segunda abertura do APP).
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   asyncio: para o servidor TCP rodar no mesmo loop de eventos das execuções (sem threads extras)
+#   os: para gravar/apagar o arquivo de endereço e informar o PID
+#   json: para ler os comandos e gravar as respostas
+#   secrets: para gerar e comparar o token de acesso
+#   ENDPOINT_FILE, HOST: arquivo de endereço e host usados também pelo cliente (control_client)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import asyncio
+import os
+import json
+import secrets
+from app.executer.control_client import ENDPOINT_FILE, HOST
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe ControlServer
+#   Servidor TCP em 127.0.0.1 (porta escolhida pelo sistema) que roda no loop de eventos do APP.
+#   A porta e um token aleatório são gravados no ENDPOINT_FILE (somente leitura do dono); todo comando precisa do token.
+#   Como o loop de eventos roda dentro do tkinter (process_loop), os comandos são executados na thread da janela e podem
+#   chamar os métodos do App diretamente.
+#   Comandos:
+#       ping: confirma que a instância está aberta (devolve o PID)
+#       show: traz a janela para frente (usado quando o APP é aberto de novo)
+#       status: devolve a lista de execuções (mesmas colunas da tela Executed)
+#       run: executa um programa cadastrado (program_id)
+#       cancel: cancela uma execução em andamento (exec_id)
+#       reload: descarta o catálogo de programas e as configurações em cache e verifica o schedule na hora
+#       agents: devolve os agentes de execução conectados e as execuções em andamento em cada um
+#       queue: devolve os pedidos da fila durável que estão aguardando, reservados ou em execução
+#   Métodos:
+#       __init__: Inicializa o servidor com a janela principal.
+#       start: Inicia o servidor no loop de eventos.
+#       stop: Fecha o servidor e apaga o arquivo de endereço.
+#       dispatch: Executa um comando e monta a resposta.
+#       _serve: Abre o servidor e grava o arquivo de endereço.
+#       _handle: Lê um comando de uma conexão, confere o token e envia a resposta.
+#       _write_endpoint: Grava o arquivo de endereço com a porta e o token.
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class ControlServer:
+    # Colunas de cada execução devolvidas pelo status (mesma ordem da execute_list)
+    STATUS_COLUMNS = ("run_id", "program_name", "start", "finished", "status", "type_run")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método construtor
+#   Parâmetros:
+#       app: janela principal (App), dona do runner, do catálogo de programas e do agendador
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def __init__(self, app):
+        self.app = app
+        self.token = secrets.token_hex(16)
+        self.port = None
+        self._server = None
+        self._task = None
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que inicia o servidor no loop de eventos
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def start(self):
+        if self._task is None or self._task.done():
+            loop = asyncio.get_event_loop()
+            self._task = loop.create_task(self._serve())
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que fecha o servidor e apaga o arquivo de endereço (somente se ele ainda for desta instância)
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def stop(self):
+        if self._server:
+            self._server.close()
+            self._server = None
+        try:
+            with open(ENDPOINT_FILE, "r", encoding="utf-8") as file:
+                if json.load(file).get("pid") == os.getpid():
+                    os.remove(ENDPOINT_FILE)
+        except (OSError, ValueError):
+            pass
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que abre o servidor em uma porta livre e grava o arquivo de endereço
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def _serve(self):
+        try:
+            self._server = await asyncio.start_server(self._handle, HOST, 0)
+            self.port = self._server.sockets[0].getsockname()[1]
+            self._write_endpoint()
+        except Exception as e:
+            print(f"Error to start the control server: {e}")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que grava o arquivo de endereço (porta, token e PID)
+#   O arquivo é criado com permissão somente para o dono e trocado de uma vez (os.replace)
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _write_endpoint(self):
+        temporary_path = ENDPOINT_FILE + ".tmp"
+        descriptor = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump({"pid": os.getpid(), "port": self.port, "token": self.token}, file)
+        os.replace(temporary_path, ENDPOINT_FILE)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que atende uma conexão: lê uma linha JSON, confere o token, executa o comando e envia a resposta
+#   Parâmetros:
+#       reader, writer: streams da conexão (asyncio)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def _handle(self, reader, writer):
+        try:
+            line = await asyncio.wait_for(reader.readline(), timeout=5)
+            request = json.loads(line)
+            if not isinstance(request, dict) or not secrets.compare_digest(str(request.get("token", "")), self.token):
+                response = {"ok": False, "error": "Invalid token."}
+            else:
+                response = self.dispatch(request)
+        except (asyncio.TimeoutError, ValueError) as e:
+            response = {"ok": False, "error": f"Invalid request: {e}"}
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+
+        try:
+            writer.write((json.dumps(response) + "\n").encode("utf-8"))
+            await writer.drain()
+        finally:
+            writer.close()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que executa um comando e monta a resposta
+#   Parâmetros:
+#       request: dicionário do comando ({"command": ..., argumentos})
+#   Retorna o dicionário da resposta ({"ok": True/False, ...})
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def dispatch(self, request):
+        command = request.get("command")
+
+        if command == "ping":
+            return {"ok": True, "pid": os.getpid()}
+
+        if command == "show":
+            self.app.show_window()
+            return {"ok": True}
+
+        if command == "status":
+            runs = [dict(zip(self.STATUS_COLUMNS, run)) for run in self.app.execute_list]
+            return {"ok": True, "runs": runs}
+
+        if command == "run":
+            program_id = str(request.get("program_id", "")).strip()
+            exec_id = self.app.start_run(program_id, "Remote")
+            if exec_id is None:
+                return {"ok": False, "error": f"Program '{program_id}' not found!"}
+            return {"ok": True, "exec_id": exec_id}
+
+        if command == "cancel":
+            exec_id = str(request.get("exec_id", "")).strip()
+            if not self.app.cancel_run(exec_id):
+                return {"ok": False, "error": f"Run '{exec_id}' is not 'On Going'."}
+            return {"ok": True}
+
+        if command == "reload":
+            self.app.reload_schedule()
+            return {"ok": True}
+
+        if command == "agents":
+            dispatcher = self.app.runner.agent_dispatcher
+            if dispatcher is None:
+                return {"ok": False, "error": "The agent dispatcher is disabled (agents.json)."}
+            return {"ok": True, "agents": dispatcher.status()}
+
+        if command == "queue":
+            return {"ok": True, "jobs": self.app.job_queue.jobs(states=("queued", "leased", "running"))}
+
+        return {"ok": False, "error": f"Unknown command '{command}'."}
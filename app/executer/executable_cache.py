@@ -0,0 +1,132 @@
+""" 
+Código para o cache dos caminhos resolvidos dos executáveis usados nas execuções (Python do sistema, interpretadores dos programas e Tableau Prep).
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   os: para montar e verificar os caminhos dos interpretadores
+#   shutil: para procurar os executáveis no PATH (shutil.which)
+#   threading: para proteger o cache quando for lido por mais de uma thread
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import os
+import shutil
+import threading
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe ExecutableCache
+#   Guarda em memória o caminho já resolvido de cada executável, evitando percorrer o PATH (shutil.which)
+#   a cada execução de um programa Python e ler as configurações a cada execução de Prep.
+#   O cache é compartilhado por todo o APP (atributos da classe), como o SettingsCache, e é invalidado junto com ele
+#   (janela de configurações e comando "reload" do canal de controle).
+#   Somente caminhos encontrados são guardados: um interpretador que ainda não existe é procurado de novo na próxima execução.
+#   Um caminho guardado que deixou de existir (ex: virtualenv apagado ou movido) é descartado e resolvido de novo.
+#   Métodos principais da classe:
+#       _resolve: devolve o caminho guardado (se o arquivo ainda existir) ou resolve e guarda (se encontrado)
+#       python: devolve o Python do sistema (python ou python3 no PATH)
+#       interpreter: devolve o executável Python de um interpretador ou virtualenv cadastrado no programa
+#       _find_interpreter: procura o executável do interpretador (sem cache)
+#       prep_cli: guarda o caminho do Tableau Prep lido das configurações
+#       cached: devolve um caminho guardado sem resolver
+#       discard: descarta um caminho guardado que falhou ao abrir o processo
+#       invalidate: limpa o cache para que os caminhos sejam resolvidos de novo
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class ExecutableCache:
+    _paths = {}
+    _lock = threading.Lock()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve o caminho guardado ou chama a função de resolução e guarda o resultado (se encontrado)
+#   O caminho guardado só é usado se o arquivo ainda existir; caso contrário, é resolvido de novo
+#   Parâmetros:
+#       key: chave do caminho no cache
+#       resolver: função sem parâmetros que devolve o caminho ou None
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def _resolve(cls, key, resolver):
+        with cls._lock:
+            path = cls._paths.get(key)
+            if path is not None and os.path.isfile(path):
+                return path
+            cls._paths.pop(key, None)
+            path = resolver()
+            if path:
+                cls._paths[key] = path
+            return path
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve o Python do sistema (não o sys.executable do APP)
+#   Parâmetros:
+#       Nenhum
+#   Retorna o caminho do executável ou None se não houver Python no PATH
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def python(cls):
+        return cls._resolve("python", lambda: shutil.which("python") or shutil.which("python3"))
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve o executável Python de um interpretador cadastrado no programa
+#   Parâmetros:
+#       value: pasta de um virtualenv (ex: C:/Automations/.venv), caminho do executável ou nome de um comando no PATH (ex: py)
+#   Retorna o caminho do executável ou None se o interpretador não for encontrado
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def interpreter(cls, value):
+        value = (value or "").strip()
+        if not value:
+            return None
+        return cls._resolve(("interpreter", value), lambda: cls._find_interpreter(value))
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que procura o executável do interpretador (sem cache)
+#   Virtualenv: Scripts/python.exe no Windows e bin/python nos demais sistemas
+#   Parâmetros:
+#       value: pasta do virtualenv, caminho do executável ou nome de um comando no PATH
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @staticmethod
+    def _find_interpreter(value):
+        if os.path.isdir(value):
+            candidates = ("Scripts/python.exe", "bin/python") if os.name == "nt" else ("bin/python", "Scripts/python.exe")
+            for candidate in candidates:
+                path = os.path.join(value, candidate)
+                if os.path.isfile(path):
+                    return os.path.abspath(path)
+            return None
+        if os.path.isfile(value):
+            return os.path.abspath(value)
+        return shutil.which(value)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que guarda o caminho do Tableau Prep lido das configurações (tableau_bat)
+#   Parâmetros:
+#       tableau_bat: caminho cadastrado na janela de configurações
+#   Retorna o caminho do executável (o valor cadastrado, se não for encontrado, para que o erro apareça no log da execução)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def prep_cli(cls, tableau_bat):
+        tableau_bat = (tableau_bat or "").strip()
+        path = cls._resolve("prep_cli", lambda: os.path.abspath(tableau_bat) if os.path.isfile(tableau_bat) else shutil.which(tableau_bat) if tableau_bat else None)
+        return path or tableau_bat
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve um caminho já guardado, sem resolver
+#   Parâmetros:
+#       key: chave do caminho no cache (ex: "prep_cli")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def cached(cls, key):
+        with cls._lock:
+            return cls._paths.get(key)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que descarta um caminho guardado (ex: o processo não abriu porque o executável foi apagado)
+#   Parâmetros:
+#       path: caminho do executável descartado (todas as chaves que apontam para ele)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def discard(cls, path):
+        with cls._lock:
+            cls._paths = {key: value for key, value in cls._paths.items() if value != path}
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que limpa o cache; deve ser chamado sempre que as configurações forem gravadas
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def invalidate(cls):
+        with cls._lock:
+            cls._paths = {}
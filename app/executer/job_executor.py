@@ -0,0 +1,266 @@
+""" 
+Código do executor da fila durável: retira os pedidos da fila de execuções (JobQueueDB) e executa os programas com o Runner.
+Exemplo de executor extra, sem interface (divide a mesma fila com o APP):
+    python -m app.executer.job_executor --capacity 4
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   asyncio: para verificar a fila e executar os programas sem travar o loop de eventos
+#   os, sys: para montar o caminho do projeto e a identificação do executor (PID)
+#   time: para controlar a renovação das reservas
+#   socket: para a identificação do executor (nome da máquina)
+#   argparse: para ler as opções do executor sem interface
+#   datetime: para exibir as datas dos pedidos no histórico de execuções
+#   AsyncDBOperations: para acessar a fila na thread do banco sem travar as tarefas em execução
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import asyncio
+import os
+import sys
+import time
+import socket
+import argparse
+from datetime import datetime
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from app.database.asyncOperationDBs import AsyncDBOperations
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe JobExecutor
+#   Retira da fila os pedidos de execução (agendados, manuais ou da linha de comando) e cria as tarefas do Runner,
+#   nas mesmas listas (automatic_tasks / ondemmand_tasks_list) e com os mesmos IDs de antes: cancelar pela tela continua igual.
+#   Enquanto o executor estiver vivo, as reservas dos pedidos em execução são renovadas (heartbeat); se o APP fechar ou travar,
+#   a reserva vence e o pedido volta para a fila (ou termina como failed, sem tentativas restantes) para o próximo executor.
+#   Métodos:
+#       __init__: Inicializa o executor (sem começar a ler a fila).
+#       start: Começa a ler a fila no loop de eventos.
+#       stop: Para de ler a fila e devolve os pedidos reservados e ainda não iniciados.
+#       wake: Pede uma leitura da fila na hora (sem esperar o próximo intervalo).
+#       _free: Devolve quantos pedidos ainda podem ser reservados.
+#       poll: Reserva e inicia os pedidos que estiverem aguardando (chamada síncrona, usada na execução manual).
+#       cancel: Cancela a execução de um pedido.
+#       restore_history: Devolve o histórico recente da fila no formato da lista de execuções.
+#       run_forever: Lê a fila até o executor ser parado (executor sem interface).
+#       _loop: Lê a fila a cada intervalo e renova as reservas.
+#       _launch: Cria a tarefa do Runner de um pedido reservado.
+#       _execute: Executa o programa e grava o resultado na fila.
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class JobExecutor:
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método construtor
+#   Parâmetros:
+#       runner: Runner que executa os programas
+#       program_catalog: catálogo de programas (os dados do programa são lidos na hora de executar)
+#       job_queue: fila de execuções (JobQueueDB)
+#       capacity: quantidade máxima de pedidos em execução ao mesmo tempo (0 = sem limite, como antes da fila)
+#       lease_seconds: duração da reserva de cada pedido (renovada a cada terço desse tempo)
+#       poll_interval: intervalo (segundos) entre as leituras da fila
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def __init__(self, runner, program_catalog, job_queue, capacity=0, lease_seconds=120, poll_interval=2):
+        self.runner = runner
+        self.program_catalog = program_catalog
+        self.job_queue = job_queue
+        self.capacity = capacity
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        # Identificação única do executor na fila (máquina + PID)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self.tasks = {}
+        self._wake = None
+        self._task = None
+        self._last_heartbeat = 0
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que começa a ler a fila no loop de eventos
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def start(self):
+        if self._task is None or self._task.done():
+            loop = asyncio.get_event_loop()
+            self._task = loop.create_task(self._loop())
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que para de ler a fila e devolve para a fila os pedidos reservados e ainda não iniciados
+#   Os pedidos em execução continuam reservados: se o processo fechar, a reserva vence e eles voltam para a fila
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        try:
+            self.job_queue.release(self.owner)
+        except Exception as e:
+            print(f"Error to release the queued jobs. Check the error:\n{e}")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que pede uma leitura da fila na hora (ex: logo depois do agendador acrescentar um pedido)
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def wake(self):
+        if self._wake:
+            self._wake.set()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve quantos pedidos ainda podem ser reservados (None = sem limite)
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _free(self):
+        if not self.capacity:
+            return None
+        return max(0, self.capacity - len(self.tasks))
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que reserva e inicia os pedidos que estiverem aguardando (chamada síncrona)
+#   Usado pela execução manual para que a execução comece na hora e o ID da execução seja devolvido
+#   Parâmetros:
+#       Nenhum
+#   Retorna um dicionário {ID do pedido: ID da execução} dos pedidos iniciados
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def poll(self):
+        free = self._free()
+        if free == 0:
+            return {}
+        return {job["id"]: self._launch(job) for job in self.job_queue.dequeue(self.owner, self.lease_seconds, free)}
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que cancela a execução de um pedido (o Runner registra o cancelamento e a fila grava o status "Error Run")
+#   Parâmetros:
+#       job_id: ID do pedido
+#   Retorna True se havia uma execução em andamento
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def cancel(self, job_id):
+        task = self.tasks.get(job_id)
+        if task and not task.done():
+            task.cancel()
+            return True
+        return False
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que devolve o histórico recente da fila no formato da lista de execuções do Runner
+#   Usado na abertura do APP para que as execuções anteriores ao fechamento (ou travamento) continuem na tela Executed
+#   Parâmetros:
+#       hours: idade máxima (horas) dos pedidos terminados exibidos
+#   Retorna a lista de tuplas (ID, nome, início, fim, status, tipo), mais recentes primeiro
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def restore_history(self, hours=24):
+        history = []
+        for job in self.job_queue.jobs(states=("done", "failed"), since=time.time() - hours * 3600):
+            start = datetime.fromtimestamp(job["started_at"] or job["enqueued_at"]).strftime("%d/%m/%Y - %H:%M:%S")
+            finish = datetime.fromtimestamp(job["finished_at"]).strftime("%d/%m/%Y - %H:%M:%S") if job["finished_at"] else "-"
+            history.append((job["exec_id"] or "-", f"{job['program_id']} - {job['program_name']}", start, finish, job["status"], job["type_run"]))
+        return history
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que lê a fila a cada intervalo (ou quando acordado pelo wake) e renova as reservas dos pedidos em execução
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def _loop(self):
+        self._wake = asyncio.Event()
+        while True:
+            try:
+                if time.time() - self._last_heartbeat >= self.lease_seconds / 3:
+                    await AsyncDBOperations.submit(self.job_queue.heartbeat, self.owner, self.lease_seconds)
+                    self._last_heartbeat = time.time()
+                free = self._free()
+                # Leitura rápida antes de reservar: a reserva trava a escrita da fila para os outros executores
+                if free != 0 and await AsyncDBOperations.submit(self.job_queue.has_queued):
+                    for job in await AsyncDBOperations.submit(self.job_queue.dequeue, self.owner, self.lease_seconds, free):
+                        self._launch(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error to read the job queue. Check the error:\n{e}")
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que cria a tarefa do Runner de um pedido reservado (mesmos IDs e listas usados antes da fila)
+#   Parâmetros:
+#       job: pedido reservado (dicionário da fila)
+#   Retorna o ID da execução
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _launch(self, job):
+        if job["type_run"] == "Automatic":
+            task_list = self.runner.automatic_tasks
+            exec_id = job["job_key"]
+        else:
+            task_list = self.runner.ondemmand_tasks_list
+            exec_id = str(len(task_list) + 1)
+        run_id = len(task_list) + 1
+        task = asyncio.get_event_loop().create_task(self._execute(job, run_id, exec_id))
+        task.exec_id = exec_id
+        task_list.append(task)
+        self.tasks[job["id"]] = task
+        task.add_done_callback(lambda _, job_id=job["id"]: self.tasks.pop(job_id, None))
+        return exec_id
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que executa o programa de um pedido e grava o resultado na fila
+#   Parâmetros:
+#       job: pedido reservado (dicionário da fila)
+#       run_id: ID da execução na lista de execuções
+#       exec_id: ID usado para cancelar a execução
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def _execute(self, job, run_id, exec_id):
+        status = "Error Run"
+        try:
+            program = await AsyncDBOperations.submit(self.program_catalog.get, job["program_id"])
+            if program is None:
+                status = "Program Not Found"
+                return
+            if not await AsyncDBOperations.submit(self.job_queue.start, job["id"], self.owner, exec_id, self.lease_seconds):
+                # A reserva venceu e o pedido já foi para outro executor
+                status = None
+                return
+            status = await self.runner.tasks_ondemmand(
+                job["type_run"], run_id, f"{program['id']} - {program['program_name']}", program["program_type"],
+                program["program_path"], program["parameter_items"], program.get("interpreter")
+            )
+        finally:
+            # Gravado também no cancelamento (sem novas tentativas: o usuário pediu para parar)
+            # A gravação roda na thread do banco (outro executor com a fila bloqueada não trava a janela);
+            # o shield mantém a gravação mesmo se a tarefa for cancelada enquanto espera
+            if status:
+                try:
+                    await asyncio.shield(AsyncDBOperations.submit(self.job_queue.finish, job["id"], self.owner, status))
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    print(f"Error to save the result of the job {job['id']}. Check the error:\n{e}")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que lê a fila até o executor ser parado (executor sem interface)
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def run_forever(self):
+        self.start()
+        try:
+            await self._task
+        finally:
+            self.stop()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Executa um executor sem interface somente se rodado o arquivo .py hospedeiro
+#   Os programas são lidos do executerDB.db e os resultados vão para o mesmo histórico (executed.txt) do APP
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Terminator headless job executor")
+    parser.add_argument("--capacity", type=int, default=os.cpu_count() or 1, help="Jobs run at the same time (0 = no limit)")
+    parser.add_argument("--lease", type=float, default=120, help="Lease (seconds) of each job")
+    args = parser.parse_args()
+    from app.adm_files.manipulator import manipulador
+    from app.database.operationDBs import GenericDBOperations
+    from app.database.programsDB import ProgramsDB
+    from app.database.programCatalog import ProgramCatalog
+    from app.database.jobQueueDB import JobQueueDB
+    from app.executer.runner import Runner
+    executor = JobExecutor(
+        Runner(),
+        ProgramCatalog(GenericDBOperations(ProgramsDB, "sqlite:///C:/Terminator/Database/executerDB.db")),
+        JobQueueDB(manipulador().job_queue_db),
+        args.capacity, args.lease
+    )
+    print(f"Executor {executor.owner} reading {executor.job_queue.queue_path} (capacity {args.capacity or 'no limit'}).")
+    try:
+        asyncio.run(executor.run_forever())
+    except KeyboardInterrupt:
+        pass
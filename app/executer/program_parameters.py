@@ -0,0 +1,74 @@
+""" 
+Código para conversão dos parâmetros dos programas entre o texto gravado pelas janelas de cadastro e a forma estruturada (JSON).
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   re: para separar os pares chave: valor do texto dos parâmetros
+#   ast: para converter os blocos Output/Input do Prep em dicionários
+#   json: para gravar e ler a forma estruturada dos parâmetros
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import re
+import ast
+import json
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe ProgramParameters
+#   Os parâmetros são cadastrados como texto (ex: "password: b'gAAA...',path: C:/arquivo.xlsx" ou "Output:{...},Input:{...}" no Prep).
+#   Antes, o Runner aplicava a expressão regular e o ast.literal_eval nesse texto a cada execução.
+#   Agora o texto é convertido uma única vez, no cadastro, para uma lista de itens {"key": ..., "value": ...} gravada em JSON
+#   (coluna parameters_json). Nos blocos do Prep o valor já é o dicionário da conexão.
+#   As senhas continuam criptografadas na forma estruturada; só o Runner as restaura (com cache de curta duração).
+#   Métodos principais da classe:
+#       parse: converte o texto dos parâmetros para a lista de itens
+#       dumps: grava a lista de itens em JSON
+#       loads: lê a lista de itens do JSON (ou converte o texto, para programas cadastrados antes da coluna JSON)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class ProgramParameters:
+    PATTERN = re.compile(r'(\w+):\s*(.*?)(?=,\w+:|$)')
+    PREP_KEYS = ("Output", "Input")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que converte o texto dos parâmetros para a lista de itens
+#   Parâmetros:
+#       text_parameter: texto dos parâmetros gravado pelas janelas de cadastro
+#   Retorna uma lista de dicionários {"key": chave, "value": valor}
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def parse(cls, text_parameter):
+        items = []
+        for key, value in cls.PATTERN.findall(text_parameter or ""):
+            value = value.strip()
+            if key in cls.PREP_KEYS:
+                try:
+                    parsed = ast.literal_eval(value)
+                    # A senha criptografada (bytes) é guardada no mesmo formato de texto usado no resto do APP: "b'...'"
+                    value = {name: str(item) if isinstance(item, bytes) else item for name, item in parsed.items()}
+                except (ValueError, SyntaxError, AttributeError):
+                    pass
+            items.append({"key": key, "value": value})
+        return items
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que grava a lista de itens em JSON (valor da coluna parameters_json)
+#   Parâmetros:
+#       items: lista de itens devolvida por parse
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @staticmethod
+    def dumps(items):
+        return json.dumps(items, ensure_ascii=False)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que lê a lista de itens gravada em JSON
+#   Programas cadastrados antes da coluna parameters_json (valor vazio) têm o texto convertido aqui
+#   Parâmetros:
+#       parameters_json: valor da coluna parameters_json
+#       text_parameter: texto dos parâmetros (usado somente se não houver JSON)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def loads(cls, parameters_json, text_parameter=""):
+        if parameters_json:
+            try:
+                return json.loads(parameters_json)
+            except ValueError:
+                pass
+        return cls.parse(text_parameter)
@@ -0,0 +1,344 @@
+""" 
+Código do pool de processos Python pré-aquecidos: executa os programas do tipo "Python" sem abrir um interpretador novo a cada execução.
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   asyncio: para criar e conversar com os processos do pool sem travar o loop de eventos
+#   json: para ler a configuração e trocar as mensagens com os processos
+#   base64: para receber a saída (bytes) dos programas dentro das mensagens JSON
+#   psutil: para medir a memória de cada processo do pool
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import asyncio
+import json
+import base64
+import psutil
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Código executado por cada processo do pool (passado com "python -c", funciona também com o APP empacotado)
+#   1. Importa os módulos da lista de pré-carga (ex: pandas) uma única vez
+#   2. Para cada programa recebido: redireciona a saída padrão e de erro (descritores 1 e 2, inclusive de subprocessos)
+#      para arquivos temporários, define sys.argv e sys.path[0] como o "python programa.py" faria e roda o programa
+#      em um namespace novo (runpy, __name__ == "__main__")
+#   3. Depois de cada programa: descarta os módulos importados pelo programa (os pré-carregados continuam), volta a pasta
+#      atual e as variáveis de ambiente e devolve o código de saída e a saída capturada
+#   O stdin dos programas é o os.devnull; as mensagens usam cópias dos descritores originais do stdin/stdout
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+WORKER_SOURCE = r'''
+import sys, os, json, base64, runpy, tempfile, traceback, threading, importlib
+commands = os.fdopen(os.dup(0), "r", encoding="utf-8")
+answers = os.fdopen(os.dup(1), "w", encoding="utf-8")
+os.dup2(os.open(os.devnull, os.O_RDONLY), 0)
+sys.stdin = open(os.devnull, "r")
+errors = []
+for name in json.loads(sys.argv[1]):
+    try:
+        importlib.import_module(name)
+    except Exception as e:
+        errors.append(f"{name}: {e}")
+base_modules = set(sys.modules)
+base_path = list(sys.path)
+base_cwd = os.getcwd()
+base_environ = dict(os.environ)
+base_streams = (sys.stdout, sys.stderr)
+saved_fds = (os.dup(1), os.dup(2))
+answers.write(json.dumps({"ready": True, "errors": errors}) + "\n")
+answers.flush()
+for line in commands:
+    job = json.loads(line)
+    captured = (tempfile.TemporaryFile(), tempfile.TemporaryFile())
+    os.dup2(captured[0].fileno(), 1)
+    os.dup2(captured[1].fileno(), 2)
+    sys.argv = [job["path"], *job["args"]]
+    sys.path[:] = [os.path.dirname(os.path.abspath(job["path"]))] + base_path[1:]
+    returncode = 0
+    try:
+        runpy.run_path(job["path"], run_name="__main__")
+    except SystemExit as e:
+        if isinstance(e.code, int) or e.code is None:
+            returncode = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            returncode = 1
+    except BaseException as e:
+        # Mostra o traceback a partir do programa (sem os quadros do runpy), como no "python programa.py"
+        frames = e.__traceback__
+        while frames and frames.tb_frame.f_code.co_filename != job["path"]:
+            frames = frames.tb_next
+        traceback.print_exception(type(e), e, frames or e.__traceback__)
+        returncode = 1
+    finally:
+        for stream in (sys.stdout, sys.stderr, *base_streams):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+        sys.stdout, sys.stderr = base_streams
+        os.dup2(saved_fds[0], 1)
+        os.dup2(saved_fds[1], 2)
+    output = []
+    for file in captured:
+        file.seek(0)
+        output.append(base64.b64encode(file.read()).decode("ascii"))
+        file.close()
+    for name in set(sys.modules) - base_modules:
+        del sys.modules[name]
+    os.chdir(base_cwd)
+    os.environ.clear()
+    os.environ.update(base_environ)
+    answers.write(json.dumps({"returncode": returncode, "stdout": output[0], "stderr": output[1], "dirty": threading.active_count() > 1}) + "\n")
+    answers.flush()
+'''
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe PythonWorkerPool
+#   Mantém 'workers' processos Python já abertos (e com os módulos da pré-carga importados) para rodar os programas do tipo "Python".
+#   Opcional: só é criado se a configuração (python_pool.json) estiver com "enabled": true.
+#   Cada processo é trocado por um novo depois de 'max_runs' execuções, se passar de 'max_memory_mb' de memória ou se o programa
+#   deixar threads rodando. Se todos os processos estiverem ocupados, o Runner abre um interpretador novo, como antes.
+#   Métodos:
+#       __init__: Inicializa o pool (sem abrir os processos).
+#       from_config: Cria o pool a partir do arquivo de configuração (None se desativado).
+#       start: Abre os processos do pool em segundo plano.
+#       stop: Fecha todos os processos do pool.
+#       run: Executa um programa em um processo livre do pool.
+#       _spawn: Abre um processo e espera a pré-carga terminar.
+#       _fill: Abre processos até completar o tamanho do pool.
+#       _should_recycle: Verifica se (e por que) um processo deve ser trocado depois de uma execução.
+#       _retire: Fecha um processo e abre outro no lugar.
+#       _reap: Espera um processo trocado terminar (encerrado à força depois de RETIRE_TIMEOUT segundos).
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class PythonWorkerPool:
+    # Configuração usada quando o arquivo não existe ou não informa algum valor
+    #   enabled: ativa o pool (padrão: desativado, cada execução abre um interpretador novo)
+    #   workers: quantidade de processos abertos
+    #   preload: módulos importados uma única vez por processo (ex: ["pandas", "openpyxl"])
+    #   max_runs: execuções de cada processo antes de ser trocado
+    #   max_memory_mb: memória (MB) a partir da qual o processo é trocado
+    DEFAULT_CONFIG = {
+        "enabled": False,
+        "workers": 2,
+        "preload": [],
+        "max_runs": 50,
+        "max_memory_mb": 500,
+    }
+    # Segundos que um processo trocado (fim do stdin) tem para terminar antes de ser encerrado à força
+    RETIRE_TIMEOUT = 5
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método construtor
+#   Parâmetros:
+#       python_path: interpretador Python usado pelos processos do pool
+#       workers: quantidade de processos abertos
+#       preload: módulos importados uma única vez por processo
+#       max_runs: execuções de cada processo antes de ser trocado
+#       max_memory_mb: memória (MB) a partir da qual o processo é trocado
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def __init__(self, python_path, workers=2, preload=(), max_runs=50, max_memory_mb=500):
+        self.python_path = python_path
+        self.workers = workers
+        self.preload = list(preload)
+        self.max_runs = max_runs
+        self.max_memory_mb = max_memory_mb
+        self._idle = []
+        self._runs = {}
+        self._processes = set()
+        self._starting = 0
+        self._tasks = set()
+        self._running = False
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que cria o pool a partir do arquivo de configuração
+#   Parâmetros:
+#       config_path: caminho do python_pool.json
+#       python_path: interpretador Python usado pelos processos do pool
+#   Retorna o pool ou None se o pool estiver desativado (ou sem interpretador Python)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def from_config(cls, config_path, python_path):
+        config = dict(cls.DEFAULT_CONFIG)
+        try:
+            with open(config_path, "r", encoding="utf-8") as file:
+                config.update(json.load(file))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Error to read the Python pool settings {config_path}. Check the error:\n{e}")
+            return None
+
+        if not config["enabled"] or not python_path:
+            return None
+        return cls(python_path, int(config["workers"]), config["preload"], int(config["max_runs"]), float(config["max_memory_mb"]))
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que abre os processos do pool em segundo plano
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def start(self):
+        self._running = True
+        self._fill()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que fecha todos os processos do pool
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def stop(self):
+        self._running = False
+        # Cancela os processos que ainda estão abrindo e encerra todos os outros (livres ou ocupados)
+        for task in list(self._tasks):
+            task.cancel()
+        for process in list(self._processes):
+            if process.returncode is None:
+                process.kill()
+        self._idle.clear()
+        self._runs.clear()
+        self._processes.clear()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que abre processos até completar o tamanho do pool
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _fill(self):
+        loop = asyncio.get_event_loop()
+        while self._running and len(self._runs) + self._starting < self.workers:
+            self._starting += 1
+            task = loop.create_task(self._spawn())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que abre um processo do pool e espera a pré-carga dos módulos terminar
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def _spawn(self):
+        process = None
+        try:
+            process = await asyncio.create_subprocess_exec(
+                self.python_path, "-c", WORKER_SOURCE, json.dumps(self.preload),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            self._processes.add(process)
+            ready = json.loads(await process.stdout.readline() or "{}")
+            if not ready.get("ready"):
+                raise RuntimeError(f"worker exited with code {process.returncode}")
+            for error in ready["errors"]:
+                print(f"Error to preload the module {error}")
+        except BaseException as e:
+            # Falha ou cancelamento (stop) durante a abertura: o processo não entra no pool
+            if process and process.returncode is None:
+                process.kill()
+            self._processes.discard(process)
+            if not isinstance(e, Exception):
+                raise
+            print(f"Error to start a Python worker. Check the error:\n{e}")
+            return
+        finally:
+            self._starting -= 1
+
+        if not self._running:
+            process.kill()
+            self._processes.discard(process)
+            return
+        self._runs[process] = 0
+        self._idle.append(process)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que executa um programa em um processo livre do pool
+#   Se a tarefa for cancelada durante a execução, o processo é encerrado e trocado por um novo
+#   Parâmetros:
+#       path: caminho do programa .py
+#       args: argumentos do programa (sys.argv[1:])
+#   Retorna a tupla (código de saída, stdout em bytes, stderr em bytes) ou None se não houver processo livre
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def run(self, path, args):
+        while self._idle:
+            process = self._idle.pop()
+            if process.returncode is None:
+                break
+            self._runs.pop(process, None)
+            self._processes.discard(process)
+        else:
+            self._fill()
+            return None
+
+        try:
+            process.stdin.write((json.dumps({"path": path, "args": [str(arg) for arg in args]}) + "\n").encode("utf-8"))
+            await process.stdin.drain()
+            line = await process.stdout.readline()
+        except asyncio.CancelledError:
+            process.kill()
+            self._retire(process, kill=True)
+            raise
+        except (ConnectionError, OSError):
+            line = b""
+
+        # O processo terminou no meio do programa (ex: os._exit, falha do interpretador)
+        if not line:
+            returncode = await process.wait()
+            self._retire(process)
+            return returncode or 1, b"", b"The Python worker stopped while running the program."
+
+        result = json.loads(line)
+        self._runs[process] += 1
+        reason = self._should_recycle(process, result)
+        if reason:
+            # Processo com threads do programa ainda rodando ou com memória demais: encerrado na hora (o fim do stdin não basta)
+            self._retire(process, kill=reason != "max_runs")
+        else:
+            self._idle.append(process)
+        return result["returncode"], base64.b64decode(result["stdout"]), base64.b64decode(result["stderr"])
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que verifica se um processo deve ser trocado depois de uma execução
+#   Parâmetros:
+#       process: processo do pool
+#       result: resposta da execução (dirty = o programa deixou threads rodando)
+#   Retorna o motivo da troca ("dirty", "max_runs" ou "memory") ou None se o processo continua no pool
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _should_recycle(self, process, result):
+        if result.get("dirty"):
+            return "dirty"
+        if self._runs[process] >= self.max_runs:
+            return "max_runs"
+        try:
+            if psutil.Process(process.pid).memory_info().rss > self.max_memory_mb * 1024 * 1024:
+                return "memory"
+        except psutil.Error:
+            return "memory"
+        return None
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que fecha um processo (fim do stdin = fim do processo, ou encerrado à força) e abre outro no lugar
+#   O processo só sai da lista de processos depois de terminar: até lá, o stop ainda consegue encerrá-lo
+#   Parâmetros:
+#       process: processo do pool
+#       kill: encerra o processo na hora em vez de esperar o fim do stdin
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _retire(self, process, kill=False):
+        self._runs.pop(process, None)
+        if process.returncode is None:
+            if kill:
+                process.kill()
+            else:
+                try:
+                    process.stdin.close()
+                except Exception:
+                    process.kill()
+            task = asyncio.get_event_loop().create_task(self._reap(process))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        else:
+            self._processes.discard(process)
+        self._fill()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que espera um processo trocado terminar; se não terminar em RETIRE_TIMEOUT segundos, é encerrado à força
+#   (ex: threads não daemon de um programa seguram o interpretador mesmo depois do fim do stdin)
+#   Parâmetros:
+#       process: processo do pool
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def _reap(self, process):
+        try:
+            await asyncio.wait_for(process.wait(), self.RETIRE_TIMEOUT)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+        finally:
+            self._processes.discard(process)
@@ -10,28 +10,36 @@ Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
 #   Importações de bibliotecas necessárias
 #   asyncio: Para operações assíncronas.
 #   datetime: Para manipulação de datas e horas.
+#   AsyncDBOperations: Para ler o catálogo de programas e gravar na fila de execuções na thread do banco sem travar o loop de eventos.
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 import asyncio
 from datetime import datetime
+from app.database.asyncOperationDBs import AsyncDBOperations
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Classe principal para leitura e execução de programas agendados.
 #   Esta classe verifica periodicamente a lista de programas cadastrados e executa aqueles que estão agendados para o horário e dia atuais.
 #   A verificação é feita a cada 'check_interval' segundos, que pode ser configurado na inicialização da classe.
-#   A classe mantém um dicionário de tarefas agendadas para evitar execuções duplicadas.
-#   A execução dos programas é feita de forma assíncrona, permitindo que múltiplas tarefas sejam gerenciadas simultaneamente.
+#   A classe mantém um dicionário de pedidos agendados para evitar execuções duplicadas.
+#   Os programas não são executados aqui: cada horário vira um pedido na fila durável (JobQueueDB), executado pelo JobExecutor.
+#   A chave do pedido (programa + horário + dia + data) é única na fila, então reabrir o APP (ou reiniciar o agendador)
+#   no mesmo minuto não executa o programa de novo, e um pedido que não terminou por causa de um fechamento é retomado.
 #   Métodos:
-#       __init__: Inicializa a classe com o runner, banco de dados de programas e intervalo de verificação.
+#       __init__: Inicializa a classe com o runner, catálogo de programas (ProgramCatalog), executor da fila (JobExecutor) e intervalo de verificação.
 #       start: Inicia o loop assíncrono para verificação e agendamento de tarefas.
 #       stop: Para o loop de verificação e cancela todas as tarefas agendadas.
 #       check_and_schedule: Verifica os programas agendados e agenda aqueles que devem ser executados.
-#       A função 'check_and_schedule' lê a lista de programas do banco de dados, verifica o horário e dia atuais, e agenda a execução dos programas conforme necessário.
+#       A função 'check_and_schedule' lê os programas com schedule do catálogo (já decodificados), verifica o horário e dia atuais, e agenda a execução dos programas conforme necessário.
 #       Cada entrada na lista de agendamento deve estar no formato "HH:MM-Day", onde "HH:MM" é o horário e "Day" é o dia da semana (ex: "Monday", "Tuesday").
-#       Se o horário e dia atuais corresponderem a uma entrada na lista de agendamento, o programa é executado utilizando o método 'tasks_ondemmand' do runner.
+#       Se o horário e dia atuais corresponderem a uma entrada na lista de agendamento, o pedido é acrescentado na fila e o executor é acordado.
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 class read_schedule():
-    def __init__(self, runner, programs_db, check_interval = 15):
+    # Tentativas de cada pedido agendado: executa de novo uma vez se o APP fechar no meio da execução
+    MAX_ATTEMPTS = 2
+
+    def __init__(self, runner, program_catalog, job_executor, check_interval = 15):
         self.runner = runner
-        self.db_programs = programs_db
+        self.program_catalog = program_catalog
+        self.job_executor = job_executor
         self.check_interval = check_interval
         self.scheduled_tasks = {}
         self.loop = asyncio.get_event_loop()
@@ -55,11 +63,10 @@ class read_schedule():
     def stop(self):
         self.running = False
         # Cancela todas as tarefas agendadas
-        for task_id, task in list(self.scheduled_tasks.items()):
-            # Verifica se a tarefa ainda está em execução antes de cancelar
-            if not task.done() and not task.cancelled():
-                task.cancel()
-            # Remove a tarefa do dicionário
+        for task_id, job_id in list(self.scheduled_tasks.items()):
+            # Cancela a execução do pedido, se ainda estiver em andamento
+            self.job_executor.cancel(job_id)
+            # Remove o pedido do dicionário
             self.scheduled_tasks.pop(task_id, None)
 
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
@@ -68,51 +75,37 @@ class read_schedule():
 #       Nenhum
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
     async def check_and_schedule(self):
-        # Lê a lista de programas do banco de dados
-        programs = self.db_programs.get_all()
+        # Lê do catálogo somente os programas com schedule (o banco só é lido para os registros que mudaram)
+        # A leitura roda na thread do banco para não travar as tarefas em execução no loop
+        programs = await AsyncDBOperations.submit(self.program_catalog.scheduled)
         # Obtém o horário e dia atuais
         now = datetime.now()
         # Formata o horário atual como 'HH:MM' e obtém o dia da semana
         current_time = now.strftime('%H:%M')
         # Formata o dia atual como nome completo do dia da semana. Ex: Monday, Tuesday
         current_day = now.strftime('%A')  
+        current_date = now.strftime('%Y-%m-%d')
+        # Remove os pedidos de dias anteriores que já terminaram (a chave única da fila continua impedindo uma nova execução)
+        # Sem isso o dicionário cresce um item por horário executado enquanto o APP ficar aberto
+        for task_id, job_id in list(self.scheduled_tasks.items()):
+            if not task_id.endswith(f"_{current_date}") and job_id not in self.job_executor.tasks:
+                del self.scheduled_tasks[task_id]
         # Itera sobre cada programa na lista
         for program in programs:
-            # Lê a lista de agendamento do programa
-            schedule_raw = program.get("schedule_list", "")
-            # Se a lista de agendamento estiver vazia, pula para o próximo programa
-            if not schedule_raw:
-                continue
-            
-            # Divide a lista de agendamento em entradas individuais
-            schedule_entries = [entry.strip() for entry in schedule_raw.split(",") if entry.strip()]
-            # Itera sobre cada entrada na lista de agendamento
-            for entry in schedule_entries:
-                try:
-                    # Divide a entrada em horário e dia
-                    time_part, day_part = entry.split("-")
-                    time_part = time_part.strip()
-                    day_part = day_part.strip()
-                    # Cria um ID único para a tarefa agendada
-                    task_id = f"{program['id']}_{time_part}_{day_part}"
-                    # Verifica se o horário e dia atuais correspondem à entrada de agendamento
-                    if time_part == current_time and day_part.upper() == current_day.upper() and task_id not in self.scheduled_tasks:
-                        # Agenda a execução do programa
-                        task = self.loop.create_task(
-                            # Chama o método tasks_ondemmand do runner para executar o programa
-                            self.runner.tasks_ondemmand(
-                                "Automatic",
-                                id=len(self.runner.automatic_tasks)+1,
-                                name=f"{program['id']} - {program['program_name']}",
-                                type_program=program["program_type"],
-                                path=program["program_path"],
-                                parameters=program["parameters"]
-                            )
-                        )
-                        # Atribui o ID da tarefa para referência futura
-                        task.exec_id = str(task_id)
-                        # Adiciona a tarefa ao dicionário de tarefas agendadas
-                        self.runner.automatic_tasks.append(task)
-                        self.scheduled_tasks[task_id] = task
-                except ValueError:
-                    continue
\ No newline at end of file
+            # Itera sobre cada entrada (hora, dia) do schedule já separada pelo catálogo
+            for time_part, day_part in program["schedule_entries"]:
+                # Verifica se o horário e dia atuais correspondem à entrada de agendamento
+                if time_part != current_time or day_part.upper() != current_day.upper():
+                    continue
+                # Cria um ID único para o pedido agendado (com a data: o mesmo horário na semana seguinte é outro pedido)
+                task_id = f"{program['id']}_{time_part}_{day_part}_{current_date}"
+                if task_id not in self.scheduled_tasks:
+                    # Acrescenta o pedido na fila (se a chave já existir, devolve o pedido existente e nada é executado de novo)
+                    job_id = await AsyncDBOperations.submit(
+                        self.job_executor.job_queue.enqueue,
+                        program["id"], program["program_name"], "Automatic", task_id, self.MAX_ATTEMPTS
+                    )
+                    # Adiciona o pedido ao dicionário de pedidos agendados
+                    self.scheduled_tasks[task_id] = job_id
+                    # Inicia a execução sem esperar o próximo intervalo do executor
+                    self.job_executor.wake()
\ No newline at end of file
@@ -8,7 +8,6 @@ Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
 
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Importações necessárias para a execução do Runner
-#   re - Biblioteca para expressões regulares, usada para manipulação de strings.
 #   ast - Biblioteca para manipulação de estruturas de dados em Python.
 #   asyncio - Biblioteca para programação assíncrona, permitindo a execução de tarefas sem bloquear o fluxo principal.
 #   datetime - Biblioteca para manipulação de datas e horas.
@@ -16,16 +15,27 @@ Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
 #       password_hash - Classe para hash e verificação de senhas.
 #       manipulator - Classe para manipulação de arquivos e diretórios.
 #       settingsDB - Classe para configuração do banco de dados.
-#       operationDBs - Classe para operações genéricas no banco de dados.
+#       asyncOperationDBs - Classe para operações no banco de dados sem bloquear o loop de eventos (thread dedicada ao banco).
+#       settingsCache - Cache do registro de configurações (caminho do Tableau Prep sem consultar o banco a cada execução).
+#       program_parameters - Classe que converte os parâmetros cadastrados para a lista de itens (somente programas antigos, sem JSON).
+#       secret_cache - Cache de curta duração das senhas restauradas.
+#       python_pool - Pool opcional de processos Python pré-aquecidos para os programas do tipo "Python".
+#       executable_cache - Cache dos caminhos resolvidos do Python, dos interpretadores dos programas e do Tableau Prep.
+#       agent_dispatcher - Despachante opcional que envia as execuções para agentes (worker_agent) em outras máquinas.
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-import re
 import ast
 import asyncio
 from datetime import datetime
 from app.security.password_hash import Hash
-from app.adm_files.manipulator import manipulador, shutil, os
+from app.adm_files.manipulator import manipulador, os
 from app.database.settingsDB import SettingsDB
-from app.database.operationDBs import GenericDBOperations
+from app.database.asyncOperationDBs import AsyncDBOperations
+from app.database.settingsCache import SettingsCache
+from app.executer.program_parameters import ProgramParameters
+from app.security.secret_cache import SecretCache
+from app.executer.python_pool import PythonWorkerPool
+from app.executer.executable_cache import ExecutableCache
+from app.executer.agent_dispatcher import AgentDispatcher
 
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Classe Runner
@@ -36,27 +46,40 @@ from app.database.operationDBs import GenericDBOperations
 #       __init__: Inicializa a classe, configurando o hash de senhas, manipulador de arquivos, listas de tarefas e conexão com o banco de dados.
 #       tasks_ondemmand: Executa uma tarefa sob demanda, atualizando o status e registrando a saída.
 #       safe_decode: Decodifica bytes de saída de processos, tentando múltiplas codificações para evitar erros.
-#       get_parameters: Extrai e processa parâmetros de uma string, incluindo a restauração de senhas criptografadas.
+#       split_prep_parameters: Separa os blocos de parâmetros do Prep em conexões de saída e de entrada.
+#       get_parameters: Devolve os valores dos parâmetros já convertidos, restaurando as senhas criptografadas (com cache de curta duração).
+#       has_secrets: Verifica se os parâmetros têm senhas (restauradas na execução).
 #       update_execute_list: Atualiza o status de uma tarefa na lista de execuções e chama o callback de atualização, se fornecido.                 
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 class Runner:
+    SECRET_KEYS = ("password", "PasswordOut", "PasswordIn")
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método __init__
 #   Inicializa a classe Runner, configurando o hash de senhas, manipulador de arquivos, listas de tarefas e conexão com o banco de dados.
 #   Parâmetros:
 #       update_callback: Função de callback opcional para atualizar a interface do usuário.
+#       settings_url: URL do banco com as configurações (padrão: executerDB.db do Terminator; os benchmarks usam um banco temporário).
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-    def __init__(self, update_callback=None):
+    def __init__(self, update_callback=None, settings_url="sqlite:///C:/Terminator/Database/executerDB.db"):
         # Inicializa o hash de senhas, manipulador de arquivos e listas de tarefas
         self.hash = Hash()
+        # Senhas restauradas ficam em memória por pouco tempo (evita o Fernet a cada execução de um programa frequente)
+        self.secrets = SecretCache(self.hash)
         
         self.manipulador = manipulador()
         self.master_files = self.manipulador.master_folder
+
+        # Pool de processos Python pré-aquecidos (somente se ativado no python_pool.json; iniciado pela janela principal)
+        self.python_pool = PythonWorkerPool.from_config(self.manipulador.python_pool_json, ExecutableCache.python())
+
+        # Despachante de execuções para os agentes (somente se ativado no agents.json; iniciado pela janela principal)
+        self.agent_dispatcher = AgentDispatcher.from_config(self.manipulador.agents_json)
         
         self.automatic_tasks = []
         self.ondemmand_tasks_list = []
         
-        self.db_settings = GenericDBOperations(SettingsDB, "sqlite:///C:/Terminator/Database/executerDB.db")
+        # Acesso assíncrono: as consultas rodam na thread do banco e não travam as tarefas em execução
+        self.db_settings = AsyncDBOperations(SettingsDB, settings_url)
 
         self.execute_list = []
 
@@ -77,10 +100,15 @@ class Runner:
 #       name: Nome do programa a ser executado.     
 #       type_program: Tipo do programa (e.g., "Executable", "Python", "Prep").
 #       path: Caminho do programa a ser executado.
-#       parameters: Parâmetros para a execução do programa. 
+#       parameters: Parâmetros para a execução do programa (lista de itens do catálogo ou texto, para chamadas antigas).
+#       interpreter: Interpretador ou virtualenv do programa Python (opcional; vazio = Python do sistema ou pool).
+#   Retorna:
+#       Status final da execução (Success, Error, Path Not Found, Interpreter Not Found ou Error Run), gravado na fila de execuções.
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-    async def tasks_ondemmand(self, type_run, id, name, type_program, path, parameters):
+    async def tasks_ondemmand(self, type_run, id, name, type_program, path, parameters, interpreter=None):
         try:
+            # Execução que leva senhas restauradas (parâmetros com senha ou conexões do Prep): sem TLS, só vai para agentes na própria máquina
+            secret = self.has_secrets(parameters) or (type_program == "Prep" and bool(parameters))
             # Obtém os parâmetros processados
             parameters = self.get_parameters(parameters)
             # Adiciona a tarefa à lista de execuções e atualiza a interface
@@ -90,14 +118,34 @@ class Runner:
             if self.update_callback:
                 self.update_callback()
 
-            # Verifica se o caminho do programa existe
-            if not os.path.exists(path):
-                self.update_execute_list(id, "Path Not Found")
+            # Resultado (código, stdout, stderr) quando o programa roda em um agente ou no pool de processos Python
+            result = None
+            # Envia a execução para um agente livre que aceite o tipo do programa (o status e a saída voltam pelo despachante)
+            # O caminho e o interpretador são conferidos pelo agente: podem existir somente na máquina dele
+            if self.agent_dispatcher and self.agent_dispatcher.available(type_program, secret):
+                # O Prep recebe o conteúdo do arquivo de conexões: o agente cria o arquivo na máquina dele
+                connections = self.manipulador.connection_data(*self.split_prep_parameters(parameters), self.secrets.restore) if type_program == "Prep" and parameters else None
+                result = await self.agent_dispatcher.run(type_program, path, [] if type_program == "Prep" else parameters, interpreter, connections, secret)
+
+            # Interpretador escolhido no cadastro do programa (caminho já resolvido e guardado em cache; somente para execução nesta máquina)
+            python_path = ExecutableCache.interpreter(interpreter) if result is None and type_program == "Python" and interpreter else None
+
+            # Verifica se o caminho do programa existe (somente para execução nesta máquina)
+            if result is None and not os.path.exists(path):
+                final_status = "Path Not Found"
+                self.update_execute_list(id, final_status)
+            # Verifica se o interpretador do programa existe (ex: virtualenv apagado ou movido)
+            elif result is None and type_program == "Python" and interpreter and python_path is None:
+                final_status = "Interpreter Not Found"
+                self.update_execute_list(id, final_status)
             # Se o caminho não existe, atualiza o status e registra a saída
             else:
-                # Executa o programa com base no tipo especificado
+                # Executa o programa nesta máquina com base no tipo especificado
+                if result is not None:
+                    # O programa já rodou em um agente
+                    pass
                 # Se o tipo do programa for "Executable", executa diretamente
-                if type_program == "Executable":
+                elif type_program == "Executable":
                     # Executa o programa diretamente no sistema operacional
                     process = await asyncio.create_subprocess_exec(
                         path, *parameters,
@@ -106,17 +154,32 @@ class Runner:
                     )
                 # Se o tipo do programa for "Python", usa o interpretador Python para rodar o script
                 elif type_program == "Python":
-                    # Usa o Python real do sistema, não o sys.executable
-                    python_path = shutil.which("python") or shutil.which("python3")
-                    process = await asyncio.create_subprocess_exec(
-                        python_path, path, *parameters,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE
-                    )
+                    # Tenta rodar em um processo já aberto do pool (None = pool desativado ou todos ocupados)
+                    # O pool usa o Python do sistema: programas com interpretador próprio sempre abrem um processo novo
+                    if self.python_pool and python_path is None:
+                        result = await self.python_pool.run(path, parameters)
+                    if result is None:
+                        # Usa o interpretador do programa ou o Python real do sistema, não o sys.executable
+                        python_path = python_path or ExecutableCache.python()
+                        try:
+                            process = await asyncio.create_subprocess_exec(
+                                python_path, path, *parameters,
+                                stdout=asyncio.subprocess.PIPE,
+                                stderr=asyncio.subprocess.PIPE
+                            )
+                        except FileNotFoundError:
+                            # O interpretador foi apagado entre a verificação e a execução: descarta o caminho do cache
+                            ExecutableCache.discard(python_path)
+                            self.update_execute_list(id, "Interpreter Not Found")
+                            self.manipulador.dell_item(self.path_json)
+                            return "Interpreter Not Found"
                 # Se o tipo do programa for "Prep", executa o comando específico para Prep
                 elif type_program == "Prep":
-                    # Obtém o caminho do prep_cli a partir das configurações do banco de dados
-                    prep_cli_path = self.db_settings.get_by_column("id", 1)["tableau_bat"]
+                    # Obtém o caminho do prep_cli do cache; as configurações só são lidas na primeira execução (ou após alterá-las)
+                    prep_cli_path = ExecutableCache.cached("prep_cli")
+                    if prep_cli_path is None:
+                        settings = await self.db_settings.run(SettingsCache.get, self.db_settings.db)
+                        prep_cli_path = ExecutableCache.prep_cli(settings["tableau_bat"])
                     # Garante que o caminho do prep_cli existe
                     self.path_json = os.path.join(self.master_files, f"{name}.json")
 
@@ -129,17 +192,10 @@ class Runner:
                         )
                     else:
                         # Separando os dados em litas de output e input
-                        outputs = []
-                        inputs = []
-                        for item in parameters:
-                            parsed = ast.literal_eval(item)
-                            if any(key.endswith('Out') for key in parsed.keys()):
-                                outputs.append(parsed)
-                            elif any(key.endswith('In') for key in parsed.keys()):
-                                inputs.append(parsed)
+                        outputs, inputs = self.split_prep_parameters(parameters)
 
                         # Cria o arquivo de configuração JSON necessário para o Prep
-                        self.manipulador.create_connection_file(self.path_json, outputs, inputs)
+                        self.manipulador.create_connection_file(self.path_json, outputs, inputs, self.secrets.restore)
                         # Espera o arquivo ser criado
                         while not os.path.exists(self.path_json):
                             await asyncio.sleep(1)
@@ -150,13 +206,18 @@ class Runner:
                             stderr=asyncio.subprocess.PIPE
                         )
                         
-                # Associa o processo à tarefa atual para permitir o cancelamento
-                current_task = asyncio.current_task()
-                current_task.process = process
-                # Aguarda a conclusão do processo e captura a saída
-                stdout, stderr = await process.communicate()
+                if result is None:
+                    # Associa o processo à tarefa atual para permitir o cancelamento
+                    current_task = asyncio.current_task()
+                    current_task.process = process
+                    # Aguarda a conclusão do processo e captura a saída
+                    stdout, stderr = await process.communicate()
+                    returncode = process.returncode
+                else:
+                    # O pool já devolve a saída capturada (o cancelamento encerra o processo do pool)
+                    returncode, stdout, stderr = result
                 # Decodifica a saída e atualiza o status com base no resultado
-                status = process.returncode == 0
+                status = returncode == 0
                 # Define o status final com base no resultado da execução
                 final_status = "Success" if status else "Error"
                 
@@ -175,6 +236,7 @@ class Runner:
 
             # Limpa a pasta master_files após a execução
             self.manipulador.dell_item(self.path_json)
+            return final_status
         
         # Trata erros de cancelamento da tarefa
         except asyncio.CancelledError:
@@ -193,6 +255,7 @@ class Runner:
             
             # Limpa a pasta master_files após o cancelamento
             self.manipulador.clean_folder(self.master_files)
+            return "Error Run"
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método safe_decode
 #   Decodifica bytes de saída de processos, tentando múltiplas codificações para evitar erros.
@@ -214,32 +277,57 @@ class Runner:
                     return output_bytes.decode("latin1", errors="replace")
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método get_parameters
-#   Extrai e processa parâmetros de uma string, incluindo a restauração de senhas criptografadas.
+#   Devolve os valores dos parâmetros, restaurando as senhas criptografadas.
+#   Os parâmetros chegam já convertidos (lista de itens do catálogo, gravada em JSON no cadastro); o texto só é convertido
+#   aqui para chamadas antigas. As senhas restauradas vêm do cache de curta duração (SecretCache).
 #   Parâmetros:
-#       text_parameter: String contendo os parâmetros a serem extraídos.
+#       parameters: Lista de itens {"key": ..., "value": ...} ou texto dos parâmetros.
 #   Retorna:
 #       Lista de parâmetros processados.
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-    def get_parameters(self, text_parameter):
-        # Expressão regular para capturar pares chave-valor no formato key: value
-        padrao = r'(\w+):\s*(.*?)(?=,\w+:|$)'
-        # Encontra todos os pares chave-valor na string de entrada
-        correspond = re.findall(padrao, text_parameter)
+    def get_parameters(self, parameters):
+        items = ProgramParameters.parse(parameters) if isinstance(parameters, str) else parameters
 
-        parameters = []
-        # Itera sobre os pares chave-valor encontrados
-        for key, value in correspond:
-            value = value.strip()
-            # Restaura senhas criptografadas, se aplicável
-            if (key == "password" or key == "PasswordOut" or key == "PasswordIn") and value.startswith("b'"):
-                # Tenta restaurar a senha, ignorando erros
-                try:
-                    value = self.hash.restore_password(value)
-                except:
-                    pass
-            parameters.append(value)
-        
-        return parameters
+        values = []
+        for item in items:
+            value = item["value"]
+            # Restaura senhas criptografadas, se aplicável (se não for possível, mantém o valor gravado)
+            if item["key"] in self.SECRET_KEYS and isinstance(value, str) and value.startswith("b'"):
+                restored = self.secrets.restore(value)
+                value = restored if restored is not None else value
+            values.append(value)
+
+        return values
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método has_secrets
+#   Verifica se os parâmetros têm alguma senha (chaves de SECRET_KEYS), restaurada pelo get_parameters na execução.
+#   Parâmetros:
+#       parameters: Lista de itens do catálogo ou texto, para chamadas antigas.
+#   Retorna:
+#       True se algum parâmetro for uma senha.
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def has_secrets(self, parameters):
+        items = ProgramParameters.parse(parameters) if isinstance(parameters, str) else parameters
+        return any(item["key"] in self.SECRET_KEYS for item in items)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método split_prep_parameters
+#   Separa os blocos de parâmetros do Prep em conexões de saída (chaves terminadas em 'Out') e de entrada (terminadas em 'In').
+#   Parâmetros:
+#       parameters: Lista de blocos do Prep (dicionários; texto só em chamadas antigas).
+#   Retorna:
+#       Tupla (outputs, inputs).
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def split_prep_parameters(self, parameters):
+        outputs = []
+        inputs = []
+        for item in parameters:
+            # Os blocos do Prep já chegam como dicionários; texto só em chamadas antigas
+            parsed = item if isinstance(item, dict) else ast.literal_eval(item)
+            if any(key.endswith('Out') for key in parsed.keys()):
+                outputs.append(parsed)
+            elif any(key.endswith('In') for key in parsed.keys()):
+                inputs.append(parsed)
+        return outputs, inputs
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método update_execute_list
 #   Atualiza o status de uma tarefa na lista de execuções e chama o callback de atualização, se fornecido.
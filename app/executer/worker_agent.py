@@ -0,0 +1,251 @@
+""" 
+Código do agente de execução: processo que roda em outra máquina (ou na mesma), se registra no APP e executa os programas recebidos.
+Exemplo (na pasta do projeto):
+    python -m app.executer.worker_agent --host 192.168.0.10 --port 8766 --name server-02 --capacity 4 --types Python,Executable
+O token vem de --token ou da variável de ambiente TERMINATOR_AGENT_TOKEN (mesmo valor do agents.json do APP).
+Com certificado no agents.json do APP, use --cafile <certificado do APP ou da autoridade que o assinou> (ou --tls, com as autoridades do sistema).
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   asyncio: para conversar com o APP e rodar vários programas ao mesmo tempo sem threads
+#   os, sys: para montar o caminho do projeto, verificar os programas e apagar o arquivo de conexões do Prep
+#   json: para trocar as mensagens (uma linha JSON por mensagem) com o APP
+#   base64: para enviar a saída (bytes) dos programas dentro das mensagens JSON
+#   socket: para usar o nome da máquina como nome padrão do agente
+#   ssl: para o canal criptografado (TLS) com o APP
+#   tempfile: para criar o arquivo de conexões do Prep (somente leitura do dono)
+#   argparse: para ler as opções da linha de comando
+#   ExecutableCache: para resolver o Python, os interpretadores (virtualenv) e o Tableau Prep desta máquina
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import asyncio
+import os
+import sys
+import json
+import base64
+import socket
+import ssl
+import tempfile
+import argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from app.executer.executable_cache import ExecutableCache
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe WorkerAgent
+#   Conecta no despachante do APP (AgentDispatcher), se registra com o nome, a capacidade e os tipos de programa aceitos
+#   e executa os programas recebidos, enviando o status e a saída (stdout/stderr) enquanto o programa roda.
+#   Se a conexão cair, as execuções em andamento são encerradas e o agente tenta conectar de novo a cada 'reconnect' segundos.
+#   Métodos:
+#       __init__: Guarda as opções do agente.
+#       run_forever: Conecta, registra e atende o APP, reconectando se a conexão cair.
+#       _session: Registra o agente e lê as mensagens do APP até a conexão fechar.
+#       _send: Envia uma mensagem para o APP.
+#       _command: Monta a linha de comando do programa de acordo com o tipo.
+#       _execute: Executa um programa e envia o status, a saída e o código de saída.
+#       _stream: Lê a saída do processo em pedaços e envia cada pedaço para o APP.
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class WorkerAgent:
+    # Tamanho de cada pedaço da saída enviado ao APP
+    CHUNK_SIZE = 64 * 1024
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método construtor
+#   Parâmetros:
+#       host, port: endereço do despachante do APP
+#       token: senha compartilhada (agents.json do APP)
+#       name: nome do agente exibido no APP
+#       capacity: quantidade de programas ao mesmo tempo
+#       program_types: tipos de programa aceitos (o Prep só é aceito com o caminho do Tableau Prep)
+#       prep_cli: caminho do Tableau Prep nesta máquina
+#       reconnect: segundos de espera antes de conectar de novo (0 = não reconecta)
+#       ssl_context: contexto TLS do cliente (None = canal sem criptografia)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def __init__(self, host, port, token, name, capacity=1, program_types=("Python", "Executable"), prep_cli=None, reconnect=5, ssl_context=None):
+        self.host = host
+        self.port = port
+        self.token = token
+        self.name = name
+        self.capacity = capacity
+        self.prep_cli = ExecutableCache.prep_cli(prep_cli) if prep_cli else None
+        self.program_types = [program_type for program_type in program_types if program_type != "Prep" or self.prep_cli]
+        self.reconnect = reconnect
+        self.ssl_context = ssl_context
+        self.jobs = {}
+        self._writer = None
+        self._lock = asyncio.Lock()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que conecta, registra e atende o APP; reconecta se a conexão cair
+#   Parâmetros:
+#       Nenhum
+#   Retorna False quando o registro for recusado (token inválido) e True quando, sem reconexão, a conexão cair
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def run_forever(self):
+        while True:
+            try:
+                if not await self._session():
+                    return False
+            except (ConnectionError, OSError, ValueError) as e:
+                # Inclui os erros de TLS (ssl.SSLError), ex: certificado do APP não confiável
+                print(f"Error in the connection with {self.host}:{self.port}: {e}")
+            finally:
+                # Sem o APP, ninguém recebe o resultado: as execuções em andamento são encerradas
+                for task in list(self.jobs.values()):
+                    task.cancel()
+                self.jobs.clear()
+            if not self.reconnect:
+                return True
+            await asyncio.sleep(self.reconnect)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que registra o agente e lê as mensagens do APP até a conexão fechar
+#   Parâmetros:
+#       Nenhum
+#   Retorna False se o registro for recusado e True quando a conexão fechar
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def _session(self):
+        reader, self._writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl_context)
+        try:
+            await self._send({"type": "register", "token": self.token, "name": self.name, "capacity": self.capacity, "program_types": self.program_types})
+            answer = json.loads(await reader.readline() or "{}")
+            if answer.get("type") != "registered":
+                print(f"Error to register the agent: {answer.get('error', 'connection closed')}")
+                return False
+            print(f"Agent '{answer['name']}' registered on {self.host}:{self.port} (capacity {self.capacity}, types {', '.join(self.program_types)}).")
+
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return True
+                message = json.loads(line)
+                if message.get("type") == "run":
+                    task = asyncio.get_running_loop().create_task(self._execute(message))
+                    self.jobs[message["job_id"]] = task
+                    task.add_done_callback(lambda _, job_id=message["job_id"]: self.jobs.pop(job_id, None))
+                elif message.get("type") == "cancel" and message.get("job_id") in self.jobs:
+                    self.jobs[message["job_id"]].cancel()
+        finally:
+            self._writer.close()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que envia uma mensagem para o APP (uma linha JSON)
+#   Parâmetros:
+#       message: dicionário da mensagem
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def _send(self, message):
+        async with self._lock:
+            self._writer.write((json.dumps(message) + "\n").encode("utf-8"))
+            await self._writer.drain()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que monta a linha de comando do programa de acordo com o tipo (mesmas regras do Runner)
+#   Parâmetros:
+#       job: mensagem "run" recebida do APP
+#       connections_path: arquivo de conexões do Prep (None se não houver)
+#   Retorna a lista com o executável e os argumentos
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _command(self, job, connections_path):
+        if job["program_type"] == "Executable":
+            return [job["path"], *job["args"]]
+        if job["program_type"] == "Python":
+            python_path = ExecutableCache.interpreter(job["interpreter"]) if job.get("interpreter") else ExecutableCache.python()
+            if python_path is None:
+                raise FileNotFoundError(f"Interpreter not found on the agent: {job.get('interpreter') or 'python'}")
+            return [python_path, job["path"], *job["args"]]
+        if job["program_type"] == "Prep":
+            return [self.prep_cli, "run", "-t", job["path"], *(["-c", connections_path] if connections_path else [])]
+        raise ValueError(f"Program type '{job['program_type']}' is not supported by this agent.")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que executa um programa e envia o status, a saída (em pedaços) e o código de saída para o APP
+#   Se a execução for cancelada pelo APP, o processo é encerrado
+#   Parâmetros:
+#       job: mensagem "run" recebida do APP
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def _execute(self, job):
+        job_id = job["job_id"]
+        connections_path = None
+        process = None
+        try:
+            if len(self.jobs) > self.capacity:
+                raise RuntimeError(f"The agent '{self.name}' is busy.")
+            if job["program_type"] not in self.program_types:
+                raise ValueError(f"Program type '{job['program_type']}' is not supported by this agent.")
+            if not os.path.exists(job["path"]):
+                raise FileNotFoundError(f"Path not found on the agent: {job['path']}")
+            # Arquivo de conexões do Prep criado somente para esta execução (contém as senhas)
+            if job.get("connections"):
+                descriptor, connections_path = tempfile.mkstemp(suffix=".json")
+                with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                    json.dump(job["connections"], file, indent=4)
+
+            command = self._command(job, connections_path)
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+            except FileNotFoundError:
+                # O executável foi apagado depois de guardado no cache: descarta o caminho (resolvido de novo na próxima execução)
+                ExecutableCache.discard(command[0])
+                if job["program_type"] == "Python":
+                    raise FileNotFoundError(f"Interpreter not found on the agent: {job.get('interpreter') or 'python'}")
+                raise
+            await self._send({"type": "status", "job_id": job_id, "status": "running", "pid": process.pid})
+            await asyncio.gather(self._stream(job_id, "stdout", process.stdout), self._stream(job_id, "stderr", process.stderr))
+            returncode = await process.wait()
+        except asyncio.CancelledError:
+            if process and process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+        except Exception as e:
+            await self._send({"type": "output", "job_id": job_id, "stream": "stderr", "data": base64.b64encode(str(e).encode("utf-8")).decode("ascii")})
+            returncode = 1
+        finally:
+            if connections_path:
+                try:
+                    os.remove(connections_path)
+                except OSError:
+                    pass
+        await self._send({"type": "done", "job_id": job_id, "returncode": returncode})
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que lê a saída do processo em pedaços e envia cada pedaço para o APP
+#   Parâmetros:
+#       job_id: ID da execução no APP
+#       stream_name: "stdout" ou "stderr"
+#       stream: stream de leitura do processo
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    async def _stream(self, job_id, stream_name, stream):
+        while True:
+            chunk = await stream.read(self.CHUNK_SIZE)
+            if not chunk:
+                return
+            await self._send({"type": "output", "job_id": job_id, "stream": stream_name, "data": base64.b64encode(chunk).decode("ascii")})
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Executa o agente somente se rodado o arquivo .py hospedeiro
+#   Exemplo (vários agentes na mesma máquina para testes):
+#       python -m app.executer.worker_agent --port 8766 --token abc --name agent-1 --capacity 2
+#       python -m app.executer.worker_agent --port 8766 --token abc --name agent-2 --capacity 2
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Terminator worker agent")
+    parser.add_argument("--host", default="127.0.0.1", help="Address of the Terminator agent dispatcher")
+    parser.add_argument("--port", type=int, default=8766, help="Port of the Terminator agent dispatcher")
+    parser.add_argument("--token", default=os.environ.get("TERMINATOR_AGENT_TOKEN", ""), help="Shared token (default: TERMINATOR_AGENT_TOKEN)")
+    parser.add_argument("--name", default=socket.gethostname(), help="Agent name shown in Terminator")
+    parser.add_argument("--capacity", type=int, default=os.cpu_count() or 1, help="Programs run at the same time")
+    parser.add_argument("--types", default="Python,Executable", help="Accepted program types, separated by ','")
+    parser.add_argument("--prep-cli", default="", help="Tableau Prep CLI path on this machine (required to accept 'Prep')")
+    parser.add_argument("--reconnect", type=float, default=5, help="Seconds before reconnecting (0 = exit when the connection drops)")
+    parser.add_argument("--tls", action="store_true", help="Use TLS, verifying the Terminator certificate with the system CAs")
+    parser.add_argument("--cafile", default="", help="Certificate (PEM) used to verify the Terminator certificate (implies --tls)")
+    args = parser.parse_args()
+    if not args.token:
+        parser.error("the token is required (--token or TERMINATOR_AGENT_TOKEN)")
+    # O nome (ou IP) em --host precisa constar no certificado do APP
+    ssl_context = ssl.create_default_context(cafile=args.cafile or None) if args.tls or args.cafile else None
+    agent = WorkerAgent(args.host, args.port, args.token, args.name, max(1, args.capacity),
+                        [program_type.strip() for program_type in args.types.split(",") if program_type.strip()], args.prep_cli, args.reconnect, ssl_context)
+    try:
+        if not asyncio.run(agent.run_forever()):
+            sys.exit(1)
+    except KeyboardInterrupt:
+        pass
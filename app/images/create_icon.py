@@ -1,5 +1,5 @@
-"""  
-Código para criar um ícone de pixel art a partir de uma matriz de cores.
+""" 
+Código para criar o ícone de pixel art do APP a partir da imagem com os pixels (terminator_pixels.png).
 Code by: Marco Antônio Samuelsson
 Data: 18/9/2025
 Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
@@ -9,47 +9,136 @@ Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
 #   Bibliotecas externas:
 #       PIL: Biblioteca para manipulação de imagens (Python Imaging Library)
 #           Image: Classe da PIL para criar e manipular imagens.
-#           ImageDraw: Classe da PIL para desenhar em imagens.
+#           ImageColor: Classe da PIL para converter as cores em hexadecimal para RGB.
+#       os: para verificar se o ícone existe e trocar o arquivo do ícone de uma vez (os.replace)
+#       hashlib: para gerar o hash do conteúdo da imagem com os pixels
+#       functools.lru_cache: para converter cada cor em hexadecimal para RGB uma única vez
+#       itertools.chain: para percorrer a matriz de cores inteira em uma única passada
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Bibliotecas externas:
 #       manipulador: para pegar o caminho onde o ícone deve ser salvo
-#       color_matrix: importa a matrix de cores da imagem
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-from PIL import Image, ImageDraw
+import os
+import hashlib
+from functools import lru_cache
+from itertools import chain
+from PIL import Image, ImageColor
 from app.adm_files.manipulator import manipulador
-from app.images.matriz_terminator import color_matrix  # Aqui você importa a matriz diretamente
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Classe para criar ícones de pixel art
-#   Esta classe utiliza a matriz de cores para gerar um ícone de pixel art.
-#   Utiliza a biblioteca PIL para manipulação de imagens.
+#   Os pixels do ícone ficam em uma imagem PNG (sem perda) na pasta do código, lida de uma vez só.
+#   O ícone só é gerado quando não existe ou quando a imagem com os pixels mudou (hash do conteúdo
+#   salvo ao lado do ícone, em icon_terminator.ico.sha256).
+#   O ícone tem várias resoluções (ICON_SIZES), todas geradas pela PIL a partir de uma única imagem de 256x256.
+#   Métodos principais da classe:
+#       __init__: construtor da classe
+#       content_hash: gera o hash do conteúdo da imagem com os pixels
+#       is_stale: verifica se o ícone precisa ser gerado
+#       create_icon: gera o ícone somente se necessário
+#       hex_to_rgb: converte uma cor em hexadecimal para os bytes RGB (com memória das cores já convertidas)
+#       render_matrix: converte uma matriz de cores (hexadecimal) em uma imagem com um único Image.frombytes
+#       build_asset: converte uma matriz de cores (hexadecimal) na imagem com os pixels
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 class PixelArtIcon:
+    # Imagem com os pixels do ícone (200x200, RGB)
+    ASSET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "terminator_pixels.png")
+    # Incrementar quando a forma de gerar o ícone mudar, para que os ícones já gerados sejam refeitos
+    RENDER_VERSION = 2
+    # Resoluções salvas no ícone (a barra de tarefas e o Explorer escolhem a mais adequada)
+    ICON_SIZES = [(16, 16), (32, 32), (64, 64), (256, 256)]
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Contrutor da classe. 
 #   Parâmtros:
-#       Nenhum
+#       icon_path: caminho do ícone gerado (padrão: icon_terminator do manipulador)
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-    def __init__(self):
+    def __init__(self, icon_path=None):
         self.manipulador = manipulador()
-        self.color_matrix = color_matrix  # Agora isso funciona corretamente
+        self.icon_path = icon_path or self.manipulador.icon_terminator
+        self.hash_path = self.icon_path + ".sha256"
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-#   Método 'create_icon': Cria o ícone de pixel art a partir da matriz de cores.
+#   Método 'content_hash': gera o hash do conteúdo da imagem com os pixels e da versão da geração do ícone
 #   Parâmetros:
 #       Nenhum
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-    def create_icon(self):
-        # Criar imagem pixel art
-        altura = len(self.color_matrix)
-        largura = len(self.color_matrix[0])
-        img = Image.new("RGB", (largura, altura), "black")
-        draw = ImageDraw.Draw(img)
-        # Para cada pixel na matriz de cores...
-        for y, row in enumerate(self.color_matrix):
-            # Para cada coluna na linha...
-            for x, color in enumerate(row):
-                #... desenha o pixel com a cor correspondente 
-                draw.rectangle([x, y, x+1, y+1], fill=color)
+    def content_hash(self):
+        with open(self.ASSET, "rb") as file:
+            content = file.read()
+        return hashlib.sha256(content + f"|{self.RENDER_VERSION}".encode()).hexdigest()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método 'is_stale': verifica se o ícone precisa ser gerado (não existe ou foi gerado a partir de outra imagem)
+#   Parâmetros:
+#       content_hash: hash atual da imagem com os pixels (calculado se não informado)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def is_stale(self, content_hash=None):
+        if not os.path.exists(self.icon_path):
+            return True
+        try:
+            with open(self.hash_path, "r", encoding="utf-8") as file:
+                stored_hash = file.read().strip()
+        except OSError:
+            return True
+        return stored_hash != (content_hash or self.content_hash())
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método 'create_icon': gera o ícone a partir da imagem com os pixels, somente se necessário.
+#   O ícone é salvo em um arquivo temporário e trocado de uma vez, para que a janela nunca leia um ícone pela metade.
+#   Parâmetros:
+#       force: gera o ícone mesmo que ele esteja atualizado
+#   Retorna True se o ícone foi gerado e False se o ícone existente foi mantido
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def create_icon(self, force=False):
+        content_hash = self.content_hash()
+        if not force and not self.is_stale(content_hash):
+            return False
+
+        with Image.open(self.ASSET) as image:
+            img = image.convert("RGB")
+        # Amplia para a maior resolução sem suavizar os pixels; as menores são reduzidas pela PIL ao salvar
+        largest = max(self.ICON_SIZES)
+        if img.size != largest:
+            img = img.resize(largest, Image.Resampling.NEAREST)
 
         # Salvar como ícone
-        caminho_ícone = self.manipulador.icon_terminator
-        img.save(caminho_ícone, format="ICO")
\ No newline at end of file
+        temporary_path = self.icon_path + ".tmp"
+        img.save(temporary_path, format="ICO", sizes=self.ICON_SIZES)
+        os.replace(temporary_path, self.icon_path)
+        with open(self.hash_path, "w", encoding="utf-8") as file:
+            file.write(content_hash)
+        return True
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método 'hex_to_rgb': converte uma cor em hexadecimal (ex: "#089c4c") para os 3 bytes RGB
+#   Cada cor diferente é convertida uma única vez (a matriz repete poucas cores em milhares de pixels)
+#   Parâmetros:
+#       color: cor em hexadecimal ou nome de cor aceito pela PIL
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def hex_to_rgb(color):
+        if len(color) == 7 and color[0] == "#":
+            return bytes.fromhex(color[1:])
+        return bytes(ImageColor.getrgb(color)[:3])
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método 'render_matrix': converte a matriz de cores inteira em um buffer RGB (uma passada, sem desenhar pixel a pixel)
+#   e cria a imagem com um único Image.frombytes
+#   Parâmetros:
+#       color_matrix: matriz de cores (todas as linhas com o mesmo tamanho)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def render_matrix(cls, color_matrix):
+        altura = len(color_matrix)
+        largura = len(color_matrix[0])
+        if any(len(row) != largura for row in color_matrix):
+            raise ValueError("All rows of the color matrix must have the same size.")
+        buffer = b"".join(map(cls.hex_to_rgb, chain.from_iterable(color_matrix)))
+        return Image.frombytes("RGB", (largura, altura), buffer)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método 'build_asset': converte uma matriz de cores em hexadecimal (lista de linhas, ex: "#089c4c")
+#   na imagem com os pixels. Usado somente quando o desenho do ícone for alterado.
+#   Parâmetros:
+#       color_matrix: matriz de cores (todas as linhas com o mesmo tamanho)
+#       asset_path: caminho da imagem gerada (padrão: ASSET)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @classmethod
+    def build_asset(cls, color_matrix, asset_path=None):
+        img = cls.render_matrix(color_matrix)
+        img.save(asset_path or cls.ASSET, format="PNG", optimize=True)
+        return img
@@ -1,203 +0,0 @@
-# Matriz de cores para o ícone
-color_matrix = [
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4a4b43", "#888888", "#63615d", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#666160", "#635e5d", "#5a5554", "#43413f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3b3b39", "#62625d", "#676762", "#575551", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#605b58", "#6b6663", "#000000", "#4e4c48", "#63625b", "#5c5b54", "#5d5c55", "#5a5856", "#5b5653", "#5d5b57", "#5f5d59", "#595954", "#5a5a55", "#5f5f5a", "#5d5d58", "#5a5a55", "#5d5b59", "#5b5957", "#585654", "#5e5c5a", "#62605c", "#686662", "#888888", "#888888", "#666663", "#52524d", "#3d3d39", "#34352d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#403f40", "#888888", "#888888", "#666460", "#3f3d39", "#565450", "#65635f", "#5f5d59", "#635e5b", "#585654", "#5a5856", "#5a5854", "#5b5957", "#56554e", "#3d3b37", "#3d3b37", "#5a5952", "#4f4e45", "#4d4b47", "#514e4f", "#4f4a47", "#4e4c48", "#4d4b47", "#4c4a46", "#4c4c47", "#4d4e46", "#505149", "#505149", "#53514f", "#555351", "#575553", "#55534f", "#55534f", "#5d5855", "#595451", "#54524e", "#605f58", "#66655e", "#68675d", "#686559", "#676259", "#5f5a51", "#332e25", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4b4a4a", "#888888", "#888888", "#888888", "#888888", "#4a4542", "#33312d", "#504e4a", "#64645f", "#585853", "#575752", "#53534e", "#53534e", "#50504d", "#4d4d48", "#4d4e46", "#4d4d48", "#4d4d4a", "#454540", "#000000", "#4b4b46", "#474742", "#44463c", "#46483e", "#474541", "#464442", "#464442", "#464442", "#444240", "#44443f", "#474742", "#474742", "#44423e", "#464440", "#494743", "#484642", "#484843", "#4c4c47", "#4d4e49", "#4d4d48", "#50504b", "#52524d", "#54544f", "#555550", "#575752", "#5d5e56", "#61615c", "#62635b", "#616059", "#43433d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#595954", "#888888", "#888888", "#5e5d56", "#635f59", "#56524c", "#000000", "#56514e", "#62605c", "#5a5854", "#4f4f4a", "#51514c", "#50504b", "#4a4a45", "#474742", "#494a40", "#474840", "#474840", "#42423d", "#454444", "#3b3b36", "#000000", "#35362e", "#3c3d35", "#3e3e39", "#3c3d35", "#3e3c38", "#3f3d3b", "#423d3c", "#403e3c", "#3d3d3a", "#40403d", "#3f3f3c", "#3d3d3a", "#3c3c37", "#3e3e39", "#41413c", "#40403b", "#41423d", "#44443f", "#454540", "#474742", "#484843", "#4a4a45", "#4b4c47", "#4e4e49", "#51514c", "#52524d", "#53534e", "#575754", "#66615e", "#686662", "#686662", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#66675d", "#53544a", "#56584e", "#616258", "#34332c", "#494743", "#524d4c", "#000000", "#625d5a", "#45403d", "#4f4d49", "#43433e", "#464641", "#42423d", "#444441", "#44443f", "#41413e", "#414040", "#3e3d3e", "#403f40", "#373637", "#403f40", "#000000", "#000000", "#000000", "#353530", "#000000", "#383634", "#3b3635", "#383634", "#3b3937", "#383737", "#353434", "#323131", "#353434", "#373833", "#373833", "#393a35", "#3e3e39", "#3c3c37", "#3d3d38", "#3d3d38", "#40403b", "#43433e", "#44443f", "#474840", "#484843", "#464641", "#454542", "#4c4b4b", "#504f4f", "#53514f", "#585350", "#5f5a54", "#6b6761", "#3d3b37", "#514c49", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#494841", "#55564e", "#56574f", "#42433b", "#000000", "#45433f", "#54524e", "#4b4945", "#000000", "#4c4a46", "#474541", "#484843", "#484843", "#474840", "#43443c", "#40403b", "#3b3b36", "#3e3d3e", "#3e3d3d", "#3d3c3d", "#3b3a3a", "#373636", "#363535", "#000000", "#000000", "#000000", "#000000", "#323330", "#343230", "#373531", "#33312f", "#363430", "#000000", "#000000", "#343333", "#343333", "#343530", "#373833", "#383934", "#393a35", "#343530", "#363732", "#393a35", "#3b3b36", "#3b3b36", "#3d3d38", "#3e3e3b", "#41413c", "#42423d", "#44443f", "#434340", "#393936", "#4d4d48", "#54524e", "#504f48", "#62615a", "#3f3d39", "#000000", "#888888", "#4a4746", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#666661", "#494a42", "#44443f", "#41413c", "#656560", "#5f5f5a", "#54544f", "#4d4d48", "#50504b", "#000000", "#000000", "#34342f", "#000000", "#000000", "#000000", "#000000", "#363631", "#383833", "#3a3a35", "#373639", "#343333", "#363633", "#343431", "#373734", "#373734", "#333330", "#000000", "#34362e", "#373833", "#000000", "#000000", "#353530", "#000000", "#000000", "#343530", "#343532", "#31322f", "#000000", "#000000", "#373833", "#353631", "#000000", "#000000", "#000000", "#31322d", "#343530", "#363631", "#393934", "#3b3b36", "#373734", "#3e3d3e", "#3e3d3e", "#3a3939", "#000000", "#000000", "#000000", "#000000", "#000000", "#565555", "#000000", "#5d5d5a", "#63615f", "#5a5856", "#52504e", "#444240", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#626359", "#000000", "#000000", "#888888", "#51514c", "#484843", "#555550", "#454540", "#33332e", "#000000", "#000000", "#3f3f3a", "#3d3d38", "#41413e", "#424141", "#3a393a", "#32332b", "#000000", "#383833", "#363631", "#383737", "#353532", "#353530", "#3a3a37", "#353532", "#393838", "#000000", "#000000", "#353631", "#000000", "#000000", "#32322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32342c", "#30322a", "#30322a", "#33332e", "#32322d", "#343431", "#393838", "#373639", "#353435", "#3b3a3b", "#000000", "#000000", "#4c4c47", "#494944", "#333232", "#000000", "#000000", "#494849", "#535252", "#62605e", "#615f5d", "#534e4d", "#616060", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#3c3b32", "#57564d", "#5b5a50", "#64655b", "#4d4d48", "#4f4f4a", "#40403d", "#000000", "#353532", "#393934", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#353530", "#34342f", "#373732", "#373734", "#363631", "#363631", "#33332e", "#333330", "#000000", "#3a3a37", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322a", "#363631", "#353633", "#353532", "#373732", "#000000", "#454542", "#000000", "#000000", "#373734", "#3b3b38", "#434340", "#474744", "#4e4e4b", "#52524f", "#4e4c4a", "#595755", "#5d5b59", "#615f5d", "#595858", "#5c5c5c", "#545454", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#615b5b", "#5f5d5b", "#464641", "#53534e", "#5a5a55", "#595954", "#494a45", "#555651", "#353631", "#34342f", "#383833", "#000000", "#000000", "#373732", "#494944", "#444441", "#454444", "#3f3f3c", "#3a3a37", "#3a3a37", "#000000", "#000000", "#000000", "#000000", "#32332e", "#333330", "#32322d", "#33332e", "#373732", "#000000", "#000000", "#363633", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322d", "#000000", "#000000", "#000000", "#000000", "#3c3c3c", "#323233", "#3b3a3b", "#3b3a3a", "#3c3b3b", "#434340", "#454542", "#514f4d", "#5a5856", "#5f5a59", "#555455", "#5c5b5b", "#656562", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#686662", "#4e4f4a", "#464643", "#43433e", "#5a5a55", "#000000", "#33342f", "#000000", "#000000", "#464641", "#51514c", "#474742", "#40403b", "#3e3e3b", "#42423f", "#3a3939", "#363631", "#353530", "#353530", "#3a3a35", "#000000", "#31332b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#34342f", "#000000", "#343530", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#33342f", "#35372f", "#343530", "#343434", "#3c3c3c", "#383838", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#333431", "#333333", "#363535", "#3b3a3b", "#373636", "#3c3d3a", "#3e3e3b", "#424340", "#494a47", "#4a4b48", "#545552", "#585956", "#5a5a57", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#64635c", "#666460", "#5f5f5a", "#464641", "#000000", "#565651", "#000000", "#343431", "#000000", "#353631", "#4b4b46", "#464641", "#484843", "#41413c", "#3c3c37", "#3e3e39", "#3d3d3a", "#3c3b3b", "#383833", "#363631", "#34342f", "#000000", "#000000", "#000000", "#000000", "#31322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322f", "#323330", "#383936", "#3a3b38", "#000000", "#31322f", "#000000", "#000000", "#333333", "#353434", "#373636", "#353435", "#3b3b38", "#3e3e3b", "#3e3f3c", "#424340", "#474845", "#4f4f4a", "#535350", "#595956", "#646461", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#5d5e56", "#595a52", "#54544f", "#52524d", "#000000", "#32302c", "#000000", "#464646", "#4e4f4a", "#484a42", "#3a3a35", "#4a4a45", "#3f3f3a", "#3e3e39", "#3b3b36", "#3a3a37", "#3a3a37", "#393838", "#373732", "#33332e", "#000000", "#32322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#313134", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#30322a", "#353631", "#343530", "#383737", "#323131", "#353435", "#373734", "#373636", "#3c3c39", "#363633", "#40403d", "#41413e", "#494944", "#4d4d48", "#535253", "#605e5a", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#464641", "#888888", "#888888", "#686662", "#5f5f5a", "#585951", "#54544f", "#413f3d", "#363432", "#000000", "#353434", "#4d4d4d", "#454641", "#42443c", "#44443f", "#3c3c37", "#383833", "#3a3a35", "#3e3e3b", "#3d3d3a", "#393936", "#393936", "#3a3a35", "#383833", "#32322d", "#34342f", "#000000", "#000000", "#373833", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#363732", "#363633", "#3b3a3a", "#000000", "#000000", "#373734", "#3a3a37", "#363633", "#3e3e3b", "#454540", "#46473f", "#4e4d4e", "#514d47", "#686360", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#6a6962", "#888888", "#5f5d5b", "#51514c", "#565651", "#000000", "#000000", "#000000", "#50504d", "#464646", "#454545", "#3b3c37", "#3f4137", "#000000", "#000000", "#3b3b36", "#000000", "#41413c", "#383833", "#393934", "#33332e", "#353530", "#000000", "#33332e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#33342c", "#34352d", "#363631", "#646461", "#3a3a37", "#000000", "#383835", "#3e3e39", "#40403b", "#454445", "#4b4643", "#544f4c", "#5a5552", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#6b6663", "#888888", "#5b5955", "#5a5758", "#555552", "#4a4b43", "#353631", "#000000", "#565754", "#3e3f3c", "#484848", "#404040", "#3e3f3c", "#3c3e36", "#000000", "#000000", "#000000", "#3b3b36", "#393934", "#3b3c34", "#34352d", "#353530", "#000000", "#363631", "#000000", "#000000", "#000000", "#33342f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#383833", "#000000", "#000000", "#3e3e3b", "#393936", "#383835", "#373732", "#3d3e36", "#3e3d3e", "#4e484a", "#55504f", "#514d47", "#5e5d54", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#62605e", "#5e5c58", "#545451", "#4a4a47", "#4f504b", "#000000", "#363734", "#41423f", "#484946", "#494949", "#3f3f3f", "#3c3d38", "#363830", "#000000", "#000000", "#3f3f3a", "#3a3a35", "#33332e", "#32332b", "#32332b", "#000000", "#000000", "#000000", "#000000", "#000000", "#32332e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#323131", "#000000", "#000000", "#000000", "#32322f", "#353532", "#000000", "#373732", "#33332e", "#373734", "#3a3939", "#3f393b", "#423d3a", "#4c4842", "#5a5952", "#5d5d5a", "#393936", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4a4a45", "#888888", "#888888", "#646260", "#615f5d", "#595755", "#4b4b46", "#52524f", "#3a3a37", "#353434", "#4f504d", "#3c3d3a", "#464744", "#464744", "#3e3f3c", "#3e3e3e", "#353535", "#3b3b36", "#383833", "#000000", "#36372f", "#32322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#666663", "#585855", "#000000", "#000000", "#000000", "#000000", "#353435", "#383738", "#000000", "#3a3836", "#3e3c3a", "#454341", "#4b4947", "#545451", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#67665f", "#888888", "#645f5e", "#5c5a58", "#5f5d5b", "#4d4d48", "#575754", "#000000", "#4d4c4c", "#464744", "#3f403d", "#393a37", "#41423f", "#353633", "#393a37", "#363734", "#3b3b36", "#34352d", "#33332e", "#35362e", "#000000", "#32322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5c5c59", "#343431", "#656562", "#4e4e4b", "#000000", "#000000", "#383738", "#343336", "#3b3b38", "#383835", "#3b3b38", "#3d3d3a", "#444441", "#4f4f4c", "#373734", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4f504d", "#888888", "#888888", "#646461", "#5f5f5c", "#5d5d5a", "#565651", "#474742", "#000000", "#000000", "#4f4e4e", "#3e3f3c", "#3c3d3a", "#3d3e3b", "#383936", "#393a37", "#3a3b36", "#3b3d35", "#35362e", "#32322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#565653", "#000000", "#000000", "#000000", "#4c4c49", "#888888", "#5a5a55", "#000000", "#34352d", "#353633", "#353633", "#343532", "#3c3d3a", "#4c4c49", "#343431", "#50504d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#5a5a55", "#686961", "#5f5f5c", "#60605d", "#575754", "#51514e", "#454444", "#000000", "#000000", "#414040", "#3e3f3c", "#393936", "#3b3b38", "#373734", "#3d3d38", "#3d3e36", "#34352d", "#31332b", "#35362e", "#000000", "#000000", "#36372f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#64655b", "#33342c", "#36372c", "#343431", "#353532", "#353532", "#383835", "#42423f", "#000000", "#000000", "#383935", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#454540", "#888888", "#61615c", "#585855", "#535350", "#4c4c49", "#42423f", "#000000", "#000000", "#464643", "#383835", "#393936", "#383835", "#000000", "#353530", "#000000", "#000000", "#000000", "#3e3f3a", "#4f5149", "#000000", "#000000", "#000000", "#30322a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32322f", "#333330", "#32322f", "#363633", "#373734", "#3f3f3c", "#000000", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#3e3e39", "#595858", "#5f5f5c", "#545451", "#50504d", "#4a4a47", "#454542", "#000000", "#000000", "#3f3f3c", "#000000", "#343431", "#343431", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#000000", "#000000", "#333431", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#393934", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32322f", "#373734", "#373734", "#40403d", "#000000", "#666663", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#373734", "#888888", "#595956", "#565653", "#4e4e4b", "#494946", "#40403b", "#3b3b36", "#000000", "#000000", "#000000", "#656562", "#888888", "#ffffff", "#888888", "#474646", "#000000", "#000000", "#000000", "#32332e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#383833", "#363631", "#373732", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#333330", "#333330", "#3c3c39", "#000000", "#41413e", "#464744", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#000000", "#5e5f5c", "#595956", "#52524d", "#494944", "#4a4a47", "#41423d", "#393a35", "#3a3c34", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#343530", "#3b3c37", "#33332e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#333336", "#3e3e3f", "#000000", "#000000", "#626359", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4f4f4c", "#888888", "#3d3d3a", "#5f605d", "#595954", "#4e4f47", "#45463e", "#454540", "#383934", "#393a35", "#393a35", "#3a3a35", "#363631", "#34342f", "#393934", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#34342f", "#393934", "#353530", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#393939", "#000000", "#000000", "#54554d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5e5e5b", "#888888", "#363633", "#63645f", "#565651", "#505146", "#46473f", "#42423d", "#383934", "#3a3b36", "#353631", "#32322d", "#32322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#343532", "#000000", "#000000", "#474742", "#3d3d38", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3c39", "#626161", "#888888", "#32322d", "#5d5f57", "#50504d", "#4b4b46", "#434340", "#41413e", "#383936", "#393a37", "#353530", "#000000", "#33352d", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#33342c", "#000000", "#34352d", "#6c6d63", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#46413e", "#666364", "#888888", "#000000", "#5a5c52", "#4e4d4e", "#464546", "#42423f", "#3c3b3b", "#363633", "#353532", "#33312d", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#313228", "#000000", "#383931", "#000000", "#000000", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#656361", "#888888", "#000000", "#5d5e54", "#494946", "#484845", "#3e3d3d", "#3a3a37", "#323131", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#353532", "#000000", "#32322d", "#4b4c44", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#615c59", "#6b6a63", "#888888", "#000000", "#555651", "#484642", "#474840", "#3a3a35", "#393934", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#323132", "#000000", "#393839", "#000000", "#000000", "#44443f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5d5857", "#888888", "#55534f", "#625d5a", "#888888", "#000000", "#4b4d45", "#47463d", "#3b3a3a", "#383833", "#353530", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#33342f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#333232", "#000000", "#000000", "#414238", "#41433b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#696463", "#888888", "#504f48", "#625d5a", "#888888", "#342f2c", "#494b43", "#44453d", "#3c3c39", "#373734", "#343431", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#333330", "#000000", "#000000", "#424339", "#53544b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#6a655f", "#5d5c52", "#4e4946", "#888888", "#000000", "#444540", "#42433b", "#393934", "#353530", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#34342f", "#000000", "#000000", "#414238", "#6b6c64", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#4c4842", "#888888", "#4b4643", "#888888", "#000000", "#434441", "#42423d", "#393a32", "#343431", "#333233", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#2f2f32", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32332b", "#000000", "#000000", "#000000", "#32322d", "#000000", "#000000", "#3b3c32", "#474743", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#706662", "#443c37", "#3e3d33", "#5d5c55", "#888888", "#000000", "#393a35", "#3d3b41", "#373636", "#323329", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#373835", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#363535", "#000000", "#373732", "#33332e", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#605554", "#423d35", "#464239", "#5d5c52", "#888888", "#373734", "#363639", "#3f3f3c", "#33332e", "#000000", "#000000", "#322e26", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#323330", "#000000", "#000000", "#32342a", "#000000", "#323330", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#333232", "#000000", "#363633", "#000000", "#000000", "#4c4c47", "#000000", "#595954", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#686262", "#625957", "#888888", "#4b473e", "#46453c", "#888888", "#3b3b36", "#000000", "#423e36", "#383330", "#333031", "#322f31", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32322f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#323330", "#000000", "#000000", "#363732", "#36382e", "#34342f", "#000000", "#3b3b36", "#32332b", "#000000", "#32322f", "#333330", "#343431", "#000000", "#333232", "#3c3b3b", "#000000", "#33332e", "#000000", "#ffffff", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#58504b", "#605b55", "#534f47", "#413f3b", "#888888", "#494a42", "#000000", "#403c33", "#383332", "#352f34", "#373136", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#333330", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3b3b36", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#353633", "#32332e", "#33352d", "#36372f", "#36372f", "#000000", "#373636", "#000000", "#32322f", "#363631", "#333330", "#343333", "#323131", "#3a3a37", "#000000", "#373732", "#000000", "#888888", "#ffffff", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#5c554a", "#555145", "#56524a", "#4e4c48", "#5d5e56", "#5b5b56", "#000000", "#3d3739", "#38342e", "#000000", "#000000", "#322d2a", "#000000", "#342f2c", "#32302e", "#000000", "#353530", "#000000", "#000000", "#000000", "#000000", "#000000", "#33332e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32322f", "#343431", "#3d3d38", "#3c3c37", "#3b3b36", "#3a3a37", "#3a3a37", "#333232", "#000000", "#000000", "#35312b", "#34332c", "#393733", "#000000", "#32322d", "#32322d", "#000000", "#31322a", "#353530", "#888888", "#ffffff", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#ffffff", "#585144", "#645d50", "#535346", "#59554f", "#55544d", "#63635e", "#000000", "#353331", "#373531", "#373531", "#37362f", "#33312d", "#33312d", "#36312e", "#353530", "#000000", "#34342f", "#32322d", "#000000", "#000000", "#000000", "#313228", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#393936", "#383835", "#3d3d3a", "#3e3f37", "#3b3b36", "#3a3a35", "#393934", "#3b3b38", "#383738", "#363430", "#373531", "#383330", "#373533", "#363633", "#393936", "#373732", "#000000", "#3a3a35", "#000000", "#ffffff", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#ffffff", "#514a3f", "#5a5348", "#57574a", "#5d584f", "#59554d", "#67665f", "#000000", "#3a3836", "#33312d", "#373531", "#34332c", "#000000", "#32322d", "#33332e", "#353530", "#383833", "#383833", "#393838", "#31322a", "#35362c", "#36372d", "#33352b", "#373637", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32322f", "#33332e", "#343431", "#353532", "#3a3a37", "#3c3c39", "#393934", "#3c3c37", "#31322a", "#373830", "#373732", "#3c3c39", "#34322e", "#32302e", "#363432", "#383536", "#363633", "#393936", "#353530", "#000000", "#33332e", "#41413c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#ffffff", "#524e3e", "#5c544d", "#56554c", "#5d594d", "#615d55", "#66625c", "#000000", "#393431", "#36312e", "#342f2c", "#363430", "#373830", "#393831", "#373830", "#363430", "#3c3a36", "#3a3932", "#3c3a36", "#393831", "#37362d", "#3d3c33", "#37362d", "#000000", "#363633", "#32322d", "#32322d", "#33332e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#323131", "#3e3e3b", "#3f3f3a", "#3e3d36", "#3e3d36", "#3b3935", "#3b3935", "#3f3d39", "#413f3b", "#353530", "#3c3a36", "#403e3a", "#37322f", "#343230", "#3d3d38", "#373732", "#33332e", "#000000", "#383833", "#363631", "#41413c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#434344", "#ffffff", "#676150", "#67625c", "#5d5951", "#646155", "#5b574f", "#6b6761", "#000000", "#000000", "#34322e", "#363430", "#373531", "#393831", "#3a3932", "#393831", "#3d3c35", "#414039", "#403f38", "#3f3d39", "#3a3834", "#414039", "#3a3932", "#3a3930", "#3f4038", "#40403b", "#393934", "#353530", "#32322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#333431", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#373636", "#000000", "#3c3d3a", "#36372f", "#3a3930", "#3e3d36", "#3a3834", "#46413e", "#413c39", "#44423e", "#3c3832", "#3a3834", "#363430", "#373531", "#393831", "#33332e", "#32322d", "#383931", "#000000", "#383833", "#32322f", "#373732", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#565657", "#ffffff", "#5f5948", "#65605a", "#5e5a52", "#625e56", "#57534b", "#888888", "#000000", "#000000", "#3a3834", "#393733", "#35332f", "#3a3932", "#3e3d36", "#3b3a33", "#3e3d36", "#3f3e37", "#403f38", "#3f3d39", "#3f3d39", "#403e3a", "#42413a", "#43423b", "#464641", "#40403b", "#363631", "#353530", "#393934", "#000000", "#000000", "#32332b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#373734", "#393839", "#333233", "#40413e", "#3c3c37", "#42413a", "#44423e", "#3b3937", "#403b38", "#423d3a", "#3b3633", "#413c39", "#3f3b33", "#393831", "#383632", "#3b3935", "#363536", "#000000", "#3a393a", "#000000", "#353530", "#33342c", "#393934", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#636363", "#ffffff", "#534d3c", "#5d5850", "#59554d", "#6e6a64", "#888888", "#888888", "#3a3630", "#000000", "#3c3c37", "#383833", "#353530", "#3a3932", "#36352e", "#3b3a33", "#43423b", "#45443d", "#484740", "#494743", "#4a4844", "#4d4b49", "#403e3a", "#4b4741", "#42403c", "#44443f", "#41413c", "#3f3f3a", "#353530", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#333431", "#000000", "#3c3d3a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#444542", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#383838", "#000000", "#363633", "#333232", "#353434", "#434340", "#44423e", "#3b3633", "#403b38", "#3f3d3b", "#433e3b", "#45403d", "#3d3933", "#3f3a37", "#3a392f", "#3b3a31", "#37362f", "#363432", "#353437", "#3b3a3b", "#353435", "#000000", "#454540", "#000000", "#464641", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#4d4637", "#595247", "#57534d", "#5e5a54", "#5f6056", "#888888", "#3c372e", "#000000", "#3c3a36", "#363430", "#383632", "#3c3832", "#3f3b35", "#433f37", "#48443b", "#433f36", "#4a463d", "#484539", "#4e4d44", "#494841", "#4b4a43", "#4f4e47", "#484740", "#464440", "#45433f", "#403e3c", "#3f3d39", "#373531", "#383632", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32322d", "#000000", "#000000", "#000000", "#4f4e4f", "#000000", "#4c4d48", "#3a3b38", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5c5d5a", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#393936", "#000000", "#3a3a35", "#44423e", "#443f3e", "#433e3b", "#413c39", "#494441", "#3d3b37", "#413f3b", "#423e38", "#3f3b35", "#363631", "#383931", "#000000", "#33342c", "#000000", "#383833", "#000000", "#4a4a47", "#3e3d3d", "#000000", "#60605b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#675f57", "#524d45", "#56524a", "#5f5b55", "#5b5c52", "#888888", "#332e26", "#000000", "#403b38", "#3d3835", "#393431", "#403b38", "#3c3734", "#423d3a", "#403c36", "#4d4941", "#4d4941", "#524e46", "#534f49", "#4c4b44", "#515049", "#55544d", "#4c4b44", "#474541", "#4b4945", "#403e3c", "#3d3b37", "#373531", "#363430", "#32302c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3e3d3d", "#616061", "#000000", "#888888", "#353633", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#000000", "#4c4d4a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32322f", "#000000", "#363633", "#373833", "#3f403b", "#43433e", "#45433f", "#46413e", "#4f4a47", "#484340", "#4b4643", "#464440", "#413f3b", "#45413b", "#3a3630", "#373732", "#36372f", "#363631", "#383931", "#353435", "#000000", "#575657", "#888888", "#424142", "#000000", "#63635e", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#665e59", "#5c544f", "#56524a", "#5c5850", "#505147", "#ffffff", "#000000", "#45403d", "#3f3a37", "#3f3b35", "#3f3a37", "#3d3931", "#3d3931", "#45413b", "#4f4b45", "#4c4842", "#524e46", "#4e4a44", "#52514a", "#5b5a53", "#54534c", "#55544d", "#53524b", "#52504c", "#4f4d49", "#474543", "#43413d", "#3c3a36", "#3f3d39", "#383632", "#33332e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#605f60", "#888888", "#000000", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#353530", "#32322f", "#323131", "#3d3e39", "#454641", "#454540", "#4b4945", "#47423f", "#46413e", "#4a4542", "#46413e", "#45433f", "#44423e", "#413d37", "#3f3b35", "#000000", "#373830", "#363631", "#363631", "#3a3939", "#000000", "#888888", "#000000", "#888888", "#000000", "#54544f", "#575752", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#534847", "#574e4c", "#58544c", "#68645b", "#626359", "#888888", "#36312b", "#5c5852", "#888888", "#000000", "#433f39", "#3d3a2a", "#423f31", "#464335", "#48443c", "#4e4a44", "#515049", "#514c49", "#54534c", "#54534c", "#53524b", "#585750", "#55544d", "#53514d", "#4d4b47", "#4a4846", "#494743", "#413f3b", "#42403c", "#3c3a36", "#363631", "#33332e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#000000", "#888888", "#000000", "#333431", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#404040", "#3e3e3e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#36372f", "#34342f", "#353532", "#3e3d3d", "#464643", "#43453d", "#41423a", "#43423b", "#4f4b45", "#45403d", "#514c49", "#3e3936", "#484642", "#464440", "#45413b", "#3e3a34", "#373732", "#393a32", "#32322d", "#36372f", "#36372f", "#000000", "#888888", "#000000", "#888888", "#000000", "#454540", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#595453", "#4f4b45", "#59554d", "#56514e", "#635e5b", "#ffffff", "#000000", "#645e61", "#ffffff", "#000000", "#3f3b32", "#413f3d", "#403e3a", "#4d4845", "#4c4744", "#524d4a", "#5d5953", "#69655d", "#625d57", "#67615e", "#625957", "#655c5a", "#59544e", "#58544c", "#5b5a50", "#55534f", "#4e4b4c", "#514f4d", "#3d3b37", "#46453c", "#3d3c32", "#39382f", "#34322e", "#322f30", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#393936", "#888888", "#888888", "#000000", "#888888", "#000000", "#363637", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#484946", "#31322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#33342f", "#323330", "#393934", "#000000", "#34342f", "#4c4c47", "#454540", "#4f5048", "#484a42", "#4c4a46", "#464440", "#464440", "#515049", "#49453f", "#4d4943", "#413c39", "#3c3734", "#3f3a37", "#3d3930", "#353129", "#38342e", "#333330", "#353532", "#000000", "#000000", "#000000", "#3b3935", "#37362c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#49494a", "#ffffff", "#443e40", "#555149", "#514d45", "#534e4b", "#888888", "#888888", "#322e28", "#58544b", "#ffffff", "#44423e", "#35302f", "#383730", "#443f3c", "#494841", "#4f4b45", "#4e4a44", "#5b5751", "#5d5951", "#68635d", "#5e5855", "#6d6764", "#67615e", "#615c56", "#59554d", "#5a574b", "#5d5c55", "#595755", "#4e4c48", "#494841", "#424138", "#403f38", "#3f3e37", "#3b3935", "#34322e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#41413c", "#61615e", "#888888", "#000000", "#5e5f5a", "#000000", "#353536", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3f403d", "#525252", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31332b", "#373833", "#31322f", "#3b3b36", "#3a3a35", "#42423d", "#4b4b46", "#42423d", "#4b4b48", "#51524f", "#4d4b49", "#4f4e47", "#525148", "#4d4c43", "#4b4741", "#49453f", "#56514e", "#3a3532", "#44403a", "#3e3d33", "#3b372e", "#33322b", "#363633", "#32322f", "#353532", "#000000", "#000000", "#343230", "#3f3d39", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#443f3c", "#423e36", "#48443b", "#4f4b45", "#68645e", "#3c3734", "#5f5b52", "#000000", "#000000", "#48443e", "#413f3d", "#484843", "#41413e", "#4f4f4a", "#504e4a", "#58544e", "#58544e", "#5e5a52", "#625d57", "#888888", "#5e5855", "#696360", "#645c57", "#5b564e", "#5a554c", "#635e5b", "#53524b", "#5a5952", "#4f4e47", "#52514a", "#414039", "#3e3d36", "#3b3a33", "#363430", "#32322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5b5b56", "#65665e", "#ffffff", "#000000", "#000000", "#000000", "#59595a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5c5c5c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322f", "#3e4038", "#343530", "#000000", "#484843", "#53534e", "#4e4e49", "#4b4b46", "#5c5c57", "#605f60", "#4c4b51", "#4d4a4c", "#454341", "#64625e", "#888888", "#4e4c4a", "#615c59", "#5b5a53", "#5f5e57", "#63645c", "#494a40", "#46473c", "#33332e", "#000000", "#000000", "#888888", "#000000", "#888888", "#383634", "#383536", "#403e3a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#37322f", "#423e36", "#413e32", "#65615b", "#68645e", "#3e3a34", "#504f48", "#37362c", "#49483f", "#39382f", "#37362f", "#42423d", "#464641", "#464641", "#55534f", "#5a5552", "#66615e", "#57534d", "#615b58", "#59504e", "#68625f", "#6c645f", "#635b56", "#665e59", "#67625a", "#655f5c", "#616059", "#5d5c53", "#54534c", "#53524b", "#494743", "#4a4942", "#43423b", "#3e3a34", "#34342f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5b5b56", "#41413c", "#888888", "#000000", "#000000", "#000000", "#3c3c3c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32332e", "#3d3e39", "#454540", "#44453d", "#494946", "#565653", "#4c4c49", "#535051", "#494648", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#4b4947", "#413f3b", "#464440", "#433f39", "#4a4a45", "#35362c", "#4d4e44", "#52534b", "#595956", "#3d3d3a", "#000000", "#888888", "#000000", "#888888", "#44423e", "#4f4d4b", "#494944", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#696650", "#322e26", "#36322c", "#39362a", "#59554f", "#57534d", "#000000", "#6a6660", "#57534d", "#5d5c53", "#55564e", "#3a3b33", "#585652", "#53514d", "#4e4e49", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#6a6864", "#595753", "#5a5854", "#64625e", "#616059", "#616059", "#5c5b54", "#53524b", "#55514b", "#47433d", "#504c46", "#3f3b35", "#3c3d33", "#323329", "#000000", "#000000", "#000000", "#000000", "#000000", "#393934", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3d3d38", "#3c3c37", "#52524d", "#555550", "#888888", "#504f4f", "#5f5e5f", "#ffffff", "#888888", "#888888", "#37322f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4e4d46", "#44433c", "#000000", "#52534b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#6f6c5a", "#000000", "#36322c", "#363229", "#514d45", "#403c34", "#000000", "#888888", "#888888", "#888888", "#000000", "#595851", "#53514d", "#54524e", "#3d3933", "#565452", "#33312d", "#433e3b", "#433e3b", "#433e3b", "#3c3734", "#69645e", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#5a5552", "#625e58", "#605c56", "#605c56", "#504c46", "#58544e", "#4f4b45", "#48443e", "#3a3b30", "#3c3d32", "#35362b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#494a45", "#5f605d", "#3d3d3a", "#373734", "#434340", "#3e3e3b", "#41413e", "#4b4b48", "#888888", "#ffffff", "#32322f", "#000000", "#000000", "#000000", "#35312b", "#5d5c55", "#5f5e57", "#5f5e57", "#534e4b", "#504b48", "#433e3b", "#443f3c", "#33342c", "#353530", "#31322a", "#33342c", "#31322a", "#36372f", "#000000", "#000000", "#000000", "#000000", "#000000", "#393733", "#353530", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5e5b4b", "#000000", "#000000", "#332f26", "#4d4940", "#000000", "#000000", "#585448", "#332a20", "#4d4842", "#4f4a47", "#433e3b", "#3c3734", "#3f3a37", "#403b38", "#45403d", "#4a4542", "#47433d", "#46413e", "#444037", "#3b362d", "#534e45", "#59554d", "#888888", "#888888", "#646054", "#756e61", "#888888", "#888888", "#888888", "#615d57", "#645f5c", "#57534d", "#524e48", "#504c46", "#44443f", "#373830", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3b3b", "#888888", "#3e3d3d", "#888888", "#888888", "#494946", "#000000", "#000000", "#484546", "#635d60", "#888888", "#888888", "#5e585a", "#686760", "#64635c", "#5e5d56", "#4e4946", "#585350", "#47423f", "#403b38", "#32312a", "#000000", "#000000", "#000000", "#31322a", "#000000", "#000000", "#34342f", "#000000", "#363430", "#332e2b", "#45433f", "#41423a", "#31322a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4f4d39", "#000000", "#34322e", "#000000", "#484740", "#000000", "#515049", "#5f5d59", "#4a4441", "#47463f", "#44453b", "#46453e", "#46403d", "#45403d", "#4e4943", "#55534f", "#585853", "#555552", "#5b5b58", "#5c5d55", "#66675c", "#54554d", "#5c5852", "#3f362a", "#000000", "#544d42", "#5e574a", "#5b5650", "#000000", "#6b6663", "#888888", "#4d4c43", "#35342d", "#4e4c4a", "#554f51", "#393934", "#3a3a35", "#4a4b43", "#42423d", "#000000", "#000000", "#000000", "#000000", "#000000", "#3d3d38", "#383833", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#ffffff", "#5f5f5c", "#888888", "#888888", "#000000", "#000000", "#000000", "#63615d", "#888888", "#666160", "#888888", "#888888", "#888888", "#888888", "#888888", "#54504a", "#514d47", "#4b4643", "#474241", "#38342e", "#32332b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#34342f", "#33312d", "#363430", "#36312e", "#4d4b47", "#45443d", "#4b4c44", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#434632", "#000000", "#000000", "#000000", "#000000", "#484740", "#4f4e47", "#585750", "#47423f", "#504c46", "#4f4e47", "#48473e", "#48443e", "#4a4640", "#514d47", "#54534a", "#56554e", "#585652", "#585652", "#56554e", "#605f56", "#635f57", "#888888", "#888888", "#888888", "#888888", "#888888", "#67615e", "#484340", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#ffffff", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#000000", "#000000", "#535350", "#888888", "#64625e", "#6a6562", "#888888", "#888888", "#888888", "#888888", "#68645e", "#6b6761", "#4d4943", "#59554d", "#4d4943", "#4a4544", "#3c3736", "#403c36", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#33342c", "#3c3b34", "#36352e", "#393831", "#414039", "#414039", "#4f5046", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#393b2b", "#000000", "#000000", "#000000", "#000000", "#595753", "#585750", "#515049", "#4d4943", "#524d47", "#58534a", "#524d45", "#48443c", "#4c4842", "#524e48", "#534f47", "#535249", "#62615a", "#5d5b57", "#565450", "#605c54", "#67635b", "#6f6a64", "#888888", "#67665f", "#6d6963", "#888888", "#888888", "#888888", "#605e5a", "#464440", "#000000", "#000000", "#000000", "#3a3a35", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#33312f", "#000000", "#000000", "#34342f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#61615e", "#5e5f57", "#63615d", "#888888", "#888888", "#888888", "#888888", "#615c59", "#4f4a47", "#55544b", "#4b473e", "#424235", "#45413b", "#443f3e", "#3b3635", "#3f3b35", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#35342d", "#000000", "#42413a", "#3e3d36", "#46453c", "#414238", "#383934", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4c4e44", "#000000", "#000000", "#000000", "#000000", "#484740", "#63625b", "#59584f", "#504e4a", "#5c5751", "#59544c", "#534b44", "#44433a", "#4b473e", "#4e4b3f", "#575448", "#545145", "#59554f", "#5b574f", "#605c56", "#656159", "#686058", "#6f6664", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#676466", "#000000", "#000000", "#000000", "#000000", "#000000", "#403e3c", "#888888", "#000000", "#000000", "#41413e", "#373835", "#434441", "#3b3b3b", "#3e3e3b", "#41413c", "#31322f", "#000000", "#000000", "#000000", "#000000", "#000000", "#393a35", "#383934", "#353535", "#414141", "#3b3b3b", "#474646", "#000000", "#000000", "#888888", "#888888", "#000000", "#000000", "#000000", "#3e3e3b", "#585855", "#888888", "#646461", "#5c5c59", "#888888", "#888888", "#6a6562", "#888888", "#888888", "#696463", "#575251", "#5a5552", "#57564c", "#48473d", "#46453b", "#33322b", "#322d2a", "#33312f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32312a", "#37362f", "#3e3d36", "#3f3e37", "#44433c", "#4b4c44", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#45463b", "#000000", "#000000", "#000000", "#000000", "#454542", "#67665f", "#67675a", "#504f48", "#656159", "#656057", "#544f46", "#48443e", "#4a4542", "#504c46", "#534f49", "#534f49", "#565450", "#5b5751", "#605a59", "#69615c", "#656057", "#6d6764", "#716c63", "#706b63", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#514e52", "#888888", "#404440", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#000000", "#494a45", "#000000", "#4e4d4d", "#888888", "#888888", "#413f3b", "#353530", "#000000", "#383833", "#333330", "#000000", "#484845", "#444441", "#4e4d4d", "#000000", "#000000", "#888888", "#5c5c59", "#454542", "#000000", "#000000", "#000000", "#000000", "#343431", "#53534e", "#5f5f5a", "#5e5e59", "#6c6764", "#888888", "#686964", "#888888", "#888888", "#888888", "#65645d", "#5e5a52", "#55504d", "#524d4a", "#55544d", "#47463f", "#42413a", "#33352b", "#33352d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#37362f", "#3c3b32", "#4e4d44", "#3e3f3a", "#4f4e4f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#47493f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#6d6c63", "#504f48", "#888888", "#6a655c", "#504b43", "#4c4842", "#4b4741", "#4d4943", "#524e48", "#585350", "#58544e", "#585350", "#5d5756", "#716c64", "#6b665d", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#666160", "#888888", "#5e5956", "#5b5955", "#424340", "#636360", "#000000", "#000000", "#000000", "#53534e", "#000000", "#888888", "#ffffff", "#888888", "#888888", "#5c5c59", "#363631", "#43433e", "#383833", "#44443f", "#000000", "#32322f", "#888888", "#888888", "#ffffff", "#53534e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3d3d38", "#575752", "#52524d", "#888888", "#888888", "#888888", "#64605a", "#888888", "#888888", "#888888", "#60605b", "#60605b", "#5e5f55", "#575752", "#454540", "#403e3a", "#34322e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3d3d38", "#383833", "#3d3d38", "#4a4a47", "#484748", "#404043", "#353434", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#55564e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#69655d", "#5a5952", "#888888", "#635e55", "#504b42", "#504b48", "#544f4c", "#55504d", "#524d4a", "#534e4d", "#595453", "#5b5655", "#5d5756", "#747064", "#6e6a5c", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#686662", "#888888", "#64625e", "#888888", "#888888", "#51524f", "#34342f", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#4e4e49", "#494944", "#656560", "#474744", "#888888", "#636360", "#434340", "#888888", "#000000", "#000000", "#000000", "#3d3d3a", "#3f3f3c", "#000000", "#000000", "#383833", "#353530", "#44453d", "#888888", "#61615c", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#5f5e55", "#514f4b", "#484342", "#363432", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3a3b31", "#383934", "#393934", "#424243", "#4c4c47", "#464545", "#484747", "#3b3b38", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4d4e44", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#6a6660", "#888888", "#888888", "#5d5850", "#54504a", "#514c49", "#514c49", "#534e4b", "#56514e", "#544f4c", "#57534d", "#534e4b", "#615b5a", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#605e5c", "#4e4c4a", "#42423f", "#44423e", "#383330", "#383632", "#888888", "#888888", "#888888", "#888888", "#63615d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#363535", "#000000", "#000000", "#494946", "#5e5f5a", "#51534b", "#424242", "#393a37", "#000000", "#000000", "#000000", "#42413a", "#696861", "#64625e", "#888888", "#888888", "#888888", "#888888", "#6f6a64", "#888888", "#888888", "#675e5c", "#5b534e", "#594f49", "#564c48", "#483f3d", "#352c2a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3f4139", "#3b3d35", "#3d3e3b", "#4b4b4c", "#4b4945", "#43413d", "#4e4c48", "#373732", "#3e3e39", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#44453a", "#000000", "#000000", "#000000", "#000000", "#000000", "#3b3a3b", "#888888", "#666460", "#888888", "#888888", "#58534d", "#514f4b", "#504c46", "#534e4b", "#56514e", "#5a5552", "#57534d", "#58544b", "#59554d", "#655f5c", "#666158", "#716c63", "#888888", "#6b665e", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#605e5c", "#504e4c", "#403e3a", "#3b3633", "#585350", "#6d6963", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#424141", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#63635e", "#62635e", "#888888", "#888888", "#424340", "#000000", "#000000", "#393831", "#45443d", "#514c49", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#756a64", "#685a55", "#5e504b", "#60524d", "#4f413c", "#41332e", "#372c26", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32322d", "#3d3d38", "#41423d", "#434441", "#4b4c47", "#504b48", "#464440", "#53514d", "#353530", "#4a4a45", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#414237", "#000000", "#000000", "#000000", "#000000", "#000000", "#5c5b5c", "#656465", "#888888", "#888888", "#675f5a", "#524d47", "#4a4942", "#504e4a", "#53514d", "#55534f", "#56514e", "#5a5650", "#534f46", "#59554f", "#5f5a59", "#635d5c", "#5d5852", "#58534a", "#574e4c", "#5a504c", "#635857", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#4d4b49", "#56514e", "#5d5855", "#888888", "#888888", "#ffffff", "#888888", "#ffffff", "#ffffff", "#888888", "#4d4c4c", "#53534e", "#888888", "#888888", "#888888", "#888888", "#6c6d63", "#888888", "#888888", "#5d5c64", "#575757", "#494a47", "#45443d", "#36322a", "#000000", "#56554e", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#775d5b", "#6b524d", "#5d443f", "#513833", "#46312b", "#34241f", "#382522", "#000000", "#000000", "#000000", "#000000", "#000000", "#443b39", "#888888", "#888888", "#888888", "#52534b", "#52524d", "#64625e", "#5a5a55", "#33332e", "#44443f", "#464641", "#514f4b", "#4b4643", "#45433f", "#52504c", "#34322e", "#4c4c47", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#424338", "#000000", "#000000", "#000000", "#000000", "#000000", "#5c5b5e", "#636263", "#888888", "#888888", "#665c58", "#544c47", "#474541", "#474843", "#4b4b46", "#50514e", "#53514d", "#4e4a44", "#514d44", "#514d47", "#524c4b", "#514a4c", "#504a49", "#4e4940", "#50493e", "#4f453e", "#544948", "#665b5c", "#888888", "#786a64", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#5d5b59", "#45403d", "#595451", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#4e4d4d", "#4d4d48", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#484642", "#3e3c38", "#37332b", "#373732", "#504f48", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#71514f", "#684642", "#5c3e39", "#472723", "#40241c", "#463129", "#331b16", "#000000", "#514242", "#888888", "#888888", "#888888", "#5c5754", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4d4b49", "#413f3d", "#504e4a", "#4f4e47", "#4d4b47", "#494441", "#575551", "#3d3d38", "#4d4d48", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#46473d", "#000000", "#000000", "#000000", "#000000", "#000000", "#6c6d63", "#68675e", "#888888", "#888888", "#5d5953", "#524e46", "#545048", "#454540", "#53524b", "#504c44", "#58544e", "#504b48", "#534a48", "#4b4242", "#504642", "#4f4440", "#51433d", "#50423c", "#463739", "#4e3e3c", "#594341", "#6c544f", "#755857", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#5a5552", "#4c4744", "#666462", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#4c4648", "#676563", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#616164", "#464140", "#413932", "#403830", "#544c45", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#7f5252", "#764347", "#693d39", "#4c251f", "#562124", "#622c34", "#888888", "#ffffff", "#888888", "#463b34", "#000000", "#000000", "#000000", "#3f2222", "#463231", "#4a3638", "#4e3f3f", "#514642", "#433935", "#4c4744", "#53534e", "#000000", "#888888", "#555351", "#585654", "#4a4a45", "#4e4c48", "#544f4c", "#46413e", "#555351", "#3f3c3d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#505147", "#373531", "#000000", "#000000", "#000000", "#000000", "#888888", "#4f4e47", "#888888", "#6e6a61", "#68645e", "#4c4744", "#403d3e", "#545451", "#5b5a53", "#49453f", "#4b4643", "#413c36", "#544b49", "#504544", "#594b46", "#5e4e4a", "#4e3a36", "#503d34", "#4f3635", "#563c3b", "#5f413e", "#6b4945", "#755351", "#7c5a56", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#5f5a57", "#4a4640", "#686362", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#696365", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#47423f", "#433b34", "#474239", "#635852", "#645955", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#9a6364", "#85494c", "#7b403f", "#888888", "#888888", "#888888", "#888888", "#000000", "#000000", "#4c1f1d", "#562929", "#59312f", "#7c5454", "#888888", "#745a5b", "#888888", "#888888", "#888888", "#888888", "#888888", "#5e5e59", "#000000", "#ffffff", "#494745", "#4e4c4a", "#4d4d48", "#4e4946", "#504e4a", "#524d4a", "#4f4a49", "#585556", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#6b6c64", "#3a3532", "#000000", "#000000", "#32322d", "#51514c", "#696861", "#53514d", "#888888", "#888888", "#49453f", "#888888", "#ffffff", "#000000", "#322d2c", "#554f4c", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#584440", "#513531", "#000000", "#5d3636", "#653b3a", "#5c302c", "#663631", "#6c3837", "#7c4643", "#8c5655", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#675d59", "#57514e", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#5a5456", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#5b5655", "#514c44", "#5b4b46", "#5d4a47", "#888888", "#ffffff", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ff0000", "#580304", "#6a141a", "#600f11", "#6a1f1f", "#7d3936", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#625d5a", "#444240", "#888888", "#000000", "#575553", "#51514c", "#514c49", "#54524e", "#5b5653", "#565150", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#3c3734", "#3a3532", "#000000", "#000000", "#5e5e59", "#666460", "#615f5b", "#888888", "#888888", "#888888", "#888888", "#3e3a34", "#413b3d", "#453f3e", "#000000", "#000000", "#000000", "#000000", "#000000", "#4f3f3d", "#888888", "#888888", "#888888", "#7e5151", "#5e2d2c", "#481815", "#592520", "#743634", "#834646", "#95585a", "#9f6165", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#ffffff", "#888888", "#888888", "#736562", "#615856", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#595355", "#676563", "#60605d", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#6a6562", "#555048", "#4f3b37", "#77615f", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#782626", "#530100", "#670402", "#832425", "#812932", "#b15a68", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#4e4c4a", "#888888", "#000000", "#5d5b59", "#3d3d38", "#000000", "#3d3b37", "#605b58", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#615c59", "#55514b", "#000000", "#000000", "#888888", "#686760", "#696861", "#65645d", "#504d4e", "#ffffff", "#4d4d40", "#696763", "#888888", "#615f5d", "#655f5c", "#6d5f5c", "#5a4a48", "#594642", "#4d3332", "#573a39", "#371818", "#320d0f", "#000000", "#460f10", "#6a3938", "#895a59", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#61514d", "#6c645f", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#494647", "#888888", "#676261", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#726761", "#765e59", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#aa6462", "#ff0000", "#6c1b1b", "#580200", "#882c28", "#ff0000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#874949", "#85453f", "#7a443f", "#91655d", "#888888", "#888888", "#888888", "#888888", "#888888", "#5b5957", "#888888", "#353331", "#575553", "#54544f", "#3f3f3a", "#888888", "#4d4b49", "#615c5b", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#615d57", "#37332d", "#888888", "#6b6a63", "#686760", "#888888", "#686760", "#535051", "#888888", "#58584b", "#62605c", "#888888", "#888888", "#888888", "#746661", "#6b605a", "#60444d", "#6a494b", "#5e3433", "#653635", "#430e11", "#4c1112", "#672021", "#541314", "#4e0708", "#5a0603", "#610f0e", "#ff0000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#5d4d48", "#6c625e", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#53514d", "#595753", "#615c5b", "#5a5856", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#756a64", "#72564e", "#888888", "#888888", "#888888", "#70342f", "#601f1e", "#4f0205", "#671014", "#ff0000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ff0000", "#ff0000", "#8f2019", "#7e0b0b", "#6b0605", "#5c0200", "#5c0a0f", "#460600", "#3b0500", "#000000", "#000000", "#4d352e", "#715e57", "#888888", "#888888", "#403e3c", "#888888", "#4b4945", "#4d4b47", "#ffffff", "#000000", "#ffffff", "#4b4947", "#5b5655", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#656560", "#888888", "#888888", "#888888", "#888888", "#66655e", "#65645d", "#888888", "#888888", "#4d4b47", "#676561", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#bf6466", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#7b0605", "#750000", "#720200", "#912321", "#ff0000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#6e554c", "#6b5952", "#60554e", "#888888", "#888888", "#ffffff", "#888888", "#ffffff", "#ffffff", "#5c5a58", "#686664", "#888888", "#5d5756", "#635e5d", "#4e4c48", "#888888", "#ffffff", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#60504b", "#583c34", "#431f1c", "#421112", "#3a0508", "#8c5057", "#888888", "#888888", "#888888", "#888888", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#740a07", "#6c100c", "#732120", "#7e373a", "#460e0e", "#401313", "#000000", "#000000", "#000000", "#786562", "#888888", "#3f3d39", "#ffffff", "#55534f", "#5a5854", "#3a3a35", "#000000", "#5d5d58", "#464440", "#5a5554", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#464744", "#888888", "#888888", "#888888", "#888888", "#6b6a63", "#888888", "#ffffff", "#888888", "#46453e", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#901210", "#7a0101", "#770001", "#751212", "#ff0000", "#ff0000", "#888888", "#888888", "#888888", "#888888", "#745852", "#6e5951", "#71635d", "#6d6560", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#565354", "#888888", "#625f60", "#534d4c", "#888888", "#6c6764", "#45413b", "#ffffff", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#625751", "#888888", "#5b3b39", "#5b3430", "#77484b", "#888888", "#888888", "#ff0000", "#ff0000", "#922018", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#940509", "#930409", "#8c080e", "#7f090e", "#7f171e", "#bd6463", "#752d29", "#4c0f0d", "#3f0f0a", "#000000", "#381f1d", "#746062", "#888888", "#4f4b43", "#888888", "#5c5a56", "#888888", "#000000", "#000000", "#32322d", "#4b4b48", "#575656", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#5a5758", "#ffffff", "#888888", "#ffffff", "#686760", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#a0645d", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#888888", "#888888", "#888888", "#888888", "#888888", "#e26664", "#ff0000", "#ff0000", "#872d2a", "#600a08", "#3d0000", "#400a09", "#421312", "#472322", "#000000", "#76625e", "#888888", "#888888", "#888888", "#888888", "#888888", "#5d5e5b", "#888888", "#ffffff", "#33312f", "#43413d", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#674340", "#6f433d", "#814442", "#702824", "#852c27", "#ff0000", "#ff0000", "#ff0000", "#950301", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#888888", "#7c0706", "#791311", "#6b120f", "#914643", "#4d100e", "#3f0d0b", "#330c0c", "#000000", "#888888", "#888888", "#5f5b52", "#888888", "#5d5b59", "#666460", "#000000", "#000000", "#3a3a37", "#4a4949", "#504f4f", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#686264", "#888888", "#67625f", "#888888", "#888888", "#ffffff", "#676465", "#888888", "#888888", "#888888", "#78665f", "#6d5149", "#46251b", "#420e09", "#50100a", "#5f1411", "#5f0903", "#6e0c06", "#ff0000", "#930b06", "#8e0600", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ff0000", "#602b2e", "#000000", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#63635e", "#888888", "#ffffff", "#ffffff", "#000000", "#59554d", "#888888", "#4c4842", "#000000", "#888888", "#888888", "#654c4a", "#855e5c", "#784843", "#7f453f", "#7b342d", "#862d26", "#7f1713", "#8c0b0b", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#8e0d0c", "#91211e", "#610200", "#7f2f2b", "#4a0908", "#450f0c", "#360f0f", "#000000", "#ffffff", "#888888", "#888888", "#888888", "#524f50", "#5c5a56", "#000000", "#000000", "#464643", "#4c4c49", "#504f4f", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#666062", "#888888", "#4b4643", "#45433f", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#000000", "#000000", "#000000", "#561d1f", "#682325", "#6f1e1e", "#650605", "#670000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#8f3635", "#ff0000", "#88504c", "#8f6562", "#5f3b38", "#674e47", "#6f6058", "#888888", "#888888", "#888888", "#535350", "#ffffff", "#ffffff", "#ffffff", "#65635f", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#5d5d5a", "#616161", "#575446", "#4b4437", "#56443d", "#654c47", "#5d3533", "#52201e", "#450803", "#4d0100", "#630300", "#740606", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#7d1312", "#6d1411", "#712b29", "#450d0b", "#482020", "#000000", "#888888", "#888888", "#888888", "#888888", "#4e4b4d", "#4c4a48", "#474744", "#474744", "#464643", "#525151", "#504f50", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#67665f", "#67665f", "#000000", "#57564f", "#656361", "#888888", "#888888", "#ffffff", "#ffffff", "#3f3028", "#000000", "#000000", "#3d1511", "#511915", "#570b0b", "#5f0e0d", "#7b1311", "#870c0d", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#850904", "#ff0000", "#ff0000", "#90403c", "#864944", "#875754", "#805856", "#888888", "#32221d", "#675c55", "#888888", "#544e50", "#888888", "#ffffff", "#ffffff", "#ffffff", "#3e3c3a", "#000000", "#000000", "#5a5856", "#656361", "#4c4b42", "#888888", "#888888", "#3f3d39", "#3e3933", "#332b24", "#3d2d28", "#341c17", "#000000", "#380604", "#450202", "#5e090a", "#6a0200", "#85100f", "#930607", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#951914", "#8a2220", "#6e1210", "#6b2320", "#4e1310", "#6b3e40", "#331917", "#ffffff", "#62605e", "#888888", "#888888", "#4d4847", "#494647", "#48474a", "#424141", "#484747", "#4f4f4c", "#4f4f4a", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#66655e", "#3e3d36", "#000000", "#595753", "#888888", "#888888", "#ffffff", "#ffffff", "#000000", "#000000", "#000000", "#370d0a", "#490c0a", "#5f100e", "#600608", "#821412", "#8e1112", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#931511", "#850c0c", "#650502", "#530300", "#440200", "#511f1d", "#401615", "#402722", "#483833", "#433831", "#35302d", "#ffffff", "#ffffff", "#625c59", "#000000", "#000000", "#000000", "#000000", "#000000", "#32322d", "#000000", "#3e3d36", "#3a3932", "#000000", "#636259", "#322c2b", "#423937", "#000000", "#000000", "#000000", "#330300", "#4b0906", "#5e0708", "#861e1c", "#7d0809", "#930607", "#920101", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#960805", "#ff0000", "#7e1411", "#832725", "#5c1410", "#4e1310", "#714444", "#000000", "#ffffff", "#57534d", "#888888", "#66625a", "#46413e", "#504d4f", "#4a494a", "#464545", "#4c4c49", "#4f4f4a", "#53534e", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#6c6b64", "#686760", "#5b5a53", "#515047", "#605f58", "#888888", "#888888", "#888888", "#ffffff", "#000000", "#000000", "#4b2927", "#4d241d", "#470a08", "#5b0a09", "#731a19", "#790f0e", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#8b0e0f", "#650000", "#560101", "#4b0808", "#370605", "#592f2e", "#5d4540", "#3a2a25", "#443a34", "#ffffff", "#888888", "#322e26", "#524c4e", "#39352f", "#32312a", "#000000", "#000000", "#000000", "#34342f", "#000000", "#3e3f37", "#3a3b33", "#000000", "#000000", "#000000", "#000000", "#000000", "#3e2923", "#000000", "#4d1d1a", "#460504", "#681313", "#ff0000", "#888888", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#861c19", "#7b1f1d", "#4f0703", "#531817", "#542a29", "#000000", "#ffffff", "#554d48", "#68645e", "#5c5b54", "#4c4744", "#4d4a4c", "#484747", "#484845", "#4a4a45", "#50504b", "#54544f", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#5d5b57", "#5f5e57", "#65645d", "#888888", "#888888", "#888888", "#888888", "#000000", "#000000", "#52322e", "#663a32", "#571a15", "#5f110c", "#94403d", "#888888", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#8f0a0e", "#650000", "#5f0907", "#4c0604", "#542220", "#5d3330", "#69504b", "#362621", "#888888", "#383330", "#38372e", "#4f4f3e", "#524c4e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#33342f", "#42433e", "#31322d", "#000000", "#000000", "#000000", "#000000", "#412924", "#3e1715", "#3b0f0b", "#410400", "#721d1d", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#888888", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#951b19", "#861c19", "#680e0d", "#4f0704", "#4c0f0f", "#49211f", "#330c0c", "#888888", "#5b534e", "#605b58", "#5c5850", "#484642", "#514e50", "#4b4b48", "#494944", "#474742", "#4f4f4a", "#54544f", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#686662", "#65635f", "#5d5b57", "#888888", "#888888", "#888888", "#888888", "#888888", "#000000", "#000000", "#421e19", "#8d605e", "#571310", "#722321", "#620c08", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#891511", "#690908", "#560501", "#651a18", "#5d2b29", "#5e3433", "#492f2e", "#000000", "#000000", "#413b3a", "#3d3830", "#443c34", "#605b52", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3a3a35", "#373835", "#40403d", "#383634", "#000000", "#000000", "#000000", "#3f312c", "#543e3c", "#000000", "#401110", "#501210", "#5d0c0c", "#6a0504", "#871716", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#888888", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ffaa00", "#ff0000", "#6b0404", "#620908", "#4c0803", "#420c09", "#371010", "#351311", "#888888", "#5a4744", "#5b5554", "#524d4c", "#504e4a", "#413f3d", "#50504b", "#494944", "#4a4a45", "#51514c", "#595954", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#686662", "#605e5a", "#888888", "#888888", "#888888", "#888888", "#888888", "#000000", "#000000", "#32100c", "#7c534e", "#5b1a19", "#722321", "#711b19", "#670402", "#da6460", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#888888", "#888888", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#910000", "#888888", "#ffaa00", "#630705", "#5c0b0a", "#671c1a", "#693735", "#785050", "#351c1b", "#000000", "#000000", "#352d26", "#3f3936", "#463d3b", "#5e5a51", "#34332a", "#000000", "#000000", "#000000", "#000000", "#000000", "#3a3a35", "#32342c", "#3e4038", "#393a32", "#37362d", "#000000", "#000000", "#000000", "#3f2927", "#000000", "#000000", "#3f0401", "#550907", "#6a0a09", "#8e2020", "#8c0504", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#8a0c0a", "#901c18", "#650000", "#5e0708", "#4a0805", "#3e0a07", "#000000", "#371916", "#888888", "#5d4d49", "#4e484a", "#544e4d", "#4f4d49", "#4a4846", "#4e4e49", "#494944", "#4c4c47", "#4f4f4a", "#575752", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#686662", "#6a6864", "#888888", "#888888", "#635e5b", "#888888", "#888888", "#000000", "#000000", "#000000", "#572d2c", "#4f110f", "#540808", "#6a1613", "#6b0605", "#952725", "#888888", "#888888", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#fa646b", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#800e08", "#6d0b05", "#6f1b18", "#7e3330", "#641b1d", "#5f332f", "#481e1f", "#000000", "#000000", "#000000", "#000000", "#5a554f", "#3f3938", "#4c4b42", "#39382f", "#000000", "#000000", "#000000", "#000000", "#000000", "#474742", "#3c3d35", "#3a3b33", "#3a3b33", "#403f38", "#3d3432", "#000000", "#000000", "#000000", "#462727", "#000000", "#340101", "#450300", "#5f0507", "#700d0d", "#ff0000", "#870309", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#888888", "#ff0000", "#ff0000", "#ff0000", "#730d09", "#600704", "#550a07", "#400502", "#380a07", "#000000", "#381e1c", "#645150", "#594a4a", "#504b4a", "#5b5655", "#555351", "#494745", "#51514c", "#474742", "#474742", "#51514c", "#565651", "#666663", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#393934", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#5a5854", "#888888", "#888888", "#40322c", "#000000", "#000000", "#360e0c", "#541614", "#4f0404", "#5c0a09", "#7b1414", "#730000", "#888888", "#888888", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#fd6c64", "#ff0000", "#920909", "#8d1713", "#6f0705", "#5b0704", "#611915", "#7b3636", "#5d2f2c", "#3e1616", "#000000", "#000000", "#000000", "#ffffff", "#000000", "#4b4542", "#4a4940", "#38392f", "#000000", "#000000", "#000000", "#000000", "#000000", "#353530", "#363732", "#4a4a45", "#464643", "#44423e", "#504745", "#000000", "#000000", "#000000", "#3f2020", "#6e4644", "#572521", "#460907", "#550a07", "#721817", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#888888", "#ff0000", "#ff0000", "#670706", "#5c0805", "#4b0503", "#3d0503", "#330604", "#000000", "#381f1e", "#4f413e", "#594e4d", "#423d3c", "#565150", "#545250", "#4a4846", "#52524d", "#484843", "#494944", "#53534e", "#53534e", "#61615e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#44433a", "#888888", "#888888", "#564a49", "#000000", "#000000", "#000000", "#4f1916", "#4d0a0a", "#4b0000", "#ff0000", "#ff0000", "#888888", "#888888", "#ff0000", "#888888", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#8d0f0e", "#7a0707", "#6b0001", "#7d2828", "#540e0a", "#400301", "#320602", "#000000", "#000000", "#000000", "#ffffff", "#000000", "#595453", "#53514f", "#4a4b43", "#3a3a35", "#000000", "#474843", "#000000", "#000000", "#000000", "#000000", "#373833", "#454540", "#3d3d38", "#4d4b47", "#423c39", "#46423c", "#372f2a", "#000000", "#000000", "#000000", "#3e110f", "#410607", "#460401", "#3b0000", "#888888", "#790a10", "#ff0000", "#931010", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#888888", "#888888", "#ff0000", "#888888", "#ff0000", "#ff0000", "#72090b", "#5b0201", "#4d0406", "#410605", "#000000", "#000000", "#361d1b", "#000000", "#50403e", "#605554", "#39352f", "#4e4c48", "#4b4945", "#484642", "#565555", "#52524f", "#484843", "#50514c", "#575853", "#494a47", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#515047", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#34332c", "#888888", "#888888", "#574c48", "#000000", "#000000", "#000000", "#451311", "#5c1e1c", "#5f1713", "#91332e", "#88201c", "#8a1d19", "#ff0000", "#888888", "#ff0000", "#888888", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#910e0e", "#7d0605", "#6a0303", "#650605", "#540504", "#4d0a0a", "#410f0b", "#000000", "#000000", "#000000", "#888888", "#000000", "#595451", "#645f5c", "#4d4845", "#42423d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#343530", "#4a4a45", "#42423d", "#4a4844", "#57524c", "#000000", "#352d28", "#4d3c3d", "#000000", "#000000", "#330b0b", "#400e0c", "#52120c", "#530f09", "#6c1815", "#771716", "#ff0000", "#888888", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#ff0000", "#888888", "#8c1919", "#ff0000", "#790f0e", "#650504", "#530704", "#440604", "#3b0502", "#370b07", "#44221c", "#341f19", "#3e2b27", "#584d49", "#5f5752", "#37362f", "#4f4e47", "#4c4b44", "#4e4d46", "#4c4c4c", "#535350", "#484843", "#51514c", "#565752", "#414340", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4a4940", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#595a52", "#888888", "#000000", "#888888", "#888888", "#645a56", "#362b24", "#372420", "#000000", "#340a07", "#3f0707", "#541813", "#6e1d15", "#892b24", "#73140f", "#730f0c", "#730503", "#8d1311", "#ff0000", "#ff0000", "#888888", "#ffaa00", "#888888", "#ff0000", "#ff0000", "#ff0000", "#ffaa00", "#ff0000", "#6c0604", "#610805", "#570504", "#470300", "#3c0402", "#000000", "#000000", "#000000", "#534444", "#000000", "#4c4840", "#000000", "#47423f", "#4f4e47", "#46473f", "#353530", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#41413c", "#42423d", "#5b5653", "#454038", "#39352f", "#332827", "#453435", "#888888", "#000000", "#000000", "#000000", "#3b0903", "#4e1710", "#650e0f", "#4b0300", "#5f0809", "#5a0100", "#861f1f", "#7c0e0a", "#861311", "#7f0a09", "#8a0f10", "#8e1515", "#7d0a08", "#7a0c0a", "#871c1d", "#781819", "#5f0907", "#4d0100", "#4c0b0a", "#370100", "#3d0f0a", "#4f2c25", "#45281f", "#3f2c23", "#51423a", "#60564f", "#59544c", "#37362f", "#54534c", "#53524b", "#4e4d46", "#444344", "#5f5f5c", "#454540", "#5b5b56", "#545550", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5e5e59", "#616057", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#55564e", "#888888", "#000000", "#585951", "#888888", "#675f5a", "#4c3e38", "#41322a", "#000000", "#000000", "#350806", "#380401", "#56100b", "#5f0f09", "#6f1512", "#690405", "#720909", "#730000", "#7d0203", "#820403", "#910704", "#ff0000", "#960a06", "#920909", "#830100", "#7f0300", "#ff0000", "#ff0000", "#5b0201", "#570605", "#520705", "#410404", "#360402", "#000000", "#000000", "#463030", "#3f3430", "#322c29", "#3d3931", "#332f29", "#000000", "#4c4a46", "#3c3c37", "#000000", "#000000", "#000000", "#000000", "#323330", "#000000", "#000000", "#343530", "#3c3c37", "#474742", "#5f5d59", "#55514b", "#45403d", "#423937", "#473b3a", "#392524", "#705655", "#391a1a", "#3a1615", "#320904", "#4e201d", "#500709", "#551715", "#600e0d", "#64100d", "#5e0504", "#600400", "#680906", "#660704", "#660301", "#75110e", "#761410", "#771914", "#670d08", "#5d0c0c", "#5f100f", "#520d0d", "#380000", "#3c100c", "#532c26", "#5b3c34", "#493029", "#534138", "#62584e", "#635953", "#5c5751", "#373830", "#505149", "#4e4c48", "#4b4c44", "#484747", "#575754", "#4f4f4c", "#4b4b46", "#5f605b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#5f6159", "#6b6761", "#414039", "#3d3f37", "#888888", "#6b6660", "#594b45", "#45322e", "#412e27", "#000000", "#000000", "#000000", "#3e0606", "#450202", "#560b0b", "#610203", "#670706", "#650200", "#720505", "#780304", "#790201", "#7b0501", "#7c0401", "#770905", "#710704", "#6f0b08", "#620300", "#580200", "#530705", "#480401", "#3f0100", "#330201", "#3f1512", "#53312f", "#3a211f", "#372421", "#3e332f", "#403534", "#433e38", "#35342d", "#000000", "#4c4a46", "#000000", "#363631", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3c37", "#484843", "#5c5754", "#625d5a", "#524c49", "#4c4643", "#453c3a", "#483834", "#36221f", "#371d1b", "#361717", "#512a28", "#491f1e", "#53211f", "#521c1b", "#4f0e0d", "#500a06", "#570b09", "#5c0b07", "#671310", "#6c1815", "#691512", "#64100d", "#62120e", "#570c06", "#5c110b", "#571510", "#6a2d28", "#7a423e", "#8a5854", "#8e6761", "#77554f", "#775b55", "#6f5752", "#665852", "#645a54", "#605a57", "#57564f", "#31322d", "#4e4f47", "#50504b", "#4e4e49", "#4c4c49", "#545451", "#575754", "#000000", "#ffffff", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#6b6a63", "#62645c", "#67665f", "#4a4b43", "#000000", "#888888", "#6d6764", "#61564f", "#44342f", "#34251d", "#5f433f", "#3f1f1b", "#000000", "#000000", "#3f0908", "#48070a", "#5c0b0b", "#621010", "#681210", "#6c0d0c", "#6a0504", "#710b09", "#710907", "#760c09", "#6d0705", "#690604", "#6c0d0c", "#5e0403", "#4e0301", "#480603", "#480d0a", "#531d1a", "#7d504e", "#5e3735", "#000000", "#3a2421", "#43302d", "#413534", "#413635", "#49443e", "#42413a", "#000000", "#54524e", "#4d4d48", "#3e3e39", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#353631", "#40403b", "#4a4a45", "#62605c", "#575551", "#5b5653", "#514c49", "#413b38", "#40352f", "#3d2d29", "#483430", "#341a18", "#000000", "#3f1b18", "#562e2a", "#4d1f1c", "#4f1916", "#5c211e", "#60231e", "#5c1612", "#520c08", "#58120e", "#601a16", "#5c1612", "#6a2623", "#652320", "#682824", "#733d38", "#733d38", "#6b3b36", "#784c48", "#73534d", "#6f534d", "#765e59", "#888888", "#888888", "#6f655f", "#625d57", "#55544d", "#000000", "#4f4f4a", "#52524d", "#4f4f4a", "#4f4f4c", "#484845", "#676764", "#000000", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#ffffff", "#615e50", "#888888", "#888888", "#888888", "#666460", "#656661", "#615f5b", "#5d5d58", "#000000", "#888888", "#888888", "#6b615d", "#6b5d58", "#5c4d45", "#4d352e", "#4d302f", "#4c2c26", "#825f56", "#4c231e", "#000000", "#420404", "#470605", "#510b07", "#590a08", "#5b0a06", "#6b1714", "#711b17", "#620906", "#540600", "#500500", "#4f0704", "#5c1413", "#4e1111", "#3f0b0a", "#330300", "#000000", "#330b09", "#43231f", "#523d35", "#3e2e29", "#3d322c", "#453b37", "#413836", "#4c4741", "#3c3d35", "#000000", "#54524e", "#464442", "#4f4f4a", "#32322f", "#4f4e4e", "#40413e", "#000000", "#888888", "#888888", "#000000", "#3b3b36", "#50504b", "#63615d", "#5b5b56", "#54524e", "#504e4a", "#433f39", "#423d34", "#463c36", "#453731", "#432f2b", "#4a3431", "#49302b", "#000000", "#000000", "#4a231f", "#522523", "#521e1d", "#6b3732", "#5f2b26", "#56221d", "#5d2924", "#5e2a25", "#5d2926", "#673732", "#633530", "#6c433c", "#744842", "#805a52", "#8d6a63", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#000000", "#595956", "#565653", "#545451", "#4e4e4b", "#4b4b48", "#60605d", "#42423f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#ffffff", "#888888", "#666259", "#888888", "#ffffff", "#888888", "#67635d", "#5e625c", "#5c5d58", "#63685f", "#000000", "#888888", "#888888", "#888888", "#888888", "#605853", "#534844", "#5f4c48", "#664c4b", "#694a42", "#8e675d", "#926962", "#61312c", "#52241f", "#46120d", "#652924", "#6d2d26", "#773730", "#63231c", "#611f19", "#5f2125", "#561a1d", "#501a19", "#390705", "#000000", "#000000", "#360f0f", "#482826", "#523837", "#4a3434", "#3c282a", "#3f3433", "#49413a", "#423d37", "#4d4744", "#504b45", "#484340", "#000000", "#49453f", "#646461", "#888888", "#646562", "#5c5c59", "#52544c", "#42443c", "#888888", "#888888", "#514f4b", "#53514d", "#575551", "#66615e", "#52504c", "#575551", "#524d4a", "#464442", "#453a39", "#3c3331", "#423736", "#413733", "#433331", "#46342d", "#483531", "#473332", "#000000", "#000000", "#452925", "#5b3a3b", "#543132", "#4e2c2a", "#512d2c", "#64403f", "#654140", "#63413f", "#684846", "#6e5651", "#7b6260", "#7c6663", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#60645e", "#000000", "#60615e", "#565653", "#555552", "#575656", "#4c4b4e", "#565556", "#363633", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#645f5c", "#61615c", "#61615c", "#666661", "#000000", "#888888", "#888888", "#888888", "#888888", "#6f6762", "#6e6460", "#6e5e5a", "#7e6563", "#75584f", "#836256", "#715044", "#69413d", "#673837", "#633532", "#602e2c", "#4b1915", "#6d3934", "#63312d", "#888888", "#451617", "#000000", "#000000", "#411f19", "#452223", "#4a2c29", "#462928", "#482e2c", "#432f2c", "#463330", "#40322f", "#433b36", "#3f3b35", "#47433d", "#4e4845", "#524d4a", "#5c5754", "#35302d", "#3f3b35", "#888888", "#ffffff", "#555552", "#888888", "#3d3e36", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#676561", "#4c4a46", "#4e4c48", "#4a4844", "#43413d", "#403b38", "#3a3532", "#3f3936", "#403a37", "#433834", "#3f342d", "#473934", "#4b3d3a", "#463631", "#45322e", "#3f2c28", "#000000", "#000000", "#000000", "#462e29", "#6a524d", "#796360", "#888888", "#76625e", "#74625b", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#5a5c54", "#000000", "#61625a", "#55564c", "#55564c", "#52524f", "#545354", "#545353", "#000000", "#454643", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5a595a", "#888888", "#888888", "#000000", "#6c6764", "#67635d", "#676860", "#656560", "#696964", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#826b60", "#888888", "#735351", "#71514f", "#82625e", "#888888", "#888888", "#5d3b37", "#000000", "#000000", "#000000", "#3f211c", "#4a312a", "#442b24", "#412726", "#442e2b", "#422f2c", "#463632", "#4d3d39", "#433832", "#433935", "#46403d", "#3e3c38", "#4b4a43", "#504c46", "#48443e", "#484340", "#000000", "#000000", "#ffffff", "#ffffff", "#3e3c38", "#5d5e56", "#36372f", "#696a62", "#575850", "#33342c", "#888888", "#645f5c", "#ffffff", "#000000", "#ffffff", "#000000", "#4c4a46", "#3e3c38", "#413f3b", "#403e3a", "#413c39", "#413c39", "#423c39", "#443c35", "#493f39", "#4b403f", "#3f3531", "#413630", "#3c312b", "#3f3430", "#493e3a", "#3a2c27", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#3e3e39", "#000000", "#616258", "#595a52", "#575850", "#595956", "#504f4f", "#545353", "#000000", "#525350", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4c4c4f", "#888888", "#888888", "#888888", "#3f3a37", "#6b6663", "#686760", "#888888", "#888888", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#473431", "#000000", "#36221f", "#5d4946", "#685250", "#644e4b", "#4d312d", "#49302b", "#48332d", "#44322b", "#3e2b2a", "#382a27", "#352a26", "#3a322b", "#413731", "#423d35", "#413d37", "#443f3c", "#474541", "#393831", "#434239", "#534f49", "#888888", "#ffffff", "#888888", "#888888", "#35332f", "#595851", "#000000", "#44433c", "#4f5048", "#404137", "#515247", "#888888", "#888888", "#575551", "#888888", "#575551", "#ffffff", "#3b3935", "#494743", "#3f3f3a", "#44443f", "#40403b", "#494944", "#504b48", "#4d4943", "#443f3c", "#423c3b", "#4f4443", "#473c3b", "#443935", "#382d2c", "#413733", "#463c38", "#5a4f49", "#695e58", "#685e58", "#6a625b", "#5f5750", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#000000", "#535350", "#888888", "#575754", "#595954", "#565651", "#535252", "#535350", "#383833", "#5d5e5b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#36322c", "#888888", "#888888", "#696861", "#888888", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#696159", "#57534d", "#000000", "#000000", "#655d58", "#645653", "#60524d", "#594b46", "#60524d", "#4d3f39", "#463832", "#42342e", "#433530", "#3d362b", "#362e26", "#39312a", "#39312a", "#393330", "#484340", "#413c39", "#4b4b46", "#000000", "#393a32", "#515349", "#323128", "#ffffff", "#423e38", "#ffffff", "#3c3e34", "#43443c", "#888888", "#000000", "#000000", "#45463e", "#585853", "#555550", "#888888", "#888888", "#484740", "#000000", "#ffffff", "#888888", "#888888", "#3d3b37", "#434340", "#4a4a45", "#484843", "#44453d", "#484843", "#50504b", "#53534e", "#4c4c47", "#56514e", "#4e4946", "#47423f", "#3f3a37", "#433e3b", "#48423f", "#605755", "#6b6260", "#615b58", "#6a6461", "#888888", "#888888", "#888888", "#645f5c", "#000000", "#4f453b", "#55463e", "#888888", "#75665e", "#888888", "#888888", "#000000", "#000000", "#62625d", "#61615c", "#5c5c57", "#5a5a55", "#565653", "#535350", "#51514e", "#4d4e4b", "#626262", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#5c5754", "#888888", "#888888", "#888888", "#888888", "#888888", "#000000", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#574e42", "#392f28", "#544a44", "#888888", "#888888", "#888888", "#888888", "#888888", "#645c57", "#625a55", "#59514c", "#48433b", "#47423a", "#443f37", "#3e3933", "#36352b", "#3c3830", "#3e3a34", "#3a3532", "#47423f", "#413f3b", "#40403b", "#42423d", "#3e3e39", "#4a4a45", "#000000", "#ffffff", "#888888", "#888888", "#000000", "#575951", "#45463e", "#383a32", "#000000", "#41413c", "#42433b", "#888888", "#000000", "#000000", "#888888", "#888888", "#67665f", "#000000", "#888888", "#64625e", "#ffffff", "#3a3a37", "#54544f", "#4c4c47", "#51524a", "#4f4f4a", "#52524d", "#53534e", "#4f4f4a", "#504b48", "#4e4c48", "#534e4b", "#3e3e39", "#484843", "#4b4b46", "#645f5c", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#4e4e4b", "#5c5c59", "#5e5e5b", "#888888", "#686863", "#666661", "#5b5b56", "#595954", "#5e5e5b", "#575754", "#535350", "#545552", "#585858", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#494743", "#5a5650", "#383529", "#645f5e", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#373734", "#43413d", "#59554d", "#69655c", "#888888", "#000000", "#000000", "#524d47", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#6a6562", "#6c6764", "#615c59", "#4c4842", "#4b4741", "#433f39", "#3e3a34", "#414037", "#3e3f37", "#45433f", "#4a4844", "#46413e", "#3d3d38", "#4b4c47", "#3b3b36", "#51514e", "#000000", "#888888", "#888888", "#ffffff", "#55514b", "#363229", "#404237", "#000000", "#000000", "#000000", "#51514c", "#46473f", "#888888", "#373732", "#000000", "#63625b", "#5b5955", "#000000", "#3d3b37", "#888888", "#504e4a", "#888888", "#888888", "#44443f", "#51514c", "#4e4f47", "#565651", "#53534e", "#54544f", "#555550", "#54544f", "#565651", "#52524d", "#40403b", "#51514c", "#514f4b", "#605b58", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#676762", "#696964", "#5d5d58", "#585855", "#555552", "#4c4c49", "#636461", "#4d4d4d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#595956", "#615d57", "#44403a", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#6a6962", "#585951", "#4d4d48", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#6a6562", "#544f4c", "#4b4643", "#484340", "#484740", "#4a4942", "#4d4b47", "#52504c", "#5a5854", "#44423e", "#4a4844", "#43413d", "#45433f", "#565450", "#ffffff", "#888888", "#000000", "#888888", "#515047", "#6b675f", "#000000", "#888888", "#888888", "#000000", "#333233", "#373732", "#3b3b36", "#000000", "#000000", "#52524d", "#888888", "#888888", "#5e5c58", "#65635f", "#6b6663", "#605f58", "#888888", "#888888", "#3c3a36", "#5e5c58", "#5f5a57", "#55534f", "#61615c", "#676762", "#5c5c57", "#5e5e59", "#595954", "#474541", "#52504c", "#575553", "#55504d", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#666661", "#64645f", "#5b5b56", "#54544f", "#474744", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#535451", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#63615d", "#5c5a56", "#55534f", "#504e4a", "#514c49", "#55504d", "#4e4946", "#4f4a47", "#5d5855", "#504b48", "#443f3c", "#43413d", "#4d4b47", "#32302c", "#888888", "#000000", "#888888", "#3f3e37", "#494841", "#ffffff", "#888888", "#888888", "#000000", "#000000", "#555455", "#393934", "#575850", "#000000", "#000000", "#000000", "#ffffff", "#53534e", "#ffffff", "#403e3c", "#888888", "#46453e", "#000000", "#ffffff", "#888888", "#5c5a56", "#5a5650", "#62605c", "#585853", "#5f5f5a", "#5a5a57", "#575754", "#575754", "#4d4b47", "#53514f", "#5c5a58", "#565450", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#676764", "#595a52", "#585853", "#4d4d48", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#52524f", "#888888", "#ffffff", "#000000", "#353226", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#686662", "#666460", "#595753", "#53514d", "#4f4d49", "#4e4c48", "#5a5854", "#5c5754", "#5d5b57", "#64625e", "#65635f", "#5b5955", "#4c4a46", "#888888", "#ffffff", "#000000", "#56554e", "#ffffff", "#484740", "#ffffff", "#888888", "#5e5f55", "#4a4b41", "#000000", "#000000", "#565653", "#353530", "#606159", "#000000", "#000000", "#000000", "#000000", "#888888", "#3b3935", "#888888", "#4b4945", "#888888", "#4f4e47", "#000000", "#888888", "#888888", "#6e6a64", "#696461", "#888888", "#888888", "#888888", "#888888", "#61615e", "#52504c", "#565452", "#5c5a58", "#5d5b57", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#5e5e59", "#595954", "#53534e", "#5e5f5c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#464643", "#888888", "#ffffff", "#565442", "#3f3b32", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#656560", "#5b5b56", "#575752", "#5a5854", "#565450", "#55534f", "#5a5552", "#66615e", "#5f5a57", "#6c6764", "#888888", "#888888", "#64625e", "#474543", "#ffffff", "#3e3c38", "#000000", "#888888", "#4c4a46", "#888888", "#ffffff", "#000000", "#353530", "#000000", "#000000", "#000000", "#515053", "#000000", "#6b6c64", "#000000", "#000000", "#000000", "#000000", "#888888", "#000000", "#ffffff", "#403e3a", "#888888", "#42403c", "#5b5957", "#464344", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#656560", "#62615a", "#5f5d5b", "#646260", "#5f5d59", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#5e5e59", "#54544f", "#555550", "#51514e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#41433b", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#656562", "#5c5c57", "#5b5b56", "#5e5e5b", "#62625f", "#63635e", "#64645f", "#575752", "#666661", "#888888", "#6a6b63", "#888888", "#888888", "#888888", "#888888", "#888888", "#585750", "#46453e", "#686360", "#888888", "#000000", "#ffffff", "#585750", "#686863", "#000000", "#000000", "#000000", "#000000", "#3a3c34", "#000000", "#3a3b36", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#5a5856", "#888888", "#000000", "#888888", "#5b5a5a", "#888888", "#5b5b5b", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#5c5754", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#62625f", "#5a5a57", "#5a5a57", "#575754", "#373535", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3a3b34", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#6b6c64", "#888888", "#888888", "#888888", "#61615c", "#5f5f5a", "#646461", "#656562", "#64645f", "#656560", "#5f5f5a", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#53524b", "#000000", "#6a6562", "#000000", "#000000", "#888888", "#000000", "#5d5d58", "#35372f", "#000000", "#000000", "#3e3e3e", "#3e4038", "#000000", "#494a45", "#000000", "#000000", "#000000", "#000000", "#000000", "#45433f", "#393735", "#ffffff", "#4a4748", "#888888", "#3e3e3b", "#888888", "#555555", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#686662", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#666663", "#5c5c59", "#555552", "#60605d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#41433b", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#59584f", "#414039", "#55534f", "#000000", "#ffffff", "#000000", "#515046", "#000000", "#000000", "#000000", "#000000", "#000000", "#41423d", "#000000", "#363732", "#353535", "#000000", "#000000", "#000000", "#000000", "#000000", "#5e5958", "#000000", "#ffffff", "#32312a", "#5d5b57", "#888888", "#555653", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#595956", "#51514e", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#393b33", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#67665f", "#3f3d39", "#000000", "#888888", "#888888", "#414036", "#000000", "#33342c", "#000000", "#000000", "#000000", "#000000", "#494b43", "#000000", "#000000", "#4b4c49", "#3a3b38", "#000000", "#000000", "#000000", "#000000", "#3f3d3b", "#3d3b37", "#888888", "#414039", "#504e4a", "#4e4e4b", "#474845", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#565653", "#545353", "#646461", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#313329", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#373830", "#35362e", "#000000", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#5a5854", "#4f4e47", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#484843", "#363631", "#000000", "#3a3a35", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#545550", "#413f3b", "#ffffff", "#34322e", "#4e4a44", "#4f4d4b", "#605f62", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#65605d", "#322e25", "#000000", "#423e38", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#666663", "#60605b", "#555552", "#565556", "#52524f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#888888", "#6c6d63", "#696a62", "#5e5d5e", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#54544f", "#5e5f54", "#65665b", "#48493e", "#000000", "#3c3c37", "#676762", "#888888", "#ffffff", "#4a4846", "#888888", "#6a6960", "#888888", "#54534c", "#888888", "#000000", "#000000", "#40403d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4e4f47", "#353530", "#34342f", "#45463e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5a5b53", "#676561", "#ffffff", "#000000", "#62605e", "#ffffff", "#ffffff", "#888888", "#3f3d3b", "#494342", "#605c56", "#000000", "#343530", "#32322f", "#ffffff", "#000000", "#3b3a3b", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#555550", "#555550", "#5d5c5c", "#5b5a5b", "#434340", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#464838", "#4d4e43", "#565556", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#696a62", "#888888", "#888888", "#63635e", "#676762", "#363631", "#383835", "#3d3e36", "#888888", "#888888", "#888888", "#888888", "#3b3a30", "#65645a", "#4d4b47", "#888888", "#888888", "#686662", "#61625a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4c4c49", "#4b4b46", "#000000", "#3c3d35", "#494a42", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3b3b36", "#888888", "#888888", "#5c5754", "#504e4a", "#4e4c4a", "#ffffff", "#888888", "#41413e", "#44443f", "#55564e", "#42413a", "#000000", "#000000", "#6c6b64", "#55564e", "#585951", "#4a4942", "#535249", "#3a3932", "#888888", "#ffffff", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#4f4f4a", "#5b5c54", "#3f3f3c", "#000000", "#000000", "#393935", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#6c6e60", "#38392e", "#474445", "#63625b", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#64665e", "#5f6056", "#888888", "#646464", "#000000", "#000000", "#888888", "#555552", "#888888", "#60605b", "#ffffff", "#888888", "#66655e", "#514f4b", "#4a4846", "#3c393b", "#ffffff", "#393637", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#4f5048", "#484941", "#3b3b36", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#575752", "#51524a", "#66655c", "#ffffff", "#888888", "#43413d", "#ffffff", "#ffffff", "#888888", "#494946", "#3c3d38", "#50514c", "#000000", "#4b4945", "#000000", "#423d3a", "#57564f", "#4d4e44", "#3d3c33", "#44433a", "#626158", "#56524a", "#888888", "#888888", "#ffffff", "#4c4a48", "#000000", "#888888", "#888888", "#888888", "#52534b", "#575752", "#51524a", "#5f5f5a", "#3f4038", "#33332e", "#5e5d56", "#5b5c54", "#000000", "#000000", "#000000", "#373835", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#888888", "#424137", "#4d4c45", "#585750", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#65665c", "#888888", "#5f5e5e", "#484843", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#555651", "#5b5c57", "#606156", "#5b5d55", "#63645f", "#000000", "#888888", "#57564f", "#888888", "#888888", "#64625e", "#888888", "#888888", "#888888", "#3d3b39", "#44423e", "#5e5c5a", "#474541", "#63615d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#555351", "#ffffff", "#4b4a40", "#3d3c33", "#ffffff", "#65665e", "#000000", "#000000", "#000000", "#ffffff", "#888888", "#615d57", "#635f57", "#50514e", "#504f4f", "#5a5959", "#ffffff", "#ffffff", "#52524f", "#686863", "#3f4038", "#43433e", "#484843", "#888888", "#888888", "#65605f", "#ffffff", "#000000", "#4c4d45", "#3a3b31", "#4f5046", "#39352d", "#4e4946", "#555149", "#4f4f42", "#363535", "#000000", "#000000", "#464840", "#43433e", "#5d5855", "#565450", "#5a5952", "#595851", "#63625b", "#888888", "#6c6764", "#5a5856", "#888888", "#5b5c54", "#56574f", "#343434", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#ffffff", "#ffffff", "#4e4d44", "#45443b", "#54534a", "#63615f", "#888888", "#888888", "#5d5e54", "#424339", "#505146", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#5e6058", "#626360", "#52524d", "#64655b", "#888888", "#5c5e56", "#000000", "#45463e", "#55544b", "#888888", "#5f5e57", "#4a4844", "#636360", "#ffffff", "#888888", "#888888", "#322d2c", "#515049", "#44423e", "#4c4a46", "#888888", "#000000", "#000000", "#000000", "#000000", "#3d3d3a", "#888888", "#888888", "#545349", "#4b4a43", "#3d3c33", "#888888", "#54554b", "#404136", "#888888", "#6a665d", "#888888", "#888888", "#67635b", "#3a3b38", "#4b4a4a", "#888888", "#ffffff", "#888888", "#5a5a57", "#888888", "#56574f", "#383931", "#53544c", "#888888", "#888888", "#888888", "#888888", "#565656", "#444540", "#3c3d35", "#41413c", "#888888", "#4d4c45", "#000000", "#3b3b36", "#393b33", "#000000", "#54564e", "#888888", "#888888", "#888888", "#888888", "#615f5d", "#4d4b47", "#5e5d56", "#57524f", "#888888", "#5c5a58", "#888888", "#888888", "#6a6b63", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#ffffff", "#ffffff", "#64635c", "#4f4d49", "#535249", "#64625e", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#68695e", "#696964", "#5e5e5b", "#51514c", "#5b5c51", "#5a5b53", "#61625a", "#5d5f51", "#50514e", "#5f5f5f", "#61615e", "#57584e", "#888888", "#4b4c47", "#000000", "#ffffff", "#545447", "#888888", "#676561", "#4d4b49", "#888888", "#888888", "#ffffff", "#ffffff", "#5f595b", "#363430", "#52514a", "#535249", "#5d5e54", "#888888", "#888888", "#000000", "#000000", "#5e5e59", "#888888", "#ffffff", "#53524b", "#3e3c38", "#595755", "#5e5a54", "#47433b", "#47433a", "#565647", "#888888", "#6a665d", "#888888", "#56524c", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#62625d", "#656560", "#61625a", "#36372f", "#44453d", "#888888", "#888888", "#888888", "#41423f", "#888888", "#434441", "#888888", "#888888", "#888888", "#3f3d39", "#888888", "#888888", "#000000", "#000000", "#52544c", "#65675f", "#888888", "#6a6564", "#888888", "#6a6864", "#504e4a", "#57564d", "#49483f", "#888888", "#615f5b", "#888888", "#6c6d63", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#4b4b3c", "#4d4b39", "#4e4c4a", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#686662", "#888888", "#888888", "#52534b", "#888888", "#888888", "#454139", "#888888", "#606060", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#60605b", "#888888", "#000000", "#4e4f4c", "#000000", "#43423b", "#676561", "#504e4a", "#4e4c48", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#555550", "#65645d", "#ffffff", "#888888", "#4f4b42", "#58544b", "#57564c", "#000000", "#888888", "#888888", "#888888", "#4d4c43", "#888888", "#ffffff", "#3a3834", "#4c4b44", "#5c5b51", "#585549", "#888888", "#646058", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#61615e", "#888888", "#62605c", "#484642", "#45433f", "#000000", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#000000", "#888888", "#888888", "#393939", "#31322f", "#000000", "#3a3a35", "#888888", "#888888", "#888888", "#888888", "#61625a", "#504e4a", "#55504a", "#5e5953", "#888888", "#646057", "#888888", "#585652", "#61615e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#51524a", "#3b372f", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#666661", "#888888", "#888888", "#888888", "#888888", "#888888", "#444038", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#636461", "#888888", "#60615e", "#575855", "#ffffff", "#888888", "#64605a", "#65635f", "#4f4d49", "#5b5653", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#64605a", "#888888", "#888888", "#4e4e41", "#888888", "#37362f", "#888888", "#ffffff", "#4a4942", "#56554e", "#ffffff", "#888888", "#494743", "#4f4e47", "#5f5e54", "#6e6a61", "#6e6a62", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#61615e", "#888888", "#6b6663", "#504c46", "#55534f", "#50504b", "#62625d", "#ffffff", "#423d37", "#ffffff", "#ffffff", "#61615e", "#50504b", "#44443f", "#888888", "#888888", "#000000", "#000000", "#000000", "#3a3a35", "#888888", "#54524e", "#888888", "#888888", "#5b5c57", "#565450", "#58534d", "#888888", "#888888", "#888888", "#888888", "#666160", "#40403d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#63625b", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#000000", "#615d57", "#403e3a", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#5d5d58", "#ffffff", "#888888", "#888888", "#ffffff", "#888888", "#4c4744", "#504e4a", "#64625e", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#5c5c4f", "#535248", "#59584f", "#44423e", "#53514d", "#64625e", "#53514d", "#888888", "#41413c", "#575752", "#5b5b56", "#585a52", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#6c6764", "#4b4945", "#4c4a46", "#5e5e59", "#31322a", "#3a3932", "#888888", "#413f3b", "#888888", "#4e4e4b", "#4e4e49", "#555550", "#888888", "#000000", "#383a32", "#34362e", "#000000", "#000000", "#35332f", "#55504d", "#888888", "#888888", "#51524d", "#52524d", "#888888", "#888888", "#888888", "#888888", "#888888", "#686664", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#4c4840", "#514d47", "#47423f", "#66615e", "#888888", "#5a5552", "#888888", "#888888", "#888888", "#3f3f3a", "#888888", "#ffffff", "#888888", "#ffffff", "#888888", "#45433f", "#55534f", "#64625e", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#6d6e63", "#5f6055", "#4a4b40", "#53544a", "#505147", "#514f4d", "#646162", "#4f4d49", "#666860", "#60625a", "#64665e", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#6c6663", "#5c5754", "#565450", "#63635e", "#888888", "#332f29", "#514944", "#595753", "#888888", "#888888", "#383833", "#52524d", "#888888", "#000000", "#3b3c37", "#000000", "#000000", "#4d4d48", "#3d3d38", "#34322e", "#888888", "#888888", "#484944", "#43413d", "#888888", "#ffffff", "#696763", "#888888", "#888888", "#605e5c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5d5d5d", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#676561", "#ffffff", "#ffffff", "#888888", "#000000", "#38372d", "#44433c", "#888888", "#505149", "#888888", "#888888", "#888888", "#888888", "#888888", "#6a6c62", "#000000", "#ffffff", "#888888", "#ffffff", "#888888", "#67635d", "#66615e", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#686863", "#5d5d58", "#53534e", "#5b5b56", "#565651", "#656560", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#5d5c55", "#5c5b54", "#616059", "#888888", "#888888", "#000000", "#5d5d58", "#575752", "#ffffff", "#393936", "#32322f", "#888888", "#000000", "#000000", "#000000", "#000000", "#33312d", "#888888", "#4d4c43", "#ffffff", "#888888", "#4c4a46", "#37322a", "#ffffff", "#ffffff", "#888888", "#ffffff", "#888888", "#4f4f4f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#515050", "#ffffff", "#888888", "#373531", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#585853", "#ffffff", "#888888", "#888888", "#888888", "#ffffff", "#36312e", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#5f5f5a", "#4e4e49", "#5c5c57", "#64645f", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#65645d", "#63625b", "#64635c", "#888888", "#888888", "#393934", "#43433e", "#484843", "#888888", "#ffffff", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#403f38", "#ffffff", "#888888", "#54524e", "#57534d", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#343434", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#ffffff", "#ffffff", "#888888", "#3d3837", "#888888", "#4a4c42", "#888888", "#888888", "#5f5c5d", "#888888", "#ffffff", "#888888", "#55534f", "#ffffff", "#55514b", "#45403d", "#65605d", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#686863", "#656560", "#4b4b46", "#53534e", "#5a5a55", "#5f5f5a", "#64645f", "#60605b", "#676762", "#6a6864", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#515049", "#595851", "#888888", "#888888", "#494946", "#64655d", "#606157", "#626359", "#000000", "#000000", "#888888", "#54524e", "#000000", "#323128", "#000000", "#ffffff", "#000000", "#888888", "#ffffff", "#676561", "#52504c", "#888888", "#ffffff", "#888888", "#ffffff", "#ffffff", "#595959", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#5e5e59", "#888888", "#ffffff", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#ffffff", "#ffffff", "#888888", "#403b3a", "#888888", "#35372d", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#63615d", "#ffffff", "#332e2b", "#45403d", "#888888", "#6b6663", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#60605b", "#696964", "#64645f", "#656560", "#5b5b56", "#4a4a45", "#585853", "#5a5a55", "#565651", "#5c5c57", "#51514c", "#5c5c57", "#5a5854", "#686760", "#5f5e57", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#5a5952", "#55544d", "#56554e", "#888888", "#888888", "#4f4f4c", "#54554b", "#5f6056", "#4d4e44", "#3d3e36", "#888888", "#888888", "#5b5955", "#000000", "#000000", "#000000", "#3b3a33", "#454341", "#888888", "#ffffff", "#43413d", "#504e4a", "#888888", "#ffffff", "#545250", "#ffffff", "#ffffff", "#5b5b5b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#62635b", "#888888", "#ffffff", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#ffffff", "#ffffff", "#59584f", "#6a6b63", "#62625d", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#5b5955", "#888888", "#888888", "#484740", "#888888", "#67665f", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#65665e", "#686863", "#60605b", "#595954", "#58594f", "#5a5a55", "#555454", "#575752", "#4f5048", "#4d4e46", "#53534e", "#4c4c47", "#51514e", "#52524f", "#50504d", "#51514e", "#565653", "#54544f", "#5b5b56", "#5b5b56", "#6b6663", "#6a6562", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#585855", "#5e5e59", "#464641", "#888888", "#5a5959", "#888888", "#000000", "#555253", "#64635c", "#403f36", "#888888", "#494743", "#888888", "#888888", "#000000", "#332f26", "#524e48", "#383330", "#ffffff", "#ffffff", "#36372d", "#484539", "#888888", "#888888", "#575752", "#ffffff", "#888888", "#595a57", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#626359", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#463d3b", "#888888", "#888888", "#464641", "#ffffff", "#ffffff", "#888888", "#3d3e39", "#656663", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#ffffff", "#66655e", "#6d6c63", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#696964", "#888888", "#64645f", "#61615c", "#54554b", "#53534e", "#4f4e4e", "#595954", "#494a42", "#494a42", "#4e4e49", "#4a4a45", "#4a4a45", "#4a4a45", "#4b4b46", "#4c4c47", "#4e4e49", "#53544c", "#595954", "#575752", "#5c5754", "#645f5c", "#686360", "#888888", "#888888", "#888888", "#888888", "#888888", "#656464", "#60605d", "#54544f", "#888888", "#646461", "#62625f", "#383835", "#454341", "#5f5e57", "#54534a", "#000000", "#888888", "#888888", "#52514a", "#676561", "#514d45", "#888888", "#000000", "#ffffff", "#888888", "#37372a", "#494638", "#888888", "#888888", "#615f5b", "#888888", "#888888", "#5e5f5c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#5f6157", "#626161", "#888888", "#ffffff", "#888888", "#888888", "#ffffff", "#888888", "#ffffff", "#413a2d", "#3f3e35", "#4b4643", "#454444", "#888888", "#ffffff", "#ffffff", "#888888", "#3f3e37", "#4c4b44", "#888888", "#888888", "#686662", "#ffffff", "#888888", "#888888", "#888888", "#53524b", "#66655c", "#696861", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#676762", "#696964", "#585853", "#4e4f45", "#4e4e49", "#515050", "#4b4b46", "#45463e", "#3d3e36", "#3f3f3a", "#454540", "#3e3f37", "#41423a", "#404139", "#474742", "#44443f", "#53534e", "#50504b", "#5f5f5a", "#5e5956", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#5e5d5d", "#888888", "#52524d", "#54544f", "#555550", "#000000", "#393733", "#6a6962", "#434239", "#3c3a36", "#888888", "#54524e", "#3d3c35", "#888888", "#000000", "#46423c", "#ffffff", "#888888", "#40423a", "#414238", "#5e5d53", "#888888", "#44423e", "#57524f", "#888888", "#68635d", "#626360", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#5f6055", "#585855", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#6b6663", "#59544b", "#524e45", "#46473d", "#000000", "#ffffff", "#33342c", "#000000", "#000000", "#000000", "#403c34", "#47413e", "#888888", "#888888", "#ffffff", "#888888", "#ffffff", "#3b3a33", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#60605d", "#5e5e5b", "#4a4a45", "#4e4f47", "#4f504b", "#43443f", "#3b3c32", "#393a32", "#393934", "#3b3b36", "#40423a", "#43443f", "#40413c", "#474742", "#4b4b46", "#52524d", "#4e4e49", "#62625d", "#888888", "#676561", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#595858", "#888888", "#3c3c37", "#ffffff", "#888888", "#555550", "#000000", "#383931", "#393831", "#4a4942", "#44423e", "#888888", "#514f4b", "#5a5a55", "#000000", "#514c4b", "#888888", "#ffffff", "#ffffff", "#36352b", "#45443a", "#888888", "#888888", "#403c33", "#49453d", "#66615b", "#59544e", "#646560", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#5c5d53", "#4a4a45", "#888888", "#ffffff", "#ffffff", "#6d6c63", "#888888", "#888888", "#605b58", "#888888", "#57564d", "#46473d", "#393a32", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#000000", "#888888", "#4c4b4b", "#ffffff", "#ffffff", "#53544c", "#888888", "#36352e", "#3d3c35", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#54554d", "#50504b", "#494b43", "#4e5048", "#404139", "#3f4038", "#40403b", "#3e3e39", "#43433e", "#484843", "#4f4f4a", "#51524f", "#575752", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#595954", "#888888", "#3d3e36", "#888888", "#5c5c59", "#000000", "#34352b", "#343530", "#393a35", "#000000", "#888888", "#63615d", "#000000", "#000000", "#5e585a", "#888888", "#716961", "#888888", "#403d31", "#48443b", "#888888", "#5e5953", "#3c392d", "#47433a", "#555148", "#504c46", "#656663", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#5d5e53", "#50504b", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#5a554f", "#59554d", "#6e6d64", "#575850", "#888888", "#666661", "#888888", "#ffffff", "#888888", "#888888", "#5f5e55", "#888888", "#353532", "#ffffff", "#ffffff", "#555550", "#888888", "#888888", "#403f38", "#4d4c45", "#ffffff", "#656560", "#888888", "#888888", "#ffffff", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#56574f", "#4e5048", "#4f5149", "#474742", "#44443f", "#40403b", "#3e3f37", "#3f4038", "#484941", "#54554d", "#585652", "#555552", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#50504d", "#4e4e4b", "#4e4e49", "#888888", "#888888", "#888888", "#605f60", "#000000", "#3b3b36", "#000000", "#000000", "#000000", "#888888", "#4e4c48", "#41413c", "#000000", "#4a4447", "#888888", "#645f57", "#888888", "#000000", "#69685f", "#ffffff", "#6a6660", "#36352c", "#4b473f", "#57534b", "#49453c", "#5e5f5a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#61625a", "#888888", "#ffffff", "#5a5b50", "#555550", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#656256", "#5c584f", "#605f56", "#888888", "#888888", "#ffffff", "#888888", "#626161", "#ffffff", "#ffffff", "#313228", "#888888", "#646562", "#ffffff", "#ffffff", "#5d5d58", "#4c4b44", "#34332c", "#888888", "#605f58", "#888888", "#ffffff", "#888888", "#888888", "#41413c", "#494a42", "#5b5c52", "#64665c", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#60605b", "#5c5d58", "#51524a", "#4d4d48", "#4e4f47", "#69685f", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#52534b", "#60605b", "#606159", "#5d5d58", "#32322d", "#585853", "#3f3f3a", "#888888", "#888888", "#888888", "#888888", "#61615c", "#ffffff", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#4d4b47", "#888888", "#000000", "#000000", "#888888", "#39342c", "#888888", "#4a4542", "#393936", "#000000", "#000000", "#47463f", "#3b3935", "#47463f", "#55544a", "#48483b", "#4d4f4a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5d5e56", "#888888", "#ffffff", "#5d5f51", "#565850", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#5f5a57", "#5c5852", "#888888", "#666460", "#ffffff", "#888888", "#888888", "#ffffff", "#ffffff", "#6e6a64", "#888888", "#888888", "#ffffff", "#60605b", "#52534b", "#57534d", "#4f4d49", "#888888", "#626360", "#888888", "#606061", "#888888", "#888888", "#ffffff", "#888888", "#ffffff", "#63635e", "#676860", "#63645c", "#5f5f5c", "#888888", "#ffffff", "#888888", "#888888", "#636259", "#45443d", "#4c4b44", "#888888", "#888888", "#575853", "#484a42", "#55574f", "#5d5c52", "#454138", "#000000", "#3d3c33", "#585951", "#888888", "#888888", "#5a5a55", "#56554e", "#4f4e47", "#44433c", "#5e5c58", "#888888", "#888888", "#42423d", "#35362e", "#888888", "#888888", "#888888", "#5f5e5e", "#888888", "#63655d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#000000", "#888888", "#3a362d", "#44423e", "#888888", "#3a3a37", "#000000", "#000000", "#000000", "#000000", "#888888", "#534e4b", "#595453", "#413c39", "#3a3a3a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#565651", "#888888", "#ffffff", "#58594f", "#474843", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#6b6761", "#000000", "#3a3a2d", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#635f59", "#686360", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#000000", "#888888", "#888888", "#888888", "#313228", "#5d5e56", "#ffffff", "#ffffff", "#888888", "#888888", "#6e6d64", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#595a55", "#888888", "#595858", "#494946", "#888888", "#000000", "#494a42", "#686964", "#3d3d3a", "#888888", "#888888", "#5d5e56", "#000000", "#888888", "#888888", "#54544f", "#505149", "#888888", "#888888", "#888888", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#60625a", "#373428", "#504e4a", "#444240", "#000000", "#000000", "#000000", "#000000", "#000000", "#403c34", "#534f49", "#595451", "#4c4744", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#565651", "#888888", "#888888", "#55564e", "#474845", "#5c5c57", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#6d6a5c", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#514d47", "#6c6764", "#ffffff", "#888888", "#ffffff", "#ffffff", "#888888", "#37362d", "#888888", "#ffffff", "#888888", "#000000", "#424339", "#ffffff", "#888888", "#888888", "#636259", "#504f46", "#6b6a63", "#888888", "#888888", "#888888", "#888888", "#888888", "#000000", "#3d3e39", "#50514e", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#656560", "#4b4b46", "#656465", "#888888", "#888888", "#45433f", "#3c3c39", "#888888", "#888888", "#5c605a", "#51524d", "#ffffff", "#888888", "#ffffff", "#363631", "#3c3b34", "#888888", "#32312a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#635e5b", "#000000", "#504b48", "#35332f", "#32322d", "#000000", "#000000", "#000000", "#000000", "#3d3930", "#58544c", "#524d4a", "#55504d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#555552", "#888888", "#888888", "#555550", "#484848", "#4a4a47", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#6b6761", "#ffffff", "#888888", "#ffffff", "#888888", "#888888", "#6c6862", "#ffffff", "#4f4b45", "#46413e", "#32322d", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#ffffff", "#ffffff", "#323426", "#4d4e43", "#888888", "#ffffff", "#888888", "#41413c", "#504e4a", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#484843", "#50504b", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#45473d", "#393a32", "#888888", "#888888", "#888888", "#363830", "#464744", "#ffffff", "#ffffff", "#5d5e59", "#474843", "#ffffff", "#ffffff", "#000000", "#44453d", "#58594f", "#54554b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#37362d", "#35332f", "#41413c", "#000000", "#000000", "#000000", "#000000", "#000000", "#464239", "#58574d", "#4a4942", "#605e5a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#535350", "#565558", "#888888", "#585853", "#434343", "#3f403d", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#5c5e4c", "#46473d", "#888888", "#888888", "#888888", "#888888", "#534e4b", "#ffffff", "#3e3936", "#888888", "#888888", "#888888", "#888888", "#5a554f", "#514d47", "#32322d", "#000000", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#ffffff", "#ffffff", "#000000", "#56574c", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#ffffff", "#453f41", "#4e4c48", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#484b3b", "#34352a", "#888888", "#888888", "#ffffff", "#454641", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#ffffff", "#53544f", "#52544c", "#37382e", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#33342f", "#43443f", "#3f4038", "#31322d", "#32342c", "#000000", "#000000", "#000000", "#000000", "#393831", "#4d4845", "#55534f", "#454540", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#535350", "#3d3c3f", "#888888", "#5c5d55", "#3c3d38", "#353631", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#4f5143", "#484a3a", "#59584f", "#615c59", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#6a665e", "#888888", "#5e5a54", "#6a625d", "#6b6a63", "#43433e", "#535451", "#363732", "#ffffff", "#ffffff", "#888888", "#888888", "#ffffff", "#ffffff", "#3b3d2f", "#4c4d42", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#ffffff", "#888888", "#ffffff", "#5b5653", "#000000", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#ffffff", "#363830", "#000000", "#888888", "#ffffff", "#ffffff", "#4f504d", "#888888", "#ffffff", "#ffffff", "#888888", "#43453b", "#4f5149", "#888888", "#888888", "#888888", "#000000", "#888888", "#000000", "#000000", "#000000", "#33332e", "#000000", "#000000", "#000000", "#000000", "#52524d", "#36372f", "#3a3b33", "#000000", "#000000", "#000000", "#000000", "#000000", "#474742", "#4c4744", "#504e4a", "#474840", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#555552", "#343334", "#888888", "#656560", "#3f403b", "#343530", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#34342f", "#666460", "#888888", "#888888", "#888888", "#6a6660", "#888888", "#888888", "#888888", "#4d4941", "#888888", "#44403a", "#6a655f", "#6b6a63", "#000000", "#000000", "#54564e", "#000000", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#505146", "#4a4b41", "#ffffff", "#888888", "#ffffff", "#888888", "#323330", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#ffffff", "#000000", "#000000", "#ffffff", "#ffffff", "#888888", "#ffffff", "#888888", "#ffffff", "#5f5f62", "#000000", "#ffffff", "#ffffff", "#ffffff", "#888888", "#ffffff", "#888888", "#000000", "#000000", "#32342a", "#888888", "#888888", "#888888", "#888888", "#000000", "#888888", "#000000", "#000000", "#44443f", "#5c5c57", "#60605b", "#000000", "#000000", "#888888", "#000000", "#35362e", "#31332b", "#000000", "#000000", "#000000", "#000000", "#000000", "#44453d", "#4b4741", "#4f4e47", "#494a42", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#575656", "#323132", "#888888", "#605f5f", "#383a32", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#55544d", "#888888", "#67635d", "#888888", "#888888", "#888888", "#888888", "#69645e", "#ffffff", "#888888", "#585350", "#595451", "#6b6761", "#888888", "#353532", "#888888", "#ffffff", "#585951", "#434537", "#616258", "#888888", "#000000", "#ffffff", "#ffffff", "#3e3e39", "#ffffff", "#ffffff", "#ffffff", "#363929", "#888888", "#ffffff", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#4b4b48", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#ffffff", "#888888", "#000000", "#000000", "#000000", "#32342c", "#35372f", "#3c3d38", "#888888", "#888888", "#888888", "#888888", "#888888", "#000000", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#484843", "#ffffff", "#55504d", "#000000", "#32332b", "#000000", "#000000", "#000000", "#000000", "#000000", "#34352d", "#4a4b41", "#46423a", "#48473e", "#4c4d45", "#61625a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3c37", "#000000", "#888888", "#888888", "#3f4137", "#000000", "#696964", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#66655e", "#6b6761", "#5c5852", "#888888", "#888888", "#888888", "#69655f", "#ffffff", "#888888", "#ffffff", "#000000", "#52504c", "#6c6b62", "#888888", "#3e3e3b", "#888888", "#ffffff", "#6b6c64", "#323329", "#888888", "#505147", "#4a4b43", "#000000", "#000000", "#000000", "#888888", "#888888", "#ffffff", "#000000", "#454847", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#666762", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#51514e", "#000000", "#000000", "#000000", "#000000", "#000000", "#4d4e49", "#3a3b36", "#646560", "#50514c", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#000000", "#505149", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#55504d", "#423d3a", "#000000", "#32322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#3f3e37", "#46453c", "#433e36", "#45443b", "#4c4d43", "#54554b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5f605d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5b5c54", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#56524c", "#888888", "#888888", "#888888", "#888888", "#413c39", "#ffffff", "#4f4a47", "#888888", "#3c3a36", "#4f4d49", "#888888", "#888888", "#40403d", "#888888", "#ffffff", "#ffffff", "#888888", "#ffffff", "#000000", "#888888", "#676860", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#50504d", "#888888", "#888888", "#545250", "#000000", "#000000", "#000000", "#000000", "#545454", "#434343", "#383838", "#000000", "#000000", "#000000", "#000000", "#000000", "#4f5149", "#4f5149", "#5c5d58", "#000000", "#888888", "#888888", "#888888", "#585858", "#888888", "#888888", "#888888", "#000000", "#000000", "#36372d", "#45463c", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#5a5552", "#3c3c37", "#31322a", "#000000", "#000000", "#000000", "#000000", "#393934", "#404139", "#3b3a31", "#403c36", "#43423b", "#4d4e44", "#404036", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5f605d", "#000000", "#44443f", "#888888", "#5c5c59", "#44463e", "#373931", "#585951", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#3d3933", "#888888", "#736b64", "#534e48", "#888888", "#3b3633", "#615f5b", "#62605c", "#5a5854", "#888888", "#888888", "#464643", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#ffffff", "#888888", "#000000", "#888888", "#53534e", "#4e4e49", "#3e3e39", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#393a30", "#45463c", "#47483e", "#000000", "#60625a", "#494a45", "#888888", "#000000", "#888888", "#ffffff", "#888888", "#3e3e3e", "#888888", "#ffffff", "#42443c", "#000000", "#000000", "#000000", "#515247", "#000000", "#000000", "#000000", "#3a3b33", "#000000", "#888888", "#3a3532", "#383833", "#000000", "#000000", "#000000", "#000000", "#000000", "#3e3e39", "#403f36", "#333229", "#3d3931", "#3f3e35", "#505147", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5e5f5a", "#36372f", "#4f4e4f", "#888888", "#888888", "#3f4139", "#000000", "#45463e", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#55534f", "#888888", "#000000", "#000000", "#5d5e56", "#888888", "#635857", "#59554f", "#000000", "#35312b", "#48443e", "#635e5b", "#888888", "#888888", "#46483e", "#434638", "#ffffff", "#ffffff", "#65675f", "#ffffff", "#888888", "#ffffff", "#ffffff", "#5b5c57", "#ffffff", "#5a5a57", "#888888", "#000000", "#888888", "#4f5244", "#606257", "#31332b", "#575951", "#595b51", "#4f4f4c", "#4d4d48", "#000000", "#4a4c44", "#4f504b", "#55564e", "#888888", "#000000", "#5b5c54", "#585954", "#888888", "#888888", "#676863", "#61625d", "#888888", "#888888", "#3e4038", "#595a57", "#888888", "#888888", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#47483e", "#000000", "#3c3c39", "#ffffff", "#393735", "#33312f", "#353331", "#000000", "#000000", "#000000", "#000000", "#000000", "#443f3c", "#413c39", "#000000", "#3a3630", "#3a3a35", "#555651", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#595a55", "#373732", "#4b4a4a", "#888888", "#888888", "#42443a", "#34362e", "#393a32", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#585352", "#3a3532", "#000000", "#000000", "#000000", "#5c5852", "#888888", "#000000", "#38342e", "#38342e", "#49453f", "#5f5b55", "#65635f", "#888888", "#313329", "#404237", "#888888", "#ffffff", "#888888", "#ffffff", "#888888", "#ffffff", "#ffffff", "#888888", "#ffffff", "#888888", "#888888", "#000000", "#888888", "#888888", "#888888", "#3e3e41", "#888888", "#6c6e64", "#66685e", "#5d5f57", "#3f4139", "#888888", "#888888", "#888888", "#888888", "#62625d", "#61615c", "#888888", "#888888", "#888888", "#888888", "#565752", "#888888", "#ffffff", "#000000", "#888888", "#888888", "#888888", "#383936", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#30322a", "#3d3e36", "#000000", "#888888", "#000000", "#000000", "#36322a", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3734", "#3e3c38", "#34322e", "#000000", "#393831", "#393831", "#585853", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4b4d45", "#3f3f3a", "#525151", "#888888", "#888888", "#40413c", "#3b3c37", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#65615b", "#5b5955", "#4a4a45", "#000000", "#383934", "#3e3d36", "#403b35", "#ffffff", "#534f49", "#413d37", "#49453f", "#3f3b35", "#625e58", "#68645c", "#414037", "#393a2f", "#393934", "#343431", "#434340", "#ffffff", "#888888", "#ffffff", "#ffffff", "#32332e", "#ffffff", "#888888", "#888888", "#000000", "#ffffff", "#ffffff", "#888888", "#000000", "#ffffff", "#888888", "#888888", "#888888", "#4d4e49", "#383934", "#ffffff", "#888888", "#888888", "#888888", "#000000", "#ffffff", "#888888", "#ffffff", "#888888", "#5d5e59", "#888888", "#ffffff", "#000000", "#000000", "#888888", "#000000", "#373931", "#000000", "#000000", "#000000", "#000000", "#000000", "#30322a", "#000000", "#000000", "#000000", "#363631", "#000000", "#3c3b34", "#000000", "#000000", "#888888", "#66655e", "#353530", "#000000", "#000000", "#413c39", "#3b3935", "#000000", "#383632", "#34332c", "#3d3c35", "#53534e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#494a45", "#42423d", "#575656", "#888888", "#888888", "#4a4b46", "#3c3e36", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#4c4a46", "#5c5d58", "#000000", "#000000", "#504f48", "#4c4842", "#888888", "#888888", "#000000", "#36322c", "#5f5b55", "#5e5a54", "#59554d", "#36352c", "#403f36", "#000000", "#43443c", "#000000", "#888888", "#363633", "#ffffff", "#ffffff", "#000000", "#ffffff", "#ffffff", "#888888", "#000000", "#ffffff", "#ffffff", "#888888", "#000000", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#000000", "#ffffff", "#888888", "#888888", "#888888", "#000000", "#ffffff", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#ffffff", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#30322a", "#000000", "#000000", "#888888", "#000000", "#383632", "#000000", "#000000", "#ffffff", "#3a3a35", "#32322f", "#000000", "#48443e", "#373531", "#000000", "#363430", "#000000", "#3b3b36", "#4e4e49", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3a3a3a", "#484845", "#646363", "#888888", "#888888", "#424242", "#3b3d35", "#000000", "#515151", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#484843", "#61615c", "#4c4c47", "#000000", "#000000", "#5e5956", "#888888", "#ffffff", "#4a463e", "#56524a", "#4b473f", "#59554d", "#46423a", "#46423a", "#47433b", "#3c3b31", "#000000", "#36372d", "#31322f", "#616060", "#888888", "#ffffff", "#606159", "#888888", "#ffffff", "#3e3f37", "#33342a", "#ffffff", "#ffffff", "#888888", "#53534e", "#676762", "#ffffff", "#888888", "#888888", "#888888", "#000000", "#ffffff", "#888888", "#ffffff", "#888888", "#000000", "#888888", "#888888", "#ffffff", "#888888", "#000000", "#393934", "#000000", "#33332e", "#3a3a35", "#353530", "#000000", "#000000", "#000000", "#000000", "#31322a", "#36352e", "#32312a", "#000000", "#000000", "#000000", "#33332e", "#000000", "#888888", "#000000", "#000000", "#000000", "#000000", "#888888", "#000000", "#3f3d3b", "#363432", "#35342d", "#000000", "#000000", "#32302c", "#33332e", "#454540", "#353631", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#333333", "#4c4c49", "#888888", "#888888", "#888888", "#40413e", "#383934", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#54544f", "#42423d", "#5e5e59", "#32322d", "#000000", "#494441", "#ffffff", "#888888", "#000000", "#47433b", "#46423a", "#615d54", "#4a463d", "#545047", "#413d35", "#3e3e31", "#383835", "#38392e", "#3d3e3b", "#41413e", "#000000", "#373830", "#3f4038", "#696964", "#ffffff", "#888888", "#000000", "#ffffff", "#888888", "#ffffff", "#000000", "#888888", "#ffffff", "#888888", "#888888", "#4b4b48", "#000000", "#ffffff", "#888888", "#ffffff", "#000000", "#3b3d2d", "#000000", "#888888", "#888888", "#000000", "#464641", "#32322d", "#32322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#32332b", "#363631", "#3c3d35", "#3e3d36", "#3a3932", "#33322b", "#000000", "#000000", "#53534e", "#000000", "#888888", "#000000", "#000000", "#000000", "#000000", "#888888", "#000000", "#33312d", "#454341", "#000000", "#000000", "#000000", "#000000", "#32322d", "#4f4f4a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4f4f4c", "#888888", "#888888", "#888888", "#444540", "#373737", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#696964", "#41413c", "#565651", "#42423d", "#000000", "#5f5a57", "#888888", "#888888", "#433f37", "#3b372f", "#555149", "#635f56", "#4c483f", "#524e45", "#413d34", "#454538", "#3e3e3b", "#393a2f", "#000000", "#000000", "#3e3e39", "#34342f", "#474742", "#000000", "#888888", "#3c3d35", "#000000", "#888888", "#ffffff", "#ffffff", "#3b3b36", "#404139", "#5f5f5c", "#ffffff", "#ffffff", "#000000", "#000000", "#61615e", "#888888", "#ffffff", "#000000", "#33342a", "#323132", "#000000", "#41413e", "#3c3c39", "#474742", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32322d", "#3c3d35", "#43433e", "#46473f", "#3d3c35", "#383730", "#383730", "#000000", "#000000", "#888888", "#000000", "#888888", "#000000", "#000000", "#3d3e39", "#000000", "#888888", "#000000", "#36352e", "#3a3834", "#000000", "#000000", "#000000", "#32302c", "#373732", "#4e4e49", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#54524e", "#888888", "#888888", "#888888", "#4b4c44", "#393839", "#353530", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#585652", "#413f3b", "#65635f", "#36322c", "#5c5754", "#888888", "#46423c", "#888888", "#000000", "#47463f", "#4f4e45", "#504f46", "#5a5950", "#4a4b41", "#49483e", "#4a4942", "#46453c", "#424138", "#44443f", "#3a3b36", "#383a32", "#363732", "#3c3d3a", "#42433e", "#3f4136", "#34352a", "#000000", "#000000", "#000000", "#3d3d38", "#40403b", "#34342f", "#32322d", "#000000", "#3b3b36", "#3c3c37", "#43433e", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322f", "#000000", "#000000", "#000000", "#000000", "#383833", "#000000", "#000000", "#343431", "#393934", "#3d3d38", "#605f56", "#5d5c53", "#4d4c45", "#46453c", "#3b372e", "#37362d", "#34342f", "#353530", "#000000", "#000000", "#888888", "#5a5b51", "#32342c", "#3b3d35", "#000000", "#000000", "#3f4038", "#3d3e34", "#000000", "#000000", "#000000", "#000000", "#000000", "#4b4c49", "#383833", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5e5d56", "#888888", "#888888", "#888888", "#4c4d45", "#373637", "#34352d", "#000000", "#686662", "#888888", "#888888", "#6b6663", "#888888", "#63615d", "#63615d", "#6a6864", "#888888", "#666460", "#42403c", "#5d5953", "#524d4a", "#615d55", "#888888", "#000000", "#888888", "#000000", "#54534c", "#585853", "#54544f", "#888888", "#464641", "#49453d", "#535249", "#504f46", "#4f4e45", "#494944", "#444540", "#41423d", "#41423d", "#40413e", "#32332e", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3d3e36", "#000000", "#353530", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3a3a35", "#000000", "#323131", "#41413e", "#484843", "#555550", "#5a594f", "#57534b", "#57534d", "#6a665e", "#444037", "#000000", "#34342f", "#33332e", "#000000", "#000000", "#888888", "#888888", "#3b3c34", "#373931", "#000000", "#000000", "#393934", "#35362c", "#000000", "#000000", "#000000", "#000000", "#343334", "#555556", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5e5d56", "#888888", "#888888", "#888888", "#54554d", "#363535", "#34352d", "#000000", "#000000", "#888888", "#888888", "#888888", "#686360", "#62605c", "#64625e", "#5a5854", "#62615a", "#5f5e57", "#504f48", "#38372e", "#5b5a51", "#59584f", "#888888", "#000000", "#888888", "#5a5650", "#888888", "#55544d", "#54534c", "#888888", "#595851", "#5a554d", "#605c54", "#5c5852", "#5d5850", "#565651", "#4a4b46", "#53544f", "#4f504b", "#464744", "#000000", "#888888", "#3a3c34", "#383a32", "#464840", "#585a52", "#5c5c57", "#5f5f5a", "#53544c", "#888888", "#888888", "#888888", "#888888", "#585853", "#5c5c57", "#555550", "#565651", "#4c4c47", "#555653", "#424340", "#363734", "#000000", "#000000", "#383934", "#4c4c47", "#393934", "#535350", "#676764", "#888888", "#888888", "#888888", "#888888", "#000000", "#888888", "#363229", "#36352c", "#4e4e49", "#454540", "#000000", "#54544f", "#ffffff", "#4a4b43", "#888888", "#000000", "#000000", "#333330", "#32322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#42423f", "#404040", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#605f58", "#888888", "#888888", "#888888", "#53544c", "#373637", "#3a3b33", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#65635f", "#64625e", "#5c5b54", "#5a5950", "#56554e", "#54534a", "#33342a", "#5c5e56", "#616359", "#63635e", "#000000", "#ffffff", "#ffffff", "#000000", "#65615b", "#5b5751", "#514d47", "#494841", "#635e56", "#888888", "#6a655d", "#645f57", "#5a5854", "#5b5c57", "#5c5d58", "#565752", "#535451", "#414142", "#575757", "#393934", "#31322d", "#3d3e39", "#4e5048", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#656560", "#5e5e5b", "#565653", "#555552", "#575754", "#555555", "#3b3c39", "#31322f", "#000000", "#000000", "#3a3b36", "#54544f", "#50504b", "#656560", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#36302d", "#888888", "#322e25", "#38372e", "#5b5b56", "#5c5c57", "#3c3c37", "#888888", "#888888", "#3b3b36", "#888888", "#33342f", "#000000", "#363633", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#50504d", "#000000", "#000000", "#000000", "#33352d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#595858", "#888888", "#888888", "#888888", "#53544c", "#353536", "#39393a", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#66675f", "#605f56", "#585750", "#58544e", "#4c4842", "#4c4842", "#3a3932", "#67625f", "#888888", "#44433a", "#535249", "#888888", "#ffffff", "#888888", "#000000", "#55514b", "#55504f", "#524d4a", "#615e60", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#62635b", "#676764", "#888888", "#4b4b48", "#5a5a55", "#575752", "#333431", "#383838", "#393a37", "#585956", "#616161", "#5d5d60", "#888888", "#888888", "#888888", "#6a6b63", "#888888", "#656464", "#575752", "#565651", "#50504b", "#545552", "#454641", "#000000", "#34362e", "#000000", "#000000", "#61625d", "#888888", "#888888", "#888888", "#67665f", "#888888", "#ffffff", "#888888", "#000000", "#888888", "#56554e", "#424138", "#888888", "#55564e", "#3a3b33", "#888888", "#888888", "#000000", "#000000", "#33332e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#333330", "#383835", "#000000", "#000000", "#42423d", "#404139", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5d5d5a", "#888888", "#888888", "#5f5b55", "#53534e", "#000000", "#3b3b3e", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#64655d", "#605f56", "#5c5b52", "#55514b", "#4d4c45", "#4c4b44", "#4a4942", "#65605d", "#888888", "#595851", "#5d5953", "#888888", "#ffffff", "#ffffff", "#000000", "#888888", "#524d4c", "#6b6761", "#4e4b4f", "#ffffff", "#888888", "#ffffff", "#5a5a57", "#ffffff", "#888888", "#626161", "#656464", "#51514e", "#54544f", "#888888", "#383936", "#333431", "#3a3b38", "#575757", "#888888", "#5d5d5d", "#888888", "#888888", "#888888", "#656560", "#5f5e5e", "#595858", "#565651", "#505149", "#565651", "#61625f", "#494a45", "#383934", "#363830", "#30322a", "#000000", "#464840", "#595954", "#ffffff", "#888888", "#65635f", "#67665c", "#ffffff", "#363633", "#000000", "#888888", "#53524b", "#414039", "#888888", "#3b3a33", "#888888", "#ffffff", "#686863", "#000000", "#34342f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#454542", "#000000", "#000000", "#393a32", "#484941", "#4e4f47", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#333431", "#5b5a5a", "#888888", "#888888", "#888888", "#505147", "#363636", "#3b3c39", "#353530", "#000000", "#000000", "#000000", "#000000", "#888888", "#666661", "#63625b", "#595851", "#504f48", "#4a4942", "#54534c", "#4e4c48", "#54534c", "#585750", "#676561", "#63615f", "#474541", "#888888", "#888888", "#69655f", "#59554d", "#68645e", "#888888", "#666365", "#ffffff", "#343431", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#575754", "#4e4f47", "#888888", "#343532", "#000000", "#41423d", "#404041", "#434343", "#4a4a4a", "#888888", "#525350", "#5f5e5e", "#888888", "#444441", "#484843", "#4a4a45", "#464641", "#555552", "#888888", "#575853", "#40413c", "#000000", "#34362e", "#000000", "#51524d", "#888888", "#888888", "#5c5a58", "#66655e", "#888888", "#888888", "#000000", "#888888", "#3e3e39", "#5b5653", "#4e4946", "#3e3c3a", "#000000", "#ffffff", "#ffffff", "#000000", "#32322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32322d", "#43433e", "#42423d", "#000000", "#000000", "#484941", "#4b4b46", "#5b5c54", "#000000", "#000000", "#000000", "#000000", "#393939", "#444444", "#323232", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#343532", "#5a5959", "#888888", "#888888", "#888888", "#4a4b41", "#333431", "#3e3f3c", "#32332e", "#000000", "#000000", "#000000", "#000000", "#403f3f", "#888888", "#67625f", "#5d5e56", "#52524d", "#4f5048", "#4c4c47", "#4a4844", "#47463f", "#525148", "#62605e", "#888888", "#5a5650", "#888888", "#ffffff", "#000000", "#625e55", "#888888", "#888888", "#605d61", "#ffffff", "#525350", "#888888", "#888888", "#64655d", "#888888", "#888888", "#888888", "#5f5f5c", "#4c4c47", "#54544f", "#000000", "#000000", "#333333", "#484a42", "#343530", "#4c4d4a", "#5b5b5b", "#60615c", "#474649", "#46444a", "#696964", "#484843", "#44453d", "#454540", "#4d4c4d", "#888888", "#5a5b56", "#40413c", "#000000", "#000000", "#000000", "#5a5c54", "#888888", "#5e5c58", "#5b5957", "#888888", "#888888", "#888888", "#000000", "#ffffff", "#3e3c38", "#555351", "#514e50", "#53524b", "#000000", "#ffffff", "#5c5b5c", "#000000", "#000000", "#32322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3c37", "#454540", "#000000", "#000000", "#000000", "#4c4c47", "#56574f", "#54544f", "#000000", "#000000", "#000000", "#000000", "#353633", "#000000", "#000000", "#000000", "#525252", "#353535", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3a3a3a", "#383838", "#565656", "#888888", "#ffffff", "#888888", "#494841", "#35342d", "#403f38", "#35362e", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#625e56", "#514d47", "#4d4847", "#464140", "#44423e", "#43423b", "#4b4a40", "#535547", "#6a665d", "#5c5850", "#ffffff", "#888888", "#514c49", "#6e6a64", "#888888", "#696964", "#888888", "#888888", "#000000", "#383833", "#888888", "#888888", "#888888", "#888888", "#888888", "#4e4e49", "#484843", "#30322a", "#000000", "#000000", "#42433e", "#3d3e39", "#30322a", "#3b3c37", "#3d3d3d", "#464647", "#444542", "#484946", "#3e4038", "#363732", "#32332e", "#4b4c49", "#585858", "#4c4d4a", "#373833", "#000000", "#000000", "#353530", "#575752", "#888888", "#5f6159", "#888888", "#5d5b57", "#888888", "#34342f", "#000000", "#ffffff", "#44443f", "#5f5f5a", "#4f4f4a", "#34352d", "#40403b", "#888888", "#000000", "#373732", "#393a30", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32322f", "#494a45", "#000000", "#000000", "#000000", "#000000", "#4f4f4a", "#888888", "#4c4b4c", "#000000", "#000000", "#000000", "#3b3b3c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#42443c", "#52544c", "#34352e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322f", "#000000", "#000000", "#000000", "#505050", "#888888", "#ffffff", "#888888", "#44433c", "#35342d", "#403f38", "#35362e", "#000000", "#000000", "#000000", "#000000", "#303228", "#000000", "#888888", "#6f6b63", "#5f5b55", "#524e48", "#4e4948", "#474543", "#423e38", "#44433c", "#454138", "#4b4d43", "#5b574e", "#56524c", "#ffffff", "#ffffff", "#403c36", "#888888", "#888888", "#888888", "#888888", "#42423d", "#000000", "#64645f", "#595954", "#888888", "#888888", "#888888", "#888888", "#454540", "#62625d", "#000000", "#000000", "#000000", "#4a4b46", "#3f403b", "#000000", "#000000", "#000000", "#363636", "#373835", "#373835", "#31332b", "#343530", "#000000", "#424340", "#505050", "#434343", "#353631", "#000000", "#000000", "#000000", "#5c5d55", "#5e5e59", "#5d5e59", "#666661", "#615c59", "#888888", "#000000", "#33342c", "#888888", "#474742", "#585853", "#3a3a35", "#000000", "#666663", "#4a494a", "#454445", "#363631", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#33332e", "#343431", "#3d3e39", "#000000", "#000000", "#000000", "#000000", "#5b5b56", "#888888", "#535252", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#343530", "#40413e", "#40403d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3c3c", "#333431", "#000000", "#000000", "#000000", "#000000", "#000000", "#464647", "#888888", "#ffffff", "#888888", "#434239", "#36352e", "#42413a", "#36352e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#605b55", "#5f5b55", "#5c5756", "#4d4b49", "#484340", "#42413a", "#413d34", "#3f4038", "#47433b", "#504b48", "#888888", "#ffffff", "#6d6963", "#322d2a", "#888888", "#888888", "#888888", "#888888", "#888888", "#3d3d38", "#3d3d3a", "#ffffff", "#888888", "#595858", "#888888", "#4a4b43", "#4f4f4c", "#000000", "#000000", "#000000", "#3e3f3a", "#363732", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#373835", "#4b4b4b", "#3f403d", "#000000", "#000000", "#000000", "#4c4c47", "#888888", "#585853", "#5f605b", "#555550", "#888888", "#ffffff", "#000000", "#50504b", "#888888", "#44443f", "#575752", "#4b4b46", "#000000", "#3d3d3a", "#000000", "#353532", "#3e3e39", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#34342f", "#4f4f4c", "#000000", "#000000", "#000000", "#000000", "#353530", "#696964", "#888888", "#605f60", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3b3c39", "#3f403d", "#353535", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#363734", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3f3e", "#888888", "#ffffff", "#888888", "#43423b", "#000000", "#3d3c35", "#35362e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#65615b", "#5a5552", "#514f4d", "#494743", "#43413d", "#414036", "#3f4038", "#43423b", "#4f4d49", "#504d4f", "#ffffff", "#888888", "#888888", "#6b6c64", "#888888", "#888888", "#666661", "#64645f", "#585853", "#888888", "#000000", "#ffffff", "#888888", "#888888", "#888888", "#61615e", "#000000", "#000000", "#000000", "#343530", "#363732", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#414141", "#3d3e3b", "#000000", "#000000", "#000000", "#474742", "#888888", "#5d5d58", "#555651", "#666661", "#888888", "#ffffff", "#000000", "#31322a", "#888888", "#40403b", "#4c4c47", "#5d5d58", "#42423d", "#464641", "#40403d", "#41413c", "#3a3b33", "#000000", "#000000", "#000000", "#33332e", "#000000", "#383833", "#484843", "#41413e", "#000000", "#383934", "#000000", "#000000", "#32322d", "#696964", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#424340", "#393a36", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#2d332e", "#888888", "#888888", "#888888", "#3a3b38", "#000000", "#3f3f3c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3a3a37", "#888888", "#6b6663", "#5b5a53", "#4a4844", "#484644", "#454538", "#3e3d34", "#484740", "#494745", "#4e4b4c", "#ffffff", "#ffffff", "#676762", "#55564c", "#888888", "#888888", "#888888", "#888888", "#3d3d38", "#000000", "#31322a", "#888888", "#666661", "#888888", "#4d4d48", "#5c5c57", "#000000", "#343530", "#000000", "#31322d", "#33342f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3d3e3b", "#373835", "#000000", "#000000", "#000000", "#3d3d38", "#888888", "#4f4d49", "#676762", "#656560", "#888888", "#64645f", "#000000", "#000000", "#63615d", "#393936", "#575752", "#888888", "#888888", "#60605b", "#413f3b", "#42403c", "#403e3a", "#32322f", "#34342f", "#363633", "#333330", "#363631", "#44443f", "#3a3a35", "#000000", "#000000", "#3c3c37", "#33332e", "#000000", "#353530", "#888888", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322d", "#42433e", "#353631", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#33342f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#595959", "#888888", "#68645c", "#363734", "#000000", "#40403d", "#33332e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4c4b4b", "#888888", "#5c5b54", "#5d5855", "#52504e", "#424137", "#47433a", "#42403e", "#514f4d", "#565450", "#ffffff", "#ffffff", "#888888", "#57584e", "#5f5e5e", "#888888", "#676762", "#888888", "#888888", "#393a30", "#525348", "#5d5f55", "#65665e", "#ffffff", "#ffffff", "#888888", "#373732", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#383936", "#323330", "#000000", "#000000", "#000000", "#50504d", "#888888", "#514f4d", "#888888", "#ffffff", "#353530", "#6b6c64", "#000000", "#000000", "#494848", "#393936", "#40403b", "#888888", "#888888", "#888888", "#4a4542", "#45433f", "#433e3b", "#000000", "#33332e", "#3b3b36", "#3d3e36", "#45463e", "#373732", "#888888", "#000000", "#000000", "#43433e", "#3a3a35", "#000000", "#34342f", "#888888", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32342c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#393a37", "#343434", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#464646", "#888888", "#5b5a51", "#000000", "#000000", "#3e3d3d", "#363633", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#474646", "#3d3d38", "#888888", "#6a6562", "#5d5857", "#4f4c40", "#514e40", "#4c4a48", "#5f5d5b", "#66655b", "#323131", "#494848", "#000000", "#38392f", "#545451", "#5e5e59", "#888888", "#696a62", "#ffffff", "#888888", "#ffffff", "#4d4e44", "#36382a", "#535350", "#ffffff", "#ffffff", "#333330", "#393a37", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#373835", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#000000", "#ffffff", "#000000", "#42423d", "#363633", "#000000", "#000000", "#363830", "#3a3b33", "#3b3c34", "#54544f", "#888888", "#888888", "#4f4a47", "#484642", "#433e3b", "#393934", "#393934", "#393934", "#43433e", "#43433e", "#3f3f3a", "#666661", "#000000", "#000000", "#4e4e49", "#484843", "#000000", "#363633", "#888888", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#3e4038", "#383a32", "#3f4139", "#393a37", "#343530", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3a3a3a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#373833", "#353631", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#52514a", "#000000", "#000000", "#3f3f3a", "#363631", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#505050", "#000000", "#575752", "#888888", "#65665e", "#525446", "#474939", "#4a4942", "#6a6962", "#6c695b", "#000000", "#4c4c47", "#4a4b43", "#313228", "#4c4c47", "#5c5c57", "#888888", "#3a3a35", "#888888", "#ffffff", "#ffffff", "#000000", "#000000", "#40403d", "#888888", "#888888", "#363732", "#40413c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3a3c34", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#474744", "#000000", "#000000", "#363633", "#383833", "#000000", "#000000", "#000000", "#404137", "#323329", "#3c3c37", "#888888", "#888888", "#4f4f4a", "#464641", "#3b3b36", "#393b33", "#3e3f37", "#40423a", "#53554d", "#000000", "#34362e", "#464742", "#000000", "#000000", "#565651", "#545451", "#000000", "#353434", "#888888", "#ffffff", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#454641", "#4e4f4c", "#444540", "#40413c", "#353631", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3d3d3d", "#393939", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#363632", "#3b3b3b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#575853", "#3c3d35", "#000000", "#000000", "#3f3f3a", "#3a3c2e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3d3a", "#000000", "#000000", "#000000", "#888888", "#65665b", "#5d5e53", "#605f58", "#888888", "#888888", "#4e4e4b", "#888888", "#888888", "#40403b", "#585951", "#565651", "#4e4e49", "#888888", "#000000", "#888888", "#888888", "#888888", "#888888", "#676764", "#5c5c59", "#888888", "#44463e", "#4b4c47", "#373931", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#2e2d33", "#32322f", "#888888", "#888888", "#4e4e4b", "#343431", "#363631", "#383833", "#373833", "#000000", "#000000", "#000000", "#4a4c42", "#41423a", "#3c3c37", "#3e3d3e", "#535350", "#4d4d48", "#454540", "#40403b", "#494b43", "#44463e", "#565850", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#565651", "#5b5b56", "#000000", "#3a3a37", "#888888", "#ffffff", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5d5e59", "#888888", "#5c5d5a", "#545552", "#42433e", "#41423d", "#3b3b3b", "#363637", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#373737", "#353535", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#464744", "#3e3f3c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#33332e", "#333330", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#44443f", "#35362e", "#000000", "#000000", "#3c3c37", "#393b2b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3f403d", "#000000", "#000000", "#000000", "#000000", "#888888", "#606159", "#63645c", "#63625b", "#6d6963", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#5c5c57", "#54544f", "#565651", "#3a3939", "#3d3c3d", "#888888", "#4b4b46", "#474744", "#666663", "#888888", "#888888", "#454641", "#4e5048", "#3f4139", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#313134", "#000000", "#888888", "#888888", "#61615e", "#363631", "#000000", "#353530", "#000000", "#000000", "#000000", "#000000", "#454641", "#404139", "#3c3c37", "#393936", "#484843", "#454540", "#43433e", "#4d4d48", "#454641", "#4f504b", "#3e3f3a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#50504b", "#60605b", "#000000", "#393936", "#888888", "#ffffff", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#61625d", "#888888", "#888888", "#888888", "#545550", "#4d4e4b", "#424242", "#3b3c39", "#343434", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#393939", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#424242", "#3b3b3b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322d", "#353530", "#373732", "#383931", "#363631", "#333232", "#323132", "#353435", "#333233", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3b3b36", "#3b3c32", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3d3a", "#000000", "#000000", "#000000", "#000000", "#32322f", "#888888", "#67665f", "#888888", "#605a5c", "#888888", "#ffffff", "#ffffff", "#888888", "#5f5f5a", "#5a5a55", "#5a5a55", "#4d4d48", "#000000", "#000000", "#000000", "#3b3b36", "#434340", "#494946", "#5f5f5c", "#888888", "#575951", "#5c5e56", "#686a62", "#373732", "#383835", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#343530", "#373833", "#3b3c39", "#000000", "#5c5b5b", "#888888", "#888888", "#52534b", "#000000", "#000000", "#000000", "#000000", "#000000", "#393a35", "#4a4a45", "#4f4f4a", "#44443f", "#41423a", "#454542", "#4c4c47", "#494944", "#4d4d48", "#5a5b56", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4b4b46", "#666661", "#000000", "#33332e", "#50504b", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32332e", "#888888", "#888888", "#888888", "#888888", "#5f605d", "#454643", "#3a3b38", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#4c4e46", "#4d4e49", "#363833", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#41423d", "#3c3d3a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#30322a", "#33342f", "#353631", "#373833", "#3a3a35", "#3c3d33", "#38392e", "#38392f", "#383a32", "#35372f", "#32332e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3d35", "#3e3f37", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#42423d", "#888888", "#706c64", "#69665a", "#888888", "#888888", "#888888", "#888888", "#5a5a55", "#5d5d58", "#575752", "#5d5d58", "#464641", "#34342f", "#000000", "#000000", "#3a3b36", "#5b5c57", "#5d5e5b", "#888888", "#888888", "#888888", "#888888", "#5e5e59", "#45463e", "#5e5f55", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32332b", "#000000", "#40413c", "#3e3f3a", "#3c3e36", "#3c3e36", "#000000", "#5e5e5e", "#888888", "#888888", "#676762", "#535350", "#31322a", "#323329", "#000000", "#36372f", "#484843", "#4c4b4b", "#4d4d4a", "#4f4f4a", "#494a42", "#444343", "#4b4b4c", "#525350", "#50514c", "#333330", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3f4139", "#62645c", "#32332e", "#363631", "#44443f", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3e36", "#51524d", "#5c5d5a", "#5b5c59", "#4d4e4b", "#434343", "#393a37", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3e3e3e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#32342c", "#363732", "#3f3f3f", "#4d4d4d", "#515151", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#40423a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322d", "#343530", "#353631", "#373931", "#393a35", "#3a3b36", "#3c3c37", "#3b3c34", "#3b3b36", "#3f4038", "#40413c", "#3d3f37", "#3a3b36", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3d3d38", "#40403d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32332e", "#000000", "#000000", "#000000", "#3b3c37", "#000000", "#000000", "#33332e", "#888888", "#68695f", "#888888", "#888888", "#888888", "#5c5c57", "#5b5b56", "#5b5b56", "#5b5b56", "#5d5d58", "#454540", "#363631", "#3c3c37", "#4d4d48", "#545550", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#63635e", "#50504b", "#888888", "#888888", "#888888", "#585855", "#4f4f4a", "#4f5046", "#54554d", "#5a5b53", "#565651", "#5b5b58", "#4b4c49", "#4f504d", "#575855", "#444542", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#53534e", "#51514c", "#4d4d48", "#53534e", "#4e4e49", "#5b5b56", "#595954", "#5c5c57", "#54554d", "#52524f", "#5e5e5e", "#555653", "#393a35", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#33342f", "#5a5c54", "#383a32", "#000000", "#373732", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#353535", "#404040", "#000000", "#424242", "#000000", "#000000", "#000000", "#000000"],
-    ["#30322a", "#000000", "#000000", "#353535", "#343532", "#424242", "#595959", "#5e5e5e", "#565656", "#60615e", "#60615c", "#888888", "#4e4f4a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322d", "#353631", "#373833", "#393a35", "#3a3b36", "#3b3d35", "#3c3d38", "#3d3e39", "#40403b", "#404139", "#42423d", "#474744", "#454641", "#3e3f3a", "#32342c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3f3f3a", "#41413c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3d38", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#5b5c54", "#5c5c57", "#5e5e59", "#5f5f5a", "#5b5b56", "#5d5d58", "#63635e", "#5d5d58", "#5e5e59", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#5f5f5c", "#686863", "#888888", "#5f5f5a", "#666661", "#61615c", "#5c5c59", "#565754", "#61625f", "#888888", "#5f605d", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#5e5e5b", "#5d5d5a", "#585855", "#5c5c59", "#565651", "#575752", "#565651", "#5a5a55", "#5e5e59", "#5c5c59", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#52544c", "#3b3d33", "#000000", "#363631", "#686863", "#61615c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#363636", "#000000", "#000000", "#353633", "#4c4d4a", "#5b5c59", "#3f403d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#383936", "#383934", "#32342c", "#373931", "#3b3d35", "#3f4137", "#3c3d38", "#43443f", "#4f504b", "#63645f", "#4f504d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#333334", "#353535", "#393936", "#393a37", "#3c3d38", "#3b3c37", "#3e3f3a", "#43443f", "#42443c", "#41423d", "#454641", "#464641", "#45463e", "#40403b", "#393936", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#353631", "#000000", "#000000", "#000000", "#393934", "#3a3a35", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#65665e", "#5d5d58", "#686863", "#61615c", "#63635e", "#666661", "#63635e", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#686863", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#626360", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#64655d", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3e36", "#3b3d32", "#353532", "#000000", "#3d3d38", "#393934", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#464742", "#595b53", "#484944", "#000000", "#000000", "#31322f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#343530", "#000000", "#30322a", "#000000", "#000000", "#373835", "#373835", "#3b3b3b", "#444542", "#40413e", "#474941", "#5f605b", "#4b4d45", "#000000", "#000000", "#000000", "#000000", "#383737", "#383738", "#3c3b3b", "#3b3b38", "#3d3d38", "#3e3e39", "#40403b", "#41413c", "#464742", "#454641", "#444540", "#40413c", "#393a35", "#343530", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#363732", "#000000", "#3e3f3a", "#4e4e49", "#3a3a35", "#000000", "#404139", "#414339", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#343530", "#000000", "#000000", "#000000", "#000000", "#000000", "#3b3b36", "#3d3c35", "#888888", "#888888", "#888888", "#686760", "#888888", "#656361", "#6a6962", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#585954", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322f", "#000000", "#000000", "#373833", "#44463e", "#393a37", "#000000", "#333431", "#323330", "#000000", "#000000", "#3d3e39", "#363732", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#555651", "#575853", "#454641", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322f", "#343532", "#353633", "#3a3b38", "#3c3d38", "#41423d", "#40413c", "#454641", "#535451", "#51524f", "#424340", "#393838", "#373637", "#414040", "#3f3f3c", "#42423f", "#41413e", "#40403d", "#40403d", "#3b3c37", "#393a35", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4a4b48", "#888888", "#888888", "#353532", "#3e3f37", "#3a3a35", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#494a47", "#000000", "#000000", "#000000", "#000000", "#000000", "#373732", "#4f4e47", "#414039", "#54534c", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#4f504b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#4d4e4b", "#000000", "#323330", "#333431", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#323330", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3d38", "#3f403b", "#373833", "#464742", "#4f504b", "#53544f", "#40413c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#353633", "#353633", "#3d3e3b", "#3a3b38", "#3a3b38", "#424340", "#4f504d", "#4c4b4b", "#4a494a", "#3d3c3c", "#3d3d3a", "#3d3d3a", "#3f3e3e", "#3f3e3e", "#383737", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#535353", "#31322d", "#000000", "#4b4b4c", "#888888", "#888888", "#40403d", "#474742", "#43433e", "#000000", "#000000", "#000000", "#000000", "#343532", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4b4b4b", "#000000", "#000000", "#000000", "#000000", "#000000", "#474742", "#4e4d46", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#636263", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#656562", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#000000", "#000000", "#888888", "#4a4b48", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322d", "#888888", "#5a5b58", "#31322f", "#323330", "#383936", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#40413e", "#4e4f4c", "#494a47", "#4e4f4c", "#393a35", "#33342f", "#32332e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#55544b"],
-    ["#767361", "#64614d", "#544e3b", "#444135", "#3e3a2e", "#000000", "#34302a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#353633", "#31322f", "#393a37", "#383936", "#3c3d3a", "#3b3c39", "#353532", "#373636", "#454542", "#4d4d4a", "#484845", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#585956", "#464744", "#000000", "#000000", "#000000", "#454641", "#888888", "#888888", "#444542", "#434340", "#43433e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#34342f", "#5f5e57", "#6b675e", "#888888", "#000000", "#34322e", "#4f4f4a", "#888888", "#363430", "#000000", "#333229", "#5d5a5b", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#404041", "#ffffff", "#ffffff", "#888888", "#4c4b4c", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#666764", "#888888", "#888888", "#888888", "#454545", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#414141", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#535451", "#333635", "#000000", "#343736", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3f403b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3d3f34", "#43453b", "#3b3c37", "#353631", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#393527", "#423b2e", "#5d5649", "#888888", "#585549", "#888888"],
-    ["#888888", "#888888", "#888888", "#6e6a5e", "#595549", "#4c453a", "#413c33", "#323127", "#36352c", "#37362d", "#363430", "#2f3224", "#000000", "#000000", "#000000", "#333431", "#000000", "#000000", "#000000", "#323330", "#31322f", "#000000", "#373734", "#3a3a37", "#373734", "#3c3c39", "#434340", "#484845", "#454540", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#41423f", "#333431", "#000000", "#000000", "#000000", "#000000", "#494a45", "#888888", "#888888", "#474845", "#444441", "#444441", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#34342f", "#686760", "#888888", "#888888", "#373531", "#363430", "#888888", "#000000", "#000000", "#616059", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#646464", "#888888", "#545454", "#888888", "#61615c", "#52524d", "#646461", "#54564e", "#5d5f57", "#51524d", "#595a55", "#60605b", "#5c5c57", "#42423d", "#888888", "#888888", "#464646", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4c4d48", "#404040", "#303332", "#000000", "#353837", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#363732", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4e4f4c", "#474845", "#3c3d38", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#38372e", "#4a4940", "#555148", "#67635a", "#888888", "#888888", "#ffffff", "#67665d", "#ffffff"],
-    ["#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#595549", "#534f43", "#666158", "#504f45", "#4c4840", "#3e3d36", "#393735", "#30322a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32322f", "#343431", "#373734", "#3c3c39", "#3f3f3c", "#3e3e3b", "#3a3a35", "#3f3f3a", "#40413e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#666764", "#3c3d38", "#000000", "#000000", "#000000", "#31322f", "#000000", "#4a4a4a", "#888888", "#888888", "#484946", "#45463e", "#494944", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#383833", "#888888", "#888888", "#888888", "#393831", "#5e5d56", "#888888", "#000000", "#42413a", "#888888", "#888888", "#888888", "#5f5e54", "#414037", "#383632", "#4d4e46", "#686863", "#888888", "#888888", "#888888", "#888888", "#888888", "#5e5e5b", "#5b5955", "#383632", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3e3f35", "#48493f", "#46473d", "#404139", "#40423a", "#43453d", "#454641", "#3b3d35", "#000000", "#52524d", "#ffffff", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#ffffff", "#888888", "#000000", "#000000", "#000000", "#3a3b38", "#5b5c59", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#474843", "#323132", "#000000", "#000000", "#363535", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3a3b36", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4e4e4e", "#40413e", "#373737", "#343434", "#31322f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32332b", "#37332b", "#39352d", "#454236", "#534f43", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#ffffff"],
-    ["#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#716962", "#888888", "#888888", "#67615e", "#888888", "#525245", "#3b4034", "#3b3d35", "#373835", "#313132", "#343434", "#000000", "#000000", "#000000", "#000000", "#343431", "#000000", "#353532", "#3c3c39", "#393934", "#383833", "#373734", "#41423f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#565656", "#000000", "#000000", "#000000", "#000000", "#000000", "#333333", "#000000", "#4b4b4c", "#888888", "#888888", "#4b4b46", "#43433e", "#454540", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3c37", "#888888", "#888888", "#888888", "#3c3b34", "#888888", "#888888", "#34332c", "#888888", "#ffffff", "#888888", "#888888", "#6c6b61", "#66655b", "#606159", "#373835", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#000000", "#000000", "#403e3a", "#35312b", "#323329", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#35362e", "#33342c", "#44443f", "#4c4e46", "#35372f", "#000000", "#000000", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#000000", "#000000", "#000000", "#565754", "#888888", "#424340", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4c4d48", "#373636", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32332e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3d3d3d", "#50514e", "#464742", "#32342c", "#3b3d35", "#33342f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322d", "#373931", "#3d3d38", "#4e4a44", "#4d4840", "#6c695d", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888"],
-    ["#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#6a655d", "#888888", "#888888", "#544d42", "#4d463b", "#656058", "#4e4a42", "#333229", "#3d3f37", "#000000", "#000000", "#000000", "#000000", "#333330", "#383936", "#373b37", "#3e3d3d", "#383835", "#393936", "#43433e", "#535350", "#3b3b38", "#000000", "#000000", "#4a4a47", "#51514e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#464649", "#888888", "#888888", "#4a4a45", "#42433b", "#494a40", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#383833", "#888888", "#888888", "#ffffff", "#3e3936", "#888888", "#6e6a64", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#64635c", "#55544d", "#49483f", "#373830", "#363732", "#393934", "#3c3c37", "#63635e", "#888888", "#888888", "#414040", "#343530", "#000000", "#33352d", "#393b33", "#42433e", "#3a3b36", "#41423d", "#464742", "#484946", "#464646", "#3f3f3f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4f4f4f", "#5f605d", "#000000", "#000000", "#4e4f4a", "#888888", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4c4c47", "#393936", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#343530", "#000000", "#000000", "#000000", "#585956", "#4c4d48", "#3d3e39", "#353631", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#33332e", "#3c3734", "#463d3b", "#4d4744", "#5a5151", "#625a55", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#3d3f44", "#000000", "#000000"],
-    ["#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#5b5751", "#888888", "#888888", "#46453e", "#3e3d36", "#383730", "#000000", "#000000", "#000000", "#000000", "#31322f", "#333232", "#3c3c39", "#383835", "#373732", "#34342f", "#3d3d38", "#484843", "#4c4c47", "#4b4b46", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#454548", "#888888", "#888888", "#4e4e49", "#3c3d35", "#48493f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3d3d38", "#888888", "#ffffff", "#ffffff", "#585350", "#888888", "#3d3933", "#000000", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#62615a", "#59554f", "#3e3d36", "#36372f", "#393a30", "#3b3c34", "#42423d", "#52524f", "#353435", "#000000", "#43443f", "#383934", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#484946", "#000000", "#000000", "#545550", "#888888", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#50504b", "#3e3e3b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4c4d48", "#525350", "#42433e", "#000000", "#000000", "#000000", "#30322a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#484843", "#454540", "#464641", "#515049", "#64605a", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#3b3b3b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#373732", "#383835", "#4f4f4c", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#65605d", "#888888", "#888888", "#4b4a43", "#393831", "#3a3630", "#000000", "#000000", "#000000", "#000000", "#323330", "#353532", "#373732", "#3b3b36", "#3c3c37", "#383833", "#32322d", "#393934", "#3f3f3a", "#3a3a35", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#424243", "#888888", "#888888", "#53534e", "#44453d", "#484941", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#43433e", "#888888", "#ffffff", "#ffffff", "#65615b", "#888888", "#35312b", "#000000", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#615c59", "#494841", "#3c3d35", "#33352b", "#3c3d33", "#383931", "#3f3f3a", "#414041", "#403f3f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#33332e", "#393934", "#3d3d38", "#3f3f3a", "#363631", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#43453d", "#000000", "#000000", "#5e5f5a", "#888888", "#ffffff", "#ffffff", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4a4a45", "#40403d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#43443f", "#494a45", "#393a35", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#373737", "#000000", "#000000", "#000000", "#2e322e", "#000000", "#454540", "#888888", "#888888", "#44453d", "#606159", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#3a3b36", "#5f6055", "#5c5e56", "#888888"],
-    ["#40403b", "#4b4b46", "#585853", "#363536", "#353435", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#646058", "#4d4940", "#423e35", "#35342d", "#000000", "#333232", "#000000", "#000000", "#000000", "#34352d", "#383931", "#33332e", "#3c3c37", "#383833", "#3b3b36", "#353530", "#3a3a35", "#393934", "#000000", "#000000", "#000000", "#000000", "#000000", "#464646", "#888888", "#888888", "#575752", "#484941", "#4b4c44", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#41413c", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#464440", "#3e3e3b", "#000000", "#363633", "#373833", "#494946", "#494848", "#3c3b3b", "#41423f", "#393939", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#383934", "#4f4f4a", "#544f4c", "#575551", "#625d5a", "#5d5b57", "#5d5c55", "#54524e", "#413c39", "#000000", "#373737", "#595a55", "#000000", "#40413c", "#000000", "#3d3e39", "#888888", "#888888", "#ffffff", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#393a35", "#3c3c39", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#40423a", "#464742", "#363732", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#4b4c49", "#565656", "#000000", "#000000", "#3a3a3b", "#383934", "#4f504b", "#888888", "#5f5f5a", "#666663", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5d5e59", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#443f3c", "#3e3c38", "#43413d", "#4b4d3d", "#4c4d42", "#000000", "#3b3d42", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#6a6467", "#534e4d", "#443f3c", "#3f3a37", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#34342f", "#363732", "#373833", "#373833", "#373732", "#383833", "#3b3b36", "#383833", "#373732", "#31332b", "#000000", "#3e3f3a", "#888888", "#888888", "#565850", "#3f4038", "#42423d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3f3f3c", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#3d3931", "#000000", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#515047", "#3a3932", "#000000", "#000000", "#000000", "#3f4038", "#3f403d", "#3b3b3b", "#383838", "#3a3a3a", "#363636", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#373835", "#434340", "#5b5b56", "#616059", "#696763", "#888888", "#888888", "#888888", "#888888", "#616057", "#50504b", "#4c4d4a", "#5c5d58", "#000000", "#4a4b46", "#3c3c39", "#3f3f3c", "#60605d", "#ffffff", "#585858", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#373833", "#42423f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#40413c", "#3f403b", "#363732", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#323235", "#5c5c5d", "#424242", "#000000", "#36372f", "#42433b", "#494a40", "#57594b", "#5f5f52", "#67665c", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3d3c3c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#575850", "#000000", "#33342c"],
-    ["#534f49", "#484642", "#45443a", "#555548", "#44433a", "#505149", "#525350", "#545550", "#333431", "#3c3d3a", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#6b685a", "#635f56", "#4c4b42", "#36352c", "#333229", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322d", "#33342f", "#353631", "#393934", "#353530", "#363631", "#383833", "#3a3b36", "#3a3b36", "#000000", "#4d4d4d", "#888888", "#61635b", "#3e3f37", "#41413c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#444038", "#000000", "#000000", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#67665d", "#4d4c43", "#000000", "#313228", "#393b31", "#41413c", "#3b3b3b", "#373737", "#000000", "#313132", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#333431", "#484946", "#5e5f5c", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#4c4d48", "#000000", "#888888", "#565653", "#61615e", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#41413c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#393a35", "#373833", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#565651", "#585853", "#3d3d3a", "#000000", "#000000", "#5d5e56", "#888888", "#666661", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#5c5c5f", "#000000", "#000000", "#000000", "#000000", "#424340", "#383934", "#000000", "#000000", "#000000", "#000000", "#383931", "#000000", "#393a2f", "#46473f", "#888888", "#888888", "#888888", "#888888", "#888888"],
-    ["#888888", "#888888", "#55544b", "#423c3e", "#423c3e", "#3e3d3d", "#383737", "#51514c", "#4e4e49", "#5b5c54", "#000000", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#5c5b52", "#545048", "#414037", "#3e3a32", "#383931", "#32322d", "#000000", "#000000", "#000000", "#000000", "#31322d", "#000000", "#32322d", "#353530", "#373732", "#383833", "#34362e", "#3a3b36", "#3f403d", "#323232", "#000000", "#393b33", "#484941", "#474742", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#ffffff", "#ffffff", "#888888", "#888888", "#64605a", "#000000", "#000000", "#545454", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#6b6a60", "#4e4a42", "#000000", "#000000", "#3c3e36", "#464641", "#4a4b48", "#3e3f3c", "#3b3b3b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3d3a", "#5a5b58", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#000000", "#656661", "#5b5b56", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3f3f3a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322d", "#373833", "#31322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32332e", "#4e4e49", "#50504b", "#36372f", "#000000", "#4a4a3d", "#47473a", "#888888", "#ffffff", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#555556", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#393b33", "#3a3b30", "#45463c", "#4f5046", "#888888", "#585855", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#888888"],
-    ["#ffffff", "#888888", "#888888", "#888888", "#4f4b42", "#4a463d", "#343427", "#44453d", "#363830", "#4a4b43", "#45463e", "#50504b", "#414041", "#4b4b4c", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#656158", "#4b473e", "#45443b", "#393a32", "#34332c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32322d", "#33332e", "#32322d", "#363631", "#373732", "#393934", "#32322f", "#393a37", "#3a3a35", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#000000", "#363633", "#000000", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#68645b", "#504f45", "#34352d", "#34362c", "#40423a", "#5a5b58", "#535350", "#464643", "#40413e", "#363636", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3e3e3b", "#5a5959", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#000000", "#383835", "#888888", "#40413e", "#888888", "#4e4e4e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3b3b36", "#000000", "#000000", "#000000", "#333431", "#363734", "#000000", "#000000", "#30322a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#363732", "#3f4036", "#42423d", "#595a52", "#6b6c62", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#000000", "#000000", "#000000", "#000000", "#373833", "#000000", "#000000", "#000000", "#393934", "#3a3b31", "#47463d", "#4f5046", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#ffffff", "#888888", "#565657", "#5e5e5f", "#5c5c5d", "#5d5c5c"],
-    ["#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#6b675e", "#53524b", "#494944", "#41413c", "#45463e", "#504f4f", "#585855", "#4d4c4c", "#4b4a4a", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#67665d", "#515047", "#4c4b42", "#434239", "#353530", "#000000", "#32332e", "#000000", "#000000", "#000000", "#32322d", "#32322d", "#34342f", "#33332e", "#353530", "#363631", "#373830", "#33342c", "#000000", "#000000", "#34362c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#000000", "#43413d", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#686458", "#4a493f", "#000000", "#373931", "#4d4e49", "#5f605b", "#5b5b56", "#51524a", "#484843", "#3c3d3a", "#343532", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c3c39", "#5e5d5d", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#4d4e4b", "#000000", "#888888", "#4a4c42", "#62635e", "#ffffff", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#373732", "#000000", "#000000", "#000000", "#363734", "#353633", "#383936", "#000000", "#353631", "#3a3b36", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#373734", "#383931", "#464838", "#55564c", "#6d6e63", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#000000", "#000000", "#000000", "#000000", "#36372d", "#32332b", "#000000", "#36372f", "#38392f", "#44443f", "#383931", "#68675e", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#636364", "#59595c", "#5b5b5e", "#494949", "#525252", "#474748", "#464646", "#383936"],
-    ["#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#676561", "#62615a", "#575850", "#4d4c45", "#4b4b4c", "#3f3f3c", "#555550", "#666860", "#4f504b", "#484848", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#6b675f", "#59554d", "#484642", "#42413a", "#3c3d35", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#34352d", "#3b3c34", "#000000", "#3f3f3a", "#000000", "#000000", "#3d3e36", "#30322a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#888888", "#696658", "#000000", "#3f3f32", "#000000", "#000000", "#64645f", "#888888", "#888888", "#888888", "#888888", "#888888", "#565347", "#3d3c33", "#000000", "#575754", "#888888", "#888888", "#666661", "#53534e", "#4d4d4a", "#3d3e3b", "#343532", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3e3e39", "#5c5c57", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#000000", "#888888", "#888888", "#61625a", "#ffffff", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#393a35", "#363732", "#3c3d38", "#000000", "#000000", "#40413e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3e3f35", "#49483e", "#4d4940", "#636356", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#484b57", "#000000", "#353a3b", "#000000", "#000000", "#000000", "#000000", "#323328", "#3c3d33", "#4c4d45", "#888888", "#47483d", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#5e5d60", "#65646a", "#59585e", "#58585b", "#3c3c3c", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#363732"],
-    ["#000000", "#333334", "#5b5e5e", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#615d57", "#54504a", "#474742", "#888888", "#484843", "#42423f", "#595956", "#4f5048", "#393934", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#6b6761", "#5b5653", "#54534c", "#3f3f3a", "#3b3c32", "#303228", "#000000", "#000000", "#000000", "#3b3c34", "#36372f", "#000000", "#3d3e36", "#000000", "#34352d", "#363631", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322d", "#353631", "#42433e", "#2e332a", "#000000", "#ffffff", "#ffffff", "#888888", "#4b4937", "#33311f", "#353729", "#000000", "#000000", "#353532", "#888888", "#888888", "#888888", "#888888", "#48443b", "#3d3c35", "#4d4d48", "#888888", "#888888", "#888888", "#888888", "#5d5e56", "#454542", "#363734", "#31322f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#363631", "#50504b", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#000000", "#64665e", "#888888", "#34302a", "#ffffff", "#888888", "#000000", "#000000", "#000000", "#31322d", "#383934", "#4a4b48", "#585858", "#3d3d3d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#34362e", "#33352d", "#000000", "#40423a", "#000000", "#000000", "#363732", "#000000", "#000000", "#000000", "#000000", "#000000", "#393733", "#434239", "#505043", "#5b5a50", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#000000", "#373737", "#000000", "#000000", "#363734", "#434242", "#34332a", "#434032", "#504d41", "#4f4b42", "#5b574f", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#565656", "#474748", "#4f4f52", "#333238", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#323330", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#505149", "#484944", "#525350", "#43433e", "#3e3e39", "#888888", "#555550", "#575850", "#6a6b63", "#5a5b53", "#53544c", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#5f5b52", "#48443b", "#3c392d", "#39362a", "#5b5b56", "#000000", "#000000", "#4e4f4c", "#000000", "#000000", "#343431", "#888888", "#43443a", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#383737", "#000000", "#000000", "#332e2b", "#504e4a", "#34352d", "#000000", "#888888", "#ffffff", "#ffffff", "#6b6b5e", "#363229", "#3b3633", "#000000", "#000000", "#000000", "#000000", "#4d4c45", "#5b5b58", "#50504d", "#514e50", "#636061", "#888888", "#888888", "#888888", "#666764", "#888888", "#444540", "#3f403b", "#33342f", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#414141", "#565656", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#000000", "#000000", "#69655f", "#403f35", "#888888", "#ffffff", "#59595a", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#888888", "#393934", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#31322d", "#000000", "#000000", "#585855", "#000000", "#000000", "#373931", "#000000", "#33322b", "#403d31", "#40392c", "#535346", "#626456", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#000000", "#000000", "#373830", "#35362c", "#35362e", "#313227", "#000000", "#515047", "#64635a", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#5d5c62", "#4b4b4e", "#444343", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5a5a5a", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#68675e", "#56514e", "#3e3f3a", "#888888", "#000000", "#888888", "#575752", "#53534e", "#888888", "#000000", "#31322f", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#665e57", "#605850", "#423b30", "#66675f", "#000000", "#000000", "#888888", "#000000", "#363633", "#000000", "#343434", "#484845", "#4a4b46", "#43433e", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#565452", "#888888", "#888888", "#000000", "#343431", "#000000", "#ffffff", "#ffffff", "#ffffff", "#3a3826", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#333330", "#393838", "#323132", "#3e3d3d", "#565555", "#888888", "#5d5e5b", "#656663", "#3f403b", "#3a3b36", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#343532", "#000000", "#343532", "#888888", "#888888", "#ffffff", "#ffffff", "#888888", "#000000", "#636459", "#5d5c53", "#888888", "#ffffff", "#888888", "#40413c", "#000000", "#000000", "#000000", "#3a3b36", "#ffffff", "#ffffff", "#504f4f", "#3a3a3b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#32332e", "#000000", "#33352d", "#000000", "#000000", "#474742", "#6b6663", "#000000", "#000000", "#4f5046", "#46453e", "#504c44", "#605c50", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#3b3b3c", "#000000", "#4b4b48", "#000000", "#35342d", "#3d3e36", "#43443a", "#47463c", "#5e5d54", "#63615d", "#888888", "#888888", "#888888", "#888888", "#575758", "#525255", "#535354", "#3d3d3d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#434346", "#888888", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#53544a", "#66675d", "#42423d", "#51514c", "#424142", "#888888", "#4e4e49", "#5a5a57", "#888888", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#524e48", "#4c4b44", "#62635b", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#393934", "#3a3c34", "#3e4038", "#3f433d", "#3c3c37", "#000000", "#000000", "#353633", "#3f403d", "#363734", "#000000", "#40413e", "#000000", "#4a4844", "#383737", "#000000", "#36372f", "#353532", "#000000", "#888888", "#ffffff", "#888888", "#565744", "#000000", "#37362d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#888888", "#000000", "#363734", "#6e7062", "#333527", "#888888", "#ffffff", "#57565c", "#5d5d5e", "#393b31", "#000000", "#000000", "#31322d", "#363732", "#303332", "#414443", "#000000", "#000000", "#444540", "#393a35", "#3d3e39", "#474843", "#3b3b38", "#3a3a37", "#383835", "#393934", "#31322d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#413d37", "#4e4940", "#888888", "#6a665d", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#000000", "#474647", "#000000", "#000000", "#484941", "#332f29", "#413d35", "#66655e", "#888888", "#545451", "#ffffff", "#ffffff", "#666661", "#61625d", "#5b5c57", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#5b5a5d", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#65665c", "#5d5d58", "#666663", "#888888", "#000000", "#888888", "#575752", "#484843", "#888888", "#000000", "#000000", "#000000", "#000000", "#545457", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#6c695d", "#6f6b63", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#33342c", "#34322e", "#363830", "#353631", "#3a3b38", "#363636", "#383838", "#383737", "#31322f", "#333431", "#373a39", "#31322f", "#3b3c39", "#000000", "#313132", "#000000", "#373830", "#000000", "#3c3b3b", "#000000", "#666160", "#ffffff", "#ffffff", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3b3c37", "#000000", "#000000", "#414141", "#5f5f5c", "#000000", "#888888", "#ffffff", "#888888", "#888888", "#2d2c32", "#3c3e36", "#000000", "#3c3e36", "#34362e", "#44463e", "#50544e", "#444842", "#3e423c", "#31322f", "#000000", "#000000", "#000000", "#45463e", "#373734", "#3f3f3c", "#333431", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#544f49", "#888888", "#736962", "#6e645a", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#353633", "#000000", "#484a40", "#000000", "#40403b", "#3d3d38", "#000000", "#5a5552", "#66625c", "#5e5a54", "#888888", "#ffffff", "#888888", "#525255", "#4c4c4d", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#515056", "#888888", "#888888", "#ffffff", "#888888", "#635f57", "#888888", "#5f5e57", "#534e4b", "#656560", "#474742", "#888888", "#3a3b36", "#888888", "#5b5c57", "#000000", "#000000", "#000000", "#000000", "#000000", "#525252", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#34352b", "#888888", "#ffffff", "#888888", "#888888", "#50473b", "#3d3931", "#383833", "#000000", "#000000", "#000000", "#000000", "#333330", "#3d3e36", "#454540", "#44443f", "#40413c", "#40413c", "#41423f", "#373738", "#353a31", "#323330", "#000000", "#313033", "#000000", "#000000", "#000000", "#888888", "#66655e", "#ffffff", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#30322a", "#000000", "#000000", "#000000", "#4b4c49", "#333431", "#000000", "#ffffff", "#888888", "#888888", "#373833", "#303228", "#43453a", "#32332e", "#464646", "#4a4a4a", "#4e4e4e", "#5f5f5f", "#4a4a4a", "#494949", "#404040", "#3b3b3b", "#3c3c37", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#363629", "#4c493b", "#4c4d3a", "#888888", "#888888", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#3b3a3d", "#000000", "#41413c", "#42443c", "#373835", "#000000", "#000000", "#42413a", "#888888", "#69685f", "#888888", "#ffffff", "#888888", "#55545d", "#5e5d65", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3f3f40", "#888888", "#ffffff", "#ffffff", "#888888", "#888888", "#4b4a43", "#888888", "#5c5c57", "#888888", "#000000", "#666762", "#43443f", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#373737", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#ffffff", "#ffffff", "#888888", "#32342c", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#888888", "#625a52", "#3d3b29", "#000000", "#363636", "#313132", "#383c38", "#393d37", "#3d3e39", "#40413c", "#45473f", "#40423a", "#3a3b38", "#3e3e3e", "#3a3c34", "#373833", "#363633", "#333232", "#000000", "#000000", "#3b3b36", "#000000", "#888888", "#575455", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#343530", "#484848", "#3c3d3a", "#000000", "#888888", "#888888", "#ffffff", "#888888", "#31322d", "#484a42", "#55574f", "#454643", "#494949", "#555555", "#888888", "#888888", "#666764", "#5b5c59", "#444542", "#323330", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3c392b", "#373323", "#5e574a", "#716d61", "#888888", "#ffffff", "#ffffff", "#ffffff", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#888888", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#888888", "#888888", "#626360", "#595954", "#353532", "#000000", "#4f4f4a", "#000000", "#393a32", "#353532", "#5a5a55", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#5f5e5e", "#404043", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#525157", "#888888", "#ffffff", "#ffffff", "#ffffff", "#504f46", "#888888", "#888888", "#3d3d38", "#4a4b46", "#62635e", "#585954", "#5a5b53", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#636363", "#888888", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#ffffff", "#888888", "#4c4b42", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#5a5344", "#42403c", "#434242", "#454643", "#454540", "#41423d", "#42433e", "#3b3d35", "#35372f", "#31322d", "#393a37", "#44453a", "#3d3e34", "#414037", "#47433a", "#3f3b35", "#3f3b35", "#000000", "#000000", "#000000", "#000000", "#888888", "#6a6962", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#3e4038", "#3f403b", "#000000", "#000000", "#000000", "#000000", "#686a62", "#888888", "#000000", "#414037", "#888888", "#ffffff", "#39393a", "#434343", "#4d4e4b", "#545552", "#565754", "#565754", "#4e4f4a", "#4a4b46", "#40413c", "#33342f", "#322e26", "#000000", "#000000", "#000000", "#000000", "#000000", "#5c5850", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#3e3e41", "#000000", "#000000", "#000000", "#36372d", "#ffffff", "#888888", "#888888", "#888888", "#888888", "#595959", "#525252", "#464744", "#393a37", "#3e3e39", "#000000", "#46473f", "#3f3f3a", "#393733", "#59584f", "#000000", "#5d5b57", "#888888", "#888888", "#ffffff", "#888888", "#434344", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-    ["#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#888888", "#888888", "#ffffff", "#888888", "#ffffff", "#595a52", "#404139", "#888888", "#000000", "#888888", "#888888", "#45463c", "#5a5c54", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#555555", "#888888", "#888888", "#888888", "#888888", "#888888", "#ffffff", "#888888", "#48473e", "#000000", "#000000", "#343334", "#888888", "#888888", "#ffffff", "#ffffff", "#ffffff", "#ffffff", "#888888", "#3c3d35", "#474840", "#4a4a45", "#51514c", "#53534e", "#5b5b56", "#55564c", "#46473f", "#3b3d35", "#454641", "#505244", "#5b5c51", "#656158", "#6d6a5e", "#635f59", "#54504a", "#3f3b35", "#000000", "#000000", "#000000", "#000000", "#5e5d54", "#343532", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#35372f", "#43453d", "#000000", "#000000", "#000000", "#000000", "#000000", "#343530", "#676961", "#000000", "#373533", "#615d54", "#ffffff", "#ffffff", "#47474a", "#4e4e4e", "#585956", "#888888", "#888888", "#61625f", "#575853", "#4d4e49", "#464742", "#424640", "#4d4941", "#45443d", "#000000", "#000000", "#000000", "#000000", "#888888", "#ffffff", "#ffffff", "#ffffff", "#888888", "#605a57", "#2c3132", "#000000", "#000000", "#000000", "#31332b", "#35362c", "#888888", "#888888", "#5b5b56", "#53544f", "#51514e", "#494949", "#3b3b3c", "#000000", "#000000", "#3b3b36", "#4c4c47", "#34342f", "#4a4b43", "#44433c", "#000000", "#888888", "#686760", "#888888", "#888888", "#888888", "#888888", "#888888", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000", "#000000"],
-]
@@ -0,0 +1,142 @@
+"""
+Código para a interface de edição da política de limpeza de uma pasta utilizando customtkinter.
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias para o funcionamento da interface
+#   Biblitecas externas:
+#       tkinter: para a criação da interface gráfica
+#       customtkinter: para a criação da interface gráfica
+#       datetime: para validar os horários da janela de execução
+#       CTkMessagebox: para exibir caixas de mensagem personalizadas
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação dos módulos criados para o APP:
+#       manipulador: para manipulação de arquivos e pastas
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import tkinter
+import customtkinter as ctk
+from datetime import datetime
+from CTkMessagebox import CTkMessagebox
+from app.adm_files.manipulator import manipulador
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe que gera a interface de edição da política de limpeza de uma pasta
+#   Herda de CTkToplevel para criar uma janela separada
+#   Métodos principais da classe:
+#       __init__: construtor da classe que inicializa a interface e preenche os campos com a política atual
+#       _add_field: cria uma linha com o texto e o campo de entrada
+#       save_policy: valida os campos e devolve a política para a janela de configurações
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class Inter_CleanerPolicy(ctk.CTkToplevel):
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Construtor da classe
+#   Parâmetros:
+#       master: janela de configurações
+#       folder: caminho da pasta
+#       policy: política atual da pasta (dicionário completo)
+#       on_save: função chamada com a nova política quando o usuário salvar
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def __init__(self, master, folder, policy, on_save):
+        super().__init__(master)
+        self.folder = folder
+        self.policy = policy
+        self.on_save = on_save
+        self.bg_color = "#333333"
+
+        self.title(f"Cleaner Policy - {folder}")
+        self.wm_iconbitmap(manipulador().icon_terminator)
+        self.resizable(False, False)
+        width = 450
+        height = 460
+        screen_width = self.winfo_screenwidth()
+        screen_height = self.winfo_screenheight()
+        x = (screen_width // 2) - (width // 2)
+        y = (screen_height // 2) - (height // 2)
+        self.geometry(f"{width}x{height}+{x}+{y}")
+
+        self.main_container = ctk.CTkFrame(self, corner_radius=10, fg_color=self.bg_color)
+        self.main_container.pack(fill=tkinter.BOTH, expand=True, padx=10, pady=10)
+
+        # Campos da política
+        self.entry_days = self._add_field(0, "Age (days)", policy["days"])
+        self.label_time_field = ctk.CTkLabel(self.main_container, text="Age based on")
+        self.label_time_field.grid(row=1, column=0, padx=10, pady=5, sticky="w")
+        self.combo_time_field = ctk.CTkComboBox(self.main_container, values=["ctime", "mtime"], width=200, state="readonly")
+        self.combo_time_field.set(policy["time_field"])
+        self.combo_time_field.grid(row=1, column=1, padx=10, pady=5, sticky="w")
+        self.entry_include = self._add_field(2, "Include (globs, ';')", ";".join(policy["include"]))
+        self.entry_exclude = self._add_field(3, "Exclude (globs, ';')", ";".join(policy["exclude"]))
+        self.entry_depth = self._add_field(4, "Subfolder depth", policy["depth"])
+        self.entry_window_start = self._add_field(5, "Window start (HH:MM)", policy["window_start"])
+        self.entry_window_end = self._add_field(6, "Window end (HH:MM)", policy["window_end"])
+        self.entry_rate = self._add_field(7, "Max items/second (0 = no limit)", policy["max_items_per_second"])
+        self.entry_quota = self._add_field(8, "Size quota GB (0 = no quota)", policy.get("max_size_gb", 0))
+
+        self.button_save = ctk.CTkButton(self.main_container, text="Save", fg_color="#089c4c", command=self.save_policy)
+        self.button_save.grid(row=9, column=0, columnspan=2, pady=15)
+
+        # Traz a janela para frente e bloqueia interação com a janela de configurações
+        self.grab_set()
+        self.focus_force()
+        self.lift()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que cria uma linha com o texto e o campo de entrada preenchido
+#   Parâmetros:
+#       row: linha do grid
+#       text: texto exibido ao lado do campo
+#       value: valor atual do campo
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _add_field(self, row, text, value):
+        label = ctk.CTkLabel(self.main_container, text=text)
+        label.grid(row=row, column=0, padx=10, pady=5, sticky="w")
+        entry = ctk.CTkEntry(self.main_container, width=200)
+        entry.grid(row=row, column=1, padx=10, pady=5, sticky="w")
+        entry.insert(0, str(value))
+        return entry
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que valida os campos e devolve a nova política para a janela de configurações
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def save_policy(self):
+        try:
+            days = float(self.entry_days.get())
+            depth = int(self.entry_depth.get())
+            rate = int(self.entry_rate.get() or 0)
+            quota = float(self.entry_quota.get() or 0)
+            if days < 0 or depth < 0 or rate < 0 or quota < 0:
+                raise ValueError
+        except ValueError:
+            CTkMessagebox(title="Error", message="Age, depth, max items/second and quota must be positive numbers!", icon="warning", button_color="#089c4c", justify="center")
+            return
+
+        window_start = self.entry_window_start.get().strip()
+        window_end = self.entry_window_end.get().strip()
+        # A janela precisa ter início e fim (ou nenhum dos dois)
+        try:
+            if bool(window_start) != bool(window_end):
+                raise ValueError
+            for hour in (window_start, window_end):
+                if hour:
+                    datetime.strptime(hour, "%H:%M")
+        except ValueError:
+            CTkMessagebox(title="Error", message="Fill in the window start and end in the format HH:MM (or leave both empty)!", icon="warning", button_color="#089c4c", justify="center")
+            return
+
+        include = [pattern.strip() for pattern in self.entry_include.get().split(";") if pattern.strip()]
+        exclude = [pattern.strip() for pattern in self.entry_exclude.get().split(";") if pattern.strip()]
+
+        self.on_save({
+            "days": int(days) if days.is_integer() else days,
+            "time_field": self.combo_time_field.get(),
+            "include": include or ["*"],
+            "exclude": exclude,
+            "depth": depth,
+            "window_start": window_start,
+            "window_end": window_end,
+            "max_items_per_second": rate,
+            "max_size_gb": int(quota) if quota.is_integer() else quota,
+        })
+        self.destroy()
@@ -27,6 +27,10 @@ ctk.set_default_color_theme("green")  # ou qualquer outro tema
 #   Métodos principais da classe:
 #       __init__: construtor da classe que inicializa a interface e seus componentes
 #       _load_txt: lê os dados do arquivo .txt criado para armazenar os logs
+#       _append_new_lines: acrescenta no texto somente as linhas gravadas no log depois da última leitura
+#       _build_search_bar: cria a barra de busca (somente quando existe um índice do log)
+#       search: busca os registros no índice com os filtros preenchidos
+#       jump_to: rola o texto até o resultado selecionado e destaca o registro
 #       _on_close: define o como e o que fazer quando a janela for fechada
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 class TextViewerApp(ctk.CTkToplevel):
@@ -35,20 +39,26 @@ class TextViewerApp(ctk.CTkToplevel):
 #   Parâmetros:
 #       program_path (str): Caminho do arquivo de log a ser exibido
 #       program_name (str): Nome do programa relacionado ao log
+#       log_index (LogsIndexDB): índice de busca do log (opcional). Quando informado, exibe a barra de busca
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-    def __init__(self, program_path, program_name):
+    def __init__(self, program_path, program_name, log_index=None):
         super().__init__()
         # Armazena os parâmetros recebidos
         self.program_path = program_path
         self.program_name = program_name
+        self.log_index = log_index
+        self.results = []
+        self.result_position = -1
+        # Bytes do log já exibidos no texto (até a última quebra de linha lida)
+        self.loaded_offset = 0
         self.bg_color = "#000811"  # Cor de fundo padrão
         self.configure(bg=self.bg_color)  # Aplica cor de fundo
         # Acresenta o ícone ao app
         self.wm_iconbitmap(default=manipulador().icon_terminator)
         # Configura título e dimensões da janela
         self.title(f"Allocation Log - {self.program_name}")
-        width = 600
-        height = 400
+        width = 900 if self.log_index else 600
+        height = 550 if self.log_index else 400
         screen_width = self.winfo_screenwidth()
         screen_height = self.winfo_screenheight()
         x = (screen_width // 2) - (width // 2)
@@ -58,6 +68,12 @@ class TextViewerApp(ctk.CTkToplevel):
         # Cria o frame container principal com cor de fundo
         self.container_frame = ctk.CTkFrame(self, fg_color=self.bg_color, bg_color=self.bg_color)
         self.container_frame.pack(fill=tkinter.BOTH, expand=True)
+
+        # Cria a barra de busca acima do texto, se existir índice para o log
+        if self.log_index:
+            self._build_search_bar()
+            # Atualiza o índice em segundo plano com os registros novos
+            self.log_index.start_background_update()
         
         # Cria o frame do texto com padding interno
         self.text_frame = ctk.CTkFrame(self.container_frame, fg_color=self.bg_color, bg_color=self.bg_color)
@@ -72,6 +88,8 @@ class TextViewerApp(ctk.CTkToplevel):
             relief="flat",        # Remove bordas visuais
         )
         self.textbox.pack(side=tkinter.LEFT, fill=tkinter.BOTH, expand=True)
+        # Destaque do registro encontrado na busca
+        self.textbox.tag_configure("search_match", background="#089c4c")
 
         # Adiciona uma barra de rolagem vertical ao widget de texto
         self.scrollbar = tkinter.Scrollbar(self.text_frame, command=self.textbox.yview)
@@ -104,14 +122,128 @@ class TextViewerApp(ctk.CTkToplevel):
             )
             return
 
-        # Lê o conteúdo do arquivo e insere no widget de texto
-        with open(self.program_path, "r", encoding="utf-8") as file:
-            content = file.read()
-
         self.textbox.delete("1.0", tkinter.END)      # Limpa o conteúdo anterior
-        self.textbox.insert(tkinter.END, content)     # Insere o novo conteúdo
+        self.loaded_offset = 0
+        self._append_new_lines()                      # Insere o conteúdo do arquivo
         self.textbox.see(tkinter.END)                 # Rola até o final do texto
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que acrescenta no widget de texto somente o que foi gravado no log depois da última leitura
+#   Lê a partir do offset já exibido até a última quebra de linha (uma linha ainda sendo escrita fica para a próxima leitura)
+#   Se o arquivo diminuir (truncado ou substituído), o texto é recarregado do início
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _append_new_lines(self):
+        if not os.path.exists(self.program_path):
+            return
+        size = os.path.getsize(self.program_path)
+        if size < self.loaded_offset:
+            self._load_txt()
+            return
+        if size == self.loaded_offset:
+            return
+
+        with open(self.program_path, "rb") as file:
+            file.seek(self.loaded_offset)
+            data = file.read(size - self.loaded_offset)
+        data = data[:data.rfind(b"\n") + 1]
+        if not data:
+            return
+        self.loaded_offset += len(data)
+        # "end-1c": antes da quebra de linha que o widget sempre mantém no final
+        self.textbox.insert("end-1c", data.decode("utf-8", errors="replace").replace("\r\n", "\n"))
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que cria a barra de busca com os filtros de texto, programa, status e intervalo de datas
+#   Também cria os botões para navegar entre os resultados encontrados
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _build_search_bar(self):
+        self.search_frame = ctk.CTkFrame(self.container_frame, fg_color=self.bg_color, bg_color=self.bg_color)
+        self.search_frame.pack(fill=tkinter.X, padx=10, pady=(10, 0))
+
+        # Texto livre procurado no registro (saída do programa, caminho, tipo...)
+        self.entry_search = ctk.CTkEntry(self.search_frame, width=200, placeholder_text="Search text")
+        self.entry_search.grid(row=0, column=0, padx=5, pady=5)
+        self.entry_search.bind("<Return>", lambda event: self.search())
+        # ID ou nome do programa
+        self.entry_program = ctk.CTkEntry(self.search_frame, width=120, placeholder_text="Program ID/Name")
+        self.entry_program.grid(row=0, column=1, padx=5, pady=5)
+        self.entry_program.bind("<Return>", lambda event: self.search())
+        # Status da execução
+        self.combo_status = ctk.CTkComboBox(self.search_frame, values=["All", "Success", "Error", "Canceled"], width=100, state="readonly")
+        self.combo_status.set("All")
+        self.combo_status.grid(row=0, column=2, padx=5, pady=5)
+        # Intervalo de datas (dd/mm/YYYY)
+        self.entry_date_from = ctk.CTkEntry(self.search_frame, width=110, placeholder_text="From dd/mm/yyyy")
+        self.entry_date_from.grid(row=0, column=3, padx=5, pady=5)
+        self.entry_date_to = ctk.CTkEntry(self.search_frame, width=110, placeholder_text="To dd/mm/yyyy")
+        self.entry_date_to.grid(row=0, column=4, padx=5, pady=5)
+
+        self.bt_search = ctk.CTkButton(self.search_frame, text="Search", fg_color="#089c4c", width=70, command=self.search)
+        self.bt_search.grid(row=0, column=5, padx=5, pady=5)
+        # Os resultados vêm do mais recente para o mais antigo
+        self.bt_older = ctk.CTkButton(self.search_frame, text="<", fg_color="#089c4c", width=30, command=lambda: self.jump_to(self.result_position + 1))
+        self.bt_older.grid(row=0, column=6, padx=2, pady=5)
+        self.bt_newer = ctk.CTkButton(self.search_frame, text=">", fg_color="#089c4c", width=30, command=lambda: self.jump_to(self.result_position - 1))
+        self.bt_newer.grid(row=0, column=7, padx=2, pady=5)
+
+        self.label_results = ctk.CTkLabel(self.search_frame, text="")
+        self.label_results.grid(row=1, column=0, columnspan=8, padx=5, sticky="w")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que busca os registros no índice com os filtros preenchidos pelo usuário
+#   A busca usa somente o que já está indexado (sem esperar o índice); a atualização incremental continua em segundo plano
+#   A janela pula para o resultado mais recente
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def search(self):
+        status = self.combo_status.get()
+        try:
+            self.results = self.log_index.search(
+                text=self.entry_search.get(),
+                program=self.entry_program.get(),
+                status="" if status == "All" else status,
+                date_from=self.entry_date_from.get().strip(),
+                date_to=self.entry_date_to.get().strip()
+            )
+        except ValueError:
+            CTkMessagebox(title="Error", message="Invalid date. Use the format dd/mm/yyyy.", icon="warning", button_color="#089c4c")
+            return
+        except Exception as e:
+            CTkMessagebox(title="Error", message=f"It was not possible to search the log.\nCheck the error:\n{e}", icon="warning", button_color="#089c4c")
+            return
+
+        # Indexa em segundo plano os registros gravados depois da última atualização (aparecem na próxima busca)
+        self.log_index.start_background_update()
+        # Acrescenta no texto as linhas novas do log, para que as linhas encontradas no índice existam no widget
+        self._append_new_lines()
+        self.textbox.tag_remove("search_match", "1.0", tkinter.END)
+        if not self.results:
+            self.result_position = -1
+            self.label_results.configure(text="No records found.")
+            return
+        self.jump_to(0)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que rola o texto até o resultado escolhido e destaca o registro inteiro
+#   Parâmetros:
+#       position: posição do resultado na lista de resultados da busca
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def jump_to(self, position):
+        if not self.results or not (0 <= position < len(self.results)):
+            return
+        self.result_position = position
+        result = self.results[position]
+        # Limites do registro: da linha de traços inicial até a próxima linha de traços
+        start = f"{result['line']}.0"
+        end = self.textbox.search("-" * 20, f"{result['line'] + 1}.0", stopindex=tkinter.END) or tkinter.END
+        self.textbox.tag_remove("search_match", "1.0", tkinter.END)
+        self.textbox.tag_add("search_match", start, f"{end} lineend")
+        self.textbox.see(start)
+        self.label_results.configure(
+            text=f"{position + 1} of {len(self.results)} - {result['program_name']} - {result['status']} - {result['finish']}"
+        )
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método chamado ao fechar a janela. Destroi a janela de log.
 #   Parâmetros:
 #       Nenhum
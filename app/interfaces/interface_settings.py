@@ -17,7 +17,10 @@ Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
 #   Importação dos módulos criados para o APP:
 #       manipulador: para manipulação de arquivos e pastas
 #       TextViewerApp: para visualizar arquivos de log
+#       Inter_CleanerPolicy: para editar a política de limpeza de uma pasta
 #       GenericDBOperations, SettingsDB: para operações de banco de dados
+#       SettingsCache: para invalidar o cache das configurações depois de gravar
+#       ExecutableCache: para invalidar os caminhos resolvidos dos executáveis (Tableau Prep) depois de gravar
 #       Hash: para hash e verificação de senhas
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#       
 import tkinter
@@ -27,7 +30,10 @@ from datetime import datetime
 from CTkMessagebox import CTkMessagebox
 from app.adm_files.manipulator import manipulador, os
 from app.interfaces.interface_log import TextViewerApp
+from app.interfaces.interface_cleaner_policy import Inter_CleanerPolicy
 from app.database.settingsDB import SettingsDB
+from app.database.settingsCache import SettingsCache
+from app.executer.executable_cache import ExecutableCache
 from app.database.operationDBs import GenericDBOperations
 from app.security.password_hash import Hash
 
@@ -44,11 +50,13 @@ ctk.set_default_color_theme("green")
 #   Métodos principais da classe:
 #       __init__: construtor da classe que inicializa a interface e seus componentes
 #       open_log: método chamado por um botão para abrir o log do settings
+#       dry_run_cleaner: método chamado por um botão que simula a limpeza das pastas da lista (sem apagar nada) e abre o relatório
 #       on_closing: define como e o que fazer quando a janela for fechada
 #       select_path: método chamado por um botão para o usuário selecionar o caminho de um arquivo
 #       select_folder: método chamado por um botão para o usuário selecionar o caminho de uma pasta
 #       add_folder: método para adicionar o caminho da pasta selecionada pelo usuário na lista de exclusão de arquivos
 #       remove_folder: método para remover o caminho da pasta selecionada pelo usuário na lista de exclusçao de aquivos
+#       edit_policy: método chamado por um botão para editar a política de limpeza da pasta selecionada
 #       change_visibility: método chamado por um botão que altera a visibilidade da senha
 #       register_data: método que registra os dados inputados pelo usuário no banco de dados, tabela SettingsDB
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
@@ -152,10 +160,16 @@ class Inter_Settings(ctk.CTkToplevel):
         self.bt_remove_folder = ctk.CTkButton(self.buttons_frame, text="-", fg_color="#089c4c", command=self.remove_folder, width=30, height=30, font=("Arial", 20, "bold"))
         self.bt_remove_folder.grid(row=1, column=0, padx=5, pady=5)
 
+        # Botão para editar a política de limpeza da pasta selecionada
+        self.bt_policy_folder = ctk.CTkButton(self.buttons_frame, text="Policy", fg_color="#089c4c", command=self.edit_policy, width=30, height=30)
+        self.bt_policy_folder.grid(row=2, column=0, padx=5, pady=5)
+
         # Listbox com largura ajustada
         self.folders_listbox = tkinter.Listbox(self.list_box_frame, width=57, height=5, bg=self.bg_color, fg="white", font=("Arial", 9, "bold"), justify="left", selectbackground="#089c4c")
         self.folders_listbox.grid(row=0, column=0, padx=10, pady=5, sticky="w")
         self.folders_list = []
+        # Políticas de limpeza gravadas para cada pasta
+        self.policies = self.main_app.folder_cleaner.load_policies()
 
         self.bnt_register_container = ctk.CTkFrame(self.main_container, corner_radius=10, fg_color=self.bg_color)
         self.bnt_register_container.grid(row=2, column=0, sticky="n")
@@ -168,6 +182,14 @@ class Inter_Settings(ctk.CTkToplevel):
         self.button_log_settings = ctk.CTkButton(self.bnt_register_container, text="History",  fg_color="#089c4c", command=lambda: self.open_log(self.manipulador.settings_txt, "Settings"))
         self.button_log_settings.grid(row=6, column=1, pady=5, sticky="w")
 
+        # Define o botão que simula a limpeza das pastas da lista (nada é apagado)
+        self.button_dry_run = ctk.CTkButton(self.bnt_register_container, text="Dry Run Cleaner", fg_color="#089c4c", command=self.dry_run_cleaner)
+        self.button_dry_run.grid(row=5, column=2, padx=(10, 0), pady=5, sticky="w")
+
+        # Define o botão para abrir os relatórios das passadas do limpador de pastas
+        self.button_log_cleaner = ctk.CTkButton(self.bnt_register_container, text="Cleaner Report", fg_color="#089c4c", command=lambda: self.open_log(self.manipulador.cleaner_txt, "Folder Cleaner"))
+        self.button_log_cleaner.grid(row=6, column=2, padx=(10, 0), pady=5, sticky="w")
+
         # Se os dados já estiverem preenchidos
         if self.settings_data:
             self.entry_tableau_bat.insert(0, self.settings_data["tableau_bat"])
@@ -190,12 +212,40 @@ class Inter_Settings(ctk.CTkToplevel):
                 button_color="#089c4c",
                 justify="center"
             )
-            self.folder_cleaner.stop()
             return
 
         # Abre a janela de log 
         TextViewerApp(path_log, name_log)
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que simula a limpeza das pastas que estão na lista (dry run)
+#   Nada é apagado: apenas é gerado o relatório com o que seria apagado, que é aberto ao terminar
+#   A passada roda no loop assíncrono do APP principal, sem travar a interface
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def dry_run_cleaner(self):
+        if not self.folders_list:
+            CTkMessagebox(title="Error", message="Add at least one folder to the list!", icon="warning", button_color="#089c4c", justify="center")
+            return
+
+        self.button_dry_run.configure(state="disabled", text="Running...")
+        task = self.main_app.loop.create_task(self.main_app.folder_cleaner.run_pass(list(self.folders_list), dry_run=True, policies=dict(self.policies)))
+
+        # Ao terminar, reabilita o botão e abre o relatório
+        def on_done(finished_task):
+            if finished_task.cancelled():
+                return
+            error = finished_task.exception()
+            def show():
+                if self.winfo_exists():
+                    self.button_dry_run.configure(state="normal", text="Dry Run Cleaner")
+                if error:
+                    CTkMessagebox(title="Error", message=f"It was not possible to run the cleaner.\nCheck the error:\n{error}", icon="warning", button_color="#089c4c", justify="center")
+                else:
+                    self.open_log(self.manipulador.cleaner_txt, "Folder Cleaner")
+            self.main_app.after(0, show)
+        task.add_done_callback(on_done)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método que define o que fazer e como fazer quando o usuário desejar fechar a janela repentinamente 
 #   Parâmetros:
 #       Nenhum
@@ -204,7 +254,7 @@ class Inter_Settings(ctk.CTkToplevel):
         # Pergunta para o usuário se ele deseja realmente fechar a janela 
         result = CTkMessagebox(title="Confirmation", message="Do you really want to close the window?", icon="question", option_1="Yes", option_2="No", button_color="#089c4c", justify="center").get()
         if result == "Yes":
-            if self.settingsdb.get_all() == []:
+            if not self.settingsdb.exists():
                 cancel_inicialization = CTkMessagebox(title="Confirmation", message="The program cannot be started without the settings. Do you really want to cancel the program's initialization? (You will lose all previously entered data)", icon="question", option_1="Yes", option_2="No", button_color="#089c4c", justify="center").get()
                 if cancel_inicialization == "Yes":
                     self.main_app.destroy()
@@ -261,8 +311,28 @@ class Inter_Settings(ctk.CTkToplevel):
         if selected_folder:
             index = selected_folder[0]
             self.folders_listbox.delete(index)
+            self.policies.pop(self.folders_list[index], None)
             del self.folders_list[index]
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método para editar a política de limpeza da pasta selecionada pelo usuário
+#   A política só é gravada quando o usuário salvar as configurações
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def edit_policy(self):
+        selected_folder = self.folders_listbox.curselection()
+        if not selected_folder:
+            CTkMessagebox(title="Error", message="Select a folder in the list!", icon="warning", button_color="#089c4c", justify="center")
+            return
+
+        folder = self.folders_list[selected_folder[0]]
+
+        # Guarda a política editada para a pasta
+        def on_save(policy):
+            self.policies[folder] = policy
+
+        Inter_CleanerPolicy(self, folder, self.main_app.folder_cleaner.get_policy(folder, self.policies), on_save)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método para alterar a visibilidade da string password quando selecionada
 #   Altera a visualização de "*" para caracteres normais e vice-versa
 #   Parâmetros:
@@ -305,8 +375,18 @@ class Inter_Settings(ctk.CTkToplevel):
             "paths_delete": ",".join(self.folders_list)
         }
 
+        # Grava as políticas de limpeza somente das pastas que estão na lista
+        try:
+            self.main_app.folder_cleaner.save_policies({folder: policy for folder, policy in self.policies.items() if folder in self.folders_list})
+        except Exception as e:
+            CTkMessagebox(title="Error", message=f"It was not possible to save the cleaner policies.\nCheck the error:\n{e}", icon="warning", button_color="#089c4c", justify="center")
+            return
+
         if hasattr(self, "settings_data") and self.settings_data:
             self.settingsdb.update(self.settings_data["id"], **settings_data)
+            # O registro mudou: a próxima leitura das configurações vem do banco
+            SettingsCache.invalidate()
+            ExecutableCache.invalidate()
 
             content = f"-------------------------------------------------------------------------------------------------------------------\nSettings Updated {datetime.now().strftime("%d/%m/%Y - %H:%M:%S")}.\nTableau Bat: {tableau_bat}.\nPaths to delete: {self.folders_list}.\n-------------------------------------------------------------------------------------------------------------------\n"
             self.manipulador.write_txt(self.manipulador.settings_txt, content)
@@ -321,6 +401,8 @@ class Inter_Settings(ctk.CTkToplevel):
         
         else:
             self.settingsdb.register(**settings_data)
+            SettingsCache.invalidate()
+            ExecutableCache.invalidate()
             content = f"-------------------------------------------------------------------------------------------------------------------\nSettings Registered {datetime.now().strftime("%d/%m/%Y - %H:%M:%S")}.\nTableau Bat: {tableau_bat}.\nPaths to delete: {self.folders_list}.\n-------------------------------------------------------------------------------------------------------------------\n"
             self.manipulador.write_txt(self.manipulador.settings_txt, content)
             
@@ -19,14 +19,28 @@ Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
 #       os: para manipulação de arquivos e pastas
 #       tkinter.ttk: para widgets avançados do tkinter
 #       Image: para manipulação de imagens 
-#       openpyxl: para manipulação de dados de planilhas excel
 #       filedialog: para exibição de diálogos de seleção de arquivos
+#       openpyxl: para manipulação de dados de planilhas excel (importado sob demanda, no import_schedule)
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Importação dos módulos criados para o APP:
 #       manipulador: para manipulação de arquivos e pastas
-#       Create_Excel: para criação do template de schedule com os dados de horário do banco
+#       StartupTimer: para medir o tempo de abertura do APP
 #       PasswordDialog: para exibir uma janela de diálogo para confirmação de senha
-#       Hash: para hash e verificação de senhas
+#       PixelArtIcon: para criar o ícone da janela (somente se o ícone não existir ou estiver desatualizado)
+#   Importados depois do primeiro frame (no _deferred_start e no start_scheduler, para a janela principal abrir mais rápido):
+#       GenericDBOperations, UsersDB, ProgramsDB, SettingsDB: para operações de banco de dados
+#       LogsIndexDB: para o índice de busca do histórico de execuções
+#       ProgramCatalog: para ler os programas já decodificados sem consultar a tabela inteira a cada tela
+#       Runner: para executar tarefas assíncronas (com ele, o pool de processos Python e o despachante dos agentes)
+#       read_schedule: para ler o cronograma de execuções
+#       FolderCleaner: para limpar pastas temporárias
+#       ControlServer: canal de controle local (comandos da linha de comando e de uma segunda abertura do APP)
+#       JobQueueDB: fila durável de execuções (agendadas, manuais e da linha de comando)
+#       JobExecutor: para executar os pedidos da fila com o Runner
+#   Importados sob demanda (somente no primeiro uso, para a janela principal abrir mais rápido):
+#       Hash: para hash e verificação de senhas (somente nas telas que pedem senha)
+#       Stream_Excel: para criação do template de schedule e do histórico de execuções
+#       ProgramSchedules: para gravar os schedules importados em uma única transação
 #       Window_UserSelector: para selecionar um usário que irá manipular o schedule
 #       Window_Selector: para selecionar diferentes janelas de interface
 #       Inter_Register_APP: para registrar novos aplicativos
@@ -34,35 +48,24 @@ Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
 #       Inter_Settings: para ajustar configurações do aplicativo
 #       Inter_register_users: para registrar novos usuários
 #       TextViewerApp: para visualizar arquivos de log
-#       GenericDBOperations, UsersDB, ProgramsDB, SettingsDB: para operações de banco de dados
-#       Runner: para executar tarefas assíncronas
-#       read_schedule: para ler o cronograma de execuções
-#       FolderCleaner: para limpar pastas temporárias
-#       PixelArtIcon: para criar o ícone da janela
+#   Importados na abertura:
+#       SettingsCache: para ler as configurações sem consultar o banco a cada verificação de senha
+#       ExecutableCache: para descartar os caminhos resolvidos dos executáveis no comando "reload"
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 import ctypes
+import asyncio
 import tkinter.ttk
+from tkinter import filedialog
+from datetime import datetime
 import customtkinter as ctk
+from PIL import Image
 from CTkMessagebox import CTkMessagebox
 from app.adm_files.manipulator import manipulador, Path, os
-from app.adm_files.create_excel_template import Create_Excel, openpyxl
+from app.adm_files.startup_timer import StartupTimer
 from app.security.password_dialog import PasswordDialog
-from app.security.password_hash import Hash
-from app.interfaces.select_user import Window_UserSelector
-from app.interfaces.director import Window_Selector
-from app.interfaces.register_apps import Inter_Register_APP, datetime, filedialog
-from app.interfaces.register_prep import Inter_Register_PREP
-from app.interfaces.interface_settings import Inter_Settings
-from app.interfaces.register_users import Inter_register_users
-from app.interfaces.interface_log import TextViewerApp
-from app.database.operationDBs import GenericDBOperations
-from app.database.usersDB import UsersDB
-from app.database.programsDB import ProgramsDB
-from app.database.settingsDB import SettingsDB
-from app.executer.runner import Runner, asyncio
-from app.executer.read_schedule import read_schedule
-from app.executer.cleaner import FolderCleaner
-from app.images.create_icon import PixelArtIcon, Image
+from app.images.create_icon import PixelArtIcon
+from app.database.settingsCache import SettingsCache
+from app.executer.executable_cache import ExecutableCache
 
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Configuração do modo de aparência e tema padrão do customtkinter
@@ -78,11 +81,15 @@ ctk.set_default_color_theme("green")
 #   ATENÇÃO: CASO QUEIRA ADICIONAR MAIS ELEMENTOS, SIGA O PADRÃO DA ESTRUTURA
 #   Métodos principais da classe:   
 #       __init__: construtor da classe que inicializa a interface e seus componentes
+#       _deferred_start: cria e inicia, depois do primeiro frame, o que não é necessário para mostrar a janela (bancos, índice do log, fila, Runner, limpador, agendador, canal de controle)
 #       max_window: maximiza a janela do aplicativo
+#       show_window: traz a janela para frente
 #       executed: exibe a interface de programas executados
 #       update_executed: atualiza a lista de programas executados
 #       open_schedule: exibe a interface de agendamento de execuções
 #       create_export: método acionado para criação de um template de schedule aceito pela importação
+#       export_history: método acionado para exportar todo o histórico de execuções (Excel ou CSV) em streaming, fora da thread da interface
+#       _write_history: grava o histórico de execuções a partir do índice do log (roda em uma thread do loop assíncrono)
 #       import_schedule: método acionado para importação do template gerado e modificado pelo usuário
 #       open_programs: exibe a interface de gerenciamento de programas
 #       users: exibe a interface de gerenciamento de usuários
@@ -92,7 +99,10 @@ ctk.set_default_color_theme("green")
 #       clear_filter: limpa os filtros aplicados na tabela
 #       stop_execution: para a execução de programas agendados
 #       process_loop: gerencia o loop assíncrono para execução de tarefas
+#       start_run: executa um programa do catálogo (tela Programs e canal de controle)
+#       cancel_run: cancela uma execução em andamento (tela Executed e canal de controle)
 #       start_scheduler: inicia o agendador de tarefas
+#       reload_schedule: descarta os caches do catálogo e das configurações e verifica o schedule na hora
 #       settings: carrega as configurações salvas no banco de dados
 #       open_log: abre a interface de visualização de logs
 #       users_authentication: autentica o usuário para acessar áreas restritas
@@ -122,8 +132,8 @@ class App(ctk.CTk):
         self.manipulador.create_folders(self.manipulador.logs_folder)
         self.manipulador.create_folders(self.manipulador.image_folder)
         
-        # Criação do ícone do app
-        self.pixel_art = PixelArtIcon().create_icon()
+        # Criação do ícone do app (somente se não existir ou se a imagem com os pixels mudou)
+        PixelArtIcon().create_icon()
 
         # Define a data e hora atual para registros
         self.data_atual_txt = datetime.now().strftime("%d/%m/%Y - %H:%M:%S")
@@ -148,11 +158,22 @@ class App(ctk.CTk):
         self.settings_content = f"Settings Data Base created - {self.data_atual_txt}\n"
         self.manipulador.create_txt(self.manipulador.settings_txt, self.settings_content)
 
-        # Configuração do banco de dados
-        self.db_programs = GenericDBOperations(ProgramsDB, "sqlite:///C:/Terminator/Database/executerDB.db")
-        self.db_users = GenericDBOperations(UsersDB, "sqlite:///C:/Terminator/Database/executerDB.db")
-        self.db_settings = GenericDBOperations(SettingsDB, "sqlite:///C:/Terminator/Database/executerDB.db")
-       
+        # Log (relatórios) do limpador de pastas
+        self.cleaner_content = f"Folder Cleaner reports created - {self.data_atual_txt}\n"
+        self.manipulador.create_txt(self.manipulador.cleaner_txt, self.cleaner_content)
+
+        # Bancos de dados, índice do log, Runner, fila de execuções, limpador e canal de controle: criados no _deferred_start, depois do primeiro frame
+        self.db_programs = None
+        self.db_users = None
+        self.db_settings = None
+        self.program_catalog = None
+        self.log_index = None
+        self.runner = None
+        self.job_queue = None
+        self.job_executor = None
+        self.folder_cleaner = None
+        self.control_server = None
+
         # Chama o construtor da classe ctk.CTk
         super().__init__()
 
@@ -237,10 +258,8 @@ class App(ctk.CTk):
         # Dicionário para armazenar os filtros aplicados nas tabelas
         self.day_order = {"Sun": 0, "Mon": 1, "Tue": 2, "Wed": 3, "Thu": 4, "Fri": 5, "Sat": 6}
 
-        # Inicia o processamento do loop asyncio dentro do tkinter
-        self.runner = Runner(update_callback=self.update_executed)
-        # Pega a lista de execuções do runner
-        self.execute_list = self.runner.execute_list
+        # Lista de execuções exibida no primeiro frame (vazia até o Runner ser criado no _deferred_start)
+        self.execute_list = []
         
         # loop assíncrono para executar tarefas em segundo plano
         self.loop = asyncio.get_event_loop()
@@ -249,20 +268,84 @@ class App(ctk.CTk):
 
         # Inicia as tarefas agendadas e a limpeza de pastas temporárias
         self.value_type = None        
-        # Limpeza de pastas temporárias
-        self.folder_cleaner = FolderCleaner(self.manipulador)
-        self.folder_cleaner.start()
 
         # Instancia o usuário de seleção para o import de schedule
         self.selected_user = None
 
+        # Ao iniciar, abre a tela de programas que já foram executados
+        self.executed()
+        StartupTimer.mark("window")
+        # Os bancos, o Runner, a fila, o agendador, o limpador e o índice do log só são criados depois que a janela aparecer
+        self.after_idle(self._deferred_start)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método _deferred_start para criar e iniciar o que não é necessário para mostrar a janela
+#   Roda depois do primeiro frame: conexões com o banco, índice do histórico, Runner (pool de processos Python e agentes), fila de execuções,
+#   limpador de pastas, agendador de tarefas e canal de controle. Os módulos de cada um são importados somente aqui.
+#   Grava o relatório do tempo de abertura (StartupTimer) na pasta de logs
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _deferred_start(self):
+        from app.database.operationDBs import GenericDBOperations
+        from app.database.usersDB import UsersDB
+        from app.database.programsDB import ProgramsDB
+        from app.database.settingsDB import SettingsDB
+        from app.database.logsIndexDB import LogsIndexDB
+        from app.database.programCatalog import ProgramCatalog
+        from app.database.jobQueueDB import JobQueueDB
+        from app.executer.runner import Runner
+        from app.executer.job_executor import JobExecutor
+        from app.executer.cleaner import FolderCleaner
+        from app.executer.control_server import ControlServer
+        StartupTimer.mark("first_frame")
+
+        # Configuração do banco de dados
+        self.db_programs = GenericDBOperations(ProgramsDB, "sqlite:///C:/Terminator/Database/executerDB.db")
+        self.db_users = GenericDBOperations(UsersDB, "sqlite:///C:/Terminator/Database/executerDB.db")
+        self.db_settings = GenericDBOperations(SettingsDB, "sqlite:///C:/Terminator/Database/executerDB.db")
+        # Catálogo em memória dos programas (telas e agendador), atualizado somente nos registros que mudaram
+        # Tem a sua própria conexão: o agendador atualiza o catálogo na thread do banco (AsyncDBOperations)
+        self.program_catalog = ProgramCatalog(GenericDBOperations(ProgramsDB, "sqlite:///C:/Terminator/Database/executerDB.db"))
+        # Índice de busca do histórico de execuções (banco auxiliar), atualizado em segundo plano
+        self.log_index = LogsIndexDB(self.manipulador.executed_txt, self.manipulador.logs_index_db)
+
+        # Runner (com o pool de processos Python e o despachante dos agentes, se ativados) e a lista de execuções exibida na tela Executed
+        self.runner = Runner(update_callback=self.update_executed)
+        self.execute_list = self.runner.execute_list
+        # Fila durável de execuções e o executor que a lê
+        self.job_queue = JobQueueDB(self.manipulador.job_queue_db)
+        self.job_executor = JobExecutor(self.runner, self.program_catalog, self.job_queue)
+        # Execuções das últimas 24 horas (inclusive de antes de fechar ou travar o APP) voltam para a tela Executed
+        try:
+            self.job_queue.purge()
+            self.execute_list.extend(self.job_executor.restore_history())
+        except Exception as e:
+            print(f"Error to read the job queue history. Check the error:\n{e}")
+        # Atualiza a tabela e começa a indexar o executed.txt em segundo plano
+        self.update_executed()
+
+        # Limpeza de pastas temporárias
+        self.folder_cleaner = FolderCleaner(self.manipulador)
+        self.folder_cleaner.start()
+        # Começa a ler a fila de execuções (pedidos que ficaram aguardando antes de fechar o APP são executados agora)
+        self.job_executor.start()
+        # Inicia o agendador de tarefas
+        self.start_scheduler()
+        # Abre os processos Python pré-aquecidos (somente se o pool estiver ativado)
+        if self.runner.python_pool:
+            self.runner.python_pool.start()
+        # Passa a aceitar os agentes de execução de outras máquinas (somente se o despachante estiver ativado)
+        if self.runner.agent_dispatcher:
+            self.runner.agent_dispatcher.start()
+        # Passa a aceitar comandos da linha de comando (run, status, cancel, reload, show)
+        self.control_server = ControlServer(self)
+        self.control_server.start()
+        StartupTimer.mark("deferred_start")
+        StartupTimer.save(self.manipulador.startup_json)
+
         # Função para verificar se é a primeira vez que o programa está sendo executado.
         # Se for, cria o usuário admin padrão a partir do banco de dados registrado pelo usuário
         self.after(0, self.settings)
-        # Inicia o agendador de tarefas
-        self.start_scheduler()
-        # Ao iniciar, abre a tela de programas que já foram executados
-        self.executed()
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método select_button para destacar o botão selecionado na barra lateral 
 #   Parâmetros:
@@ -291,6 +374,15 @@ class App(ctk.CTk):
         except Exception as e:
             print("Error to try turn max window", e)
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método show_window para trazer a janela para frente (pedido de uma segunda abertura do APP)
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def show_window(self):
+        self.deiconify()
+        self.lift()
+        self.focus_force()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método executed para exibir a interface de programas executados
 #   Cria uma tabela com todos os programas que já foram executados, ordenados pela data de execução
 #   Disponibiliza filtragem na tabela com o botão logo abaixo para retirar o filtro
@@ -311,8 +403,11 @@ class App(ctk.CTk):
         self.stop_run = ctk.CTkButton(self.button_frame, text="Stop", command=self.stop_execution, fg_color="#089c4c", width=100, height=50, font=("Arial", 17))
         self.stop_run.pack(side=tkinter.LEFT, padx=10)
         # Botão History -> chama o método self.open_log para abrir a interface de visualização de logs
-        self.history_executed = ctk.CTkButton(self.button_frame, text="History", command=lambda: self.open_log(self.manipulador.executed_txt, "Executed"), fg_color="#089c4c", width=100, height=50, font=("Arial", 17))
+        self.history_executed = ctk.CTkButton(self.button_frame, text="History", command=lambda: self.open_log(self.manipulador.executed_txt, "Executed", self.log_index), fg_color="#089c4c", width=100, height=50, font=("Arial", 17))
         self.history_executed.pack(side=tkinter.LEFT, padx=10)
+        # Botão Export History -> chama o método self.export_history para exportar o histórico de execuções
+        self.export_history_btn = ctk.CTkButton(self.button_frame, text="Export History", command=self.export_history, fg_color="#089c4c", width=100, height=50, font=("Arial", 17))
+        self.export_history_btn.pack(side=tkinter.LEFT, padx=10)
 
         # Cria a tabela para exibir os programas executados
         # Colunas da tabela:
@@ -370,6 +465,8 @@ class App(ctk.CTk):
                     self.executed_table.insert("", tkinter.END, values=run, tags=(tag,))
         except Exception as e:
             print(f"Error to try update the eecutables table: {e}")
+        # Indexa os registros novos do executed.txt em segundo plano
+        self.log_index.start_background_update()
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método open_schedule para exibir a interface de agendamento de execuções
 #   Cria uma tabela com todos os programas agendados e seus respectivos horários
@@ -423,22 +520,12 @@ class App(ctk.CTk):
         self.style.map('Treeview.Heading', background=[('selected', '#089c4c')])
         # Coleta os dados dos programas agendados do banco de dados
         schedules = []
-        # Itera sobre os programas cadastrados no banco de dados
-        for program in self.db_programs.get_all():
-            # Verifica se o programa tem uma lista de horários agendados
-            if program["schedule_list"] != "":
-                # Separa os horários agendados por vírgula
-                horarios = program["schedule_list"].split(",")
-                # Extrai o caminho completo do programa e cria um caminho parcial para exibição
-                full_path = Path(program["program_path"])
-                partial_path = Path("") / full_path.parts[-2] / full_path.name
-                # Itera sobre os horários agendados e adiciona à lista de schedules
-                for hora in horarios:
-                    # Separa o horário e o dia
-                    hour = hora.split("-")[0]
-                    day = hora.split("-")[1]
-                    # Adiciona uma tupla com as informações do programa agendado
-                    schedules.append((program["program_name"], partial_path, program["program_type"], day, hour))
+        # Itera sobre os programas agendados do catálogo (schedule e caminho parcial já decodificados)
+        for program in self.program_catalog.scheduled():
+            # Itera sobre os horários agendados e adiciona à lista de schedules
+            for hour, day in program["schedule_entries"]:
+                # Adiciona uma tupla com as informações do programa agendado
+                schedules.append((program["program_name"], program["partial_path"], program["program_type"], day, hour))
         # Ordena a lista de schedules por dia da semana e horário
         schedules = sorted(schedules,key=lambda x: (self.day_order.get(x[3], 7), datetime.strptime(x[4], "%H:%M")))
 
@@ -454,26 +541,24 @@ class App(ctk.CTk):
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método 'create_export' para criar um excel template de importação de schedule de programas
 #   Pede o caminho da pasta e o nome do arquivo para fazer o export
-#   Utiliza a classe 'Create_Excel' de 'create_excel_template.py' 
+#   Utiliza a classe 'Stream_Excel' de 'create_excel_template.py' (write-only, estilos compartilhados e larguras precomputadas)
 #   Pega todos os schedules cadastrados no banco e coloca no arquivo para fazer a importação mais facilmente
+#   Se o usuário escolher CSV, grava as abas em arquivos CSV simples
 #   Parâmetros:
 #       Nenhum  
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
     def create_export(self):
+        from app.adm_files.create_excel_template import Stream_Excel
         # Pede o caminho da pasta e o nome do arquivo
-        file_name = filedialog.asksaveasfilename(title="Select the folder to save the Template Schedule", initialfile="Template_Schedule.xlsx", filetypes=[("Excel Files", "*.xlsx")])
+        file_name = filedialog.asksaveasfilename(title="Select the folder to save the Template Schedule", initialfile="Template_Schedule.xlsx", filetypes=[("Excel Files", "*.xlsx"), ("CSV Files", "*.csv")])
         # Se o caminho for selecionado
         if file_name:
             # Instancia a classe
-            excel = Create_Excel(file_name)
-            # Adciona a primeira aba do excel 
-            excel.add_sheet("Schedule")
-            # Define as colunas da primeira aba
-            excel.add_head("Schedule", ["Program", "Program", "HOUR", "MINUTE", "DAY_WEEK"])
+            excel = Stream_Excel(file_name)
             # Lista temporária para armazenar os dados antes de ordenar
             schedule_sort = []
-            # Pega os dados do banco de dados para colocar no export
-            for data in self.db_programs.get_all():
+            # Pega os dados do catálogo de programas para colocar no export
+            for data in self.program_catalog.programs():
                 # Separa os schedules para melhor tratamento de dados macro
                 schedules = data['schedule_list'].split(',')
                 for sche in schedules:
@@ -489,47 +574,96 @@ class App(ctk.CTk):
 
             # Ordena os dados por hora e minuto
             schedule_sort.sort(key=lambda x: (x[2] if isinstance(x[2], int) else 999, x[3] if isinstance(x[3], int) else 999))
+            # Formata as horas e minutos com dois caracteres
+            schedule_rows = [[row[0], row[1], str(row[2]).zfill(2) if row[2] is not None else "", str(row[3]).zfill(2) if row[3] is not None else "", row[4]] for row in schedule_sort]
+            # Adciona a primeira aba do excel com as colunas e as larguras calculadas antes da gravação
+            schedule_head = ["Program", "Program", "HOUR", "MINUTE", "DAY_WEEK"]
+            excel.add_sheet("Schedule", schedule_head, Stream_Excel.column_widths(schedule_head, schedule_rows))
             # Adiciona os dados ordenados ao Excel
-            for row in schedule_sort:
-                hour_str = str(row[2]).zfill(2) if row[2] is not None else ""
-                minute_str = str(row[3]).zfill(2) if row[3] is not None else ""
-                excel.add_line("Schedule", [row[0], row[1], hour_str, minute_str, row[4]])
-            # Sheet number 2
-            excel.add_sheet("Caption")
-            excel.add_head("Caption", ["Caption and Atentions"])
+            excel.add_lines("Schedule", schedule_rows)
             caption = "Program -> Program ID registered in the database. Can be verified in the Terminator 'Programs' tab.\n'Program_Name' -> Name of the program registered in the database. Can be verified in the Terminator 'Programs' tab.\n'HOUR' -> Time the program should run.\n'MINUTE' -> Minute the program should run.\n'DAY_WEEK' -> Day of the week the program should run."
             atencion1 = "ATENTION: PROGRAMS MUST BE PREVIOUSLY REGISTERED BEFORE IMPORTING ANY TYPE OF PROGRAM INTO THE RUNNING SCHEDULE!"
             atencion2 = "ATENTION: THE DATA FROM 'HOUR', 'MINUTE' AND 'DAY_WEEK' WILL BE CONCATENATED BY THE APP TO GENERATE THE SCHEDULE ACCEPTED BY THE DATABASE,\nSO 'HOUR' AND 'MINUTE' MUST CONTAIN EXACTLY TWO CHARACTERS AND 'DAY_WEEK' MUST BE THE DAYS OF THE WEEK IN ENGLISH!"
             atencion3 = "ATENTION: THE DATA ENTERED HERE WILL REPLACE YOUR CURRENT DATA. CHECK EACH SCHEDULE TO AVOID REWORK!"
             atencion4 = "The days used are:"
             days_list = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-            excel.add_line("Caption", [caption])
-            excel.add_line("Caption", [atencion1])
-            excel.add_line("Caption", [atencion2])
-            excel.add_line("Caption", [atencion3])
-            excel.add_line("Caption", [atencion4])
-            for day in days_list:
-                excel.add_line("Caption", [day])
+            # Sheet number 2
+            excel.add_sheet("Caption", ["Caption and Atentions"], [50])
+            excel.add_lines("Caption", [[caption], [atencion1], [atencion2], [atencion3], [atencion4]] + [[day] for day in days_list])
             # Seve the export
             excel.save()
             CTkMessagebox(title="Success",message=f"Schedule Template Exported Successfully in:\n{file_name}'.",icon="check",button_color="#089c4c",justify="center")
             excel.open_excel_file()
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método 'export_history' para exportar todo o histórico de execuções
+#   A atualização do índice e a gravação do arquivo rodam em uma thread do loop assíncrono (run_in_executor), sem travar a interface
+#   Ao terminar, exibe a mensagem e abre o arquivo
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def export_history(self):
+        # Pede o caminho da pasta e o nome do arquivo
+        file_name = filedialog.asksaveasfilename(title="Select the folder to save the Run History", initialfile="Run_History.xlsx", filetypes=[("Excel Files", "*.xlsx"), ("CSV Files", "*.csv")])
+        if not file_name:
+            return
+
+        self.export_history_btn.configure(state="disabled", text="Exporting...")
+        future = self.loop.run_in_executor(None, self._write_history, file_name)
+
+        # Ao terminar, reabilita o botão e exibe o resultado
+        def on_done(finished_future):
+            if finished_future.cancelled():
+                return
+            error = finished_future.exception()
+            def show():
+                if self.export_history_btn.winfo_exists():
+                    self.export_history_btn.configure(state="normal", text="Export History")
+                if error:
+                    CTkMessagebox(title="Error", message=f"It was not possible to export the run history.\nCheck the error:\n{error}", icon="warning", button_color="#089c4c", justify="center")
+                    return
+                CTkMessagebox(title="Success",message=f"Run History Exported Successfully in:\n{file_name}'.",icon="check",button_color="#089c4c",justify="center")
+                finished_future.result().open_excel_file()
+            self.after(0, show)
+        future.add_done_callback(on_done)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método '_write_history' que grava o histórico de execuções (roda fora da thread da interface)
+#   Os registros vêm do índice do log (LogsIndexDB), atualizado antes com as últimas execuções, e são gravados em streaming (memória constante)
+#   Parâmetros:
+#       file_name: arquivo gerado (.xlsx ou .csv)
+#   Retorna a instância do Stream_Excel gravada
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def _write_history(self, file_name):
+        from app.adm_files.create_excel_template import Stream_Excel
+        # Garante que as últimas execuções estão no índice
+        self.log_index.update()
+        excel = Stream_Excel(file_name)
+        excel.add_sheet("Run History", ["Program ID", "Program Name", "Status", "Finish Hour", "Type Run"], [15, 50, 15, 25, 20])
+        # Converte a data do índice (YYYY-mm-dd HH:MM:SS) para o formato do log
+        excel.add_lines("Run History", (
+            (program_id, program_name, status, datetime.strptime(finish, "%Y-%m-%d %H:%M:%S").strftime("%d/%m/%Y - %H:%M:%S") if finish else "", type_run)
+            for program_id, program_name, status, finish, type_run in self.log_index.iter_records()
+        ))
+        excel.save()
+        return excel
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método 'import_scheduele' para importar os dados de um excel com informações do schedule de rodagem dos programas
 #   Pede o caminho completo do arquivo com os dados
 #   Parâmetros:
 #       Nenhum
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
     def import_schedule(self):
+        import openpyxl
+        from app.database.programSchedules import ProgramSchedules
+        from app.security.password_hash import Hash
+        from app.interfaces.select_user import Window_UserSelector
         list_user = []
-        users_values = self.db_users.get_all()
-        if users_values != []:
+        if self.db_users.exists():
             # Abre a janela de registro de configurações
             password_dialog_adm = PasswordDialog(self)
             # Pega a senha do usuário antes de permitir o acesso às importação
             entered_password_adm = password_dialog_adm.get_password()
             # Verifica se a senha está correta
-            if not Hash().check_login(entered_password_adm, self.db_settings.get_by_column("id", 1)["password"]):
+            if not Hash().check_login(entered_password_adm, SettingsCache.get(self.db_settings)["password"]):
                 CTkMessagebox(
                     title="Error",
                     message="Incorrect password. Action canceled!",
@@ -580,7 +714,8 @@ class App(ctk.CTk):
             if file_import_schedule:
                 # Tenta abrir o arquivo
                 try:
-                    schedule_book = openpyxl.load_workbook(filename=file_import_schedule)
+                    # Leitura em modo streaming (read_only): as linhas são lidas sob demanda, sem carregar a planilha inteira
+                    schedule_book = openpyxl.load_workbook(filename=file_import_schedule, read_only=True, data_only=True)
                 # Retorna erro se o arquivo não puder ser aberto
                 except Exception as e:
                     CTkMessagebox(
@@ -593,100 +728,103 @@ class App(ctk.CTk):
                     return
                 # Verifica se a aba "Schedule" existe
                 if "Schedule" in schedule_book.sheetnames:
-                    # Inicia o registro de importação
-                    content_initiated_import = f"-------------------------------------------------------------------------------------------------------------------\nInitiated Schedule Import. Responsible Owner: {self.selected_user}\n"
-                    self.manipulador.write_txt(self.manipulador.programs_txt, content_initiated_import)
-                    # Obtém a aba "Schedule"
-                    sheet = schedule_book["Schedule"]
-                    line_list = [item for item in sheet.iter_rows(values_only=True)]
-                    del line_list[0]  # Remove header
-
-                    program_schedule_map = {}
-                    agrouped = {}
-                    duplicated_entries = []
-                    # Para cada id, nome, hora, minuto e dia nos dados obtidos
-                    for program_id, program_name, hour, minute, day in line_list:
-                        # Verifica se os campos obrigatórios estão preenchidos:
-                        if hour is None or minute is None or day is None:
-                            content_hour_minute = f"The hour, minute, or day is missing for Program ID '{program_id}', Program Name '{program_name}'. Entry ignored.\n"
-                            self.manipulador.write_txt(self.manipulador.programs_txt, content_hour_minute)
-                            continue
-                        # Tenta converter hora e minuto
-                        try:
-                            hour = int(hour)
-                            minute = int(minute)
-                        # Se hour ou minute não forem válidos retorna um erro
-                        except ValueError:
-                            content_error_int = f"It was not possible convert to integer the hour and/or minute for Program ID '{program_id}', Program Name '{program_name}'. Entry ignored.\n"
-                            self.manipulador.write_txt(self.manipulador.programs_txt, content_error_int)
-                            continue
-                        # Verifica se a hora e o minuto estão dentro dos limites válidos
-                        if not (0 <= hour < 24) or not (0 <= minute < 60):
-                            content_error_hour_minute = f"The hour and/or minute is invalid for Program ID '{program_id}', Program Name '{program_name}'. Entry ignored.\n"
-                            self.manipulador.write_txt(self.manipulador.programs_txt, content_error_hour_minute)
-                            continue
-                        # Lista de dias possíveis 
+                    # O arquivo é fechado mesmo se a leitura falhar (no modo read_only ele fica aberto e, no Windows, bloqueado até ser fechado)
+                    try:
+                        # Inicia o registro de importação
+                        content_initiated_import = f"-------------------------------------------------------------------------------------------------------------------\nInitiated Schedule Import. Responsible Owner: {self.selected_user}\n"
+                        self.manipulador.write_txt(self.manipulador.programs_txt, content_initiated_import)
+                        # Obtém a aba "Schedule"
+                        sheet = schedule_book["Schedule"]
+
+                        # Índice horário -> programa: cada horário pertence a um único programa (busca O(1) dos conflitos)
+                        slot_index = {}
+                        agrouped = {}
+                        duplicated_entries = []
+                        # Mensagens de entradas ignoradas, gravadas de uma vez no log no final da leitura
+                        import_messages = []
+                        # Lista de dias possíveis (nome em maiúsculo -> nome como veio na planilha é mantido no horário)
                         days_of_week = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-                        # Verifica se o dia é válido
-                        if day.upper() not in [item.upper() for item in days_of_week]:
-                            content_day = f"Invalid day of the week: {day}.\nMust be one of the following: {', '.join(days_of_week)}.\n"
-                            self.manipulador.write_txt(self.manipulador.programs_txt, content_day)
-                            continue
-                        # Tenta criar a chave e o formato de hora
-                        key = (program_id, program_name)
-                        format_hour = f"{str(hour).zfill(2)}:{str(minute).zfill(2)}-{day}"
-                        # Se a chave não existir no mapa, cria um novo conjunto
-                        if key not in program_schedule_map:
-                            program_schedule_map[key] = set()
-                        # Se o formato de hora já estiver no conjunto, é uma entrada duplicada
-                        # Verifica se há conflitos com programas iguais
-                        if format_hour in program_schedule_map[key]:
-                            content_duplicate = f"Duplicate schedule entry found for same program: '{format_hour}' already assigned to Program ID '{program_id}', Program Name '{program_name}'. Entry ignored.\n"
-                            self.manipulador.write_txt(self.manipulador.programs_txt, content_duplicate)
-                            duplicated_entries.append((key, format_hour))
-                            continue
-                        # Se o formato de hora já estiver no conjunto, é uma entrada duplicada
-                        # Verifica se há conflitos com outros programas
-                        for other_key, hours in program_schedule_map.items():
-                            if other_key != key and format_hour in hours:
-                                content_duplicate = f"Duplicate schedule entry found for different programs: '{format_hour}' already assigned to Program ID '{other_key[0]}', Program Name '{other_key[1]}'. Entry for Program ID '{program_id}', Program Name '{program_name}' ignored.\n"
-                                self.manipulador.write_txt(self.manipulador.programs_txt, content_duplicate)
+                        valid_days = {item.upper() for item in days_of_week}
+                        # Para cada id, nome, hora, minuto e dia nos dados obtidos (a linha 1 é o cabeçalho)
+                        for row in sheet.iter_rows(min_row=2, values_only=True):
+                            # Linhas vazias no final da planilha são ignoradas
+                            if not any(value is not None for value in row):
+                                continue
+                            program_id, program_name, hour, minute, day = (tuple(row) + (None,) * 5)[:5]
+                            # Verifica se os campos obrigatórios estão preenchidos:
+                            if hour is None or minute is None or day is None:
+                                import_messages.append(f"The hour, minute, or day is missing for Program ID '{program_id}', Program Name '{program_name}'. Entry ignored.\n")
+                                continue
+                            # Tenta converter hora e minuto
+                            try:
+                                hour = int(hour)
+                                minute = int(minute)
+                            # Se hour ou minute não forem válidos retorna um erro
+                            except ValueError:
+                                import_messages.append(f"It was not possible convert to integer the hour and/or minute for Program ID '{program_id}', Program Name '{program_name}'. Entry ignored.\n")
+                                continue
+                            # Verifica se a hora e o minuto estão dentro dos limites válidos
+                            if not (0 <= hour < 24) or not (0 <= minute < 60):
+                                import_messages.append(f"The hour and/or minute is invalid for Program ID '{program_id}', Program Name '{program_name}'. Entry ignored.\n")
+                                continue
+                            # Verifica se o dia é válido
+                            if str(day).upper() not in valid_days:
+                                import_messages.append(f"Invalid day of the week: {day}.\nMust be one of the following: {', '.join(days_of_week)}.\n")
+                                continue
+                            # Tenta criar a chave e o formato de hora
+                            key = (program_id, program_name)
+                            format_hour = f"{str(hour).zfill(2)}:{str(minute).zfill(2)}-{day}"
+                            owner = slot_index.get(format_hour)
+                            # Se o formato de hora já pertence ao mesmo programa, é uma entrada duplicada
+                            if owner == key:
+                                import_messages.append(f"Duplicate schedule entry found for same program: '{format_hour}' already assigned to Program ID '{program_id}', Program Name '{program_name}'. Entry ignored.\n")
                                 duplicated_entries.append((key, format_hour))
-                                break
-                        # Se não houver conflitos, adiciona a entrada ao mapa
-                        else:
-                            program_schedule_map[key].add(format_hour)
+                                continue
+                            # Se o formato de hora já pertence a outro programa, é um conflito
+                            if owner is not None:
+                                import_messages.append(f"Duplicate schedule entry found for different programs: '{format_hour}' already assigned to Program ID '{owner[0]}', Program Name '{owner[1]}'. Entry for Program ID '{program_id}', Program Name '{program_name}' ignored.\n")
+                                duplicated_entries.append((key, format_hour))
+                                continue
+                            # Se não houver conflitos, adiciona a entrada ao índice
+                            slot_index[format_hour] = key
+                            agrouped.setdefault(key, []).append(format_hour)
 
-                            if key not in agrouped:
-                                agrouped[key] = []
-                            agrouped[key].append(format_hour)
+                    finally:
+                        schedule_book.close()
+                    # Grava as entradas ignoradas no log de programas
+                    if import_messages:
+                        self.manipulador.write_txt(self.manipulador.programs_txt, "".join(import_messages))
 
                     # Para a rodagem automática para atualizar o schedule
                     self.end_scheduler()
 
-                    # Limpa o campo schedule
-                    self.db_programs.clear_field("schedule_list")
-
                     # Data atual para registro no banco
                     atual_date = datetime.now().strftime("%d/%m/%Y - %H:%M:%S")
 
-                    # Iteração sobre os dados agrupados
-                    for (program_id, program_name), schedule_hours in agrouped.items():
-                        schedule_hours.sort()
-                        # Agora junta todos os dados das horas formatadas
-                        schedule_final = ",".join(schedule_hours)
-                        self.db_programs.update_schedule_by_program(program_id=program_id, program_name=program_name, schdedule_final=schedule_final, modified_date=atual_date, manipulador=self.manipulador)
+                    # Junta as horas formatadas (ordenadas) de cada programa
+                    schedules = {key: ",".join(sorted(schedule_hours)) for key, schedule_hours in agrouped.items()}
+
+                    # Substitui todos os schedules em uma única transação (se falhar, o schedule antigo é mantido)
+                    try:
+                        import_result = ProgramSchedules.replace(self.db_programs, schedules, atual_date, self.manipulador)
+                    except Exception as e:
+                        self.start_scheduler()
+                        content_error = f"Schedule Import Failed. No schedule was changed. Responsible Owner: {self.selected_user}.\nError: {e}\n-------------------------------------------------------------------------------------------------------------------\n"
+                        self.manipulador.write_txt(self.manipulador.programs_txt, content_error)
+                        CTkMessagebox(title="Error", message=f"It was not possible to import the schedule. No schedule was changed.\nCheck the error:\n{e}", icon="warning", button_color="#089c4c", justify="center")
+                        return
 
                     # Inicia novamente a rodagem automática com o banco de schedule atualizado
                     self.start_scheduler()
                     self.open_schedule()
 
                     # Escreve no log de programas quem e quando modificou o schedule
-                    content = f"Schedule Loaded. Responsible Owner: {self.selected_user}.\nCheck the new schedules in the Terminator Schedule tab.\nModified Date: {atual_date}.\n-------------------------------------------------------------------------------------------------------------------\n"
+                    content = f"Schedule Loaded. Responsible Owner: {self.selected_user}.\nPrograms Updated: {import_result['updated']}. Programs Ignored: {import_result['ignored']}. Database Time: {import_result['seconds'] * 1000:.1f} ms.\nCheck the new schedules in the Terminator Schedule tab.\nModified Date: {atual_date}.\n-------------------------------------------------------------------------------------------------------------------\n"
                     self.manipulador.write_txt(self.manipulador.programs_txt, content)
                     CTkMessagebox(title="Success",message=f"Schedule Template Imported Successfully.",icon="check",button_color="#089c4c",justify="center")
 
                 else:
+                    schedule_book.close()
                     CTkMessagebox(title="Error",message="The file is wrong: sheet 'Schedule' does not exist. \nFirst export the template!.", icon="warning",button_color="#089c4c",justify="center")
                     return
         else:
@@ -749,19 +887,15 @@ class App(ctk.CTk):
         self.style.map('Treeview.Heading', background=[('selected', '#089c4c')])
 
         # Cria um dicionário id → nome dos usuários
-        user_id_to_name = {user["id"]: user["user_name"] for user in self.db_users.get_all()}
+        user_id_to_name = dict(self.db_users.select(["id", "user_name"]))
         # Coleta os dados dos programas cadastrados do banco de dados
         programs = []
-        # Itera sobre os programas cadastrados no banco de dados
-        for app in self.db_programs.get_all():
+        # Itera sobre os programas do catálogo (caminho parcial já decodificado)
+        for program in self.program_catalog.programs():
             # Pega o nome do proprietário a partir do id
-            owner_id = app.get("owner_id")  # substitua por app["user_id"] se for esse o nome do campo
-            owner_name = user_id_to_name.get(owner_id, "Unknown")
-            # Extrai o caminho completo do programa e cria um caminho parcial para exibição
-            full_path = Path(app["program_path"])
-            partial_path = Path("") / full_path.parts[-2] / full_path.name
+            owner_name = user_id_to_name.get(program["owner_id"], "Unknown")
             # Adiciona uma tupla com as informações do programa
-            programs.append((app["id"], app["program_name"], partial_path, app["program_type"], owner_name, app["date_modified"]))
+            programs.append((program["id"], program["program_name"], program["partial_path"], program["program_type"], owner_name, program["date_modified"]))
         # Insere os dados na tabela
         for i, app in enumerate(programs):
             tag = 'oddrow' if i % 2 == 0 else 'evenrow'
@@ -900,8 +1034,11 @@ class App(ctk.CTk):
 #       Nenhum
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
     def add_programs(self):
+        from app.interfaces.director import Window_Selector
+        from app.interfaces.register_apps import Inter_Register_APP
+        from app.interfaces.register_prep import Inter_Register_PREP
         # Verifica se há usuários cadastrados antes de permitir o cadastro de programas
-        if self.db_users.get_all() == []:
+        if not self.db_users.exists():
             CTkMessagebox(title="Error",message="There are no registered users. \nYou must register users before registering programs.", icon="warning",button_color="#089c4c",justify="center")
             return
         # Abre a janela de seleção do tipo de programa
@@ -936,6 +1073,9 @@ class App(ctk.CTk):
 #       Nenhum
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
     def change_programs(self):
+        from app.interfaces.register_apps import Inter_Register_APP
+        from app.interfaces.register_prep import Inter_Register_PREP
+        from app.security.password_hash import Hash
         # Verifica se foi selecionado algum programa na tabela
         selected_item = self.program_table.selection()
         if not selected_item:
@@ -945,7 +1085,7 @@ class App(ctk.CTk):
         # Pega os dados do programa selecionado
         values = self.program_table.item(selected_item[0], "values")
         program_name = values[0].strip()  # remove espaços extras
-        program = self.db_programs.get_by_column("id", program_name)
+        program = self.program_catalog.get(program_name)
         
         # Se o programa não for encontrado, exibe uma mensagem de erro
         if not program:
@@ -1000,6 +1140,7 @@ class App(ctk.CTk):
 #       Nenhum
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
     def delete_programs(self):
+        from app.security.password_hash import Hash
         # Encerra o agendador antes de excluir o programa
         self.end_scheduler()
 
@@ -1011,7 +1152,7 @@ class App(ctk.CTk):
         # Pega os dados do programa selecionado
         values = self.program_table.item(selected_item[0], "values")
         program_id = values[0].strip()
-        program = self.db_programs.get_by_column("id", program_id)
+        program = self.program_catalog.get(program_id)
 
         # Se o programa não for encontrado, exibe uma mensagem de erro
         if not program:
@@ -1029,7 +1170,7 @@ class App(ctk.CTk):
         password_dialog = PasswordDialog(self, user_or_adm=f"USER: {user_values}\nOR\nADM USER")
         entered_password = password_dialog.get_password()
         
-        if Hash().check_login(entered_password, user["password"]) == True or (Hash().check_login(entered_password, self.db_settings.get_by_column("id", 1)["password"]) == True):
+        if Hash().check_login(entered_password, user["password"]) == True or (Hash().check_login(entered_password, SettingsCache.get(self.db_settings)["password"]) == True):
             # Deleta o programa
             self.end_scheduler()
             self.db_programs.delete(program_id)
@@ -1078,30 +1219,33 @@ class App(ctk.CTk):
         # Pega os dados do programa selecionado
         values = self.program_table.item(selected_item[0], "values")
         program_id = values[0].strip()
-        program = self.db_programs.get_by_column("id", program_id)
 
         # Se o programa não for encontrado, exibe uma mensagem de erro
-        if not program:
+        if self.start_run(program_id, "Manually") is None:
             CTkMessagebox(title="Error", message="Program not found in the database!", icon="warning", button_color="#089c4c", justify="center")
             return
 
-        # Pega os dados do programa
-        program_type = program["program_type"]
-        program_name = program["program_name"]
-        program_path = program["program_path"]
-        program_parameters = program["parameters"]
-
-        # Cria uma nova tarefa para executar o programa
-        # Adiciona a tarefa na lista de tarefas on-demand
-        id = len(self.runner.ondemmand_tasks_list) + 1
-        # Cria a tarefa assíncrona
-        task = self.loop.create_task(self.runner.tasks_ondemmand("Manually", id, f"{program_id} - {program_name}", program_type, program_path, program_parameters))
-        task.exec_id = str(id)
-        # Adiciona a tarefa na lista de tarefas on-demand
-        self.runner.ondemmand_tasks_list.append(task)
         # Adiciona a execução na lista de execuções
         self.show_temp_message()
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método start_run para executar um programa do catálogo
+#   Usado pela tela Programs (clique duplo) e pelo canal de controle (comando "run")
+#   O pedido é gravado na fila durável e reservado na hora por este APP (se ele fechar antes de terminar, o pedido não se perde)
+#   Parâmetros:
+#       program_id: ID do programa
+#       type_run: tipo de execução exibido na tela Executed (ex: "Manually", "Remote")
+#   Retorna o ID da execução ("queued-<ID do pedido>" se o pedido ficou aguardando na fila) ou None se o programa não existir
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def start_run(self, program_id, type_run):
+        program = self.program_catalog.get(program_id)
+        if not program:
+            return None
+
+        # Acrescenta o pedido na fila e inicia a execução na hora
+        job_id = self.job_queue.enqueue(program["id"], program["program_name"], type_run)
+        started = self.job_executor.poll()
+        return started.get(job_id, f"queued-{job_id}")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método show_temp_message para exibir uma mensagem temporária de sucesso
 #   Parâmetros:
 #       Nenhum
@@ -1148,35 +1292,46 @@ class App(ctk.CTk):
         
         # Verifica se a execução está em andamento
         if values[4] == "On Going":
-            # Tenta cancelar nas listas de tarefas
-            for task_list in [self.runner.automatic_tasks, self.runner.ondemmand_tasks_list]:
-                for i, task in enumerate(task_list):
-                    if hasattr(task, "exec_id") and str(task.exec_id) == exec_id:
-                        task.cancel()
-                        # Atualiza status na lista de execuções
-                        for j, item in enumerate(self.execute_list):
-                            # Se o ID da execução for igual ao ID da tarefa cancelada
-                            if item[0] == exec_id:
-                                # Atualiza o status para "Canceled"
-                                self.execute_list[j] = (item[0], item[1], item[2], item[3], "Canceled", item[5])
-                                content = f"-------------------------------------------------------------------------------------------------------------------\nProgram '{values[1].strip()}' Canceled.\nStart Hour: {values[2].strip()}.\nCanceled Hour: {datetime.now().strftime("%d/%m/%Y - %H:%M:%S")}.\nType Run: {values[5].strip()}\n-------------------------------------------------------------------------------------------------------------------\n"
-                                self.manipulador.write_txt(self.manipulador.executed_txt, content)
-                                # Atualiza a tabela de execuções
-                                self.update_executed()
-                                break
-                        return
-
+            if self.cancel_run(exec_id):
+                return
             CTkMessagebox(title="Error", message="Unable to cancel assigned task.", icon="warning", button_color="#089c4c")
         else:
             CTkMessagebox(title="Error", message="It is only possible to cancel the execution with status equal to 'On Going'")
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método cancel_run para cancelar uma execução em andamento
+#   Usado pela tela Executed (botão Stop) e pelo canal de controle (comando "cancel")
+#   Parâmetros:
+#       exec_id: ID da execução
+#   Retorna True se a execução foi cancelada e False se não existe execução em andamento com esse ID
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def cancel_run(self, exec_id):
+        # Tenta cancelar nas listas de tarefas
+        for task_list in [self.runner.automatic_tasks, self.runner.ondemmand_tasks_list]:
+            for task in task_list:
+                if hasattr(task, "exec_id") and str(task.exec_id) == exec_id and not task.done():
+                    task.cancel()
+                    # Atualiza status na lista de execuções
+                    for j, item in enumerate(self.execute_list):
+                        # Se o ID da execução for igual ao ID da tarefa cancelada
+                        if item[0] == exec_id:
+                            # Atualiza o status para "Canceled"
+                            self.execute_list[j] = (item[0], item[1], item[2], item[3], "Canceled", item[5])
+                            content = f"-------------------------------------------------------------------------------------------------------------------\nProgram '{item[1].strip()}' Canceled.\nStart Hour: {item[2].strip()}.\nCanceled Hour: {datetime.now().strftime("%d/%m/%Y - %H:%M:%S")}.\nType Run: {item[5].strip()}\n-------------------------------------------------------------------------------------------------------------------\n"
+                            self.manipulador.write_txt(self.manipulador.executed_txt, content)
+                            # Atualiza a tabela de execuções
+                            self.update_executed()
+                            break
+                    return True
+        return False
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método start_scheduler para iniciar o agendador automático de tarefas
 #   Parâmetros:
 #       Nenhum
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
     def start_scheduler(self):
+        from app.executer.read_schedule import read_schedule
         # Inicia o agendador automático de tarefas
-        self.scheduler = read_schedule(self.runner, self.db_programs)
+        self.scheduler = read_schedule(self.runner, self.program_catalog, self.job_executor)
         self.loop.create_task(self.scheduler.start())
 
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
@@ -1190,18 +1345,32 @@ class App(ctk.CTk):
         if hasattr(self, "scheduler"):
             self.scheduler.stop()
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método reload_schedule para recarregar os programas e as configurações (comando "reload" do canal de controle)
+#   Descarta o catálogo de programas, as configurações e os caminhos dos executáveis em cache e verifica o schedule na hora, sem esperar o próximo intervalo
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def reload_schedule(self):
+        self.program_catalog.invalidate()
+        SettingsCache.invalidate()
+        ExecutableCache.invalidate()
+        if hasattr(self, "scheduler") and self.scheduler.running:
+            self.loop.create_task(self.scheduler.check_and_schedule())
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método add_user para adicionar um novo usuário
 #   Solicita a senha do dono antes de permitir o cadastro
 #   Parâmetros:
 #       Nenhum
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
     def add_user(self):
+        from app.interfaces.register_users import Inter_register_users
+        from app.security.password_hash import Hash
         # Pedi a senha root da tabela settings
         password_dialog = PasswordDialog(self)
         entered_password = password_dialog.get_password()
 
         # Verifica se a senha está correta
-        if (Hash().check_login(entered_password, self.db_settings.get_by_column("id", 1)["password"]) != True):
+        if (Hash().check_login(entered_password, SettingsCache.get(self.db_settings)["password"]) != True):
             CTkMessagebox(title="Error",message="Incorrect password. Action canceled!", icon="warning",button_color="#089c4c",justify="center")
             return
         # Se a senha estiver correta, abre a janela de cadastro de usuário
@@ -1215,6 +1384,8 @@ class App(ctk.CTk):
 #       Nenhum
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
     def change_user(self):
+        from app.interfaces.register_users import Inter_register_users
+        from app.security.password_hash import Hash
         # Pega o item selecionado na tabela
         selected_item = self.user_table.selection()
         # Verifica se foi selecionado algum usuário na tabela
@@ -1237,7 +1408,7 @@ class App(ctk.CTk):
         entered_password = password_dialog.get_password()
         # Verifica se a senha está correta
         # Se a senha estiver correta, abre a janela de alteração do usuário
-        if Hash().check_login(entered_password, user["password"]) == True or (Hash().check_login(entered_password, self.db_settings.get_by_column("id", 1)["password"]) == True):
+        if Hash().check_login(entered_password, user["password"]) == True or (Hash().check_login(entered_password, SettingsCache.get(self.db_settings)["password"]) == True):
             change_user = Inter_register_users(self, user_data=user)
             self.wait_window(change_user)
             self.users()
@@ -1252,6 +1423,7 @@ class App(ctk.CTk):
 #       Nenhum
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
     def delete_user(self):
+        from app.security.password_hash import Hash
         # Pega o item selecionado na tabela
         selected_item = self.user_table.selection()
         # Verifica se foi selecionado algum usuário na tabela
@@ -1274,7 +1446,7 @@ class App(ctk.CTk):
         entered_password = password_dialog.get_password()
         # Verifica se a senha está correta
         # Se a senha estiver correta, deleta o usuário e todos os programas dele
-        if (Hash().check_login(entered_password, self.db_settings.get_by_column("id", 1)["password"]) == True):
+        if (Hash().check_login(entered_password, SettingsCache.get(self.db_settings)["password"]) == True):
             # Deleta todos os programas do usuário
             try:
                 self.db_programs.delete_by_column("owner_id", user["id"])
@@ -1299,10 +1471,10 @@ class App(ctk.CTk):
 #       Nenhum
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
     def settings(self):
+        from app.interfaces.interface_settings import Inter_Settings
         # Pega as configurações do banco de dados
-        settings_data = self.db_settings.get_all()
         # Verifica se as configurações estão definidas
-        if settings_data == []:
+        if not self.db_settings.exists():
             CTkMessagebox(
                 title="Configuration Registration",
                 message="Settings need to be set before running programs.",
@@ -1325,13 +1497,15 @@ class App(ctk.CTk):
 #       Nenhum
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
     def _settings(self):
+        from app.interfaces.interface_settings import Inter_Settings
+        from app.security.password_hash import Hash
         # Abre a janela de registro das configurações (settings)
         password_dialog = PasswordDialog(self)
         # Solicita a senha do usuário antes de permitir o acesso às configurações
         entered_password = password_dialog.get_password()
         
         # Verifica se a senha está correta
-        if not Hash().check_login(entered_password, self.db_settings.get_by_column("id", 1)["password"]):
+        if not Hash().check_login(entered_password, SettingsCache.get(self.db_settings)["password"]):
             CTkMessagebox(
                 title="Error",
                 message="Incorrect password. Action canceled!",
@@ -1343,7 +1517,7 @@ class App(ctk.CTk):
             return
 
         # Pega os dados do banco
-        setting = self.db_settings.get_by_column("id", 1)
+        setting = SettingsCache.get(self.db_settings)
         # Abre a janela da Interface
         sett = Inter_Settings(self, setting)
         # Espera a janela terminar o processo
@@ -1359,8 +1533,10 @@ class App(ctk.CTk):
 #   Parâmetros:
 #       caminho do log;
 #       nome do log (para aparecer no APP Bar da janela)
+#       log_index: índice de busca do log (opcional, habilita a barra de busca)
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-    def open_log(self, path_log, name_log):
+    def open_log(self, path_log, name_log, log_index=None):
+        from app.interfaces.interface_log import TextViewerApp
         # Se o caminho do log não existir retorna um erro
         if not os.path.exists(path_log):
             CTkMessagebox(
@@ -1374,7 +1550,7 @@ class App(ctk.CTk):
             return
 
         # Abre a janela de log 
-        TextViewerApp(path_log, name_log)
+        TextViewerApp(path_log, name_log, log_index)
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método para limpar o frame direito onde ficam as informações
 #   Toda vez que um usuário apertar um botão da esquerda, esse método apaga as informações para inputar novas
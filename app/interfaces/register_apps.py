@@ -20,6 +20,8 @@ Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
 #       ProgramsDB, UsersDB, GenericDBOperations: para operações de banco de dados
 #       PasswordDialog: para abir uma janela pedindo um input de senha
 #       Hash: para hash e verificação de senhas
+#       ProgramParameters: para gravar os parâmetros já convertidos (JSON) e o Runner não precisar convertê-los a cada execução
+#       ExecutableCache: para validar o interpretador (virtualenv) escolhido para o programa Python
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 import os
 import tkinter
@@ -33,6 +35,8 @@ from app.database.usersDB import UsersDB
 from app.database.operationDBs import GenericDBOperations
 from app.security.password_dialog import PasswordDialog
 from app.security.password_hash import Hash
+from app.executer.program_parameters import ProgramParameters
+from app.executer.executable_cache import ExecutableCache
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Configuração de modo de aparência e tema do customtkinter
 #   Define o modo de aparência para "dark" e o tema de cores para "green"
@@ -48,6 +52,7 @@ ctk.set_default_color_theme("green")
 #       on_closing: define o que e como fazer quando o usuário decidir fecar a janela repentinamente
 #       extension_path: define qual a extensão que deve ser procurada a partir do type_program
 #       select_path: método para o usuário selecionar o caminho do arquivo de acordo com o extension_path
+#       select_interpreter: método para o usuário selecionar a pasta do virtualenv do programa Python
 #       validate_hour: verifica se a hora que o usuário deseja inputar no schedule é válida
 #       validate_minute: verifica se os minutos que o usuário deseja inputar np schedule são válidos
 #       add_time: método para adicionar o horário e o dia da semana no schedule, caso seja válido
@@ -96,9 +101,10 @@ class Inter_Register_APP(ctk.CTkToplevel):
         # Faz com que o APP seja grande o suficiente para preencher toda a tela
         self.resizable(False, False)
         
-        # Define o tamanho da janela
+        # Define o tamanho da janela (programas Python têm o campo do interpretador)
+        self.is_python = (self.program_data["program_type"] if self.program_data else self.app_type) == "Python"
         width = 550
-        height = 670
+        height = 720 if self.is_python else 670
 
         # Centraliza a janela na tela
         self.update_idletasks()
@@ -156,9 +162,20 @@ class Inter_Register_APP(ctk.CTkToplevel):
         self.entry_owner_name.grid(row=4, column=0, padx=10, pady=10, sticky="w")
         self.entry_owner_name.set("Select the Owner")
 
+        # Campo Interpreter (somente programas Python): virtualenv ou executável; vazio = Python do sistema
+        self.interpreter_container = ctk.CTkFrame(self.form_container, corner_radius=10, fg_color=self.bg_color)
+        if self.is_python:
+            self.interpreter_container.grid(row=5, column=0, columnspan=2, sticky="w")
+
+        self.entry_interpreter = ctk.CTkEntry(self.interpreter_container, width=305, placeholder_text="Python interpreter or venv (optional)")
+        self.entry_interpreter.grid(row=0, column=0, padx=10, pady=10, sticky="w")
+
+        self.button_interpreter = ctk.CTkButton(self.interpreter_container, text="Browse", fg_color="#089c4c", width=80, command=self.select_interpreter)
+        self.button_interpreter.grid(row=0, column=1, padx=5, pady=10, sticky="w")
+
         # Campo Horários
         self.hours_container = ctk.CTkFrame(self.form_container, corner_radius=10, fg_color=self.bg_color)
-        self.hours_container.grid(row=5, column=0, columnspan=2, sticky="n")
+        self.hours_container.grid(row=6, column=0, columnspan=2, sticky="n")
 
         self.frame_times = ctk.CTkFrame(self.hours_container, fg_color=self.bg_color)
         self.frame_times.grid(row=3, column=0, padx=10, pady=10, sticky="w")
@@ -194,7 +211,7 @@ class Inter_Register_APP(ctk.CTkToplevel):
 
         # ---------------------- Parâmetros ---------------------- #
         self.parameters_container = ctk.CTkFrame(self.form_container, corner_radius=10, fg_color=self.bg_color)
-        self.parameters_container.grid(row=6, column=0, columnspan=2, sticky="nsew", padx=10, pady=5)
+        self.parameters_container.grid(row=7, column=0, columnspan=2, sticky="nsew", padx=10, pady=5)
 
         self.param_value_var = tkinter.StringVar()
         self.param_category_var = tkinter.StringVar(value="Select Category")
@@ -231,7 +248,7 @@ class Inter_Register_APP(ctk.CTkToplevel):
         self.parameters_list = []
 
         self.bnt_register_container = ctk.CTkFrame(self.form_container, corner_radius=10, fg_color=self.bg_color)
-        self.bnt_register_container.grid(row=7, column=0, columnspan=2, sticky="n")
+        self.bnt_register_container.grid(row=8, column=0, columnspan=2, sticky="n")
 
         # Define o botão de confirmação de registro
         self.button_register = ctk.CTkButton(self.bnt_register_container, text="Save", fg_color="#089c4c", command=self.register_data)
@@ -248,6 +265,8 @@ class Inter_Register_APP(ctk.CTkToplevel):
             self.entry_type.insert(0, self.program_data["program_type"])
             self.entry_type.configure(state="readonly")
             self.entry_name.insert(0, self.program_data["program_name"])
+            if self.program_data.get("interpreter"):
+                self.entry_interpreter.insert(0, self.program_data["interpreter"])
 
             owner_id = self.program_data["owner_id"]
             owner_name = next((name for name, uid in self.owner_name_to_id.items() if uid == owner_id), None)
@@ -301,6 +320,17 @@ class Inter_Register_APP(ctk.CTkToplevel):
         self.entry_type.insert(0, self.app_type)
         self.entry_type.configure(state="readonly")
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que abre uma janela de pesquisa de pasta para o usuário selecionar o virtualenv do programa Python
+#   Também aceita digitar o caminho do executável (ex: C:/Python311/python.exe) diretamente no campo
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def select_interpreter(self):
+        path = filedialog.askdirectory()
+        if path:
+            self.entry_interpreter.delete(0, tkinter.END)
+            self.entry_interpreter.insert(0, path)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método para validar a hora inputada pelo usuário
 #   Parâmetros:
 #       value: valor da hora inputada
@@ -349,7 +379,8 @@ class Inter_Register_APP(ctk.CTkToplevel):
     def load_existing_times(self):
         existing_times = []
         try:
-            for app in self.programsdb.get_all():
+            # Lê os schedules do catálogo de programas da janela principal
+            for app in self.main_app.program_catalog.programs():
                 times = app["schedule_list"].strip().split(",")
                 for time in times:
                     existing_times.append(time)
@@ -476,6 +507,7 @@ class Inter_Register_APP(ctk.CTkToplevel):
         program_type = self.entry_type.get()
         app_name = self.entry_name.get()
         owner_name = self.entry_owner_name.get()
+        interpreter = self.entry_interpreter.get().strip() if self.is_python else ""
         
         if not os.path.exists(app_path):
             CTkMessagebox(title="Error",
@@ -493,6 +525,15 @@ class Inter_Register_APP(ctk.CTkToplevel):
                           justify="center")
             return
         
+        # O interpretador é opcional, mas se preenchido precisa existir (pasta do virtualenv ou executável)
+        if interpreter and ExecutableCache.interpreter(interpreter) is None:
+            CTkMessagebox(title="Error",
+                          message=f"Interpreter not found!\nSelect a virtualenv folder or a Python executable:\n{interpreter}",
+                          icon="warning",
+                          button_color="#089c4c",
+                          justify="center")
+            return
+
         if self.times_list == []:
             confirm = CTkMessagebox(title="Atention!",
                                     message="This program does not have set schedules.\nDo you want to continue anyway?",
@@ -517,6 +558,8 @@ class Inter_Register_APP(ctk.CTkToplevel):
             "owner_id":owner_id,
             "schedule_list":','.join(self.times_list),
             "parameters":','.join(self.parameters_list),
+            "parameters_json": ProgramParameters.dumps(ProgramParameters.parse(','.join(self.parameters_list))),
+            "interpreter":interpreter,
             "date_modified":datetime.now().strftime("%d/%m/%Y - %H:%M:%S")
         }
 
@@ -22,6 +22,7 @@ Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
 #       ProgramsDB, UsersDB, GenericDBOperations: para operações de banco de dados
 #       PasswordDialog: para abir uma janela pedindo um input de senha
 #       Hash: para hash e verificação de senhas
+#       ProgramParameters: para gravar os parâmetros já convertidos (JSON) e o Runner não precisar convertê-los a cada execução
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 import os
 import re
@@ -37,6 +38,7 @@ from app.database.usersDB import UsersDB
 from app.database.operationDBs import GenericDBOperations
 from app.security.password_dialog import PasswordDialog
 from app.security.password_hash import Hash
+from app.executer.program_parameters import ProgramParameters
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Configuração de modo de aparência e tema do customtkinter
 #   Define o modo de aparência para "dark" e o tema de cores para "green"
@@ -721,7 +723,8 @@ class Inter_Register_PREP(ctk.CTkToplevel):
     def load_existing_times(self):
         existing_times = []
         try:
-            for app in self.programsdb.get_all():
+            # Lê os schedules do catálogo de programas da janela principal
+            for app in self.main_app.program_catalog.programs():
                 times = app["schedule_list"].strip().split(",")
                 for time in times:
                     existing_times.append(time)
@@ -806,6 +809,7 @@ class Inter_Register_PREP(ctk.CTkToplevel):
             "owner_id": owner_id,
             "schedule_list": ','.join(self.times_list),
             "parameters": ','.join(self.parameters_list),
+            "parameters_json": ProgramParameters.dumps(ProgramParameters.parse(','.join(self.parameters_list))),
             "date_modified": datetime.now().strftime("%d/%m/%Y - %H:%M:%S")
         }
 
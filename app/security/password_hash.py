@@ -12,20 +12,27 @@ Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
 #       PBKDF2HMAC: Deriva uma chave segura a partir da senha base "Schneider"
 #       hashes: Define o algoritmo de hash usado pelo PBKDF2HMAC
 #       default_backend: Necessário para inicializar o PBKDF2HMAC
+#       threading: protege a derivação da chave quando o Hash é usado por mais de uma thread
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 import base64
+import threading
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.backends import default_backend
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Classe que encapsula toda a lógica de derivação de chave, criptografia, verificação e restauração de senhas.
+#   A derivação da chave (PBKDF2, 100.000 iterações) é cara: ela só acontece no primeiro uso do fernet (não no construtor)
+#   e é feita uma única vez por senha base no processo inteiro (_fernets, compartilhado por todas as instâncias).
+#   Assim, criar um Hash() na abertura do APP ou de cada janela não custa nada.
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 class Hash:
+    _fernets = {}
+    _lock = threading.Lock()
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Construtor da classe Hash
-#   Inicializa a classe e gera uma chave criptográfica segura a partir de uma senha base.
-#   Passos:
+#   Guarda a senha base; a chave criptográfica é gerada no primeiro uso (propriedade fernet).
+#   Passos da geração da chave:
 #       Define um salt fixo (sequência de bytes) para garantir consistência na geração da chave.
 #        Usa PBKDF2HMAC para derivar uma chave segura a partir da senha base "Hash_Selecionado".
 #        Codifica essa chave em Base64 para torná-la compatível com o Fernet.
@@ -34,17 +41,30 @@ class Hash:
 #       base_password_key: chave para gerar a criptografia
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
     def __init__(self, base_password_key="Hash_Selecionado"):
-        # Deriva uma chave segura a partir da senha base
-        salt = b'\x00' * 16  # Salt fixo para consistência
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100_000,
-            backend=default_backend()
-        )
-        chave = base64.urlsafe_b64encode(kdf.derive(base_password_key.encode()))
-        self.fernet = Fernet(chave)
+        self.base_password_key = base_password_key
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Propriedade que devolve o objeto Fernet, derivando a chave somente na primeira vez para cada senha base
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    @property
+    def fernet(self):
+        with Hash._lock:
+            fernet = Hash._fernets.get(self.base_password_key)
+            if fernet is None:
+                # Deriva uma chave segura a partir da senha base
+                salt = b'\x00' * 16  # Salt fixo para consistência
+                kdf = PBKDF2HMAC(
+                    algorithm=hashes.SHA256(),
+                    length=32,
+                    salt=salt,
+                    iterations=100_000,
+                    backend=default_backend()
+                )
+                chave = base64.urlsafe_b64encode(kdf.derive(self.base_password_key.encode()))
+                fernet = Fernet(chave)
+                Hash._fernets[self.base_password_key] = fernet
+            return fernet
 #------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #   Método para criptografar a senha fornecida.
 #   Parâmetros:
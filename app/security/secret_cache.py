@@ -0,0 +1,74 @@
+""" 
+Código para o cache de curta duração das senhas restauradas (descriptografadas) usadas nas execuções.
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importações de bibliotecas necessárias:
+#       time: para controlar o tempo de vida de cada senha no cache
+#       threading: para proteger o cache quando for usado por mais de uma thread
+#       OrderedDict: para descartar primeiro as senhas usadas há mais tempo (LRU)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import time
+import threading
+from collections import OrderedDict
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe SecretCache
+#   Guarda por pouco tempo as senhas já restauradas, para que um programa agendado com frequência não pague o Fernet a cada execução.
+#   O cache é limitado em quantidade (max_items, descarta a usada há mais tempo) e em tempo (ttl segundos):
+#   a senha aberta não fica em memória além do necessário.
+#   A chave do cache é a senha criptografada, então uma senha alterada no cadastro nunca usa o valor antigo.
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class SecretCache:
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Construtor da classe
+#   Parâmetros:
+#       hash_instance: instância de Hash usada para restaurar as senhas
+#       max_items: quantidade máxima de senhas no cache
+#       ttl: tempo de vida (segundos) de cada senha no cache
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def __init__(self, hash_instance, max_items=32, ttl=300):
+        self.hash = hash_instance
+        self.max_items = max_items
+        self.ttl = ttl
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que restaura a senha, usando o cache quando ela foi restaurada há menos de ttl segundos
+#   Parâmetros:
+#       password_stored: senha criptografada (texto "b'...'" ou bytes)
+#   Retorna a senha original ou None se não for possível restaurar
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def restore(self, password_stored):
+        key = password_stored if isinstance(password_stored, str) else str(password_stored)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._items.get(key)
+            if cached and cached[1] > now:
+                self._items.move_to_end(key)
+                return cached[0]
+            self._items.pop(key, None)
+
+        password = self.hash.restore_password(password_stored)
+        if password is None:
+            return None
+
+        with self._lock:
+            self._items[key] = (password, now + self.ttl)
+            self._items.move_to_end(key)
+            # Remove as senhas vencidas e, se ainda passar do limite, as usadas há mais tempo
+            for expired in [name for name, (_, expires) in self._items.items() if expires <= now]:
+                del self._items[expired]
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+        return password
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Método que apaga todas as senhas do cache
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+    def clear(self):
+        with self._lock:
+            self._items.clear()
@@ -0,0 +1,92 @@
+""" 
+Benchmark das operações em lote do GenericDBOperations contra as operações registro a registro.
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   os, sys: para montar o caminho do projeto e do banco temporário
+#   tempfile: para criar um banco SQLite temporário (o banco real do Terminator não é usado)
+#   time: para medir a duração de cada operação
+#   json: para exibir o resultado
+#   argparse: para definir a quantidade de registros pela linha de comando
+#   GenericDBOperations, ProgramsDB: operações e tabela medidas
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import os
+import sys
+import tempfile
+import time
+import json
+import argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.database.operationDBs import GenericDBOperations
+from app.database.programsDB import ProgramsDB
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que cria um registro de programa fictício
+#   Parâmetros:
+#       index: número do registro
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def fake_program(index):
+    return {
+        "program_path": f"C:/Automations/program_{index}.py",
+        "program_name": f"Program {index}",
+        "program_type": "Python",
+        "owner_id": index % 10 + 1,
+        "schedule_list": "",
+        "parameters": "",
+        "date_modified": "19/10/2026 - 10:00:00",
+    }
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que mede o tempo de uma função
+#   Parâmetros:
+#       function: função a ser medida
+#   Retorna o tempo em segundos
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def timed(function):
+    started = time.perf_counter()
+    function()
+    return time.perf_counter() - started
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que executa o benchmark: insere, atualiza e deleta 'rows' programas registro a registro e em lote
+#   Cada modo usa um banco novo para que um não influencie o outro
+#   Parâmetros:
+#       rows: quantidade de registros
+#       batch_size: quantidade de registros por lote das operações em lote
+#   Retorna um dicionário com os tempos (segundos) de cada operação
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def run(rows, batch_size):
+    results = {"rows": rows, "batch_size": batch_size}
+    with tempfile.TemporaryDirectory() as folder:
+        # Registro a registro (um commit por registro)
+        db = GenericDBOperations(ProgramsDB, f"sqlite:///{os.path.join(folder, 'row.db')}")
+        results["row_register"] = timed(lambda: [db.register(**fake_program(i)) for i in range(rows)])
+        ids = [record["id"] for record in db.get_all()]
+        results["row_update"] = timed(lambda: [db.update(record_id, program_type="Executable") for record_id in ids])
+        results["row_delete"] = timed(lambda: [db.delete(record_id) for record_id in ids])
+        db.session.close()
+        db.engine.dispose()
+
+        # Em lote (uma única transação)
+        db = GenericDBOperations(ProgramsDB, f"sqlite:///{os.path.join(folder, 'bulk.db')}")
+        results["bulk_register"] = timed(lambda: db.bulk_register([fake_program(i) for i in range(rows)], batch_size))
+        ids = [record["id"] for record in db.get_all()]
+        results["bulk_update"] = timed(lambda: db.bulk_update([{"id": record_id, "program_type": "Executable"} for record_id in ids], batch_size))
+        results["bulk_delete"] = timed(lambda: db.bulk_delete(ids, batch_size))
+        db.session.close()
+        db.engine.dispose()
+
+    for operation in ("register", "update", "delete"):
+        results[f"speedup_{operation}"] = round(results[f"row_{operation}"] / max(results[f"bulk_{operation}"], 1e-9), 1)
+    return results
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Executa o benchmark somente se rodado o arquivo .py hospedeiro
+#   Exemplo: python benchmarks/bench_bulk_db.py --rows 1000
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk vs row-at-a-time GenericDBOperations benchmark")
+    parser.add_argument("--rows", type=int, default=500, help="Number of programs inserted, updated and deleted")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows per batch in the bulk operations")
+    args = parser.parse_args()
+    print(json.dumps(run(args.rows, args.batch_size), indent=4))
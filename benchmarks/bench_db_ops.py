@@ -0,0 +1,68 @@
+""" 
+Benchmark da latência de cada operação do GenericDBOperations (registro a registro) em uma tabela de programas já preenchida.
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   os, sys: para montar o caminho do projeto e do banco temporário
+#   tempfile: para criar um banco SQLite temporário (o banco real do Terminator não é usado)
+#   json: para exibir o resultado
+#   argparse: para definir a quantidade de registros e de chamadas pela linha de comando
+#   GenericDBOperations, ProgramsDB: operações e tabela medidas
+#   fake_program: registro de programa fictício do benchmark das operações em lote
+#   samples, summary: medição e resumo das latências
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import os
+import sys
+import tempfile
+import json
+import argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.database.operationDBs import GenericDBOperations
+from app.database.programsDB import ProgramsDB
+from benchmarks.bench_bulk_db import fake_program
+from benchmarks.latency import samples, summary
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que executa o benchmark: preenche a tabela com 'rows' programas e mede 'repeat' chamadas de cada operação
+#   As operações de escrita usam registros próprios, para que a tabela continue com 'rows' programas nas leituras
+#   Parâmetros:
+#       rows: quantidade de programas na tabela
+#       repeat: quantidade de chamadas medidas de cada operação
+#   Retorna um dicionário com o resumo da latência (milissegundos) de cada operação
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def run(rows, repeat):
+    results = {"rows": rows, "repeat": repeat, "operations": {}}
+    operations = results["operations"]
+    with tempfile.TemporaryDirectory() as folder:
+        db = GenericDBOperations(ProgramsDB, f"sqlite:///{os.path.join(folder, 'programs.db')}")
+        db.bulk_register([fake_program(i) for i in range(rows)])
+        ids = [record_id for (record_id,) in db.select(["id"])]
+
+        # Leituras
+        operations["get_by_column_id"] = summary(samples(lambda i: db.get_by_column("id", ids[i % len(ids)]), repeat, indexed=True))
+        operations["get_by_column_name"] = summary(samples(lambda i: db.get_by_column("program_name", f"Program {i % rows}"), repeat, indexed=True))
+        operations["exists"] = summary(samples(lambda i: db.exists(owner_id=i % 10 + 1), repeat, indexed=True))
+        operations["select_ids"] = summary(samples(lambda: db.select(["id", "revision", "date_modified"]), repeat))
+        operations["get_all"] = summary(samples(db.get_all, max(1, repeat // 10)))
+
+        # Escritas (um commit por chamada, como nas telas de cadastro)
+        operations["register"] = summary(samples(lambda i: db.register(**fake_program(rows + i)), repeat, indexed=True))
+        new_ids = [record_id for (record_id,) in db.select(["id"], where={"program_name": [f"Program {rows + i}" for i in range(repeat)]})]
+        operations["update"] = summary(samples(lambda i: db.update(new_ids[i], program_type="Executable"), len(new_ids), indexed=True))
+        operations["delete"] = summary(samples(lambda i: db.delete(new_ids[i]), len(new_ids), indexed=True))
+        db.session.close()
+        db.engine.dispose()
+    return results
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Executa o benchmark somente se rodado o arquivo .py hospedeiro
+#   Exemplo: python benchmarks/bench_db_ops.py --rows 5000 --repeat 200
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="GenericDBOperations latency per operation")
+    parser.add_argument("--rows", type=int, default=1000, help="Programs in the table before the measures")
+    parser.add_argument("--repeat", type=int, default=100, help="Calls measured per operation")
+    args = parser.parse_args()
+    print(json.dumps(run(args.rows, args.repeat), indent=4))
@@ -0,0 +1,122 @@
+""" 
+Benchmark da vazão (linhas por segundo) da exportação (Stream_Excel) e da importação do schedule (openpyxl read_only + ProgramSchedules.replace).
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   os, sys: para montar o caminho do projeto e dos arquivos temporários
+#   tempfile: para os arquivos e o banco temporários (o banco real do Terminator não é usado)
+#   time: para medir a duração de cada etapa
+#   json: para exibir o resultado
+#   argparse: para definir as quantidades de linhas pela linha de comando
+#   openpyxl: para ler a planilha exportada, como na importação do schedule
+#   Stream_Excel: exportação medida
+#   GenericDBOperations, ProgramsDB, ProgramSchedules: gravação dos schedules importados
+#   manipulador: log de programas usado pelo ProgramSchedules.replace (somente se algum ID não existir)
+#   fake_program: registro de programa fictício do benchmark das operações em lote
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import os
+import sys
+import tempfile
+import time
+import json
+import argparse
+import openpyxl
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.adm_files.create_excel_template import Stream_Excel
+from app.database.operationDBs import GenericDBOperations
+from app.database.programsDB import ProgramsDB
+from app.database.programSchedules import ProgramSchedules
+from app.adm_files.manipulator import manipulador
+from benchmarks.bench_bulk_db import fake_program
+# Colunas da aba "Schedule" do template (mesma ordem do create_export)
+SCHEDULE_HEAD = ["Program", "Program", "HOUR", "MINUTE", "DAY_WEEK"]
+DAYS = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que monta as linhas do template de schedule (cada horário é único, como exige a importação)
+#   Parâmetros:
+#       rows: quantidade de linhas
+#       programs: quantidade de programas (IDs 1..programs)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def schedule_rows(rows, programs):
+    return [
+        [index % programs + 1, f"Program {index % programs}", f"{(index // 60) % 24:02d}", f"{index % 60:02d}", DAYS[(index // 1440) % 7]]
+        for index in range(rows)
+    ]
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que exporta as linhas com o Stream_Excel
+#   Parâmetros:
+#       file_name: arquivo gerado (.xlsx ou .csv)
+#       rows: linhas da aba "Schedule"
+#   Retorna a duração em segundos
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def export(file_name, rows):
+    started = time.perf_counter()
+    excel = Stream_Excel(file_name)
+    excel.add_sheet("Schedule", SCHEDULE_HEAD, Stream_Excel.column_widths(SCHEDULE_HEAD, rows))
+    excel.add_lines("Schedule", rows)
+    excel.save()
+    return time.perf_counter() - started
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que lê a aba "Schedule" como a importação (read_only, linha a linha) e agrupa os horários de cada programa
+#   A validação das linhas da importação (dias, limites de hora e conflitos) fica na janela principal e não é repetida aqui
+#   Parâmetros:
+#       file_name: planilha exportada
+#   Retorna a tupla (duração em segundos, dicionário {(ID, nome): schedule_list})
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def read_schedule_sheet(file_name):
+    started = time.perf_counter()
+    book = openpyxl.load_workbook(filename=file_name, read_only=True, data_only=True)
+    grouped = {}
+    for program_id, program_name, hour, minute, day in book["Schedule"].iter_rows(min_row=2, values_only=True):
+        grouped.setdefault((program_id, program_name), []).append(f"{str(int(hour)).zfill(2)}:{str(int(minute)).zfill(2)}-{day}")
+    book.close()
+    schedules = {key: ",".join(sorted(hours)) for key, hours in grouped.items()}
+    return time.perf_counter() - started, schedules
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que executa o benchmark para cada quantidade de linhas
+#   Parâmetros:
+#       rows_list: quantidades de linhas do template
+#       programs: quantidade de programas cadastrados no banco temporário
+#   Retorna um dicionário com as linhas por segundo de cada etapa
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def run(rows_list, programs):
+    results = {"programs": programs, "runs": []}
+    with tempfile.TemporaryDirectory() as folder:
+        db = GenericDBOperations(ProgramsDB, f"sqlite:///{os.path.join(folder, 'programs.db')}")
+        db.bulk_register([fake_program(i) for i in range(programs)])
+        for rows_count in rows_list:
+            rows = schedule_rows(rows_count, programs)
+            xlsx_path = os.path.join(folder, f"schedule_{rows_count}.xlsx")
+            export_xlsx = export(xlsx_path, rows)
+            export_csv = export(os.path.join(folder, f"schedule_{rows_count}.csv"), rows)
+            import_read, schedules = read_schedule_sheet(xlsx_path)
+            import_db = ProgramSchedules.replace(db, schedules, "19/10/2026 - 10:00:00", manipulador())["seconds"]
+            results["runs"].append({
+                "rows": rows_count,
+                "xlsx_kb": round(os.path.getsize(xlsx_path) / 1024, 1),
+                "export_xlsx_seconds": round(export_xlsx, 4),
+                "export_xlsx_rows_per_second": round(rows_count / max(export_xlsx, 1e-9)),
+                "export_csv_seconds": round(export_csv, 4),
+                "export_csv_rows_per_second": round(rows_count / max(export_csv, 1e-9)),
+                "import_read_seconds": round(import_read, 4),
+                "import_read_rows_per_second": round(rows_count / max(import_read, 1e-9)),
+                "import_db_seconds": round(import_db, 4),
+                "import_rows_per_second": round(rows_count / max(import_read + import_db, 1e-9)),
+            })
+        db.session.close()
+        db.engine.dispose()
+    return results
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Executa o benchmark somente se rodado o arquivo .py hospedeiro
+#   Exemplo: python benchmarks/bench_excel.py --rows 1000 10000 --programs 500
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Schedule Excel export/import throughput")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000], help="Schedule rows exported and imported")
+    parser.add_argument("--programs", type=int, default=500, help="Programs registered in the temporary database")
+    args = parser.parse_args()
+    print(json.dumps(run(args.rows, args.programs), indent=4))
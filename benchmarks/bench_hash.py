@@ -0,0 +1,60 @@
+""" 
+Benchmark do custo do Hash: derivação da chave (PBKDF2) e criptografia/verificação/recuperação das senhas (Fernet).
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   os, sys: para montar o caminho do projeto
+#   json: para exibir o resultado
+#   argparse: para definir a quantidade de chamadas pela linha de comando
+#   Hash: classe medida
+#   samples, summary: medição e resumo das latências
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import os
+import sys
+import json
+import argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.security.password_hash import Hash
+from benchmarks.latency import samples, summary
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que executa o benchmark
+#   key_derivation: primeiro uso de uma senha base (PBKDF2 com 100.000 iterações; acontece uma vez por processo)
+#   As demais operações usam a chave já derivada, como no APP depois da primeira verificação de senha
+#   Parâmetros:
+#       repeat: quantidade de chamadas medidas de cada operação
+#       derivations: quantidade de derivações de chave medidas (cada uma com uma senha base nova)
+#   Retorna um dicionário com o resumo da latência (milissegundos) e as operações por segundo
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def run(repeat, derivations):
+    results = {"repeat": repeat, "operations": {}}
+    operations = results["operations"]
+    # Senhas base exclusivas do benchmark: a chave é derivada de novo em cada chamada
+    base_keys = [f"benchmark-{os.getpid()}-{i}" for i in range(derivations)]
+    operations["key_derivation"] = summary(samples(lambda i: Hash(base_keys[i]).fernet, derivations, indexed=True))
+    for base_key in base_keys:
+        Hash._fernets.pop(base_key, None)
+
+    password_hash = Hash()
+    stored = password_hash.create_hash("benchmark-password")
+    # Formato gravado no banco (texto "b'...'"), lido pelo Runner nos parâmetros com senha
+    stored_text = str(stored)
+    operations["create_hash"] = summary(samples(lambda: password_hash.create_hash("benchmark-password"), repeat))
+    operations["check_login"] = summary(samples(lambda: password_hash.check_login("benchmark-password", stored), repeat))
+    operations["restore_password"] = summary(samples(lambda: password_hash.restore_password(stored_text), repeat))
+    for operation in operations.values():
+        operation["per_second"] = round(1000 / max(operation["mean_ms"], 1e-9), 1)
+    return results
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Executa o benchmark somente se rodado o arquivo .py hospedeiro
+#   Exemplo: python benchmarks/bench_hash.py --repeat 2000
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hash cost (key derivation and Fernet operations)")
+    parser.add_argument("--repeat", type=int, default=1000, help="Calls measured per Fernet operation")
+    parser.add_argument("--derivations", type=int, default=5, help="Key derivations measured")
+    args = parser.parse_args()
+    print(json.dumps(run(args.repeat, args.derivations), indent=4))
@@ -0,0 +1,151 @@
+""" 
+Benchmark da geração do ícone na abertura do APP: matriz de cores em .py (antigo) x imagem com os pixels e cache por hash.
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   os, sys: para montar o caminho do projeto e dos arquivos temporários
+#   subprocess: para medir cada modo em um processo novo (como na abertura do APP, sem nada em cache na memória)
+#   time: para medir a conversão da matriz de cores em imagem
+#   tempfile: para criar a pasta temporária do ícone e da matriz antiga (o ícone real do Terminator não é usado)
+#   json: para exibir o resultado
+#   argparse: para definir a quantidade de repetições pela linha de comando
+#   Image, ImageDraw: para ler os pixels, recriar a matriz de cores antiga e desenhar como no código antigo
+#   PixelArtIcon: caminho da imagem com os pixels
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import os
+import sys
+import subprocess
+import tempfile
+import time
+import json
+import argparse
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from PIL import Image, ImageDraw
+from app.images.create_icon import PixelArtIcon
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Código executado em cada processo novo. Cada modo mede somente o trabalho do ícone (PIL já importado)
+#   legacy: importa a matriz de cores do .py (sem .pyc), desenha pixel a pixel e salva o ícone
+#   cold: gera o ícone a partir da imagem com os pixels (ícone ainda não existe)
+#   warm: ícone já existe e está atualizado (somente o hash é conferido)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+SCRIPTS = {
+    "legacy": (
+        "import sys, time\n"
+        "sys.dont_write_bytecode = True\n"
+        "from PIL import Image, ImageDraw\n"
+        "started = time.perf_counter()\n"
+        "from matriz_terminator import color_matrix\n"
+        "img = Image.new('RGB', (len(color_matrix[0]), len(color_matrix)), 'black')\n"
+        "draw = ImageDraw.Draw(img)\n"
+        "for y, row in enumerate(color_matrix):\n"
+        "    for x, color in enumerate(row):\n"
+        "        draw.rectangle([x, y, x+1, y+1], fill=color)\n"
+        "img.save(sys.argv[1], format='ICO')\n"
+        "print(time.perf_counter() - started)\n"
+    ),
+    "cold": (
+        "import sys, time\n"
+        "from PIL import Image\n"
+        "from app.images.create_icon import PixelArtIcon\n"
+        "started = time.perf_counter()\n"
+        "PixelArtIcon(sys.argv[1]).create_icon(force=True)\n"
+        "print(time.perf_counter() - started)\n"
+    ),
+    "warm": (
+        "import sys, time\n"
+        "from PIL import Image\n"
+        "from app.images.create_icon import PixelArtIcon\n"
+        "started = time.perf_counter()\n"
+        "assert not PixelArtIcon(sys.argv[1]).create_icon()\n"
+        "print(time.perf_counter() - started)\n"
+    ),
+}
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que recria a matriz de cores em hexadecimal a partir da imagem com os pixels
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def legacy_matrix():
+    with Image.open(PixelArtIcon.ASSET) as image:
+        img = image.convert("RGB")
+    width, height = img.size
+    pixels = img.load()
+    return [[f"#{r:02x}{g:02x}{b:02x}" for r, g, b in (pixels[x, y] for x in range(width))] for y in range(height)]
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que recria o arquivo .py antigo com a matriz de cores em hexadecimal
+#   Parâmetros:
+#       path: caminho do arquivo .py gerado
+#       color_matrix: matriz de cores
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def write_legacy_matrix(path, color_matrix):
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("# Matriz de cores para o ícone\ncolor_matrix = [\n")
+        for row in color_matrix:
+            file.write("    [" + ", ".join(f'"{color}"' for color in row) + "],\n")
+        file.write("]\n")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que mede somente a conversão da matriz de cores em imagem (mesmo processo)
+#   legacy: um draw.rectangle por pixel; vectorized: PixelArtIcon.render_matrix (um único Image.frombytes)
+#   Parâmetros:
+#       color_matrix: matriz de cores
+#       repeat: quantidade de repetições
+#   Retorna a média (segundos) de cada forma
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def render_times(color_matrix, repeat):
+    def legacy():
+        img = Image.new("RGB", (len(color_matrix[0]), len(color_matrix)), "black")
+        draw = ImageDraw.Draw(img)
+        for y, row in enumerate(color_matrix):
+            for x, color in enumerate(row):
+                draw.rectangle([x, y, x+1, y+1], fill=color)
+        return img
+
+    times = {}
+    for name, function in (("render_legacy", legacy), ("render_vectorized", lambda: PixelArtIcon.render_matrix(color_matrix))):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            img = function()
+        times[name] = round((time.perf_counter() - started) / repeat, 4)
+    assert legacy().tobytes() == img.tobytes()
+    return times
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que executa o benchmark: cada modo roda 'repeat' vezes, cada vez em um processo novo
+#   Parâmetros:
+#       repeat: quantidade de repetições de cada modo
+#   Retorna um dicionário com a média (segundos) de cada modo
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def run(repeat):
+    results = {"repeat": repeat}
+    color_matrix = legacy_matrix()
+    results.update(render_times(color_matrix, repeat))
+    with tempfile.TemporaryDirectory() as folder:
+        matrix_path = os.path.join(folder, "matriz_terminator.py")
+        write_legacy_matrix(matrix_path, color_matrix)
+        results["legacy_source_kb"] = round(os.path.getsize(matrix_path) / 1024, 1)
+        results["asset_kb"] = round(os.path.getsize(PixelArtIcon.ASSET) / 1024, 1)
+        icon_path = os.path.join(folder, "icon_terminator.ico")
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join([ROOT, folder])}
+        for mode in ("legacy", "cold", "warm"):
+            durations = []
+            for _ in range(repeat):
+                process = subprocess.run([sys.executable, "-c", SCRIPTS[mode], icon_path], cwd=folder, env=env, capture_output=True, text=True, check=True)
+                durations.append(float(process.stdout.strip()))
+            results[mode] = round(sum(durations) / repeat, 4)
+    results["speedup_cold"] = round(results["legacy"] / max(results["cold"], 1e-9), 1)
+    results["speedup_warm"] = round(results["legacy"] / max(results["warm"], 1e-9), 1)
+    results["speedup_render"] = round(results["render_legacy"] / max(results["render_vectorized"], 1e-9), 1)
+    return results
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Executa o benchmark somente se rodado o arquivo .py hospedeiro
+#   Exemplo: python benchmarks/bench_icon.py --repeat 5
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Startup icon generation benchmark (hex matrix source vs cached pixel asset)")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh processes per mode")
+    args = parser.parse_args()
+    print(json.dumps(run(args.repeat), indent=4))
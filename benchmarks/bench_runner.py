@@ -0,0 +1,150 @@
+""" 
+Benchmark da vazão do Runner (execuções por segundo) com N execuções simultâneas do programa simulado.
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   os, sys: para montar o caminho do projeto e dos arquivos temporários
+#   tempfile: para o banco de configurações, o histórico (executed.txt) e a fila temporários (os arquivos reais do Terminator não são usados)
+#   time: para medir a duração das execuções
+#   json: para exibir o resultado
+#   argparse: para definir as quantidades de execuções simultâneas pela linha de comando
+#   asyncio: para executar os programas no loop de eventos, como no APP
+#   Runner: executor medido
+#   JobQueueDB, JobExecutor: fila durável e executor medidos no caminho completo (pedido -> fila -> Runner)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import os
+import sys
+import tempfile
+import time
+import json
+import argparse
+import asyncio
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from app.executer.runner import Runner
+from app.database.jobQueueDB import JobQueueDB
+from app.executer.job_executor import JobExecutor
+# Programa simulado usado como carga (só imprime os argumentos recebidos)
+STUB = os.path.join(ROOT, "type_programs_terminator", "programa_simulado.py")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que cria o Runner do benchmark
+#   O banco de configurações, o histórico e a pasta dos arquivos mestre ficam na pasta temporária (o Terminator real não é tocado)
+#   O pool de processos Python e os agentes ficam desligados: toda execução abre um processo novo nesta máquina (o caminho padrão do APP)
+#   Parâmetros:
+#       folder: pasta temporária do benchmark
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def stub_runner(folder):
+    runner = Runner(settings_url=f"sqlite:///{os.path.join(folder, 'settings.db')}")
+    runner.master_files = os.path.join(folder, "Master Files")
+    runner.manipulador.executed_txt = os.path.join(folder, "executed.txt")
+    open(runner.manipulador.executed_txt, "w", encoding="utf-8").close()
+    runner.python_pool = None
+    runner.agent_dispatcher = None
+    return runner
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que cria o registro (formato do ProgramCatalog) do programa simulado
+#   Parâmetros:
+#       program_id: ID do programa
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def stub_program(program_id):
+    return {
+        "id": program_id,
+        "program_name": f"Stub {program_id}",
+        "program_type": "Python",
+        "program_path": STUB,
+        "parameter_items": [{"key": "arg", "value": "benchmark"}],
+        "interpreter": None,
+    }
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Classe com o catálogo fixo do programa simulado (mesmo get do ProgramCatalog, sem banco)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+class StubCatalog:
+    def get(self, program_id):
+        return stub_program(int(program_id))
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que executa 'total' programas simulados direto no Runner, no máximo 'concurrency' ao mesmo tempo
+#   Parâmetros:
+#       runner: Runner do benchmark
+#       concurrency: quantidade de execuções simultâneas
+#       total: quantidade de execuções
+#   Retorna a tupla (duração em segundos, quantidade de execuções com sucesso)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+async def run_direct(runner, concurrency, total):
+    semaphore = asyncio.Semaphore(concurrency)
+    program = stub_program(1)
+
+    async def one(index):
+        async with semaphore:
+            return await runner.tasks_ondemmand(
+                "Benchmark", index, program["program_name"], program["program_type"],
+                program["program_path"], program["parameter_items"], program["interpreter"]
+            )
+
+    started = time.perf_counter()
+    statuses = await asyncio.gather(*(one(index) for index in range(1, total + 1)))
+    return time.perf_counter() - started, statuses.count("Success")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que executa 'total' programas simulados pelo caminho completo: pedido na fila durável -> JobExecutor -> Runner
+#   Parâmetros:
+#       runner: Runner do benchmark
+#       folder: pasta temporária do benchmark (banco da fila)
+#       concurrency: capacidade do executor
+#       total: quantidade de execuções
+#   Retorna a tupla (duração em segundos, quantidade de execuções com sucesso)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+async def run_queue(runner, folder, concurrency, total):
+    queue = JobQueueDB(os.path.join(folder, f"queue_{concurrency}.db"))
+    executor = JobExecutor(runner, StubCatalog(), queue, capacity=concurrency, poll_interval=0.05)
+    started = time.perf_counter()
+    for index in range(total):
+        queue.enqueue(1, "Stub 1", "Benchmark")
+    executor.start()
+    try:
+        while queue.jobs(states=("queued", "leased", "running"), limit=1):
+            await asyncio.sleep(0.01)
+        # As tarefas gravam o resultado na fila antes de terminar
+        await asyncio.gather(*executor.tasks.values())
+    finally:
+        executor.stop()
+    elapsed = time.perf_counter() - started
+    return elapsed, sum(1 for job in queue.jobs(limit=total) if job["status"] == "Success")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que executa o benchmark para cada quantidade de execuções simultâneas
+#   Parâmetros:
+#       concurrency_list: quantidades de execuções simultâneas medidas
+#       rounds: execuções por vaga (total = concorrência x rounds)
+#   Retorna um dicionário com as execuções por segundo de cada modo e concorrência
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def run(concurrency_list, rounds):
+    results = {"workload": os.path.relpath(STUB, ROOT), "rounds": rounds, "runs": []}
+    with tempfile.TemporaryDirectory() as folder:
+        runner = stub_runner(folder)
+        for concurrency in concurrency_list:
+            total = concurrency * rounds
+            direct_seconds, direct_success = asyncio.run(run_direct(runner, concurrency, total))
+            queue_seconds, queue_success = asyncio.run(run_queue(runner, folder, concurrency, total))
+            results["runs"].append({
+                "concurrency": concurrency,
+                "total": total,
+                "direct_seconds": round(direct_seconds, 4),
+                "direct_runs_per_second": round(total / max(direct_seconds, 1e-9), 2),
+                "direct_success": direct_success,
+                "queue_seconds": round(queue_seconds, 4),
+                "queue_runs_per_second": round(total / max(queue_seconds, 1e-9), 2),
+                "queue_success": queue_success,
+            })
+    return results
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Executa o benchmark somente se rodado o arquivo .py hospedeiro
+#   Exemplo: python benchmarks/bench_runner.py --concurrency 1 4 16 --rounds 5
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Runner throughput (runs/second) with N concurrent stub programs")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16], help="Concurrent runs measured")
+    parser.add_argument("--rounds", type=int, default=5, help="Runs per concurrency slot")
+    args = parser.parse_args()
+    print(json.dumps(run(args.concurrency, args.rounds), indent=4))
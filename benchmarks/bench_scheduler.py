@@ -0,0 +1,170 @@
+""" 
+Benchmark do agendador: custo de cada verificação do schedule e atraso entre o horário vencido e a abertura do processo.
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   os, sys: para montar o caminho do projeto e do banco temporário
+#   tempfile: para os bancos temporários (o banco real do Terminator não é usado)
+#   time: para medir a duração de cada verificação e o atraso até a abertura do processo
+#   json: para exibir o resultado
+#   argparse: para definir as quantidades de programas e de horários pela linha de comando
+#   asyncio: para rodar o agendador no loop de eventos, como no APP
+#   datetime, timedelta: para montar horários que vencem agora (ou que não vencem durante o benchmark)
+#   GenericDBOperations, ProgramsDB, ProgramCatalog: catálogo de programas lido pelo agendador
+#   read_schedule: agendador medido
+#   JobQueueDB, JobExecutor: fila durável e executor que abrem os processos dos horários vencidos
+#   stub_runner, STUB: Runner e programa simulado do benchmark do Runner
+#   summary: resumo das latências
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import os
+import sys
+import tempfile
+import time
+import json
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.database.operationDBs import GenericDBOperations
+from app.database.programsDB import ProgramsDB
+from app.database.programCatalog import ProgramCatalog
+from app.executer.read_schedule import read_schedule
+from app.database.jobQueueDB import JobQueueDB
+from app.executer.job_executor import JobExecutor
+from benchmarks.bench_runner import stub_runner, STUB
+from benchmarks.latency import summary
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que cria o registro de um programa simulado com o schedule informado
+#   Parâmetros:
+#       index: número do registro
+#       schedule_list: horários no formato do banco ("HH:MM-Day,HH:MM-Day")
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def fake_program(index, schedule_list):
+    return {
+        "program_path": STUB,
+        "program_name": f"Stub {index}",
+        "program_type": "Python",
+        "owner_id": 1,
+        "schedule_list": schedule_list,
+        "parameters": "",
+        "date_modified": "19/10/2026 - 10:00:00",
+    }
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que monta 'entries' horários que não vencem durante o benchmark (dia de amanhã)
+#   Parâmetros:
+#       entries: quantidade de horários de cada programa
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def idle_schedule(entries):
+    day = (datetime.now() + timedelta(days=1)).strftime("%A")
+    return ",".join(f"{(minute // 60) % 24:02d}:{minute % 60:02d}-{day}" for minute in range(0, entries * 7, 7))
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que mede a verificação do schedule (check_and_schedule) sem horários vencidos
+#   cold: primeira verificação (catálogo vazio, todos os programas são lidos e decodificados)
+#   warm: verificações seguintes (o catálogo só confere as revisões)
+#   Parâmetros:
+#       folder: pasta temporária
+#       programs: quantidade de programas com schedule
+#       entries: quantidade de horários de cada programa
+#       repeat: quantidade de verificações medidas (warm)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+async def tick_cost(folder, programs, entries, repeat):
+    db = GenericDBOperations(ProgramsDB, f"sqlite:///{os.path.join(folder, f'tick_{programs}_{entries}.db')}")
+    schedule_list = idle_schedule(entries)
+    db.bulk_register([fake_program(index, schedule_list) for index in range(programs)])
+    # Sem horários vencidos o agendador não usa o executor
+    scheduler = read_schedule(None, ProgramCatalog(db), None)
+
+    started = time.perf_counter()
+    await scheduler.check_and_schedule()
+    cold = time.perf_counter() - started
+    warm = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await scheduler.check_and_schedule()
+        warm.append(time.perf_counter() - started)
+    db.session.close()
+    db.engine.dispose()
+    return {"programs": programs, "entries_per_program": entries, "cold_ms": round(cold * 1000, 4), "warm": summary(warm)}
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que mede o atraso entre a verificação que encontra um horário vencido e a abertura do processo (create_subprocess_exec)
+#   Caminho medido: agendador -> fila durável -> executor (acordado pelo agendador) -> catálogo -> Runner -> processo
+#   O horário só é encontrado na próxima verificação: no APP o atraso total ainda inclui até 'check_interval' segundos
+#   Parâmetros:
+#       folder: pasta temporária
+#       repeat: quantidade de horários vencidos medidos
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+async def dispatch_latency(folder, repeat):
+    db = GenericDBOperations(ProgramsDB, f"sqlite:///{os.path.join(folder, 'dispatch.db')}")
+    catalog = ProgramCatalog(db)
+    runner = stub_runner(folder)
+    executor = JobExecutor(runner, catalog, JobQueueDB(os.path.join(folder, "dispatch_queue.db")))
+    scheduler = read_schedule(runner, catalog, executor)
+
+    # Marca o horário de abertura de cada processo (a chamada original continua sendo feita)
+    spawned = []
+    create_subprocess_exec = asyncio.create_subprocess_exec
+
+    async def timed_create_subprocess_exec(*args, **kwargs):
+        spawned.append(time.perf_counter())
+        return await create_subprocess_exec(*args, **kwargs)
+
+    asyncio.create_subprocess_exec = timed_create_subprocess_exec
+    executor.start()
+    latencies = []
+    try:
+        for index in range(repeat):
+            # O horário precisa continuar vencido até a verificação (evita a virada do minuto)
+            if datetime.now().second >= 58:
+                await asyncio.sleep(61 - datetime.now().second)
+            now = datetime.now()
+            db.register(**fake_program(index, f"{now:%H:%M}-{now:%A}"))
+            count = len(spawned)
+            started = time.perf_counter()
+            await scheduler.check_and_schedule()
+            deadline = time.time() + 10
+            while len(spawned) == count and time.time() < deadline:
+                await asyncio.sleep(0.001)
+            if len(spawned) == count:
+                raise RuntimeError("The due program was not started in 10 seconds.")
+            latencies.append(spawned[count] - started)
+            # Espera a execução terminar para que as medições não se sobreponham
+            await asyncio.gather(*executor.tasks.values())
+    finally:
+        asyncio.create_subprocess_exec = create_subprocess_exec
+        executor.stop()
+        db.session.close()
+        db.engine.dispose()
+    return {"check_interval_seconds": scheduler.check_interval, "due_to_spawn": summary(latencies)}
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que executa o benchmark
+#   Parâmetros:
+#       programs_list: quantidades de programas com schedule
+#       entries_list: quantidades de horários de cada programa
+#       repeat: verificações medidas em cada combinação
+#       dispatch_repeat: horários vencidos medidos no atraso até a abertura do processo
+#   Retorna um dicionário com o custo das verificações e o atraso até a abertura do processo
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def run(programs_list, entries_list, repeat, dispatch_repeat):
+    results = {"tick": []}
+    with tempfile.TemporaryDirectory() as folder:
+        for programs in programs_list:
+            for entries in entries_list:
+                results["tick"].append(asyncio.run(tick_cost(folder, programs, entries, repeat)))
+        results["dispatch"] = asyncio.run(dispatch_latency(folder, dispatch_repeat))
+    return results
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Executa o benchmark somente se rodado o arquivo .py hospedeiro
+#   Exemplo: python benchmarks/bench_scheduler.py --programs 10 100 1000 --entries 1 10 --repeat 20
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scheduler tick cost and due-to-spawn dispatch latency")
+    parser.add_argument("--programs", type=int, nargs="+", default=[10, 100, 1000], help="Scheduled programs measured")
+    parser.add_argument("--entries", type=int, nargs="+", default=[1, 10, 50], help="Schedule entries per program")
+    parser.add_argument("--repeat", type=int, default=20, help="Ticks measured per combination")
+    parser.add_argument("--dispatch-repeat", type=int, default=10, help="Due programs measured in the dispatch latency")
+    args = parser.parse_args()
+    print(json.dumps(run(args.programs, args.entries, args.repeat, args.dispatch_repeat), indent=4))
@@ -0,0 +1,80 @@
+""" 
+Benchmark do tempo de importação da abertura do APP (python -X importtime) com orçamento de tempo.
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   os, sys: para montar o caminho do projeto e chamar o mesmo interpretador Python
+#   subprocess: para importar o módulo em um processo novo (sem nada em cache na memória)
+#   json: para exibir o resultado
+#   argparse: para definir o módulo, o orçamento e a quantidade de módulos listados pela linha de comando
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import os
+import sys
+import subprocess
+import json
+import argparse
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que importa o módulo em um processo novo com -X importtime e lê o tempo de cada importação
+#   Parâmetros:
+#       module: módulo importado (ex: app.interfaces.main)
+#   Retorna a lista de tuplas (módulo, tempo próprio em segundos, tempo acumulado em segundos)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def import_times(module):
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, env={**os.environ, "PYTHONPATH": ROOT}
+    )
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+    times = []
+    # Formato das linhas: "import time:      self [us] |  cumulative | imported package"
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times.append((name.strip(), int(self_us) / 1_000_000, int(cumulative_us) / 1_000_000))
+    return times
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que executa o benchmark e compara o tempo total com o orçamento
+#   Parâmetros:
+#       module: módulo importado
+#       budget: orçamento (segundos) do tempo total de importação
+#       top: quantidade de módulos mais lentos listados
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def run(module, budget, top):
+    times = import_times(module)
+    total = sum(self_time for _, self_time, _ in times)
+    # Somente os pacotes de primeiro nível (sem o nome do pai), que somam o custo de tudo que eles importam
+    top_level = [(name, cumulative) for name, _, cumulative in times if "." not in name]
+    app_modules = [(name, cumulative) for name, _, cumulative in times if name.startswith("app.")]
+    return {
+        "module": module,
+        "total_import_seconds": round(total, 4),
+        "budget_seconds": budget,
+        "within_budget": total <= budget,
+        "slowest_packages": [{"name": name, "seconds": round(seconds, 4)} for name, seconds in sorted(top_level, key=lambda item: -item[1])[:top]],
+        "slowest_app_modules": [{"name": name, "seconds": round(seconds, 4)} for name, seconds in sorted(app_modules, key=lambda item: -item[1])[:top]],
+    }
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Executa o benchmark somente se rodado o arquivo .py hospedeiro
+#   Termina com código 1 se o tempo de importação passar do orçamento
+#   Exemplo: python benchmarks/bench_startup.py --budget 0.8
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Startup import-time budget for the Terminator window")
+    parser.add_argument("--module", default="app.interfaces.main", help="Module imported by the startup path")
+    parser.add_argument("--budget", type=float, default=1.0, help="Maximum total import time in seconds")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest modules listed")
+    args = parser.parse_args()
+    try:
+        result = run(args.module, args.budget, args.top)
+    except RuntimeError as e:
+        print(f"Error importing '{args.module}': {e}")
+        sys.exit(2)
+    print(json.dumps(result, indent=4))
+    sys.exit(0 if result["within_budget"] else 1)
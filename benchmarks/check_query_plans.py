@@ -0,0 +1,104 @@
+""" 
+Verificação dos planos de execução (EXPLAIN QUERY PLAN) das consultas mais usadas nas tabelas de programas e usuários.
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   os, sys: para montar o caminho do projeto e do banco temporário
+#   sqlite3: para criar um banco no formato antigo (sem os índices) e testar a migração
+#   tempfile: para criar um banco SQLite temporário (o banco real do Terminator não é usado)
+#   json: para exibir o resultado
+#   argparse: para informar um banco existente pela linha de comando
+#   select, update, delete: construtores das consultas verificadas
+#   GenericDBOperations, ProgramsDB, UsersDB: operações e tabelas verificadas
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import os
+import sys
+import sqlite3
+import tempfile
+import json
+import argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sqlalchemy import select, update, delete
+from app.database.operationDBs import GenericDBOperations
+from app.database.programsDB import ProgramsDB
+from app.database.usersDB import UsersDB
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Consultas mais usadas que não podem voltar a percorrer a tabela inteira (SCAN)
+#       delete_by_owner: remoção dos programas de um usuário (delete_by_column("owner_id", ...))
+#       program_by_name: validação do schedule pelo nome do programa
+#       program_by_id / user_by_id: get_by_column("id", ...) e update_schedule_by_program
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+HOT_QUERIES = {
+    "delete_by_owner": lambda: delete(ProgramsDB.__table__).where(ProgramsDB.owner_id == 1),
+    "program_by_name": lambda: select(ProgramsDB.id).where(ProgramsDB.program_name == "Program 1"),
+    "program_by_id": lambda: select(ProgramsDB.program_name).where(ProgramsDB.id == 1),
+    "schedule_by_id": lambda: update(ProgramsDB.__table__).where(ProgramsDB.id == 1).values(schedule_list=""),
+    "user_by_id": lambda: select(UsersDB.user_name).where(UsersDB.id == 1),
+}
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que cria um banco no formato antigo: tabela de programas só com a chave primária
+#   Parâmetros:
+#       path: caminho do arquivo do banco
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def create_legacy_database(path):
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE programs (id INTEGER PRIMARY KEY, program_path VARCHAR, program_name VARCHAR, program_type VARCHAR, "
+        "owner_id INTEGER, schedule_list VARCHAR, parameters VARCHAR, date_modified VARCHAR)"
+    )
+    connection.executemany(
+        "INSERT INTO programs (program_path, program_name, program_type, owner_id, schedule_list, parameters) VALUES (?, ?, ?, ?, '', '')",
+        [(f"C:/Automations/program_{i}.py", f"Program {i}", "Python", i % 10 + 1) for i in range(200)]
+    )
+    connection.commit()
+    connection.close()
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que verifica o plano de cada consulta
+#   Parâmetros:
+#       database_url: URL do banco verificado
+#   Retorna um dicionário com os índices criados pela migração, o plano de cada consulta e as consultas que fazem SCAN
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def check(database_url):
+    programs = GenericDBOperations(ProgramsDB, database_url)
+    users = GenericDBOperations(UsersDB, database_url)
+    result = {"migrated_indexes": programs.created_indexes, "plans": {}, "table_scans": []}
+    for name, statement in HOT_QUERIES.items():
+        operations = users if name.startswith("user") else programs
+        plan = operations.query_plan(statement())
+        result["plans"][name] = plan
+        # "SCAN tabela" = leitura da tabela inteira ("SCAN tabela USING INDEX" também percorre todo o índice)
+        if any(detail.startswith("SCAN") for detail in plan):
+            result["table_scans"].append(name)
+    for operations in (programs, users):
+        operations.session.close()
+        operations.engine.dispose()
+    return result
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Executa a verificação somente se rodado o arquivo .py hospedeiro
+#   Sem --database, cria um banco no formato antigo, aplica a migração e verifica os planos
+#   Termina com código 1 se alguma consulta fizer SCAN ou se a migração criar algum índice de novo (não é idempotente)
+#   Exemplo: python benchmarks/check_query_plans.py --database C:/Terminator/Database/executerDB.db
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="EXPLAIN QUERY PLAN check for the hot programs/users queries")
+    parser.add_argument("--database", default="", help="Existing SQLite database to check (it is migrated). Default: a temporary legacy database")
+    args = parser.parse_args()
+    if args.database:
+        result = check(f"sqlite:///{args.database}")
+    else:
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "legacy.db")
+            create_legacy_database(path)
+            result = check(f"sqlite:///{path}")
+            # Na segunda migração não há mais nada para criar
+            # O migrate_indexes é chamado direto: uma nova instância no mesmo processo não confere o esquema de novo (_prepared_urls)
+            again = GenericDBOperations(ProgramsDB, f"sqlite:///{path}")
+            result["migrated_again"] = again.migrate_indexes()
+            again.session.close()
+            again.engine.dispose()
+    print(json.dumps(result, indent=4))
+    sys.exit(1 if result["table_scans"] or result.get("migrated_again") else 0)
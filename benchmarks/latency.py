@@ -0,0 +1,44 @@
+""" 
+Funções de medição compartilhadas pelos benchmarks (resumo das latências em milissegundos).
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   time: para medir a duração de cada chamada
+#   statistics: para a mediana e os percentis
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import time
+import statistics
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que mede 'repeat' chamadas de uma função
+#   Parâmetros:
+#       function: função medida (sem argumentos; recebe o número da chamada se 'indexed' for True)
+#       repeat: quantidade de chamadas
+#       indexed: passa o número da chamada (0, 1, 2...) para a função
+#   Retorna a lista com a duração (segundos) de cada chamada
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def samples(function, repeat, indexed=False):
+    durations = []
+    for index in range(repeat):
+        started = time.perf_counter()
+        function(index) if indexed else function()
+        durations.append(time.perf_counter() - started)
+    return durations
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que resume as durações medidas
+#   Parâmetros:
+#       durations: lista de durações em segundos
+#   Retorna um dicionário com a quantidade, média, mediana, p95 e máximo (milissegundos)
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def summary(durations):
+    ordered = sorted(durations)
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 4),
+        "p50_ms": round(statistics.median(ordered) * 1000, 4),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 4),
+        "max_ms": round(ordered[-1] * 1000, 4),
+    }
@@ -0,0 +1,134 @@
+""" 
+Executa os benchmarks do agendador, do Runner, do banco, do Hash e do Excel e grava o resultado em JSON para comparar ao longo do tempo.
+Code by: Marco Antonio Samuelsson
+Data: 19/10/2026
+Versão: 1.0
+Qualquer modificação ou cópia deste código deve ser autorizada pelo autor!
+"""
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Importação das bibliotecas necessárias
+#   os, sys: para montar o caminho do projeto e da pasta de resultados
+#   platform: para registrar o sistema e a versão do Python junto com o resultado
+#   subprocess: para registrar o commit do git medido
+#   time: para medir a duração de cada benchmark
+#   json: para gravar e comparar os resultados
+#   argparse: para escolher os benchmarks, o arquivo de saída e o resultado base da comparação
+#   datetime: para o nome do arquivo e a data do resultado
+#   bench_*: benchmarks executados
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+import os
+import sys
+import platform
+import subprocess
+import time
+import json
+import argparse
+from datetime import datetime
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from benchmarks import bench_scheduler, bench_runner, bench_db_ops, bench_bulk_db, bench_hash, bench_excel
+# Benchmarks e parâmetros usados na comparação ao longo do tempo (mantenha os mesmos para que os resultados sejam comparáveis)
+SUITES = {
+    "scheduler": lambda: bench_scheduler.run([10, 100, 1000], [1, 10, 50], 20, 10),
+    "runner": lambda: bench_runner.run([1, 4, 16], 5),
+    "db_ops": lambda: bench_db_ops.run(1000, 100),
+    "bulk_db": lambda: bench_bulk_db.run(500, 500),
+    "hash": lambda: bench_hash.run(1000, 5),
+    "excel": lambda: bench_excel.run([1000, 10000], 500),
+}
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que devolve o commit do git medido (None fora de um repositório)
+#   Parâmetros:
+#       Nenhum
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def git_commit():
+    try:
+        process = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return process.stdout.strip() if process.returncode == 0 else None
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que transforma o resultado em um dicionário plano {"suite.campo.0.campo": número}
+#   Parâmetros:
+#       value: resultado (ou parte dele)
+#       prefix: caminho até o valor
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def flatten(value, prefix=""):
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = enumerate(value)
+    else:
+        return {prefix: value} if isinstance(value, (int, float)) and not isinstance(value, bool) else {}
+    flat = {}
+    for key, item in items:
+        flat.update(flatten(item, f"{prefix}.{key}" if prefix else str(key)))
+    return flat
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que compara o resultado com um resultado anterior (mesmos benchmarks e parâmetros)
+#   Parâmetros:
+#       results: resultado atual
+#       baseline: resultado anterior (lido do arquivo JSON)
+#   Retorna um dicionário {campo: {"baseline", "current", "ratio"}} dos campos numéricos presentes nos dois
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def compare(results, baseline):
+    current = flatten(results["suites"])
+    previous = flatten(baseline.get("suites", {}))
+    return {
+        key: {"baseline": previous[key], "current": value, "ratio": round(value / previous[key], 3) if previous[key] else None}
+        for key, value in current.items() if key in previous
+    }
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Função que executa os benchmarks escolhidos
+#   Um benchmark que falhar fica registrado com o erro e não impede os demais
+#   Parâmetros:
+#       suites: nomes dos benchmarks (chaves de SUITES)
+#   Retorna o resultado com as informações da máquina, o commit e o resultado de cada benchmark
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+def run(suites):
+    results = {
+        "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "suites": {},
+        "seconds": {},
+    }
+    for name in suites:
+        started = time.perf_counter()
+        try:
+            results["suites"][name] = SUITES[name]()
+        except Exception as e:
+            results["suites"][name] = {"error": f"{type(e).__name__}: {e}"}
+        results["seconds"][name] = round(time.perf_counter() - started, 2)
+    return results
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#   Executa os benchmarks somente se rodado o arquivo .py hospedeiro
+#   O resultado é gravado em benchmarks/results/<data>.json (ou no --output); com --baseline, a comparação vai junto
+#   O código de saída é 1 se algum benchmark falhar (o resultado é gravado mesmo assim), para que a falha não passe despercebida
+#   Exemplo: python benchmarks/run_all.py --baseline benchmarks/results/20261019-100000.json
+#------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the Terminator benchmark suite and save the results as JSON")
+    parser.add_argument("--suites", nargs="+", choices=list(SUITES), default=list(SUITES), help="Benchmarks executed")
+    parser.add_argument("--output", help="JSON file written (default: benchmarks/results/<date>.json)")
+    parser.add_argument("--baseline", help="Previous JSON result compared with this run")
+    args = parser.parse_args()
+
+    results = run(args.suites)
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            results["comparison"] = compare(results, json.load(file))
+
+    output = args.output or os.path.join(ROOT, "benchmarks", "results", f"{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=4)
+    print(json.dumps(results, indent=4))
+    print(f"Results saved in: {output}")
+
+    failed = [name for name, result in results["suites"].items() if "error" in result]
+    if failed:
+        print(f"Error running the benchmarks: {', '.join(failed)}")
+        sys.exit(1)